@@ -0,0 +1,34 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Convolve(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**10, 2**16, 2**20],
+        [16, 1024],
+        ["float32", "float64"],
+        ["auto", "direct", "fft"],
+    ]
+    param_names = ["executor", "size", "filter_size", "dtype", "method"]
+
+    def setup(self, executor, size, filter_size, dtype, method):
+        self.np = self.executors[executor]
+        if self.np is numpy and method != "auto":
+            # numpy has no method keyword
+            raise NotImplementedError()
+
+        rng = numpy.random.default_rng(1)
+        self.a = self.asarray(rng.random(size).astype(dtype))
+        self.v = self.asarray(rng.random(filter_size).astype(dtype))
+        self.kwargs = {} if self.np is numpy else {"method": method}
+
+    def time_convolve(self, *args):
+        self.np.convolve(self.a, self.v, mode="same", **self.kwargs)
+
+    def time_correlate(self, *args):
+        self.np.correlate(self.a, self.v, mode="same", **self.kwargs)
@@ -0,0 +1,61 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Einsum(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [16, 64, 128],
+        ["float64", "float32"],
+        [False, "greedy"],
+    ]
+    param_names = ["executor", "size", "dtype", "optimize"]
+
+    def setup(self, executor, size, dtype, optimize):
+        self.np = self.executors[executor]
+        self.optimize = optimize
+
+        rng = numpy.random.default_rng(1)
+        # keep the number of elements of high dimensional operands bounded
+        dim = max(size // 4, 2)
+        self.a = self.asarray(rng.random((size, size)).astype(dtype))
+        self.b = self.asarray(rng.random((size, size)).astype(dtype))
+        self.v = self.asarray(rng.random(size).astype(dtype))
+        self.a3 = self.asarray(rng.random((dim,) * 3).astype(dtype))
+        self.b3 = self.asarray(rng.random((dim,) * 3).astype(dtype))
+        self.a4 = self.asarray(rng.random((dim,) * 4).astype(dtype))
+        self.b4 = self.asarray(rng.random((dim,) * 4).astype(dtype))
+        self.m = self.asarray(rng.random((dim, dim)).astype(dtype))
+
+    def time_einsum_i_ij_j(self, *args):
+        self.np.einsum("i,ij,j", self.v, self.a, self.v, optimize=self.optimize)
+
+    def time_einsum_ij_jk(self, *args):
+        self.np.einsum("ij,jk", self.a, self.b, optimize=self.optimize)
+
+    def time_einsum_ijk_jil_kl(self, *args):
+        self.np.einsum("ijk,jil->kl", self.a3, self.b3, optimize=self.optimize)
+
+    def time_einsum_bij_bjk_bik(self, *args):
+        self.np.einsum("bij,bjk->bik", self.a3, self.b3, optimize=self.optimize)
+
+    def time_einsum_abcd_cdbe_ae(self, *args):
+        self.np.einsum(
+            "abcd,cdbe->ae", self.a4, self.b4, optimize=self.optimize
+        )
+
+    def time_einsum_ea_fb_abcd_gc_hd_efgh(self, *args):
+        m = self.m
+        self.np.einsum(
+            "ea,fb,abcd,gc,hd->efgh",
+            m,
+            m,
+            self.a4,
+            m,
+            m,
+            optimize=self.optimize,
+        )
@@ -2,14 +2,14 @@ import numpy
 
 import dpnp
 
-from .common import Benchmark
+from .common import DeviceBenchmark
 
 
 # asv run --python=python --bench Elementwise
 # --quick option will run every case once
 # but looks like first execution has additional overheads
 # (need to be investigated)
-class Elementwise(Benchmark):
+class Elementwise(DeviceBenchmark):
     executors = {"dpnp": dpnp, "numpy": numpy}
     params = [
         ["dpnp", "numpy"],
@@ -20,8 +20,7 @@ class Elementwise(Benchmark):
 
     def setup(self, executor, size, dtype):
         self.np = self.executors[executor]
-        dt = getattr(self.np, dtype)
-        self.a = self.np.arange(size, dtype=dt)
+        self.a = self.asarray(numpy.arange(size, dtype=dtype))
 
     def time_arccos(self, *args):
         self.np.arccos(self.a)
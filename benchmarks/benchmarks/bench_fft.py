@@ -0,0 +1,72 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class FFT(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**10, 2**16, 2**20],
+        ["float32", "float64", "complex64", "complex128"],
+    ]
+    param_names = ["executor", "size", "dtype"]
+
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
+        a = numpy.random.default_rng(1).random(size).astype(dtype)
+        self.a = self.asarray(a)
+
+    def time_fft(self, *args):
+        self.np.fft.fft(self.a)
+
+    def time_ifft(self, *args):
+        self.np.fft.ifft(self.a)
+
+
+class RFFT(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**10, 2**16, 2**20],
+        ["float32", "float64"],
+    ]
+    param_names = ["executor", "size", "dtype"]
+
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
+        a = numpy.random.default_rng(1).random(size).astype(dtype)
+        self.a = self.asarray(a)
+
+    def time_rfft(self, *args):
+        self.np.fft.rfft(self.a)
+
+    def time_irfft(self, *args):
+        self.np.fft.irfft(self.a)
+
+
+class FFTn(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [(64, 64), (1024, 1024), (64, 64, 64), (4096, 256)],
+        ["complex64", "complex128"],
+    ]
+    param_names = ["executor", "shape", "dtype"]
+
+    def setup(self, executor, shape, dtype):
+        self.np = self.executors[executor]
+        a = numpy.random.default_rng(1).random(shape).astype(dtype)
+        self.a = self.asarray(a)
+
+    def time_fftn(self, *args):
+        self.np.fft.fftn(self.a)
+
+    def time_ifftn(self, *args):
+        self.np.fft.ifftn(self.a)
+
+    def time_fft_last_axis(self, *args):
+        # batched 1-D transforms
+        self.np.fft.fft(self.a, axis=-1)
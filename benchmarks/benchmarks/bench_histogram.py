@@ -0,0 +1,36 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Histogram(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**16, 2**20, 2**24],
+        [16, 1024],
+    ]
+    param_names = ["executor", "size", "bins"]
+
+    def setup(self, executor, size, bins):
+        self.np = self.executors[executor]
+        self.bins = bins
+
+        rng = numpy.random.default_rng(1)
+        self.a = self.asarray(rng.random(size))
+        self.b = self.asarray(rng.random(size))
+        self.ints = self.asarray(rng.integers(0, bins, size))
+
+    def time_histogram(self, *args):
+        self.np.histogram(self.a, bins=self.bins)
+
+    def time_histogram_bin_edges(self, *args):
+        self.np.histogram_bin_edges(self.a, bins=self.bins)
+
+    def time_histogram2d(self, *args):
+        self.np.histogram2d(self.a, self.b, bins=self.bins)
+
+    def time_bincount(self, *args):
+        self.np.bincount(self.ints, minlength=self.bins)
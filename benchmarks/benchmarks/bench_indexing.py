@@ -0,0 +1,43 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Indexing(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**16, 2**20, 2**24],
+        ["float32", "float64"],
+    ]
+    param_names = ["executor", "size", "dtype"]
+
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
+
+        rng = numpy.random.default_rng(1)
+        self.a = self.asarray(rng.random(size).astype(dtype))
+        self.b = self.asarray(rng.random(size).astype(dtype))
+        self.ind = self.asarray(rng.integers(0, size, size // 4))
+        self.vals = self.asarray(rng.random(size // 4).astype(dtype))
+        self.mask = self.a > 0.5
+
+    def time_take(self, *args):
+        self.np.take(self.a, self.ind)
+
+    def time_put(self, *args):
+        self.np.put(self.b, self.ind, self.vals)
+
+    def time_where(self, *args):
+        self.np.where(self.mask, self.a, self.b)
+
+    def time_where_cond(self, *args):
+        self.np.where(self.mask)
+
+    def time_compress(self, *args):
+        self.np.compress(self.mask, self.a)
+
+    def time_nonzero(self, *args):
+        self.np.nonzero(self.a)
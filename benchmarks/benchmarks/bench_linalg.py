@@ -2,149 +2,125 @@ import numpy
 
 import dpnp
 
-from .common import TYPES1, Benchmark, get_indexes_rand, get_squares_
+from .common import TYPES1, DeviceBenchmark, get_indexes_rand, get_squares_
 
 
-class Eindot(Benchmark):
+class Eindot(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
     params = [
-        [dpnp, numpy],
+        ["dpnp", "numpy"],
         [16, 32, 64, 128, 256, 512, 1024],
         ["float64", "float32", "int64", "int32"],
     ]
     param_names = ["executor", "size", "dtype"]
 
-    def setup(self, np, size, dtype):
-        dt = getattr(np, dtype)
-        # self.a = np.arange(60000.0).reshape(150, 400)
-        self.a = np.arange(size * size, dtype=dt).reshape((size, size))
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
 
-        # self.ac = self.a.copy()
-        # self.at = self.a.T
-        # self.atc = self.a.T.copy()
-        # self.b = np.arange(240000.0).reshape(400, 600)
-        self.b = np.arange(size * size, dtype=dt).reshape((size, size))
-        # self.c = np.arange(600)
-        # self.d = np.arange(400)
+        a = numpy.arange(size * size, dtype=dtype).reshape((size, size))
+        self.a = self.asarray(a)
+        self.ac = self.a.copy()
+        self.at = self.a.T
+        self.atc = self.a.T.copy()
+        self.b = self.asarray(numpy.ones((size, size), dtype=dtype))
+        self.c = self.asarray(numpy.arange(size, dtype=dtype))
+        self.d = self.asarray(numpy.arange(size, dtype=dtype))
 
-        # self.a3 = np.arange(480000.).reshape(60, 80, 100)
-        # self.b3 = np.arange(192000.).reshape(80, 60, 40)
+        self.a3 = self.asarray(numpy.ones((60, 80, 100), dtype=dtype))
+        self.b3 = self.asarray(numpy.ones((80, 60, 40), dtype=dtype))
 
-    def time_dot_a_b(self, np):
-        np.dot(self.a, self.b)
+    def time_dot_a_b(self, *args):
+        self.np.dot(self.a, self.b)
 
-    def time_dot_d_dot_b_c(self, np, *args):
-        np.dot(self.d, np.dot(self.b, self.c))
+    def time_dot_d_dot_b_c(self, *args):
+        self.np.dot(self.d, self.np.dot(self.b, self.c))
 
-    def time_dot_trans_a_at(self, np, *args):
-        np.dot(self.a, self.at)
+    def time_dot_trans_a_at(self, *args):
+        self.np.dot(self.a, self.at)
 
-    def time_dot_trans_a_atc(self, np, *args):
-        np.dot(self.a, self.atc)
+    def time_dot_trans_a_atc(self, *args):
+        self.np.dot(self.a, self.atc)
 
-    def time_dot_trans_at_a(self, np, *args):
-        np.dot(self.at, self.a)
+    def time_dot_trans_at_a(self, *args):
+        self.np.dot(self.at, self.a)
 
-    def time_dot_trans_atc_a(self, np, *args):
-        np.dot(self.atc, self.a)
+    def time_dot_trans_atc_a(self, *args):
+        self.np.dot(self.atc, self.a)
 
-    def time_einsum_i_ij_j(self, np, *args):
-        np.einsum("i,ij,j", self.d, self.b, self.c)
+    def time_einsum_i_ij_j(self, *args):
+        self.np.einsum("i,ij,j", self.d, self.b, self.c)
 
-    def time_einsum_ij_jk_a_b(self, np, *args):
-        np.einsum("ij,jk", self.a, self.b)
+    def time_einsum_ij_jk_a_b(self, *args):
+        self.np.einsum("ij,jk", self.a, self.b)
 
-    def time_einsum_ijk_jil_kl(self, np, *args):
-        np.einsum("ijk,jil->kl", self.a3, self.b3)
+    def time_einsum_ijk_jil_kl(self, *args):
+        self.np.einsum("ijk,jil->kl", self.a3, self.b3)
 
-    def time_inner_trans_a_a(self, np, *args):
-        np.inner(self.a, self.a)
+    def time_inner_trans_a_a(self, *args):
+        self.np.inner(self.a, self.a)
 
-    def time_inner_trans_a_ac(self, np, *args):
-        np.inner(self.a, self.ac)
+    def time_inner_trans_a_ac(self, *args):
+        self.np.inner(self.a, self.ac)
 
-    def time_matmul_a_b(self, np, *args):
-        np.matmul(self.a, self.b)
+    def time_matmul_a_b(self, *args):
+        self.np.matmul(self.a, self.b)
 
-    def time_matmul_d_matmul_b_c(self, np, *args):
-        np.matmul(self.d, np.matmul(self.b, self.c))
+    def time_matmul_d_matmul_b_c(self, *args):
+        self.np.matmul(self.d, self.np.matmul(self.b, self.c))
 
-    def time_matmul_trans_a_at(self, np, *args):
-        np.matmul(self.a, self.at)
+    def time_matmul_trans_a_at(self, *args):
+        self.np.matmul(self.a, self.at)
 
-    def time_matmul_trans_a_atc(self, np, *args):
-        np.matmul(self.a, self.atc)
+    def time_matmul_trans_a_atc(self, *args):
+        self.np.matmul(self.a, self.atc)
 
-    def time_matmul_trans_at_a(self, np, *args):
-        np.matmul(self.at, self.a)
+    def time_matmul_trans_at_a(self, *args):
+        self.np.matmul(self.at, self.a)
 
-    def time_matmul_trans_atc_a(self, np, *args):
-        np.matmul(self.atc, self.a)
+    def time_matmul_trans_atc_a(self, *args):
+        self.np.matmul(self.atc, self.a)
 
-    def time_tensordot_a_b_axes_1_0_0_1(self, np, *args):
-        np.tensordot(self.a3, self.b3, axes=([1, 0], [0, 1]))
+    def time_tensordot_a_b_axes_1_0_0_1(self, *args):
+        self.np.tensordot(self.a3, self.b3, axes=([1, 0], [0, 1]))
 
 
-class Linalg(Benchmark):
-    params = [[dpnp, numpy], ["svd", "pinv", "det", "norm"], TYPES1]
+class Linalg(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [["dpnp", "numpy"], ["svd", "pinv", "det", "norm"], TYPES1]
     param_names = ["executor", "op", "type"]
 
-    def setup(self, np, op, typename):
-        np.seterr(all="ignore")
+    def setup(self, executor, op, typename):
+        numpy.seterr(all="ignore")
 
-        self.func = getattr(np.linalg, op)
+        self.np = self.executors[executor]
+        self.func = getattr(self.np.linalg, op)
 
         if op == "cholesky":
             # we need a positive definite
-            self.a = np.dot(
-                get_squares_()[typename], get_squares_()[typename].T
-            )
+            a = numpy.dot(get_squares_()[typename], get_squares_()[typename].T)
         else:
-            self.a = get_squares_()[typename]
+            a = get_squares_()[typename]
 
         # check that dtype is supported at all
         try:
+            self.a = self.asarray(a)
             self.func(self.a[:2, :2])
-        except TypeError:
+        except (TypeError, ValueError):
             raise NotImplementedError()
 
-    def time_op(self, np, op, typename):
+    def time_op(self, *args):
         self.func(self.a)
 
 
-class Lstsq(Benchmark):
-    params = [dpnp, numpy]
+class Lstsq(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = ["dpnp", "numpy"]
     param_names = ["executor"]
 
-    def setup(self, np):
-        self.a = get_squares_()["float64"]
-        self.b = get_indexes_rand()[:100].astype(np.float64)
+    def setup(self, executor):
+        self.np = self.executors[executor]
+        self.a = self.asarray(get_squares_()["float64"])
+        self.b = self.asarray(get_indexes_rand()[:100].astype(numpy.float64))
 
-    def time_numpy_linalg_lstsq_a__b_float64(self, np):
-        np.linalg.lstsq(self.a, self.b, rcond=-1)
-
-
-# class Einsum(Benchmark):
-# param_names = ['dtype']
-# params = [[np.float64]]
-# def setup(self, dtype):
-# self.a = np.arange(2900, dtype=dtype)
-# self.b = np.arange(3000, dtype=dtype)
-# self.c = np.arange(24000, dtype=dtype).reshape(20, 30, 40)
-# self.c1 = np.arange(1200, dtype=dtype).reshape(30, 40)
-# self.d = np.arange(10000, dtype=dtype).reshape(10,100,10)
-
-# #outer(a,b): trigger sum_of_products_contig_stride0_outcontig_two
-# def time_einsum_outer(self, dtype):
-# np.einsum("i,j", self.a, self.b, optimize=True)
-
-# # multiply(a, b):trigger sum_of_products_contig_two
-# def time_einsum_multiply(self, dtype):
-# np.einsum("..., ...", self.c1, self.c , optimize=True)
-
-# # sum and multiply:trigger sum_of_products_contig_stride0_outstride0_two
-# def time_einsum_sum_mul(self, dtype):
-# np.einsum(",i...->", 300, self.d, optimize=True)
-
-# # sum and multiply:trigger sum_of_products_stride0_contig_outstride0_two
-# def time_einsum_sum_mul2(self, dtype):
-# np.einsum("i...,->", self.d, 300, optimize=True)
+    def time_numpy_linalg_lstsq_a__b_float64(self, *args):
+        self.np.linalg.lstsq(self.a, self.b, rcond=-1)
@@ -2,26 +2,29 @@ import numpy
 
 import dpnp
 
-from .common import Benchmark
+from .common import DeviceBenchmark, get_sycl_queue
 
 
 # asv run --python=python --quick --bench Sample
-class Sample(Benchmark):
+class Sample(DeviceBenchmark):
     executors = {"dpnp": dpnp, "numpy": numpy}
     params = [["dpnp", "numpy"], [2**16, 2**20, 2**24]]
     param_names = ["executor", "size"]
 
     def setup(self, executor, size):
-        self.executor = self.executors[executor]
+        self.np = self.executors[executor]
+        self.kwargs = {}
+        if self.np is dpnp:
+            self.kwargs["sycl_queue"] = get_sycl_queue()
 
     def time_rand(self, executor, size):
-        np = self.executor
-        np.random.rand(size)
+        np = self.np
+        np.random.rand(size, **self.kwargs)
 
     def time_randn(self, executor, size):
-        np = self.executor
-        np.random.randn(size)
+        np = self.np
+        np.random.randn(size, **self.kwargs)
 
     def time_random_sample(self, executor, size):
-        np = self.executor
-        np.random.random_sample((size,))
+        np = self.np
+        np.random.random_sample((size,), **self.kwargs)
@@ -0,0 +1,95 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Reduction(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**16, 2**20, 2**24],
+        ["float32", "float64", "int64"],
+        [None, 0, 1],
+    ]
+    param_names = ["executor", "size", "dtype", "axis"]
+
+    def setup(self, executor, size, dtype, axis):
+        self.np = self.executors[executor]
+        self.axis = axis
+
+        a = numpy.random.default_rng(1).random(size).astype(dtype)
+        self.a = self.asarray(a.reshape(-1, 1024))
+
+    def time_sum(self, *args):
+        self.np.sum(self.a, axis=self.axis)
+
+    def time_prod(self, *args):
+        self.np.prod(self.a, axis=self.axis)
+
+    def time_max(self, *args):
+        self.np.max(self.a, axis=self.axis)
+
+    def time_min(self, *args):
+        self.np.min(self.a, axis=self.axis)
+
+    def time_mean(self, *args):
+        self.np.mean(self.a, axis=self.axis)
+
+    def time_std(self, *args):
+        self.np.std(self.a, axis=self.axis)
+
+    def time_var(self, *args):
+        self.np.var(self.a, axis=self.axis)
+
+    def time_argmax(self, *args):
+        self.np.argmax(self.a, axis=self.axis)
+
+
+class NanReduction(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**16, 2**20, 2**24],
+        ["float32", "float64"],
+        [None, 1],
+    ]
+    param_names = ["executor", "size", "dtype", "axis"]
+
+    def setup(self, executor, size, dtype, axis):
+        self.np = self.executors[executor]
+        self.axis = axis
+
+        rng = numpy.random.default_rng(1)
+        a = rng.random(size).astype(dtype)
+        # about 10% of NaN values
+        a[rng.random(size) < 0.1] = numpy.nan
+        self.a = self.asarray(a.reshape(-1, 1024))
+
+    def time_nansum(self, *args):
+        self.np.nansum(self.a, axis=self.axis)
+
+    def time_nanprod(self, *args):
+        self.np.nanprod(self.a, axis=self.axis)
+
+    def time_nanmax(self, *args):
+        self.np.nanmax(self.a, axis=self.axis)
+
+    def time_nanmin(self, *args):
+        self.np.nanmin(self.a, axis=self.axis)
+
+    def time_nanmean(self, *args):
+        self.np.nanmean(self.a, axis=self.axis)
+
+    def time_nanstd(self, *args):
+        self.np.nanstd(self.a, axis=self.axis)
+
+    def time_nanvar(self, *args):
+        self.np.nanvar(self.a, axis=self.axis)
+
+    def time_nanargmax(self, *args):
+        self.np.nanargmax(self.a, axis=self.axis)
+
+    def time_nanmedian(self, *args):
+        self.np.nanmedian(self.a, axis=self.axis)
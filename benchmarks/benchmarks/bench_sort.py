@@ -0,0 +1,39 @@
+import numpy
+
+import dpnp
+
+from .common import DeviceBenchmark
+
+
+class Sort(DeviceBenchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [2**10, 2**16, 2**20, 2**24],
+        ["float32", "float64", "int32", "int64"],
+    ]
+    param_names = ["executor", "size", "dtype"]
+
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
+
+        rng = numpy.random.default_rng(1)
+        a = (rng.random(size) * size).astype(dtype)
+        self.a = self.asarray(a)
+        self.s = self.asarray(numpy.sort(a))
+        self.v = self.asarray((rng.random(1024) * size).astype(dtype))
+
+    def time_sort(self, *args):
+        self.np.sort(self.a)
+
+    def time_argsort(self, *args):
+        self.np.argsort(self.a)
+
+    def time_partition(self, *args):
+        self.np.partition(self.a, self.a.size // 2)
+
+    def time_sort_rows(self, *args):
+        self.np.sort(self.a.reshape(-1, 256), axis=-1)
+
+    def time_searchsorted(self, *args):
+        self.np.searchsorted(self.s, self.v)
@@ -1,7 +1,13 @@
+import functools
+import os
 import random
+import time
 
+import dpctl
 import numpy
 
+import dpnp
+
 # Various pre-crafted datasets/variables for testing
 # !!! Must not be changed -- only appended !!!
 # while testing numpy we better not rely on numpy to produce random
@@ -126,3 +132,125 @@ class Benchmark:
     # repeat = 1
     # rounds = 1
     pass
+
+
+@memoize
+def get_sycl_queue():
+    """
+    Return the SYCL queue all dpnp benchmarks are executed on.
+
+    The queue is in-order and has profiling enabled, so the device time can be
+    taken from SYCL events. The device is selected by ``DPNP_BENCH_DEVICE``
+    environment variable holding a SYCL filter selector string (``"cpu"`` by
+    default).
+
+    """
+
+    return dpctl.SyclQueue(
+        os.getenv("DPNP_BENCH_DEVICE", "cpu"),
+        property=["enable_profiling", "in_order"],
+    )
+
+
+def _synchronized(method):
+    """Wrap benchmark `method` to wait for the submitted kernels."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        method(self, *args)
+        self.sync()
+
+    return wrapper
+
+
+def _track_device(method):
+    """
+    Return a metric of the device time of benchmark `method` summed over the
+    kernels it submits.
+
+    """
+
+    def track(self, *args):
+        self.sync()
+        if self.np is not dpnp:
+            start = time.perf_counter()
+            for _ in range(self.metric_calls):
+                method(self, *args)
+            return (time.perf_counter() - start) / self.metric_calls
+
+        with dpnp.profiler() as prof:
+            with prof.record_function("benchmark"):
+                for _ in range(self.metric_calls):
+                    method(self, *args)
+        (row,) = [r for r in prof.stats() if r["name"] == "benchmark"]
+        return row["device_time"] / self.metric_calls
+
+    track.unit = "seconds"
+    return track
+
+
+def _track_dispatch(method):
+    """Return a metric of the host time until benchmark `method` returns."""
+
+    def track(self, *args):
+        dt = 0.0
+        for _ in range(self.metric_calls):
+            self.sync()
+            start = time.perf_counter()
+            method(self, *args)
+            dt += time.perf_counter() - start
+        self.sync()
+        return dt / self.metric_calls
+
+    track.unit = "seconds"
+    return track
+
+
+class DeviceBenchmark(Benchmark):
+    """
+    Base class for benchmarks of operations run by an executor.
+
+    A subclass has to set ``self.np`` to an executor module (dpnp or numpy)
+    in its ``setup`` and to define a ``time_<name>`` method per benchmarked
+    operation. Every dpnp array must be allocated on the queue returned by
+    :func:`get_sycl_queue`, see :meth:`asarray`.
+
+    Three metrics are reported for each operation:
+
+    - ``time_<name>``: wall time of the operation including the wait for all
+      the submitted kernels to complete;
+    - ``track_device_<name>``: total time of execution of the submitted
+      kernels on the device taken from SYCL event profiling of each kernel
+      (the same as the wall time for numpy);
+    - ``track_dispatch_<name>``: host time spent until the call returns,
+      i.e. the dispatch overhead which is not overlapped with device
+      execution.
+
+    """
+
+    # number of calls to average over in track_* metrics
+    metric_calls = 10
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if not name.startswith("time_") or not callable(method):
+                continue
+
+            op = name[len("time_") :]
+            setattr(cls, name, _synchronized(method))
+            setattr(cls, "track_device_" + op, _track_device(method))
+            setattr(cls, "track_dispatch_" + op, _track_dispatch(method))
+
+    def asarray(self, a):
+        """Create an array of the executor from a numpy array."""
+
+        if self.np is dpnp:
+            return dpnp.asarray(a, sycl_queue=get_sycl_queue())
+        return numpy.asarray(a)
+
+    def sync(self):
+        """Wait for all the work submitted by the executor to complete."""
+
+        if self.np is dpnp:
+            get_sycl_queue().wait()
@@ -68,6 +68,16 @@ from dpctl.tensor import __array_api_version__, DLDeviceType
 from .dpnp_array import dpnp_array as ndarray
 from .dpnp_array_api_info import __array_namespace_info__
 from .dpnp_flatiter import flatiter as flatiter
+from .dpnp_memory import MemoryPool as MemoryPool
+from .dpnp_memory import PinnedMemoryPool as PinnedMemoryPool
+from .dpnp_memory import (
+    get_default_pinned_memory_pool as get_default_pinned_memory_pool,
+)
+from .dpnp_memory import get_memory_pool as get_memory_pool
+from .dpnp_memory import set_memory_pool as set_memory_pool
+from .dpnp_profiler import profiler as profiler
+from .dpnp_sharded import ShardedArray as ShardedArray
+from .dpnp_sharded import shard as shard
 from .dpnp_iface_types import *
 from .dpnp_iface import *
 from .dpnp_iface import __all__ as _iface__all__
@@ -78,6 +88,22 @@ from ._version import get_versions
 __all__ = _iface__all__
 __all__ += _ifaceutils__all__
 
+# record calls of the public functions by dpnp.profiler
+from . import fft, linalg, random, sparse
+from .dpnp_profiler import register_public_functions
+
+register_public_functions(
+    [
+        (sys.modules[__name__], ""),
+        (fft, "fft."),
+        (linalg, "linalg."),
+        (random, "random."),
+        (sparse, "sparse."),
+        (sparse.linalg, "sparse.linalg."),
+    ]
+)
+del register_public_functions
+
 
 __version__ = get_versions()["version"]
 del get_versions
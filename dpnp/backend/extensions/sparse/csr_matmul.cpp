@@ -0,0 +1,287 @@
+//*****************************************************************************
+// Copyright (c) 2025, Intel Corporation
+// All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+// - Redistributions of source code must retain the above copyright notice,
+//   this list of conditions and the following disclaimer.
+// - Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+// LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+// CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+// SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+// INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+// CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+// ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+
+#include <stdexcept>
+
+#include <pybind11/pybind11.h>
+
+// dpctl tensor headers
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_utils.hpp"
+
+#include "csr_matmul.hpp"
+#include "types_matrix.hpp"
+
+namespace dpnp::extensions::sparse
+{
+namespace mkl_sparse = oneapi::mkl::sparse;
+namespace py = pybind11;
+namespace type_utils = dpctl::tensor::type_utils;
+
+typedef sycl::event (*csr_matmul_impl_fn_ptr_t)(
+    sycl::queue &,
+    oneapi::mkl::transpose,
+    const std::int64_t,
+    const std::int64_t,
+    char *,
+    char *,
+    char *,
+    const char *,
+    const bool,
+    const std::int64_t,
+    const std::int64_t,
+    char *,
+    const std::int64_t,
+    const std::vector<sycl::event> &);
+
+static csr_matmul_impl_fn_ptr_t
+    csr_matmul_dispatch_table[dpctl_td_ns::num_types][dpctl_td_ns::num_types];
+
+template <typename T, typename intT>
+static sycl::event csr_matmul_impl(sycl::queue &exec_q,
+                                   oneapi::mkl::transpose transA,
+                                   const std::int64_t num_rows,
+                                   const std::int64_t num_cols,
+                                   char *indptr,
+                                   char *indices,
+                                   char *data,
+                                   const char *dense,
+                                   const bool is_matrix,
+                                   const std::int64_t columns,
+                                   const std::int64_t ldb,
+                                   char *result,
+                                   const std::int64_t ldc,
+                                   const std::vector<sycl::event> &depends)
+{
+    type_utils::validate_type_for_device<T>(exec_q);
+
+    intT *row_ptr = reinterpret_cast<intT *>(indptr);
+    intT *col_ind = reinterpret_cast<intT *>(indices);
+    T *val = reinterpret_cast<T *>(data);
+    const T *b = reinterpret_cast<const T *>(dense);
+    T *c = reinterpret_cast<T *>(result);
+
+    std::stringstream error_msg;
+    bool is_exception_caught = false;
+
+    mkl_sparse::matrix_handle_t handle = nullptr;
+    sycl::event matmul_event;
+    try {
+        mkl_sparse::init_matrix_handle(&handle);
+
+        // the handle only refers to the arrays, no data is copied
+        sycl::event set_data_event = mkl_sparse::set_csr_data(
+            exec_q, handle, static_cast<intT>(num_rows),
+            static_cast<intT>(num_cols), oneapi::mkl::index_base::zero, row_ptr,
+            col_ind, val, depends);
+
+        if (is_matrix) {
+            matmul_event = mkl_sparse::gemm(
+                exec_q,
+                oneapi::mkl::layout::row_major, // Layout of dense matrices.
+                transA, // Defines the transpose operation for the sparse
+                        // matrix: 'N' indicates no transpose, 'T' for
+                        // transpose.
+                oneapi::mkl::transpose::nontrans, // No transpose of B.
+                T(1),    // Scaling factor for the matrix-matrix product.
+                handle,  // Handle of the sparse matrix A.
+                b,       // Pointer to the dense matrix B.
+                columns, // Number of columns of matrices B and C.
+                ldb,     // Leading dimension of matrix B.
+                T(0),    // Scaling factor for matrix C.
+                c,   // Pointer to output matrix C, where the result is stored.
+                ldc, // Leading dimension of matrix C.
+                {set_data_event});
+        }
+        else {
+            matmul_event = mkl_sparse::gemv(exec_q, transA, T(1), handle, b,
+                                            T(0), c, {set_data_event});
+        }
+        matmul_event =
+            mkl_sparse::release_matrix_handle(exec_q, &handle, {matmul_event});
+    } catch (oneapi::mkl::exception const &e) {
+        error_msg << "Unexpected MKL exception caught during sparse "
+                     "matmul() call:\nreason: "
+                  << e.what();
+        is_exception_caught = true;
+    } catch (sycl::exception const &e) {
+        error_msg << "Unexpected SYCL exception caught during sparse "
+                     "matmul() call:\n"
+                  << e.what();
+        is_exception_caught = true;
+    }
+
+    if (is_exception_caught) // an unexpected error occurs
+    {
+        if (handle != nullptr) {
+            mkl_sparse::release_matrix_handle(exec_q, &handle).wait();
+        }
+        throw std::runtime_error(error_msg.str());
+    }
+
+    return matmul_event;
+}
+
+std::pair<sycl::event, sycl::event>
+    csr_matmul(sycl::queue &exec_q,
+               const std::int64_t num_rows,
+               const std::int64_t num_cols,
+               const dpctl::tensor::usm_ndarray &indptr,
+               const dpctl::tensor::usm_ndarray &indices,
+               const dpctl::tensor::usm_ndarray &data,
+               const dpctl::tensor::usm_ndarray &dense,
+               const dpctl::tensor::usm_ndarray &result,
+               const bool transpose,
+               const std::vector<sycl::event> &depends)
+{
+    const int dense_nd = dense.get_ndim();
+
+    if ((indptr.get_ndim() != 1) || (indices.get_ndim() != 1) ||
+        (data.get_ndim() != 1))
+    {
+        throw py::value_error("The sparse matrix arrays must be 1-D.");
+    }
+    if ((dense_nd != 1 && dense_nd != 2) || (result.get_ndim() != dense_nd)) {
+        throw py::value_error("The dense arrays have incorrect dimensions.");
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(dense, result) || overlap(data, result)) {
+        throw py::value_error("Input arrays and result array are overlapping "
+                              "segments of memory");
+    }
+
+    if (!dpctl::utils::queues_are_compatible(
+            exec_q, {indptr.get_queue(), indices.get_queue(), data.get_queue(),
+                     dense.get_queue(), result.get_queue()}))
+    {
+        throw py::value_error(
+            "USM allocations are not compatible with the execution queue.");
+    }
+
+    if (!indptr.is_c_contiguous() || !indices.is_c_contiguous() ||
+        !data.is_c_contiguous() || !dense.is_c_contiguous() ||
+        !result.is_c_contiguous())
+    {
+        throw py::value_error("The arrays must be C-contiguous.");
+    }
+
+    const py::ssize_t *dense_shape = dense.get_shape_raw();
+    const py::ssize_t *result_shape = result.get_shape_raw();
+
+    if (indptr.get_size() != num_rows + 1) {
+        throw py::value_error("The size of index pointers must be equal to "
+                              "the number of rows plus one.");
+    }
+    if (indices.get_size() != data.get_size()) {
+        throw py::value_error(
+            "The sizes of indices and data arrays must be equal.");
+    }
+
+    const std::int64_t src_rows = transpose ? num_rows : num_cols;
+    const std::int64_t dst_rows = transpose ? num_cols : num_rows;
+    if (dense_shape[0] != src_rows) {
+        throw py::value_error("The number of rows in the dense operand must "
+                              "match the sparse matrix.");
+    }
+    if (result_shape[0] != dst_rows) {
+        throw py::value_error("The number of rows in the result must match "
+                              "the sparse matrix.");
+    }
+
+    const bool is_matrix = (dense_nd == 2);
+    const std::int64_t columns = is_matrix ? dense_shape[1] : 1;
+    if (is_matrix && result_shape[1] != columns) {
+        throw py::value_error("The number of columns in the dense operand "
+                              "and in the result must be equal.");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(result);
+    dpctl::tensor::validation::AmpleMemory::throw_if_not_ample(
+        result, dst_rows * columns);
+
+    const int data_typenum = data.get_typenum();
+    const int index_typenum = indices.get_typenum();
+
+    if (data_typenum != dense.get_typenum() ||
+        data_typenum != result.get_typenum())
+    {
+        throw py::value_error("Given arrays must be of the same type.");
+    }
+    if (index_typenum != indptr.get_typenum()) {
+        throw py::value_error(
+            "Indices and index pointers must be of the same type.");
+    }
+
+    auto array_types = dpctl_td_ns::usm_ndarray_types();
+    const int type_id = array_types.typenum_to_lookup_id(data_typenum);
+    const int index_type_id = array_types.typenum_to_lookup_id(index_typenum);
+
+    csr_matmul_impl_fn_ptr_t csr_matmul_fn =
+        csr_matmul_dispatch_table[type_id][index_type_id];
+    if (csr_matmul_fn == nullptr) {
+        throw py::value_error(
+            "Types of input arrays and result array are not supported.");
+    }
+
+    const oneapi::mkl::transpose transA =
+        transpose ? oneapi::mkl::transpose::trans
+                  : oneapi::mkl::transpose::nontrans;
+
+    sycl::event matmul_ev = csr_matmul_fn(
+        exec_q, transA, num_rows, num_cols, indptr.get_data(),
+        indices.get_data(), data.get_data(), dense.get_data(), is_matrix,
+        columns, columns, result.get_data(), columns, depends);
+
+    sycl::event args_ev = dpctl::utils::keep_args_alive(
+        exec_q, {indptr, indices, data, dense, result}, {matmul_ev});
+
+    return std::make_pair(args_ev, matmul_ev);
+}
+
+template <typename fnT, typename T, typename intT>
+struct CsrMatmulContigFactory
+{
+    fnT get()
+    {
+        if constexpr (types::CsrMatmulTypePairSupportFactory<T,
+                                                             intT>::is_defined)
+        {
+            return csr_matmul_impl<T, intT>;
+        }
+        else {
+            return nullptr;
+        }
+    }
+};
+
+void init_csr_matmul_dispatch_table(void)
+{
+    dpctl_td_ns::DispatchTableBuilder<csr_matmul_impl_fn_ptr_t,
+                                      CsrMatmulContigFactory,
+                                      dpctl_td_ns::num_types>
+        contig;
+    contig.populate_dispatch_table(csr_matmul_dispatch_table);
+}
+} // namespace dpnp::extensions::sparse
@@ -0,0 +1,66 @@
+//*****************************************************************************
+// Copyright (c) 2025, Intel Corporation
+// All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+// - Redistributions of source code must retain the above copyright notice,
+//   this list of conditions and the following disclaimer.
+// - Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+// LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+// CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+// SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+// INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+// CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+// ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+//
+// This file defines functions of dpnp.backend._sparse_impl extensions
+//
+//*****************************************************************************
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#if not defined(USE_ONEMKL_INTERFACES)
+#include "csr_matmul.hpp"
+
+namespace sparse_ns = dpnp::extensions::sparse;
+#endif // USE_ONEMKL_INTERFACES
+
+namespace py = pybind11;
+
+PYBIND11_MODULE(_sparse_impl, m)
+{
+#if not defined(USE_ONEMKL_INTERFACES)
+    sparse_ns::init_csr_matmul_dispatch_table();
+
+    {
+        m.def("_csr_matmul", &sparse_ns::csr_matmul,
+              "Call `gemv` or `gemm` from OneMKL sparse BLAS library to "
+              "compute the product of a sparse matrix in CSR format, or of "
+              "its transpose, and a dense vector or matrix.",
+              py::arg("sycl_queue"), py::arg("num_rows"), py::arg("num_cols"),
+              py::arg("indptr"), py::arg("indices"), py::arg("data"),
+              py::arg("dense"), py::arg("result"), py::arg("transpose"),
+              py::arg("depends") = py::list());
+    }
+#endif // USE_ONEMKL_INTERFACES
+
+    m.def(
+        "_is_available",
+        [](void) {
+#if defined(USE_ONEMKL_INTERFACES)
+            return false;
+#else
+            return true;
+#endif // USE_ONEMKL_INTERFACES
+        },
+        "Check if the OneMKL sparse BLAS library can be used.");
+}
@@ -26,6 +26,9 @@
 
 
 import os
+import threading
+import time
+import warnings
 
 __DPNP_ORIGIN__ = int(os.getenv("DPNP_ORIGIN", 0))
 """
@@ -55,3 +58,239 @@ __DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK__ = int(
 """
 Trigger non-implemented exception when DPNP fallbacks on NumPy implementation
 """
+
+
+class NumPyFallbackWarning(RuntimeWarning):
+    """
+    Warning issued when a dpnp function falls back on NumPy implementation
+    and the fallback policy of the function is ``"warn"``.
+
+    """
+
+
+_FALLBACK_POLICIES = ("allow", "warn", "raise")
+
+_fallback_lock = threading.Lock()
+_fallback_default_policy = None
+_fallback_policies = {}
+_fallback_stats = {}
+
+
+def _check_fallback_policy(policy):
+    if policy not in _FALLBACK_POLICIES:
+        raise ValueError(
+            f"Fallback policy must be one of {_FALLBACK_POLICIES}, "
+            f"but got {policy!r}"
+        )
+
+
+def get_fallback_policy(name=None):
+    """
+    Return the policy applied when a dpnp function falls back on NumPy.
+
+    Parameters
+    ----------
+    name : {None, str}, optional
+        Name of the NumPy function the fallback is made on, e.g.
+        ``"partition"``. If ``None``, the default policy is returned.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : {"allow", "warn", "raise"}
+        The fallback policy. The default policy is ``"raise"`` unless
+        ``DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK`` environment variable is set
+        to ``0`` or another default is set by :func:`set_fallback_policy`.
+
+    """
+
+    with _fallback_lock:
+        policy = _fallback_policies.get(name) if name is not None else None
+        if policy is None:
+            policy = _fallback_default_policy
+    if policy is None:
+        policy = (
+            "raise"
+            if __DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK__ == 1
+            else "allow"
+        )
+    return policy
+
+
+def set_fallback_policy(policy, name=None):
+    """
+    Set the policy applied when a dpnp function falls back on NumPy.
+
+    Parameters
+    ----------
+    policy : {None, "allow", "warn", "raise"}
+        ``"allow"`` to fall back silently, ``"warn"`` to issue
+        :class:`NumPyFallbackWarning`, ``"raise"`` to raise
+        ``NotImplementedError`` instead of falling back. ``None`` resets the
+        policy, so the default one is applied.
+    name : {None, str}, optional
+        Name of the NumPy function the fallback is made on, e.g.
+        ``"partition"``. If ``None``, the default policy applied to all the
+        functions without own policy is set.
+
+        Default: ``None``.
+
+    Notes
+    -----
+    A policy set for a function is applied to every fallback on it, while
+    the default policy is not applied to the fallbacks which are the only
+    available implementation of a function, such as ``dpnp.random.seed``.
+
+    """
+
+    global _fallback_default_policy
+
+    if policy is not None:
+        _check_fallback_policy(policy)
+
+    with _fallback_lock:
+        if name is None:
+            _fallback_default_policy = policy
+        elif policy is None:
+            _fallback_policies.pop(name, None)
+        else:
+            _fallback_policies[name] = policy
+
+
+def get_fallback_stats():
+    """
+    Return the process-wide statistics of fallbacks on NumPy.
+
+    Returns
+    -------
+    out : dict
+        Dictionary keyed by the name of the NumPy function the fallback is
+        made on. Each value is a dictionary with the number of fallbacks
+        ``"count"``, the number of bytes copied from the device to the host
+        ``"bytes_to_host"`` and back ``"bytes_to_device"``, and the total
+        time in seconds spent in the fallbacks ``"time"``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.config.reset_fallback_stats()
+    >>> np.config.set_fallback_policy("allow", "partition")
+    >>> a = np.array([3, 1, 2])
+    >>> _ = np.partition(a, 1)  # doctest: +SKIP
+    >>> np.config.get_fallback_stats()["partition"]["count"]  # doctest: +SKIP
+    1
+
+    """
+
+    with _fallback_lock:
+        return {name: dict(s) for name, s in _fallback_stats.items()}
+
+
+def reset_fallback_stats():
+    """Reset the statistics returned by :func:`get_fallback_stats`."""
+
+    with _fallback_lock:
+        _fallback_stats.clear()
+
+
+def _record_fallback(name, bytes_to_host, bytes_to_device, time):
+    """Add a fallback on NumPy `name` function to the statistics."""
+
+    with _fallback_lock:
+        stats = _fallback_stats.get(name)
+        if stats is None:
+            stats = _fallback_stats[name] = {
+                "count": 0,
+                "bytes_to_host": 0,
+                "bytes_to_device": 0,
+                "time": 0.0,
+            }
+
+        stats["count"] += 1
+        stats["bytes_to_host"] += bytes_to_host
+        stats["bytes_to_device"] += bytes_to_device
+        stats["time"] += time
+
+
+def _apply_fallback_policy(
+    name, allow_fallback=False, details="", stacklevel=2
+):
+    """
+    Apply the policy of a fallback on NumPy `name` function and report the
+    fallback to the active profiler, where `allow_fallback` marks the
+    fallback as the only implementation available and `details` describe the
+    call in the error message.
+
+    """
+
+    policy = _get_fallback_policy(name, allow_fallback)
+    if policy == "raise":
+        raise NotImplementedError(
+            f"Requested function={name}{details} isn't currently supported "
+            "and would fall back on NumPy implementation. Define environment "
+            "variable `DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK` to `0` or use "
+            "`dpnp.config.set_fallback_policy` if the fall back is required "
+            "to be supported without raising an exception."
+        )
+    if policy == "warn":
+        warnings.warn(
+            f"Requested function={name} falls back on NumPy implementation",
+            NumPyFallbackWarning,
+            stacklevel=stacklevel + 1,
+        )
+
+    # pylint: disable=import-outside-toplevel
+    from dpnp import dpnp_profiler
+
+    prof = dpnp_profiler._active
+    if prof is not None:
+        prof._record_fallback(name)
+
+
+class _Fallback:
+    """
+    Context manager of a fallback on NumPy `name` function made without
+    ``call_origin``.
+
+    The fallback policy is applied when entering the context, and the
+    fallback is added to the statistics on exit. The numbers of bytes copied
+    are to be added to `bytes_to_host` and `bytes_to_device` attributes
+    within the context.
+
+    """
+
+    def __init__(self, name, allow_fallback=False):
+        self.name = name
+        self.allow_fallback = allow_fallback
+        self.bytes_to_host = 0
+        self.bytes_to_device = 0
+        self._start = 0.0
+
+    def __enter__(self):
+        _apply_fallback_policy(self.name, self.allow_fallback, stacklevel=3)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            _record_fallback(
+                self.name,
+                self.bytes_to_host,
+                self.bytes_to_device,
+                time.perf_counter() - self._start,
+            )
+
+
+def _get_fallback_policy(name, allow_fallback=False):
+    """
+    Return the policy of a fallback on NumPy `name` function, where
+    `allow_fallback` marks the fallback as the only implementation available.
+
+    """
+
+    with _fallback_lock:
+        policy = _fallback_policies.get(name)
+    if policy is None:
+        policy = "allow" if allow_fallback else get_fallback_policy()
+    return policy
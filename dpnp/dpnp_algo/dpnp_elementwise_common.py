@@ -35,6 +35,7 @@ from dpctl.tensor._elementwise_common import (
 
 import dpnp
 import dpnp.backend.extensions.vm._vm_impl as vmi
+import dpnp.dpnp_profiler as dpnp_profiler
 from dpnp.dpnp_array import dpnp_array
 
 __all__ = [
@@ -137,6 +138,7 @@ class DPNPUnaryFunc(UnaryElementwiseFunc):
         )
         self.__name__ = "DPNPUnaryFunc"
 
+    @dpnp_profiler.record_call
     def __call__(
         self,
         x,
@@ -301,6 +303,7 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
         )
         self.__name__ = "DPNPBinaryFunc"
 
+    @dpnp_profiler.record_call
     def __call__(
         self,
         x1,
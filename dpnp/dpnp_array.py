@@ -24,10 +24,15 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+import os
+import pickle
+
 import dpctl.tensor as dpt
+import numpy
 from dpctl.tensor._numpy_helper import AxisError
 
 import dpnp
+import dpnp.dpnp_profiler as dpnp_profiler
 
 
 def _get_unwrapped_index_key(key):
@@ -50,6 +55,22 @@ def _get_unwrapped_index_key(key):
     return key
 
 
+def _is_array_type(obj):
+    """Check if `obj` is the array type or its subclass."""
+    return isinstance(obj, type) and issubclass(obj, dpnp_array)
+
+
+def _rebuild_array(data, dtype, shape, order, usm_type, device):
+    """
+    Rebuild an array from a pickled state returned by
+    :meth:`dpnp_array.__reduce_ex__`.
+
+    """
+
+    a = numpy.frombuffer(data, dtype=dtype).reshape(shape, order=order)
+    return dpnp.asarray(a, usm_type=usm_type, device=device)
+
+
 class dpnp_array:
     """
     Multi-dimensional array object.
@@ -97,6 +118,10 @@ class dpnp_array:
             array_namespace=dpnp,
         )
 
+        prof = dpnp_profiler._active
+        if prof is not None:
+            prof._record_array(self._array_obj)
+
     @property
     def __sycl_usm_array_interface__(self):
         return self._array_obj.__sycl_usm_array_interface__
@@ -227,6 +252,7 @@ class dpnp_array:
 
         return self._array_obj.__array_namespace__(api_version=api_version)
 
+    @dpnp_profiler.host_sync
     def __bool__(self):
         """``True`` if self else ``False``."""
         return self._array_obj.__bool__()
@@ -234,6 +260,7 @@ class dpnp_array:
     # '__class__',
     # `__class_getitem__`,
 
+    @dpnp_profiler.host_sync
     def __complex__(self):
         return self._array_obj.__complex__()
 
@@ -333,6 +360,7 @@ class dpnp_array:
         """Return ``self==value``."""
         return dpnp.equal(self, other)
 
+    @dpnp_profiler.host_sync
     def __float__(self):
         return self._array_obj.__float__()
 
@@ -419,12 +447,14 @@ class dpnp_array:
         dpnp.multiply(self, other, out=self)
         return self
 
+    @dpnp_profiler.host_sync
     def __index__(self):
         return self._array_obj.__index__()
 
     # '__init__',
     # '__init_subclass__',
 
+    @dpnp_profiler.host_sync
     def __int__(self):
         return self._array_obj.__int__()
 
@@ -528,7 +558,59 @@ class dpnp_array:
 
     # '__rdivmod__',
     # '__reduce__',
-    # '__reduce_ex__',
+
+    def __reduce_ex__(self, protocol):
+        """
+        Return state of the array for pickling.
+
+        With pickle protocol 5 the data are passed out-of-band as
+        :class:`pickle.PickleBuffer` over host-accessible USM memory. The
+        memory of a contiguous array of ``"host"`` or ``"shared"`` USM type
+        is exported without copying, otherwise the data are copied once into
+        a host (pinned) USM allocation. With older protocols the data are
+        serialized as bytes.
+
+        The array is rebuilt with the same USM type on the device selected
+        by the filter string of the original device.
+
+        """
+
+        usm_ary = self._array_obj
+        flags = usm_ary.flags
+        order = "F" if flags.f_contiguous and not flags.c_contiguous else "C"
+
+        if usm_ary.usm_type == "device" or not (
+            flags.c_contiguous or flags.f_contiguous
+        ):
+            # stage the data in a contiguous host USM allocation
+            usm_ary = dpt.asarray(
+                usm_ary, usm_type="host", order=order, copy=True
+            )
+        dpnp.synchronize_array_data(usm_ary)
+
+        # pylint: disable=protected-access
+        data = numpy.frombuffer(
+            usm_ary.usm_data,
+            dtype=numpy.uint8,
+            count=usm_ary.nbytes,
+            offset=usm_ary._element_offset * usm_ary.itemsize,
+        )
+        if protocol >= 5:
+            data = pickle.PickleBuffer(data)
+        else:
+            data = data.tobytes()
+
+        return (
+            _rebuild_array,
+            (
+                data,
+                self.dtype,
+                self.shape,
+                order,
+                self.usm_type,
+                self.sycl_device.filter_string,
+            ),
+        )
 
     def __repr__(self):
         """Return ``repr(self)``."""
@@ -644,6 +726,10 @@ class dpnp_array:
         res = dpnp_array.__new__(dpnp_array)
         res._array_obj = usm_ary
         res._array_obj._set_namespace(dpnp)
+
+        prof = dpnp_profiler._active
+        if prof is not None:
+            prof._record_array(usm_ary)
         return res
 
     def all(self, axis=None, out=None, keepdims=False, *, where=True):
@@ -758,6 +844,7 @@ class dpnp_array:
             self, axis, kind, order, descending=descending, stable=stable
         )
 
+    @dpnp_profiler.host_sync
     def asnumpy(self):
         """
         Copy content of the array into :class:`numpy.ndarray` instance of
@@ -771,7 +858,7 @@ class dpnp_array:
 
         """
 
-        return dpt.asnumpy(self._array_obj)
+        return dpnp.asnumpy(self, order="K")
 
     def astype(
         self,
@@ -1198,6 +1285,7 @@ class dpnp_array:
         else:
             raise TypeError("array does not have imaginary part to set")
 
+    @dpnp_profiler.host_sync
     def item(self, *args):
         """
         Copy an element of an array to a standard Python scalar and return it.
@@ -1543,6 +1631,70 @@ class dpnp_array:
 
         return dpnp.searchsorted(self, v, side=side, sorter=sorter)
 
+    def set(self, arr, /, *, blocking=True):
+        """
+        Copy the data of a NumPy array into the array.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            The source array of the same shape and data type as the array.
+        blocking : bool, optional
+            If ``False``, the copy runs in a background thread and a future
+            of the copy is returned immediately. Neither `arr` nor the array
+            must be used until the copy is done.
+
+            Default: ``True``.
+
+        Returns
+        -------
+        out : {None, concurrent.futures.Future}
+            ``None``, or a future resolving to the array if `blocking` is
+            ``False``.
+
+        Notes
+        -----
+        The data of a large array are copied by chunks through a pair of host
+        USM (pinned) buffers from :obj:`dpnp.get_default_pinned_memory_pool`,
+        so the host copy of a chunk overlaps with the copy of the previous
+        one to the device.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> import numpy
+        >>> a = np.empty(3, dtype=np.int32)
+        >>> a.set(numpy.array([1, 2, 3], dtype=numpy.int32))
+        >>> a
+        array([1, 2, 3], dtype=int32)
+
+        """
+
+        # lazy import avoids circular imports
+        from .dpnp_utils.dpnp_utils_transfer import (
+            dpnp_copy_from_host,
+            submit_transfer,
+        )
+
+        if not isinstance(arr, numpy.ndarray):
+            raise TypeError(
+                f"Only numpy.ndarray can be set, but got {type(arr)}"
+            )
+        if arr.dtype != self.dtype:
+            raise TypeError(
+                f"{arr.dtype} array cannot be set to {self.dtype} array"
+            )
+        if arr.shape != self.shape:
+            raise ValueError(
+                f"Shape mismatch: array of shape {arr.shape} cannot be set "
+                f"to array of shape {self.shape}"
+            )
+
+        if blocking:
+            dpnp_copy_from_host(self, arr)
+            return None
+        return submit_transfer(dpnp_copy_from_host, self, arr)
+
     # 'setfield',
     # 'setflags',
 
@@ -1864,8 +2016,96 @@ class dpnp_array:
         return dpnp_array._create_from_usm_ndarray(usm_res)
 
     # 'tobytes',
-    # 'tofile',
-    # 'tolist',
+
+    def tofile(self, fid, /, sep="", format="%s"):
+        """
+        Write array to a file as text or binary (default).
+
+        Data is always written in 'C' order, independent of the order of `a`.
+        The data produced by this method can be recovered using the function
+        :obj:`dpnp.fromfile`.
+
+        For full documentation refer to :obj:`numpy.ndarray.tofile`.
+
+        Parameters
+        ----------
+        fid : {file, str, pathlib.Path}
+            An open file object, or a string containing a filename.
+        sep : str, optional
+            Separator between array items for text output. If ``""`` (empty),
+            a binary file is written.
+
+            Default: ``""``.
+        format : str, optional
+            Format string for text file output. Each entry in the array is
+            formatted to text by first converting it to the closest Python
+            type, and then using ``format % item``.
+
+            Default: ``"%s"``.
+
+        Notes
+        -----
+        A binary file is written by chunks copied from the device into a pair
+        of host USM buffers, and writing of a chunk overlaps with copying of
+        the next one. A text file is written from a copy of the array on the
+        host.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> from tempfile import TemporaryFile
+        >>> fh = TemporaryFile()
+        >>> a = np.arange(4, dtype=np.int32)
+        >>> a.tofile(fh)
+        >>> _ = fh.seek(0)
+        >>> np.fromfile(fh, dtype=np.int32)
+        array([0, 1, 2, 3], dtype=int32)
+
+        """
+
+        if sep != "":
+            self.asnumpy().tofile(fid, sep=sep, format=format)
+            return
+
+        # lazy import avoids circular imports
+        from .dpnp_utils.dpnp_utils_io import dpnp_write_array
+
+        if hasattr(fid, "write"):
+            dpnp_write_array(fid, self)
+        else:
+            with open(os.fspath(fid), "wb") as fh:
+                dpnp_write_array(fh, self)
+
+    @dpnp_profiler.host_sync
+    def tolist(self):
+        """
+        Return the array as an ``a.ndim``-levels deep nested list of Python
+        scalars.
+
+        For full documentation refer to :obj:`numpy.ndarray.tolist`.
+
+        The data is copied to the host by a single transfer.
+
+        Returns
+        -------
+        out : {object, list}
+            The possibly nested list of array elements, or a Python scalar
+            for a zero-dimensional array.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> a = np.array([[1, 2], [3, 4]])
+        >>> a.tolist()
+        [[1, 2], [3, 4]]
+
+        >>> a = np.array(1)
+        >>> a.tolist()
+        1
+
+        """
+
+        return self.asnumpy().tolist()
 
     def trace(self, offset=0, axis1=0, axis2=1, dtype=None, out=None):
         """
@@ -1979,5 +2219,146 @@ class dpnp_array:
             correction=correction,
         )
 
+    def view(self, /, dtype=None, *, type=None):
+        """
+        New view of array with the same data.
+
+        For full documentation refer to :obj:`numpy.ndarray.view`.
+
+        Parameters
+        ----------
+        dtype : {None, str, dtype object}, optional
+            The desired data type of the returned view, e.g.
+            :obj:`dpnp.float32` or :obj:`dpnp.int16`. By default, it results
+            in the view having the same data type.
+
+            Default: ``None``.
+        type : {None, type}, optional
+            Type of the returned view, e.g. a subclass of :class:`dpnp.ndarray`.
+            By default, it results in type preservation.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            A view on the same USM allocation reinterpreting its memory with
+            `dtype`.
+
+        Notes
+        -----
+        Passing ``None`` for `dtype` is the same as omitting the parameter,
+        opposite to NumPy where ``None`` means the default floating-point
+        data type.
+
+        If the data type of a different itemsize is requested, the last axis
+        of the array has to be contiguous, its size in bytes has to be a
+        multiple of the new itemsize, and the strides of the other axes and
+        the offset of the array in the allocation in bytes have to be
+        multiples of the new itemsize too.
 
-# 'view'
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> x = np.ones((4,), dtype=np.float32)
+        >>> xv = x.view(dtype=np.int32)
+        >>> xv[:] = 0
+        >>> xv
+        array([0, 0, 0, 0], dtype=int32)
+
+        However, views that change dtype are totally fine for arrays with a
+        contiguous last axis, even if the rest of the axes are not
+        C-contiguous:
+
+        >>> x = np.arange(2 * 3 * 4, dtype=np.int8).reshape(2, 3, 4)
+        >>> x.transpose(1, 0, 2).view(np.int16)
+        array([[[ 256,  770],
+                [3340, 3854]],
+        <BLANKLINE>
+               [[1284, 1798],
+                [4368, 4882]],
+        <BLANKLINE>
+               [[2312, 2826],
+                [5396, 5910]]], dtype=int16)
+
+        A complex array can be viewed as pairs of its real and imaginary
+        parts:
+
+        >>> z = np.array([1 + 2j, 3 + 4j], dtype=np.complex64)
+        >>> z.view(np.float32)
+        array([1., 2., 3., 4.], dtype=float32)
+
+        """
+
+        if _is_array_type(dtype):
+            if type is not None:
+                raise ValueError("Cannot specify output type twice")
+            dtype, type = None, dtype
+
+        if type is None:
+            type = dpnp_array
+        elif not _is_array_type(type):
+            raise TypeError(
+                f"Type must be a sub-type of ndarray type, but got {type}"
+            )
+
+        usm_ary = self._array_obj
+        old_dtype = usm_ary.dtype
+        new_dtype = old_dtype if dtype is None else dpnp.dtype(dtype)
+
+        shape = list(usm_ary.shape)
+        strides = list(usm_ary.strides)
+        # pylint: disable=protected-access
+        offset = usm_ary._element_offset
+
+        old_sz = old_dtype.itemsize
+        new_sz = new_dtype.itemsize
+        if old_sz != new_sz:
+            if usm_ary.ndim == 0:
+                raise ValueError(
+                    "Changing the dtype of a 0d array is only supported if "
+                    "the itemsize is unchanged"
+                )
+            if shape[-1] != 1 and strides[-1] != 1:
+                raise ValueError(
+                    "To change to a dtype of a different size, the last axis "
+                    "must be contiguous"
+                )
+
+            last_nbytes = shape[-1] * old_sz
+            if last_nbytes % new_sz != 0:
+                if new_sz > old_sz:
+                    raise ValueError(
+                        "When changing to a larger dtype, its size must be a "
+                        "divisor of the total size in bytes of the last axis "
+                        "of the array"
+                    )
+                raise ValueError(
+                    "When changing to a smaller dtype, its size must be a "
+                    "divisor of the size of original dtype"
+                )
+
+            # strides and offset are counted in elements of the new dtype
+            if (
+                any((st * old_sz) % new_sz for st in strides[:-1])
+                or (offset * old_sz) % new_sz
+            ):
+                raise ValueError(
+                    "The strides and the offset of the array in bytes must be "
+                    "multiples of the size of the requested dtype"
+                )
+
+            shape[-1] = last_nbytes // new_sz
+            strides = [st * old_sz // new_sz for st in strides[:-1]] + [1]
+            offset = offset * old_sz // new_sz
+
+        res = dpnp_array.__new__(type)
+        res._array_obj = dpt.usm_ndarray(
+            shape,
+            dtype=new_dtype,
+            buffer=usm_ary,
+            strides=tuple(strides),
+            offset=offset,
+            array_namespace=dpnp,
+        )
+        return res
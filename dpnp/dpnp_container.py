@@ -34,11 +34,17 @@ This module contains code and dependency on different containers used in DPNP
 """
 
 
+import math
+import numbers
+import operator
+
 import dpctl.tensor as dpt
 import dpctl.utils as dpu
+import numpy
 
 import dpnp
 from dpnp.dpnp_array import dpnp_array
+from dpnp.dpnp_memory import get_memory_pool
 
 __all__ = [
     "arange",
@@ -54,6 +60,51 @@ __all__ = [
 ]
 
 
+def _fill(array_obj, value):
+    """Fill USM array allocated from a memory pool with `value`."""
+
+    # lazy import avoids circular imports
+    from .dpnp_algo.dpnp_fill import dpnp_fill
+
+    dpnp_fill(array_obj, value)
+    return array_obj
+
+
+def _pool_empty(shape, dtype, order, usm_type, sycl_queue):
+    """
+    Allocate an uninitialized USM array from the memory pool in use.
+
+    Returns ``None`` if no memory pool is in use or the arguments need
+    to be validated by `dpctl.tensor` module.
+
+    """
+
+    pool = get_memory_pool()
+    if pool is None or order not in ("C", "F"):
+        return None
+
+    # lazy import avoids circular imports
+    from .dpnp_utils.dpnp_utils_transfer import is_device_dtype
+
+    if dtype is None:
+        dtype = dpnp.default_float_type(sycl_queue=sycl_queue)
+    try:
+        dtype = numpy.dtype(dtype)
+        if not isinstance(shape, (tuple, list)):
+            shape = (shape,)
+        shape = tuple(operator.index(n) for n in shape)
+    except TypeError:
+        return None
+
+    if any(n < 0 for n in shape) or not is_device_dtype(
+        dtype, sycl_queue=sycl_queue
+    ):
+        return None
+
+    mem = pool.malloc(math.prod(shape) * dtype.itemsize, usm_type, sycl_queue)
+    return dpt.usm_ndarray(shape, dtype=dtype, buffer=mem, order=order)
+
+
 def arange(
     start,
     /,
@@ -118,6 +169,21 @@ def asarray(
             x1_obj, device=device, sycl_queue=sycl_queue
         )
 
+        # large NumPy arrays are copied by chunks through pinned buffers
+        if isinstance(x1_obj, numpy.ndarray) and copy is not False:
+            # lazy import avoids circular imports
+            from .dpnp_utils.dpnp_utils_transfer import dpnp_asarray_from_host
+
+            array_obj = dpnp_asarray_from_host(
+                x1_obj,
+                dtype=dtype,
+                order=order,
+                usm_type=usm_type,
+                sycl_queue=sycl_queue_normalized,
+            )
+            if array_obj is not None:
+                return dpnp_array._create_from_usm_ndarray(array_obj)
+
         array_obj = dpt.asarray(
             x1_obj,
             dtype=dtype,
@@ -161,13 +227,17 @@ def empty(
         order = "C"
 
     """Creates `dpnp_array` from uninitialized USM allocation."""
-    array_obj = dpt.empty(
-        shape,
-        dtype=dtype,
-        order=order,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue_normalized,
+    array_obj = _pool_empty(
+        shape, dtype, order, usm_type, sycl_queue_normalized
     )
+    if array_obj is None:
+        array_obj = dpt.empty(
+            shape,
+            dtype=dtype,
+            order=order,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue_normalized,
+        )
     return dpnp_array._create_from_usm_ndarray(array_obj)
 
 
@@ -227,14 +297,29 @@ def full(
         fill_value = fill_value.get_array()
 
     """Creates `dpnp_array` having a specified shape, filled with fill_value."""
-    array_obj = dpt.full(
-        shape,
-        fill_value,
-        dtype=dtype,
-        order=order,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue_normalized,
-    )
+    array_obj = None
+    if dtype is not None and isinstance(
+        fill_value, (numbers.Number, numpy.bool_)
+    ):
+        array_obj = _pool_empty(
+            shape,
+            dtype,
+            order,
+            "device" if usm_type is None else usm_type,
+            sycl_queue_normalized,
+        )
+
+    if array_obj is None:
+        array_obj = dpt.full(
+            shape,
+            fill_value,
+            dtype=dtype,
+            order=order,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue_normalized,
+        )
+    else:
+        _fill(array_obj, fill_value)
     return dpnp_array._create_from_usm_ndarray(array_obj)
 
 
@@ -256,13 +341,19 @@ def ones(
         order = "C"
 
     """Creates `dpnp_array` of ones with the given shape, dtype, and order."""
-    array_obj = dpt.ones(
-        shape,
-        dtype=dtype,
-        order=order,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue_normalized,
+    array_obj = _pool_empty(
+        shape, dtype, order, usm_type, sycl_queue_normalized
     )
+    if array_obj is None:
+        array_obj = dpt.ones(
+            shape,
+            dtype=dtype,
+            order=order,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue_normalized,
+        )
+    else:
+        _fill(array_obj, 1)
     return dpnp_array._create_from_usm_ndarray(array_obj)
 
 
@@ -296,11 +387,17 @@ def zeros(
         order = "C"
 
     """Creates `dpnp_array` of zeros with the given shape, dtype, and order."""
-    array_obj = dpt.zeros(
-        shape,
-        dtype=dtype,
-        order=order,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue_normalized,
+    array_obj = _pool_empty(
+        shape, dtype, order, usm_type, sycl_queue_normalized
     )
+    if array_obj is None:
+        array_obj = dpt.zeros(
+            shape,
+            dtype=dtype,
+            order=order,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue_normalized,
+        )
+    else:
+        _fill(array_obj, 0)
     return dpnp_array._create_from_usm_ndarray(array_obj)
@@ -30,7 +30,20 @@ import dpnp
 
 
 class flatiter:
-    """Flat iterator object to iterate over arrays."""
+    """
+    Flat iterator object to iterate over arrays.
+
+    Iteration copies the elements to the host by blocks of
+    :attr:`block_size` elements, with a single transfer per block, and
+    yields them as NumPy scalars.
+
+    Indexing with a slice or with an array of indices is performed on
+    the device by a single gather (or scatter for assignment) kernel.
+
+    """
+
+    block_size = 65536
+    """Number of elements copied to the host at once while iterating."""
 
     def __init__(self, X):
         if type(X) is not dpnp.ndarray:
@@ -40,6 +53,60 @@ class flatiter:
         self.arr_ = X
         self.size_ = X.size
         self.i_ = 0
+        self.block_ = None
+        self.block_start_ = 0
+
+    def _flat_indices(self, key):
+        """
+        Convert a slice or an array of indices into an array of flat indices
+        or return ``None`` for any other key.
+
+        Raises ``IndexError`` if a mask does not match the size of the array
+        or any index is out of bounds. The bounds are checked by a single
+        reduction on the device.
+
+        """
+
+        if isinstance(key, slice):
+            return dpnp.arange(
+                *key.indices(self.size_),
+                usm_type=self.arr_.usm_type,
+                sycl_queue=self.arr_.sycl_queue,
+            )
+        if dpnp.is_supported_array_type(key) or isinstance(key, list):
+            key = dpnp.asarray(
+                key,
+                usm_type=self.arr_.usm_type,
+                sycl_queue=self.arr_.sycl_queue,
+            )
+            if key.dtype == dpnp.bool:
+                if key.ndim != 1 or key.size != self.size_:
+                    raise IndexError(
+                        "boolean index did not match indexed flat iterator of "
+                        f"size {self.size_}, got mask of shape {key.shape}"
+                    )
+                return dpnp.flatnonzero(key)
+
+            if key.size > 0 and dpnp.any(
+                (key < -self.size_) | (key >= self.size_)
+            ):
+                raise IndexError(
+                    f"index is out of bounds for flat iterator of size "
+                    f"{self.size_}"
+                )
+            return key
+        return None
+
+    def _flat_view(self):
+        """
+        Return a flat view of the array if it is C-contiguous or ``None``
+        otherwise.
+
+        """
+
+        if self.arr_.flags.c_contiguous:
+            return dpnp.ravel(self.arr_)
+        return None
 
     def _multiindex(self, i):
         nd = self.arr_.ndim
@@ -61,6 +128,17 @@ class flatiter:
         return tuple(multi_index)
 
     def __getitem__(self, key):
+        if isinstance(key, slice):
+            flat = self._flat_view()
+            if flat is not None:
+                # return a copy as NumPy does
+                return flat[key].copy()
+
+        ind = self._flat_indices(key)
+        if ind is not None:
+            # gather all the elements by one kernel
+            return dpnp.take(self.arr_, ind)
+
         idx = getattr(key, "__index__", None)
         if not callable(idx):
             raise TypeError(key)
@@ -69,6 +147,12 @@ class flatiter:
         return self.arr_.__getitem__(mi)
 
     def __setitem__(self, key, val):
+        ind = self._flat_indices(key)
+        if ind is not None:
+            # scatter all the values by one kernel
+            dpnp.put(self.arr_, ind, val)
+            return
+
         idx = getattr(key, "__index__", None)
         if not callable(idx):
             raise TypeError(key)
@@ -80,9 +164,23 @@ class flatiter:
         return self
 
     def __next__(self):
-        if self.i_ < self.size_:
-            val = self.__getitem__(self.i_)
-            self.i_ = self.i_ + 1
-            return val
-        else:
+        if self.i_ >= self.size_:
             raise StopIteration
+
+        pos = self.i_ - self.block_start_
+        if self.block_ is None or pos >= self.block_.size:
+            # prefetch the next block of elements by one copy to the host
+            end = min(self.i_ + self.block_size, self.size_)
+            flat = self._flat_view()
+            if flat is None:
+                # gather the elements of a non-contiguous array every time,
+                # so the updates of the array are not missed
+                block = self[self.i_ : end]
+            else:
+                block = flat[self.i_ : end]
+            self.block_ = block.asnumpy()
+            self.block_start_ = self.i_
+            pos = 0
+
+        self.i_ = self.i_ + 1
+        return self.block_[pos]
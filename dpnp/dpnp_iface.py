@@ -49,11 +49,13 @@ import numpy
 from dpctl.tensor._device import normalize_queue_device
 
 import dpnp
+import dpnp.dpnp_profiler as dpnp_profiler
 from dpnp.dpnp_algo import *
 from dpnp.dpnp_array import dpnp_array
 from dpnp.fft import *
 from dpnp.linalg import *
 from dpnp.random import *
+from dpnp.sparse import *
 
 __all__ = [
     "are_same_logical_tensors",
@@ -78,6 +80,8 @@ from dpnp.dpnp_iface_arraycreation import *
 from dpnp.dpnp_iface_arraycreation import __all__ as __all__arraycreation
 from dpnp.dpnp_iface_bitwise import *
 from dpnp.dpnp_iface_bitwise import __all__ as __all__bitwise
+from dpnp.dpnp_iface_chunked import *
+from dpnp.dpnp_iface_chunked import __all__ as __all__chunked
 from dpnp.dpnp_iface_counting import *
 from dpnp.dpnp_iface_counting import __all__ as __all__counting
 from dpnp.dpnp_iface_functional import *
@@ -86,6 +90,8 @@ from dpnp.dpnp_iface_histograms import *
 from dpnp.dpnp_iface_histograms import __all__ as __all__histograms
 from dpnp.dpnp_iface_indexing import *
 from dpnp.dpnp_iface_indexing import __all__ as __all__indexing
+from dpnp.dpnp_iface_io import *
+from dpnp.dpnp_iface_io import __all__ as __all__io
 from dpnp.dpnp_iface_libmath import *
 from dpnp.dpnp_iface_libmath import __all__ as __all__libmath
 from dpnp.dpnp_iface_linearalgebra import *
@@ -98,6 +104,8 @@ from dpnp.dpnp_iface_mathematical import *
 from dpnp.dpnp_iface_mathematical import __all__ as __all__mathematical
 from dpnp.dpnp_iface_nanfunctions import *
 from dpnp.dpnp_iface_nanfunctions import __all__ as __all__nanfunctions
+from dpnp.dpnp_iface_polynomial import *
+from dpnp.dpnp_iface_polynomial import __all__ as __all__polynomial
 from dpnp.dpnp_iface_searching import *
 from dpnp.dpnp_iface_searching import __all__ as __all__searching
 from dpnp.dpnp_iface_sorting import *
@@ -115,19 +123,23 @@ from .dpnp_utils import (
     map_dtype_to_device,
     use_origin_backend,
 )
+from .dpnp_utils.dpnp_utils_transfer import dpnp_asnumpy
 
 __all__ += __all__arraycreation
 __all__ += __all__bitwise
+__all__ += __all__chunked
 __all__ += __all__counting
 __all__ += __all__functional
 __all__ += __all__histograms
 __all__ += __all__indexing
+__all__ += __all__io
 __all__ += __all__libmath
 __all__ += __all__linearalgebra
 __all__ += __all__logic
 __all__ += __all__manipulation
 __all__ += __all__mathematical
 __all__ += __all__nanfunctions
+__all__ += __all__polynomial
 __all__ += __all__searching
 __all__ += __all__sorting
 __all__ += __all__statistics
@@ -176,7 +188,8 @@ def are_same_logical_tensors(ar1, ar2):
     )
 
 
-def asnumpy(a, order="C"):
+@dpnp_profiler.host_sync
+def asnumpy(a, order=None, *, out=None, blocking=True):
     """
     Returns the NumPy array with input data.
 
@@ -188,27 +201,63 @@ def asnumpy(a, order="C"):
         The desired memory layout of the converted array.
         When `order` is ``'A'``, it uses ``'F'`` if `a` is column-major and
         uses ``'C'`` otherwise. And when `order` is ``'K'``, it keeps strides
-        as closely as possible.
+        as closely as possible. If ``None``, it is ``'K'`` for a dpnp or USM
+        array `a` and ``'C'`` otherwise.
 
-        Default: ``'C'``.
+        Default: ``None``.
+    out : {None, numpy.ndarray}, optional
+        The output array to copy the data of a dpnp or USM array `a` into.
+        It must have the same shape and data type as `a`. If ``None``, a new
+        array is allocated.
+
+        Default: ``None``.
+    blocking : bool, optional
+        If ``False`` and `a` is a dpnp or USM array, the copy runs in
+        a background thread and a future of the result is returned
+        immediately. `a` must not be modified until the copy is done.
+
+        Default: ``True``.
 
     Returns
     -------
-    out : numpy.ndarray
-        NumPy interpretation of input array `a`.
+    out : {numpy.ndarray, concurrent.futures.Future}
+        NumPy interpretation of input array `a`, or a future resolving to it
+        if `blocking` is ``False``.
 
     Notes
     -----
-    This function works exactly the same as :obj:`numpy.asarray`.
+    This function works exactly the same as :obj:`numpy.asarray` for input
+    which is not a dpnp or USM array.
 
-    """
+    The data of a large dpnp or USM array are copied by chunks through
+    a pair of host USM (pinned) buffers from
+    :obj:`dpnp.get_default_pinned_memory_pool`, so the copy of a chunk from
+    the device overlaps with the host copy of the previous one into `out`.
 
-    if isinstance(a, dpnp_array):
-        return a.asnumpy()
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.arange(6).reshape(2, 3)
+    >>> np.asnumpy(a)
+    array([[0, 1, 2],
+           [3, 4, 5]])
 
-    if isinstance(a, dpt.usm_ndarray):
-        return dpt.asnumpy(a)
+    Copy the data in a background thread:
+
+    >>> f = np.asnumpy(a, blocking=False)
+    >>> f.result()
+    array([[0, 1, 2],
+           [3, 4, 5]])
+
+    """
+
+    if isinstance(a, (dpnp_array, dpt.usm_ndarray)):
+        if order is None:
+            order = "K"
+        return dpnp_asnumpy(a, order=order, out=out, blocking=blocking)
 
+    if order is None:
+        order = "C"
     return numpy.asarray(a, order=order)
 
 
@@ -746,6 +795,7 @@ def is_supported_array_type(a):
     return isinstance(a, (dpnp_array, dpt.usm_ndarray))
 
 
+@dpnp_profiler.host_sync
 def synchronize_array_data(a):
     """
     The dpctl interface was reworked to make asynchronous execution.
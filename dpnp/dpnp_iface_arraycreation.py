@@ -38,7 +38,10 @@ it contains:
 """
 
 
+import contextlib
 import operator
+import os
+import stat
 
 import dpctl.tensor as dpt
 import numpy
@@ -56,6 +59,8 @@ from .dpnp_array import dpnp_array
 
 # pylint: disable=no-name-in-module
 from .dpnp_utils import get_usm_allocations, map_dtype_to_device
+from .dpnp_utils.dpnp_utils_io import dpnp_read_array
+from .dpnp_utils.dpnp_utils_transfer import is_device_dtype
 
 __all__ = [
     "arange",
@@ -150,6 +155,16 @@ def _get_empty_array(
             f"order must be None, 'C', 'F', 'A', or 'K' (got '{order}')"
         )
 
+    if strides is None and dpnp.get_memory_pool() is not None:
+        # allocate from the memory pool in use
+        return dpnp_container.empty(
+            _shape,
+            dtype=_dtype,
+            order=order.upper(),
+            usm_type=_usm_type,
+            sycl_queue=_sycl_queue,
+        )
+
     return dpnp_array(
         _shape,
         dtype=_dtype,
@@ -1809,7 +1824,10 @@ def fromfile(
 
     Notes
     -----
-    This uses :obj:`numpy.fromfile` and coerces the result to a DPNP array.
+    A binary file is read by chunks into a pair of host USM buffers, and
+    reading of a chunk overlaps with copying of the previous one to the
+    device. A text file is read by :obj:`numpy.fromfile` and the result is
+    coerced to a DPNP array.
 
     See also
     --------
@@ -1857,6 +1875,42 @@ def fromfile(
     """
 
     dpnp.check_limitations(like=like)
+    if sep == "":
+        with contextlib.ExitStack() as stack:
+            if hasattr(file, "read"):
+                fh = file
+            else:
+                fh = stack.enter_context(open(os.fspath(file), "rb"))
+
+            try:
+                st = os.fstat(fh.fileno())
+            except (AttributeError, OSError):
+                st = None
+
+            # the size of a pipe or a character device is not known in advance
+            size = st.st_size if st and stat.S_ISREG(st.st_mode) else None
+
+            dtype = numpy.dtype(dtype)
+            if size is not None and is_device_dtype(dtype, device, sycl_queue):
+                # stream binary data directly into USM allocation
+                fh.seek(offset, os.SEEK_CUR)
+                available = max(size - fh.tell(), 0) // dtype.itemsize
+
+                # like NumPy, read as many items as available if `count`
+                # exceeds them
+                if count < 0 or count > available:
+                    count = available
+
+                result = dpnp.empty(
+                    count,
+                    dtype=dtype,
+                    device=device,
+                    usm_type=usm_type,
+                    sycl_queue=sycl_queue,
+                )
+                dpnp_read_array(fh, result)
+                return result
+
     return asarray(
         numpy.fromfile(file, dtype=dtype, count=count, sep=sep, offset=offset),
         device=device,
@@ -1978,12 +2032,15 @@ def fromfunction(
     """
 
     dpnp.check_limitations(like=like)
-    return asarray(
-        numpy.fromfunction(function, shape, dtype=dtype, **kwargs),
-        device=device,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue,
-    )
+    with dpnp.config._Fallback("fromfunction", allow_fallback=True) as fallback:
+        result = asarray(
+            numpy.fromfunction(function, shape, dtype=dtype, **kwargs),
+            device=device,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue,
+        )
+        fallback.bytes_to_device = result.nbytes
+    return result
 
 
 def fromiter(
@@ -2924,12 +2981,15 @@ def loadtxt(
     """
 
     dpnp.check_limitations(like=like)
-    return asarray(
-        numpy.loadtxt(fname, dtype=dtype, **kwargs),
-        device=device,
-        usm_type=usm_type,
-        sycl_queue=sycl_queue,
-    )
+    with dpnp.config._Fallback("loadtxt", allow_fallback=True) as fallback:
+        result = asarray(
+            numpy.loadtxt(fname, dtype=dtype, **kwargs),
+            device=device,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue,
+        )
+        fallback.bytes_to_device = result.nbytes
+    return result
 
 
 def logspace(
@@ -40,9 +40,13 @@ it contains:
 # pylint: disable=protected-access
 # pylint: disable=no-name-in-module
 
+import operator
+
 import dpctl.tensor._tensor_elementwise_impl as ti
 import numpy
+from dpctl.tensor._numpy_helper import normalize_axis_index
 
+import dpnp
 import dpnp.backend.extensions.ufunc._ufunc_impl as ufi
 from dpnp.dpnp_algo.dpnp_elementwise_common import DPNPBinaryFunc, DPNPUnaryFunc
 
@@ -58,10 +62,32 @@ __all__ = [
     "bitwise_xor",
     "invert",
     "left_shift",
+    "packbits",
     "right_shift",
+    "unpackbits",
 ]
 
 
+def _get_bit_shifts(bitorder, usm_type, sycl_queue):
+    """Return an array of shifts of bits within a byte in `bitorder` order."""
+
+    if bitorder == "big":
+        start, stop, step = 7, -1, -1
+    elif bitorder == "little":
+        start, stop, step = 0, 8, 1
+    else:
+        raise ValueError("'bitorder' must be either 'little' or 'big'")
+
+    return dpnp.arange(
+        start,
+        stop,
+        step,
+        dtype=dpnp.uint8,
+        usm_type=usm_type,
+        sycl_queue=sycl_queue,
+    )
+
+
 def binary_repr(num, width=None):
     """
     Return the binary representation of the input number as a string.
@@ -609,6 +635,109 @@ left_shift = DPNPBinaryFunc(
 bitwise_left_shift = left_shift  # bitwise_left_shift is an alias for left_shift
 
 
+def packbits(a, /, axis=None, bitorder="big"):
+    """
+    Packs the elements of a binary-valued array into bits in a ``uint8`` array.
+
+    The result is padded to full bytes by inserting zero bits at the end.
+
+    For full documentation refer to :obj:`numpy.packbits`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        An array of integers or booleans whose elements should be packed to
+        bits.
+    axis : {None, int}, optional
+        The dimension over which bit-packing is done. ``None`` implies packing
+        the flattened array.
+
+        Default: ``None``.
+    bitorder : {"big", "little"}, optional
+        The order of the input bits. ``"big"`` will mimic ``bin(val)``,
+        ``[0, 0, 0, 0, 0, 0, 1, 1] => 3 = 0b00000011``, ``"little"`` will
+        reverse the order so ``[1, 1, 0, 0, 0, 0, 0, 0] => 3``.
+
+        Default: ``"big"``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        Array of type ``uint8`` whose elements represent bits corresponding to
+        the logical (``0`` or nonzero) value of the input elements. The shape
+        of `out` has the same number of dimensions as the input (unless `axis`
+        is ``None``, in which case the output is 1-D).
+
+    See Also
+    --------
+    :obj:`dpnp.unpackbits` : Unpacks elements of a ``uint8`` array into a
+                             binary-valued output array.
+    :obj:`dpnp.bitwise_count` : Computes the number of 1-bits in the absolute
+                                value of the input.
+
+    Notes
+    -----
+    A packed boolean mask takes eight times less memory than the mask itself.
+    It can be passed with ``packed=True`` keyword to :obj:`dpnp.count_nonzero`,
+    :obj:`dpnp.where`, :obj:`dpnp.compress` and :obj:`dpnp.extract` instead
+    of the mask itself.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[[1, 0, 1],
+    ...                [0, 1, 0]],
+    ...               [[1, 1, 0],
+    ...                [0, 0, 1]]])
+    >>> b = np.packbits(a, axis=-1)
+    >>> b
+    array([[[160],
+            [ 64]],
+    <BLANKLINE>
+           [[192],
+            [ 32]]], dtype=uint8)
+
+    Note that in binary 160 = 1010 0000, 64 = 0100 0000, 192 = 1100 0000,
+    and 32 = 0010 0000.
+
+    >>> m = np.array([True, False, True, True, False, True, True, True, True])
+    >>> np.packbits(m, bitorder="little")
+    array([237,   1], dtype=uint8)
+    >>> np.count_nonzero(np.packbits(m), packed=True)
+    array(7)
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    if not (a.dtype == dpnp.bool or dpnp.issubdtype(a.dtype, dpnp.integer)):
+        raise TypeError(
+            "Expected an input array of integer or boolean data type"
+        )
+
+    shifts = _get_bit_shifts(bitorder, a.usm_type, a.sycl_queue)
+
+    if axis is None:
+        a = dpnp.ravel(a)
+        axis = 0
+    else:
+        axis = normalize_axis_index(axis, a.ndim)
+    a = dpnp.moveaxis(a, axis, -1)
+
+    # bits of the input padded with zeros to full bytes along the last axis
+    n = a.shape[-1]
+    nbytes = -(-n // 8)
+    bits = dpnp.zeros_like(
+        a, dtype=dpnp.uint8, shape=a.shape[:-1] + (nbytes * 8,)
+    )
+    bits[..., :n] = a != 0
+
+    # shift the bits to their positions in place and gather them into bytes
+    bits = bits.reshape(a.shape[:-1] + (nbytes, 8))
+    dpnp.left_shift(bits, shifts, out=bits)
+    res = dpnp.sum(bits, axis=-1, dtype=dpnp.uint8)
+    return dpnp.moveaxis(res, -1, axis)
+
+
 _RIGHT_SHIFT_DOCSTRING = """
 Shifts the bits of each element :math:`x1_i` of the input array `x1` to the
 right according to the respective element :math:`x2_i` of the input array `x2`.
@@ -692,3 +821,119 @@ right_shift = DPNPBinaryFunc(
 
 # bitwise_right_shift is an alias for right_shift
 bitwise_right_shift = right_shift
+
+
+def unpackbits(a, /, axis=None, count=None, bitorder="big"):
+    """
+    Unpacks elements of a ``uint8`` array into a binary-valued output array.
+
+    Each element of `a` represents a bit-field that should be unpacked into a
+    binary-valued output array.
+
+    For full documentation refer to :obj:`numpy.unpackbits`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array of ``uint8`` data type.
+    axis : {None, int}, optional
+        The dimension over which bit-unpacking is done. ``None`` implies
+        unpacking the flattened array.
+
+        Default: ``None``.
+    count : {None, int}, optional
+        The number of elements to unpack along `axis`, provided as a way of
+        undoing the effect of packing a size that is not a multiple of eight.
+        A non-negative number means to only unpack `count` bits. A negative
+        number means to trim off that many bits from the end. ``None`` means
+        to unpack the entire array. Counts larger than the available number of
+        bits will add zero padding to the output. Negative counts must not
+        exceed the available number of bits.
+
+        Default: ``None``.
+    bitorder : {"big", "little"}, optional
+        The order of the returned bits. ``"big"`` will mimic ``bin(val)``,
+        ``3 = 0b00000011 => [0, 0, 0, 0, 0, 0, 1, 1]``, ``"little"`` will
+        reverse the order to ``[1, 1, 0, 0, 0, 0, 0, 0]``.
+
+        Default: ``"big"``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The elements are binary-valued (``0`` or ``1``) and of ``uint8``
+        data type.
+
+    See Also
+    --------
+    :obj:`dpnp.packbits` : Packs the elements of a binary-valued array into
+                           bits in a ``uint8`` array.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[2], [7], [23]], dtype=np.uint8)
+    >>> a
+    array([[ 2],
+           [ 7],
+           [23]], dtype=uint8)
+    >>> b = np.unpackbits(a, axis=1)
+    >>> b
+    array([[0, 0, 0, 0, 0, 0, 1, 0],
+           [0, 0, 0, 0, 0, 1, 1, 1],
+           [0, 0, 0, 1, 0, 1, 1, 1]], dtype=uint8)
+    >>> c = np.unpackbits(a, axis=1, count=-3)
+    >>> c
+    array([[0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0],
+           [0, 0, 0, 1, 0]], dtype=uint8)
+
+    >>> p = np.packbits(b, axis=0)
+    >>> np.unpackbits(p, axis=0)
+    array([[0, 0, 0, 0, 0, 0, 1, 0],
+           [0, 0, 0, 0, 0, 1, 1, 1],
+           [0, 0, 0, 1, 0, 1, 1, 1],
+           [0, 0, 0, 0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0, 0, 0, 0]], dtype=uint8)
+    >>> np.array_equal(b, np.unpackbits(p, axis=0, count=b.shape[0]))
+    True
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    if a.dtype != dpnp.uint8:
+        raise TypeError("Expected an input array of unsigned byte data type")
+
+    shifts = _get_bit_shifts(bitorder, a.usm_type, a.sycl_queue)
+
+    if axis is None:
+        a = dpnp.ravel(a)
+        axis = 0
+    else:
+        axis = normalize_axis_index(axis, a.ndim)
+    a = dpnp.moveaxis(a, axis, -1)
+
+    nbits = a.shape[-1] * 8
+    if count is None:
+        count = nbits
+    else:
+        count = operator.index(count)
+        if count < 0:
+            if -count > nbits:
+                raise ValueError("-count larger than number of elements")
+            count += nbits
+
+    # extract the bits of every byte in place of the shifted values
+    res = dpnp.right_shift(a[..., None], shifts)
+    dpnp.bitwise_and(res, 1, out=res)
+    res = res.reshape(a.shape[:-1] + (nbits,))
+
+    if count < nbits:
+        res = res[..., :count]
+    elif count > nbits:
+        pad = dpnp.zeros_like(res, shape=res.shape[:-1] + (count - nbits,))
+        res = dpnp.concatenate((res, pad), axis=-1)
+    return dpnp.moveaxis(res, -1, axis)
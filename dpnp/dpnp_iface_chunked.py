@@ -0,0 +1,498 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Interface of the chunked execution functions of dpnp
+
+Notes
+-----
+This module is a face or public interface file for the library
+it contains:
+ - Interface functions
+ - documentation for the functions
+ - The functions parameters check
+
+"""
+
+import numpy
+from dpctl.tensor._numpy_helper import normalize_axis_index
+
+import dpnp
+
+from .dpnp_utils import get_usm_allocations, map_dtype_to_device
+from .dpnp_utils.dpnp_utils_reduction import ChunkedReduction
+from .dpnp_utils.dpnp_utils_transfer import (
+    dpnp_copy_from_host,
+    dpnp_copy_to_host,
+    submit_transfer,
+)
+
+__all__ = ["map_chunks", "reduce_chunks"]
+
+# size in bytes of a chunk of all input arrays copied to the device
+_CHUNK_BYTES = 1 << 26
+
+# number of results of chunks being copied to the host at the same time
+_MAX_PENDING_RESULTS = 2
+
+
+def _check_chunk_result(res, axis, n):
+    """Check the result of a function applied to a chunk of `n` elements."""
+
+    dpnp.check_supported_arrays_type(res)
+    if res.ndim <= axis or res.shape[axis] != n:
+        raise ValueError(
+            f"The result of func must have {n} elements along the axis "
+            f"{axis}, but got shape {res.shape}"
+        )
+
+
+def _chunk_bounds(n, chunk_size):
+    """Return the bounds of chunks of `chunk_size` elements of `n`."""
+
+    if n == 0:
+        # the function is called once to get the result of an empty input
+        return [(0, 0)]
+    return [(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+
+
+def _chunk_key(axis, start, stop):
+    """Return the key indexing a chunk along `axis`."""
+
+    return (slice(None),) * axis + (slice(start, stop),)
+
+
+def _device_dtype(dtype, exec_q):
+    """Return the data type a host array of `dtype` is copied to."""
+
+    dtype = numpy.dtype(dtype)
+    if dtype.kind not in "biufc":
+        raise TypeError(f"Unsupported data type of input array {dtype}")
+    return map_dtype_to_device(dtype.newbyteorder("="), exec_q.sycl_device)
+
+
+def _get_chunk_size(arrays, axis, chunk_size):
+    """Return the number of elements along `axis` in a chunk of `arrays`."""
+
+    if chunk_size is not None:
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be a positive integer, but got {chunk_size}"
+            )
+        return chunk_size
+
+    n = arrays[0].shape[axis]
+    row_bytes = sum(a.nbytes // n for a in arrays) if n else 0
+    return max(1, _CHUNK_BYTES // max(row_bytes, 1))
+
+
+def _get_inputs(arrays, axis, device, sycl_queue):
+    """
+    Validate input `arrays` chunked along `axis` and return them with
+    the normalized axis and the SYCL queue of the execution.
+
+    """
+
+    if not arrays:
+        raise TypeError("At least one input array is required")
+
+    arrays = [
+        a if dpnp.is_supported_array_type(a) else numpy.asarray(a)
+        for a in arrays
+    ]
+    dev_arrays = [a for a in arrays if dpnp.is_supported_array_type(a)]
+    if dev_arrays and device is None and sycl_queue is None:
+        _, exec_q = get_usm_allocations(dev_arrays)
+    else:
+        exec_q = dpnp.get_normalized_queue_device(
+            device=device, sycl_queue=sycl_queue
+        )
+
+    if arrays[0].ndim == 0:
+        raise ValueError("Input arrays must have at least one dimension")
+    axis = normalize_axis_index(axis, arrays[0].ndim)
+
+    n = arrays[0].shape[axis]
+    for a in arrays[1:]:
+        if a.ndim <= axis or a.shape[axis] != n:
+            raise ValueError(
+                "All input arrays must have the same length along the axis "
+                f"{axis}, but got shapes {[x.shape for x in arrays]}"
+            )
+    return arrays, axis, exec_q
+
+
+def _iter_chunks(arrays, axis, chunk_size, exec_q, usm_type):
+    """
+    Yield the bounds and the chunks of `arrays` copied to the device.
+
+    The next chunk is copied to the device in a background thread while
+    the current one is processed.
+
+    """
+
+    bounds = _chunk_bounds(arrays[0].shape[axis], chunk_size)
+    pending = _load_chunk(arrays, axis, *bounds[0], exec_q, usm_type)
+    for k, (start, stop) in enumerate(bounds):
+        current = pending
+        if k + 1 < len(bounds):
+            pending = _load_chunk(
+                arrays, axis, *bounds[k + 1], exec_q, usm_type
+            )
+
+        chunks = [
+            c if dpnp.is_supported_array_type(c) else c.result()
+            for c in current
+        ]
+        yield start, stop, chunks
+
+
+def _load_chunk(arrays, axis, start, stop, exec_q, usm_type):
+    """
+    Start copying the chunk of `arrays` between `start` and `stop` along
+    `axis` to the device.
+
+    Returns a list with a chunk of every array on the device, or with
+    :class:`concurrent.futures.Future` of the chunk of a host array.
+
+    """
+
+    key = _chunk_key(axis, start, stop)
+
+    chunks = []
+    for a in arrays:
+        if dpnp.is_supported_array_type(a):
+            chunks.append(a[key])
+            continue
+
+        host = a[key]
+        dst = dpnp.empty(
+            host.shape,
+            dtype=_device_dtype(a.dtype, exec_q),
+            usm_type=usm_type,
+            sycl_queue=exec_q,
+        )
+        chunks.append(submit_transfer(dpnp_copy_from_host, dst, host))
+    return chunks
+
+
+def map_chunks(
+    func,
+    *arrays,
+    axis=0,
+    chunk_size=None,
+    out=None,
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+):
+    """
+    Apply a function to the arrays chunk by chunk along an axis.
+
+    The input arrays, which may be host arrays like :class:`numpy.memmap`
+    not fitting into the device memory, are copied to the device chunk by
+    chunk, and the result of every chunk is written to the host output
+    array or to an output array on the device.
+
+    Parameters
+    ----------
+    func : callable
+        The function called as ``func(*chunks)`` with a chunk of every input
+        array on the device, composed of dpnp elementwise functions and
+        reductions over the other axes. It must return a dpnp array of
+        the same length along `axis` as the chunks.
+    *arrays : {array_like, dpnp.ndarray, usm_ndarray}
+        Input arrays with the same length along `axis`. Host arrays are
+        copied to the device chunk by chunk, and chunks of dpnp arrays are
+        passed as views.
+    axis : int, optional
+        The axis along which the arrays are chunked.
+
+        Default: ``0``.
+    chunk_size : {None, int}, optional
+        The number of elements along `axis` in a chunk. If ``None``, a chunk
+        of all input arrays takes up to 64 MiB.
+
+        Default: ``None``.
+    out : {None, numpy.ndarray}, optional
+        A host array, for example :class:`numpy.memmap` opened for writing,
+        to write the result into. The results of the chunks are cast to its
+        data type. If ``None``, the result is kept on the device.
+
+        Default: ``None``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the chunks are processed.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    usm_type : {"device", "shared", "host"}, optional
+        The type of SYCL USM allocation for the chunks and the output array
+        on the device.
+
+        Default: ``"device"``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for processing of the chunks. The `sycl_queue`
+        can be passed as ``None`` (the default), which means to get the SYCL
+        queue from `device` keyword if present, from the input dpnp arrays
+        or to use a default queue.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : {dpnp.ndarray, numpy.ndarray}
+        The result of `func` over all chunks, written to `out` if provided.
+
+    Notes
+    -----
+    While a chunk is processed on the device, the next chunk of the host
+    arrays is copied to the device and the result of the previous chunk is
+    copied to `out` in a background thread. So at most three chunks of
+    the input arrays and three chunks of the result are kept on the device.
+
+    See Also
+    --------
+    :obj:`dpnp.reduce_chunks` : Reduce the arrays chunk by chunk.
+    :obj:`dpnp.load` : Load arrays or memory-map them on the host.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> import dpnp as np
+    >>> a = numpy.arange(10.0)
+    >>> b = numpy.ones(10)
+    >>> out = numpy.empty(10)
+    >>> np.map_chunks(lambda x, y: x * 2 + y, a, b, chunk_size=4, out=out)
+    array([ 1.,  3.,  5.,  7.,  9., 11., 13., 15., 17., 19.])
+
+    Keep the result on the device:
+
+    >>> np.map_chunks(np.sqrt, a, chunk_size=4)
+    array([0.        , 1.        , 1.41421356, 1.73205081, 2.        ,
+           2.23606798, 2.44948974, 2.64575131, 2.82842712, 3.        ])
+
+    """
+
+    if not callable(func):
+        raise TypeError(f"func must be callable, but got {type(func)}")
+    if out is not None and not isinstance(out, numpy.ndarray):
+        raise TypeError(
+            f"Output array must be numpy.ndarray, but got {type(out)}"
+        )
+
+    arrays, axis, exec_q = _get_inputs(arrays, axis, device, sycl_queue)
+    chunk_size = _get_chunk_size(arrays, axis, chunk_size)
+    n = arrays[0].shape[axis]
+
+    result = None
+    pending = []
+    try:
+        for start, stop, chunks in _iter_chunks(
+            arrays, axis, chunk_size, exec_q, usm_type
+        ):
+            res = func(*chunks)
+            _check_chunk_result(res, axis, stop - start)
+
+            shape = res.shape[:axis] + (n,) + res.shape[axis + 1 :]
+            if out is not None:
+                if out.shape != shape:
+                    raise ValueError(
+                        f"Output array of shape {out.shape} does not match "
+                        f"the result of shape {shape}"
+                    )
+                key = _chunk_key(axis, start, stop)
+                pending.append(
+                    submit_transfer(dpnp_copy_to_host, res, out[key])
+                )
+                if len(pending) > _MAX_PENDING_RESULTS:
+                    pending.pop(0).result()
+                continue
+
+            if result is None:
+                result = dpnp.empty(
+                    shape,
+                    dtype=res.dtype,
+                    usm_type=usm_type,
+                    sycl_queue=exec_q,
+                )
+            result[_chunk_key(axis, start, stop)] = res
+    finally:
+        for f in pending:
+            f.result()
+    return out if out is not None else result
+
+
+def reduce_chunks(
+    func,
+    *arrays,
+    reduction="sum",
+    axis=None,
+    ddof=0,
+    keepdims=False,
+    chunk_size=None,
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+):
+    """
+    Reduce the result of a function applied to the arrays chunk by chunk.
+
+    The input arrays, which may be host arrays like :class:`numpy.memmap`
+    not fitting into the device memory, are copied to the device chunk by
+    chunk, and the partial reductions of the chunks are combined on
+    the device.
+
+    Parameters
+    ----------
+    func : {None, callable}
+        The function called as ``func(*chunks)`` with a chunk of every input
+        array on the device, composed of dpnp elementwise functions. It must
+        return a dpnp array of the same length along the chunked axis as
+        the chunks. If ``None``, the chunks of a single input array are
+        reduced.
+    *arrays : {array_like, dpnp.ndarray, usm_ndarray}
+        Input arrays with the same length along the chunked axis. Host
+        arrays are copied to the device chunk by chunk, and chunks of dpnp
+        arrays are passed as views.
+    reduction : {"sum", "prod", "max", "min", "mean", "var", "std", \
+                 "argmax", "argmin"}, optional
+        The reduction of the results of `func`.
+
+        Default: ``"sum"``.
+    axis : {None, int}, optional
+        The axis along which the arrays are chunked and the results of `func`
+        are reduced. If ``None``, the arrays are chunked along axis 0 and all
+        elements of the results are reduced, so the indices returned by
+        ``"argmax"`` and ``"argmin"`` are into the flattened result.
+
+        Default: ``None``.
+    ddof : {int, float}, optional
+        Means Delta Degrees of Freedom of ``"var"`` and ``"std"``
+        reductions.
+
+        Default: ``0``.
+    keepdims : bool, optional
+        If ``True``, the reduced axes are left in the result as dimensions
+        with size one.
+
+        Default: ``False``.
+    chunk_size : {None, int}, optional
+        The number of elements along the chunked axis in a chunk. If
+        ``None``, a chunk of all input arrays takes up to 64 MiB.
+
+        Default: ``None``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the chunks are processed.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    usm_type : {"device", "shared", "host"}, optional
+        The type of SYCL USM allocation for the chunks on the device.
+
+        Default: ``"device"``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for processing of the chunks. The `sycl_queue`
+        can be passed as ``None`` (the default), which means to get the SYCL
+        queue from `device` keyword if present, from the input dpnp arrays
+        or to use a default queue.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The reduction of the results of `func` over all chunks, kept on
+        the device.
+
+    Notes
+    -----
+    Means and variances of the chunks are merged with the counts of their
+    elements by Chan's parallel algorithm, which is more accurate than
+    accumulating sums of values and of their squares. While a chunk is
+    processed on the device, the next chunk of the host arrays is copied to
+    the device in a background thread.
+
+    See Also
+    --------
+    :obj:`dpnp.map_chunks` : Apply a function to the arrays chunk by chunk.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> import dpnp as np
+    >>> a = numpy.arange(12.0).reshape(6, 2)
+    >>> np.reduce_chunks(None, a, reduction="mean", axis=0, chunk_size=4)
+    array([5., 6.])
+
+    >>> b = numpy.full((6, 2), 2.0)
+    >>> np.reduce_chunks(lambda x, y: x * y, a, b, chunk_size=4)
+    array(132.)
+    >>> np.reduce_chunks(None, a, reduction="argmax", chunk_size=4)
+    array(11)
+
+    """
+
+    if func is None:
+        if len(arrays) != 1:
+            raise TypeError(
+                "func is required to reduce more than one input array"
+            )
+    elif not callable(func):
+        raise TypeError(f"func must be callable, but got {type(func)}")
+
+    chunk_axis = 0 if axis is None else axis
+    arrays, chunk_axis, exec_q = _get_inputs(
+        arrays, chunk_axis, device, sycl_queue
+    )
+    chunk_size = _get_chunk_size(arrays, chunk_axis, chunk_size)
+
+    acc = ChunkedReduction(
+        reduction, axis=None if axis is None else chunk_axis, ddof=ddof
+    )
+    ndim = None
+    for start, stop, chunks in _iter_chunks(
+        arrays, chunk_axis, chunk_size, exec_q, usm_type
+    ):
+        res = chunks[0] if func is None else func(*chunks)
+        _check_chunk_result(res, chunk_axis, stop - start)
+        acc.update(res, start)
+        ndim = res.ndim
+
+    res = acc.result()
+    if keepdims:
+        if axis is None:
+            res = dpnp.reshape(res, (1,) * ndim)
+        else:
+            res = dpnp.expand_dims(res, chunk_axis)
+    return res
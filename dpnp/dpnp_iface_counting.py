@@ -41,10 +41,12 @@ import dpctl.tensor as dpt
 
 import dpnp
 
+from .dpnp_utils.dpnp_utils_bitmask import dpnp_packed_count
+
 __all__ = ["count_nonzero"]
 
 
-def count_nonzero(a, axis=None, *, keepdims=False, out=None):
+def count_nonzero(a, axis=None, *, keepdims=False, out=None, packed=False):
     """
     Counts the number of non-zero values in the array `a`.
 
@@ -72,6 +74,12 @@ def count_nonzero(a, axis=None, *, keepdims=False, out=None):
         If ``None`` then a new array is returned.
 
         Default: ``None``.
+    packed : bool, optional
+        If ``True``, `a` is a boolean mask packed to bits of an array of
+        ``uint8`` data type, as returned by :obj:`dpnp.packbits`, and the set
+        bits are counted without unpacking it.
+
+        Default: ``False``.
 
     Returns
     -------
@@ -83,6 +91,8 @@ def count_nonzero(a, axis=None, *, keepdims=False, out=None):
     See Also
     --------
     :obj:`dpnp.nonzero` : Return the coordinates of all the non-zero values.
+    :obj:`dpnp.packbits` : Packs the elements of a binary-valued array into
+                           bits in a ``uint8`` array.
 
     Examples
     --------
@@ -101,8 +111,17 @@ def count_nonzero(a, axis=None, *, keepdims=False, out=None):
     array([[2],
            [3]])
 
+    Count the ``True`` values of a packed boolean mask:
+
+    >>> m = np.packbits(a > 1)
+    >>> np.count_nonzero(m, packed=True)
+    array(4)
+
     """
 
+    if packed:
+        return dpnp_packed_count(a, axis=axis, keepdims=keepdims, out=out)
+
     usm_a = dpnp.get_usm_ndarray(a)
     usm_out = None if out is None else dpnp.get_usm_ndarray(out)
 
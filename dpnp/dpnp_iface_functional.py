@@ -36,7 +36,10 @@ it contains:
 
 """
 
+import itertools
+import numbers
 
+import numpy
 from dpctl.tensor._numpy_helper import (
     normalize_axis_index,
     normalize_axis_tuple,
@@ -44,10 +47,81 @@ from dpctl.tensor._numpy_helper import (
 
 import dpnp
 
+from .dpnp_algo.dpnp_elementwise_common import DPNPUnaryFunc
+
 __all__ = ["apply_along_axis", "apply_over_axes"]
 
+# number of 1-D slices whose results returned on the host are copied to
+# the device at once
+_CHUNK_SLICES = 1024
+
+# functions, for which applying to every 1-D slice along an axis is the same
+# as a single call with that axis passed by `axis` keyword
+_AXIS_AWARE_FUNCS = (
+    "all",
+    "amax",
+    "amin",
+    "any",
+    "argmax",
+    "argmin",
+    "argsort",
+    "count_nonzero",
+    "cumprod",
+    "cumsum",
+    "flip",
+    "max",
+    "mean",
+    "median",
+    "min",
+    "nanargmax",
+    "nanargmin",
+    "nancumprod",
+    "nancumsum",
+    "nanmax",
+    "nanmean",
+    "nanmedian",
+    "nanmin",
+    "nanprod",
+    "nanstd",
+    "nansum",
+    "nanvar",
+    "prod",
+    "ptp",
+    "sort",
+    "std",
+    "sum",
+    "var",
+)
+
+
+def _call_along_axis(func1d, axis, arr, args, kwargs):
+    """
+    Call `func1d` once for the whole array `arr` if it is known to be
+    equivalent to calling it for every 1-D slice along `axis`.
+
+    Returns ``None`` if `func1d` is not recognized.
+
+    """
+
+    if args or "axis" in kwargs or "out" in kwargs:
+        return None
 
-def apply_along_axis(func1d, axis, arr, *args, **kwargs):
+    if isinstance(func1d, DPNPUnaryFunc):
+        # unary elementwise functions do not depend on the slicing
+        return None if kwargs else func1d(arr)
+
+    if any(func1d is getattr(dpnp, name) for name in _AXIS_AWARE_FUNCS):
+        return func1d(arr, axis=axis, **kwargs)
+    return None
+
+
+def _is_host_result(res):
+    """Return ``True`` if `res` is a NumPy array or a scalar on the host."""
+
+    return isinstance(res, (numpy.ndarray, numpy.generic, numbers.Number))
+
+
+def apply_along_axis(func1d, axis, arr, *args, vectorized=False, **kwargs):
     """
     Apply a function to 1-D slices along the given axis.
 
@@ -86,6 +160,15 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
         Input array.
     args : any
         Additional arguments to `func1d`.
+    vectorized : bool, optional
+        If ``True``, `func1d` is assumed to be vectorized: instead of a call
+        per 1-D slice, it is called once with a view of `arr` of shape
+        ``(Ni..., Nk..., M)`` and must apply itself to every 1-D slice along
+        the last axis, returning an array of shape ``(Ni..., Nk..., Nj...)``.
+        The keyword is reserved by this function and is never passed to
+        `func1d`; wrap `func1d` to pass an argument of the same name.
+
+        Default: ``False``.
     kwargs : any
         Additional named arguments to `func1d`.
 
@@ -102,6 +185,18 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
     :obj:`dpnp.apply_over_axes` : Apply a function repeatedly over
                                 multiple axes.
 
+    Notes
+    -----
+    Unary elementwise functions and the dpnp reduction, sorting and
+    cumulative functions supporting `axis` keyword (for example
+    :obj:`dpnp.sum`, :obj:`dpnp.mean` or :obj:`dpnp.sort`) are recognized
+    when passed as `func1d` without additional positional arguments, and are
+    called once for the whole array instead of once per 1-D slice.
+
+    Any other `func1d` is called once per 1-D slice. The slices are processed
+    by chunks, and the results returned on the host (NumPy arrays or
+    scalars) for a whole chunk are copied to the device at once.
+
     Examples
     --------
     >>> import dpnp as np
@@ -137,6 +232,13 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
             [0, 8, 0],
             [0, 0, 9]]])
 
+    A vectorized function is called only once for all the slices:
+
+    >>> def my_vfunc(a):  # Average first and last elements of each slice
+    ...     return (a[..., 0] + a[..., -1]) * 0.5
+    >>> np.apply_along_axis(my_vfunc, 0, b, vectorized=True)
+    array([4., 5., 6.])
+
     """
 
     dpnp.check_supported_arrays_type(arr)
@@ -147,19 +249,41 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
 
     # arr, with the iteration axis at the end
     inarr_view = dpnp.moveaxis(arr, axis, -1)
+    batch_shape = inarr_view.shape[:-1]
+    if 0 in batch_shape:
+        raise ValueError(
+            "Cannot apply_along_axis when any iteration dimensions are 0"
+        )
+
+    if vectorized:
+        # invoke the function once on all the slices
+        buff = dpnp.asanyarray(
+            func1d(inarr_view, *args, **kwargs),
+            sycl_queue=exec_q,
+            usm_type=usm_type,
+        )
+        if buff.shape[: len(batch_shape)] != batch_shape:
+            raise ValueError(
+                "vectorized func1d must return an array with leading "
+                f"dimensions {batch_shape}, but got shape {buff.shape}"
+            )
+
+        # restore the inserted axes back to where they belong
+        for _ in range(buff.ndim - len(batch_shape)):
+            buff = dpnp.moveaxis(buff, -1, axis)
+        return buff
+
+    res = _call_along_axis(func1d, axis, arr, args, kwargs)
+    if res is not None:
+        return dpnp.asanyarray(res, sycl_queue=exec_q, usm_type=usm_type)
 
     # compute indices for the iteration axes, and append a trailing ellipsis to
     # prevent 0d arrays decaying to scalars
-    inds = dpnp.ndindex(inarr_view.shape[:-1])
+    inds = dpnp.ndindex(batch_shape)
     inds = (ind + (Ellipsis,) for ind in inds)
 
     # invoke the function on the first item
-    try:
-        ind0 = next(inds)
-    except StopIteration:
-        raise ValueError(
-            "Cannot apply_along_axis when any iteration dimensions are 0"
-        ) from None
+    ind0 = next(inds)
     res = dpnp.asanyarray(
         func1d(inarr_view[ind0], *args, **kwargs),
         sycl_queue=exec_q,
@@ -173,13 +297,25 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
     buff = dpnp.empty_like(res, shape=inarr_view.shape[:-1] + res.shape)
 
     # save the first result, then compute and save all remaining results
+    # by chunks of slices following in the C order of the buffer
     buff[ind0] = res
-    for ind in inds:
-        buff[ind] = dpnp.asanyarray(
-            func1d(inarr_view[ind], *args, **kwargs),
-            sycl_queue=exec_q,
-            usm_type=usm_type,
-        )
+    buff_flat = buff.reshape((-1,) + res.shape)
+    for start in range(1, buff_flat.shape[0], _CHUNK_SLICES):
+        results = [
+            func1d(inarr_view[ind], *args, **kwargs)
+            for ind in itertools.islice(inds, _CHUNK_SLICES)
+        ]
+
+        if all(_is_host_result(r) for r in results):
+            # a single copy of the whole chunk to the device
+            buff_flat[start : start + len(results)] = dpnp.asarray(
+                numpy.stack(results), sycl_queue=exec_q, usm_type=usm_type
+            )
+        else:
+            for i, r in enumerate(results, start=start):
+                buff_flat[i] = dpnp.asanyarray(
+                    r, sycl_queue=exec_q, usm_type=usm_type
+                )
 
     # restore the inserted axes back to where they belong
     for _ in range(res.ndim):
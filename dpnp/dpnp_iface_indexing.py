@@ -39,6 +39,7 @@ it contains:
 
 # pylint: disable=protected-access
 
+import math
 import operator
 from collections.abc import Iterable
 
@@ -61,6 +62,10 @@ from .dpnp_algo import (
 )
 from .dpnp_array import dpnp_array
 from .dpnp_utils import call_origin, get_usm_allocations
+from .dpnp_utils.dpnp_utils_bitmask import (
+    dpnp_packed_extract,
+    dpnp_packed_nonzero,
+)
 
 __all__ = [
     "choose",
@@ -346,7 +351,9 @@ def _take_index(x, inds, axis, q, usm_type, out=None, mode=0):
     return out
 
 
-def compress(condition, a, axis=None, out=None):
+def compress(
+    condition, a, axis=None, out=None, *, packed=False, bitorder="big"
+):
     """
     Return selected slices of an array along given axis.
 
@@ -373,6 +380,18 @@ def compress(condition, a, axis=None, out=None):
         be of the appropriate shape and dtype.
 
         Default: ``None``.
+    packed : bool, optional
+        If ``True``, `condition` is a 1-D boolean mask packed to bits of
+        an array of ``uint8`` data type, as returned by :obj:`dpnp.packbits`.
+        The mask is unpacked by chunks, so the unpacked mask is never
+        allocated in full.
+
+        Default: ``False``.
+    bitorder : {"big", "little"}, optional
+        The order of the bits in packed `condition`. Ignored if `packed` is
+        ``False``.
+
+        Default: ``"big"``.
 
     Returns
     -------
@@ -414,6 +433,14 @@ def compress(condition, a, axis=None, out=None):
 
     >>> np.compress([False, True], a)
     array([2])
+
+    Select the slices by a packed boolean mask:
+
+    >>> m = np.packbits(np.array([False, True, True]))
+    >>> np.compress(m, a, axis=0, packed=True)
+    array([[3, 4],
+           [5, 6]])
+
     """
 
     dpnp.check_supported_arrays_type(a)
@@ -424,6 +451,21 @@ def compress(condition, a, axis=None, out=None):
     axis = normalize_axis_index(operator.index(axis), a.ndim)
 
     a_ary = dpnp.get_usm_ndarray(a)
+    if packed:
+        # the indices of set bits are found chunk by chunk of the mask
+        inds = dpnp_packed_nonzero(condition, a.shape[axis], bitorder=bitorder)
+        res_usm_type, exec_q = get_usm_allocations([a_ary, inds])
+
+        res = _take_index(
+            a_ary,
+            dpnp.get_usm_ndarray(inds),
+            axis,
+            exec_q,
+            res_usm_type,
+            out=out,
+        )
+        return dpnp.get_result_array(res, out=out)
+
     cond_ary = dpnp.as_usm_ndarray(
         condition,
         dtype=dpnp.bool,
@@ -772,7 +814,7 @@ def diagonal(a, offset=0, axis1=0, axis2=1):
     )
 
 
-def extract(condition, a):
+def extract(condition, a, *, packed=False, bitorder="big"):
     """
     Return the elements of an array that satisfy some condition.
 
@@ -791,6 +833,18 @@ def extract(condition, a):
         to extract.
     a : {dpnp.ndarray, usm_ndarray}
         Input array of the same size as `condition`.
+    packed : bool, optional
+        If ``True``, `condition` is a flattened boolean mask of the size of
+        `a` packed to bits of a 1-D array of ``uint8`` data type, as returned
+        by :obj:`dpnp.packbits`. The mask is unpacked by chunks, so
+        the unpacked mask is never allocated in full.
+
+        Default: ``False``.
+    bitorder : {"big", "little"}, optional
+        The order of the bits in packed `condition`. Ignored if `packed` is
+        ``False``.
+
+        Default: ``"big"``.
 
     Returns
     -------
@@ -828,8 +882,17 @@ def extract(condition, a):
     >>> a[condition]
     array([0, 3, 6, 9])
 
+    The same elements are extracted by the packed `condition`:
+
+    >>> np.extract(np.packbits(condition), a, packed=True)
+    array([0, 3, 6, 9])
+
     """
 
+    if packed:
+        dpnp.check_supported_arrays_type(a)
+        return dpnp_packed_extract(condition, a, bitorder=bitorder)
+
     usm_a = dpnp.get_usm_ndarray(a)
     usm_type, exec_q = get_usm_allocations([usm_a, condition])
     usm_cond = dpnp.as_usm_ndarray(
@@ -1926,6 +1989,9 @@ def ravel_multi_index(multi_index, dims, mode="raise", order="C"):
     ndim = len(dims)
     if isinstance(mode, str):
         mode = (mode,) * ndim
+    for _mode in mode:
+        if _mode not in ("raise", "clip", "wrap"):
+            raise ValueError(f"Unrecognized mode: {_mode}")
 
     s = 1
     ravel_strides = [1] * ndim
@@ -1943,31 +2009,63 @@ def ravel_multi_index(multi_index, dims, mode="raise", order="C"):
             s = s * dims[i - 1]
             ravel_strides[i] = s
 
-    multi_index = dpnp.broadcast_arrays(*multi_index)
-    raveled_indices = dpnp.zeros(
-        multi_index[0].shape,
-        dtype=dpnp.int64,
-        usm_type=usm_type_alloc,
-        sycl_queue=sycl_queue_alloc,
-    )
-    for d, stride, idx, _mode in zip(dims, ravel_strides, multi_index, mode):
+    for idx in multi_index:
         if not dpnp.can_cast(idx, dpnp.int64, "same_kind"):
             raise TypeError(
                 f"multi_index entries could not be cast from dtype({idx.dtype})"
                 f" to dtype({dpnp.int64}) according to the rule 'same_kind'"
             )
-        idx = idx.astype(dpnp.int64, copy=False)
-
-        if _mode == "raise":
-            if dpnp.any(dpnp.logical_or(idx >= d, idx < 0)):
-                raise ValueError("invalid entry in coordinates array")
-        elif _mode == "clip":
-            idx = dpnp.clip(idx, 0, d - 1)
-        elif _mode == "wrap":
-            idx = idx % d
+
+    # the coordinates of all dimensions are stacked along the first axis
+    # and processed by single kernels
+    multi_index = dpnp.broadcast_arrays(*multi_index)
+    coords = dpnp.stack(multi_index, dtype=dpnp.int64)
+    col_shape = (ndim,) + (1,) * multi_index[0].ndim
+    dims_col = dpnp.asarray(
+        dims,
+        dtype=dpnp.int64,
+        usm_type=usm_type_alloc,
+        sycl_queue=sycl_queue_alloc,
+    ).reshape(col_shape)
+
+    invalid = None
+    if all(_mode == mode[0] for _mode in mode):
+        if mode[0] == "raise":
+            invalid = dpnp.any((coords < 0) | (coords >= dims_col))
+        elif mode[0] == "clip":
+            dpnp.clip(coords, 0, dims_col - 1, out=coords)
         else:
-            raise ValueError(f"Unrecognized mode: {_mode}")
-        raveled_indices += stride * idx
+            dpnp.remainder(coords, dims_col, out=coords)
+    else:
+        for k, (d, _mode) in enumerate(zip(dims, mode)):
+            if _mode == "clip":
+                dpnp.clip(coords[k], 0, d - 1, out=coords[k])
+            elif _mode == "wrap":
+                dpnp.remainder(coords[k], d, out=coords[k])
+
+        if "raise" in mode:
+            # the out-of-bounds mask is reduced over "raise" dimensions only
+            raise_col = dpnp.asarray(
+                [_mode == "raise" for _mode in mode],
+                usm_type=usm_type_alloc,
+                sycl_queue=sycl_queue_alloc,
+            ).reshape(col_shape)
+            invalid = dpnp.any(
+                ((coords < 0) | (coords >= dims_col)) & raise_col
+            )
+
+    coords *= dpnp.asarray(
+        ravel_strides,
+        dtype=dpnp.int64,
+        usm_type=usm_type_alloc,
+        sycl_queue=sycl_queue_alloc,
+    ).reshape(col_shape)
+    raveled_indices = dpnp.sum(coords, axis=0)
+
+    # the bounds are checked by a single synchronization with the host
+    # once all kernels are submitted
+    if invalid is not None and invalid:
+        raise ValueError("invalid entry in coordinates array")
     return raveled_indices
 
 
@@ -2791,8 +2889,6 @@ def unravel_index(indices, shape, order="C"):
             f"'C' or 'F', but got '{order}'"
         )
     order = "C" if order is None else order.upper()
-    if order == "C":
-        shape = reversed(shape)
 
     if not dpnp.can_cast(indices, dpnp.int64, "same_kind"):
         raise TypeError(
@@ -2801,17 +2897,42 @@ def unravel_index(indices, shape, order="C"):
             "'same_kind'"
         )
 
-    if (indices < 0).any():
-        raise ValueError("invalid entry in index array")
+    shape = tuple(shape)
+    ndim = len(shape)
+    size = math.prod(shape)
 
-    unraveled_coords = []
-    for dim in shape:
-        unraveled_coords.append(indices % dim)
-        indices = indices // dim
+    strides = [1] * ndim
+    if order == "C":
+        for i in range(ndim - 2, -1, -1):
+            strides[i] = strides[i + 1] * shape[i + 1]
+    else:
+        for i in range(1, ndim):
+            strides[i] = strides[i - 1] * shape[i - 1]
 
-    if (indices > 0).any():
-        raise ValueError("invalid entry in index array")
+    indices = dpnp.astype(indices, dpnp.int64, copy=False)
+    invalid = dpnp.any((indices < 0) | (indices >= size))
 
-    if order == "C":
-        unraveled_coords = reversed(unraveled_coords)
-    return tuple(unraveled_coords)
+    # the coordinates of all dimensions are computed by single kernels
+    # as a stack along the first axis
+    col_shape = (ndim,) + (1,) * indices.ndim
+    strides = dpnp.asarray(
+        strides,
+        dtype=dpnp.int64,
+        usm_type=indices.usm_type,
+        sycl_queue=indices.sycl_queue,
+    ).reshape(col_shape)
+    dims = dpnp.asarray(
+        shape,
+        dtype=dpnp.int64,
+        usm_type=indices.usm_type,
+        sycl_queue=indices.sycl_queue,
+    ).reshape(col_shape)
+
+    unraveled_coords = dpnp.floor_divide(indices[None, ...], strides)
+    dpnp.remainder(unraveled_coords, dims, out=unraveled_coords)
+
+    # the bounds are checked by a single synchronization with the host
+    # once all kernels are submitted
+    if invalid:
+        raise ValueError("invalid entry in index array")
+    return tuple(unraveled_coords[k] for k in range(ndim))
@@ -0,0 +1,443 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Interface of the input and output functions of dpnp
+
+Notes
+-----
+This module is a face or public interface file for the library
+it contains:
+ - Interface functions
+ - documentation for the functions
+ - The functions parameters check
+
+"""
+
+import contextlib
+import os
+import zipfile
+
+import numpy
+
+import dpnp
+
+from .dpnp_utils.dpnp_utils_io import (
+    dpnp_read_array,
+    dpnp_write_array,
+    read_npy_header,
+    write_npy_header,
+)
+
+__all__ = ["load", "save", "savez", "savez_compressed"]
+
+
+class _NpzFile(numpy.lib.npyio.NpzFile):
+    """
+    A dictionary-like object with lazy-loading of arrays in NPZ format
+    returned by :obj:`dpnp.load`.
+
+    Every array is streamed to a new USM allocation when it is accessed.
+
+    """
+
+    def __init__(self, fid, own_fid=False, allow_pickle=False, **kwargs):
+        super().__init__(fid, own_fid=own_fid, allow_pickle=allow_pickle)
+        self._usm_kwargs = kwargs
+
+    def __getitem__(self, key):
+        if key in self._files:
+            member = key
+        elif key in self.files:
+            member = key + ".npy"
+        else:
+            raise KeyError(f"{key} is not a file in the archive")
+
+        with self.zip.open(member) as fh:
+            magic = fh.read(len(numpy.lib.format.MAGIC_PREFIX))
+            fh.seek(0)
+            if magic != numpy.lib.format.MAGIC_PREFIX:
+                return fh.read()
+            return _read_npy(fh, **self._usm_kwargs)
+
+
+@contextlib.contextmanager
+def _open_file(file, mode, suffix=None):
+    """
+    Open `file` if it is a path, appending `suffix` to it if missing, or
+    yield it as is if it is a file object.
+
+    """
+
+    if hasattr(file, "read" if "r" in mode else "write"):
+        yield file
+        return
+
+    file = os.fspath(file)
+    if suffix is not None and not file.endswith(suffix):
+        file += suffix
+    with open(file, mode) as fh:
+        yield fh
+
+
+def _read_npy(fh, device=None, usm_type="device", sycl_queue=None):
+    """Read an array in NPY format from file `fh` into a new USM array."""
+
+    shape, order, dtype = read_npy_header(fh)
+    a = dpnp.empty(
+        shape,
+        dtype=dtype,
+        order=order,
+        device=device,
+        usm_type=usm_type,
+        sycl_queue=sycl_queue,
+    )
+    dpnp_read_array(fh, a, order=order)
+    return a
+
+
+def _save(fh, arr, allow_pickle):
+    """Write array `arr` in NPY format to file `fh`."""
+
+    if not dpnp.is_supported_array_type(arr):
+        numpy.lib.format.write_array(
+            fh, numpy.asanyarray(arr), allow_pickle=allow_pickle
+        )
+        return
+
+    flags = arr.flags
+    order = "F" if flags.f_contiguous and not flags.c_contiguous else "C"
+    write_npy_header(fh, arr, order)
+    dpnp_write_array(fh, arr, order=order)
+
+
+def _savez(file, args, kwds, compress, allow_pickle=True):
+    """Save several arrays into a single file in NPZ format."""
+
+    if not hasattr(file, "write"):
+        file = os.fspath(file)
+        if not file.endswith(".npz"):
+            file += ".npz"
+
+    namedict = kwds
+    for i, val in enumerate(args):
+        key = f"arr_{i}"
+        if key in namedict:
+            raise ValueError(f"Cannot use un-named variables and keyword {key}")
+        namedict[key] = val
+
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(
+        file, mode="w", compression=compression, allowZip64=True
+    ) as zipf:
+        for key, val in namedict.items():
+            with zipf.open(key + ".npy", "w", force_zip64=True) as fh:
+                _save(fh, val, allow_pickle)
+
+
+def load(
+    file,
+    mmap_mode=None,
+    allow_pickle=False,
+    *,
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+):
+    """
+    Load arrays or pickled objects from ``.npy``, ``.npz`` or pickled files.
+
+    For full documentation refer to :obj:`numpy.load`.
+
+    Parameters
+    ----------
+    file : {file-like object, str, pathlib.Path}
+        The file to read. File-like objects must support the ``seek()`` and
+        ``read()`` methods and must always be opened in binary mode.
+    mmap_mode : {None, "r+", "r", "w+", "c"}, optional
+        If not ``None``, then memory-map the file, using the given mode, and
+        return a host :class:`numpy.memmap` array (see :obj:`numpy.memmap`
+        for a detailed description of the modes) instead of copying the data
+        to the device. A memory-mapped array is kept on disk, so slices of
+        it can be copied to the device by :obj:`dpnp.asarray` without reading
+        the whole file into memory.
+
+        Default: ``None``.
+    allow_pickle : bool, optional
+        Allow loading pickled object arrays stored in npy files.
+
+        Default: ``False``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the output array is created.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    usm_type : {None, "device", "shared", "host"}, optional
+        The type of SYCL USM allocation for the output array.
+
+        Default: ``"device"``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for output array allocation and copying. The
+        `sycl_queue` can be passed as ``None`` (the default), which means
+        to get the SYCL queue from `device` keyword if present or to use
+        a default queue.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    result : {dpnp.ndarray, numpy.memmap, NpzFile, object}
+        Data stored in the file. For ``.npz`` files, the returned instance of
+        NpzFile class must be closed to avoid leaking file descriptors. Every
+        array of ``.npz`` file is copied to the device when it is accessed.
+
+    Notes
+    -----
+    The data of an array is read by chunks into a pair of host USM buffers,
+    and reading of a chunk overlaps with copying of the previous one to the
+    device. So the peak host memory used is independent of the array size.
+
+    See Also
+    --------
+    :obj:`dpnp.save` : Save an array to a binary file.
+    :obj:`dpnp.savez` : Save several arrays into an uncompressed ``.npz``
+                        archive.
+    :obj:`dpnp.fromfile` : Construct an array from data in a text or binary
+                           file.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.save("/tmp/123", np.array([[1, 2, 3], [4, 5, 6]]))
+    >>> np.load("/tmp/123.npy")
+    array([[1, 2, 3],
+           [4, 5, 6]])
+
+    Mem-map the stored array, and then copy the second row to the device:
+
+    >>> X = np.load("/tmp/123.npy", mmap_mode="r")
+    >>> np.asarray(X[1, :])
+    array([4, 5, 6])
+
+    """
+
+    usm_kwargs = {
+        "device": device,
+        "usm_type": usm_type,
+        "sycl_queue": sycl_queue,
+    }
+
+    with contextlib.ExitStack() as stack:
+        if hasattr(file, "read"):
+            fh = file
+        else:
+            fh = stack.enter_context(open(os.fspath(file), "rb"))
+
+        # code to distinguish from NumPy binary files and pickles
+        magic_prefix = numpy.lib.format.MAGIC_PREFIX
+        start = fh.tell()
+        magic = fh.read(len(magic_prefix))
+        fh.seek(start)
+
+        if magic.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+            # zip-file (assume .npz), the file is closed with NpzFile
+            stack.pop_all()
+            return _NpzFile(
+                fh,
+                own_fid=fh is not file,
+                allow_pickle=allow_pickle,
+                **usm_kwargs,
+            )
+
+        if magic == magic_prefix and mmap_mode is None:
+            return _read_npy(fh, **usm_kwargs)
+
+        return numpy.load(
+            file if mmap_mode else fh,
+            mmap_mode=mmap_mode,
+            allow_pickle=allow_pickle,
+        )
+
+
+def save(file, arr, allow_pickle=True):
+    """
+    Save an array to a binary file in NumPy ``.npy`` format.
+
+    For full documentation refer to :obj:`numpy.save`.
+
+    Parameters
+    ----------
+    file : {file, str, pathlib.Path}
+        File or filename to which the data is saved. If file is a file-object,
+        then the filename is unchanged. If file is a string or Path,
+        a ``.npy`` extension will be appended to the filename if it does not
+        already have one.
+    arr : {dpnp.ndarray, usm_ndarray, array_like}
+        Array data to be saved.
+    allow_pickle : bool, optional
+        Allow saving object arrays using Python pickles. It is used only for
+        an input which is not a dpnp or USM array.
+
+        Default: ``True``.
+
+    Notes
+    -----
+    The data of a dpnp or USM array are copied from the device by chunks
+    into a pair of host USM buffers, and writing of a chunk overlaps with
+    copying of the next one. So the peak host memory used is independent of
+    the array size.
+
+    See Also
+    --------
+    :obj:`dpnp.savez` : Save several arrays into a ``.npz`` archive.
+    :obj:`dpnp.load` : Load arrays or pickled objects from files.
+    :obj:`dpnp.ndarray.tofile` : Write array to a file as text or binary.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> x = np.arange(10)
+    >>> np.save(outfile, x)
+    >>> _ = outfile.seek(0) # Only needed to simulate closing & reopening file
+    >>> np.load(outfile)
+    array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+    """
+
+    with _open_file(file, "wb", suffix=".npy") as fh:
+        _save(fh, arr, allow_pickle)
+
+
+def savez(file, *args, allow_pickle=True, **kwds):
+    """
+    Save several arrays into a single file in uncompressed ``.npz`` format.
+
+    For full documentation refer to :obj:`numpy.savez`.
+
+    Parameters
+    ----------
+    file : {file, str, pathlib.Path}
+        Either the filename (string) or an open file (file-like object)
+        where the data will be saved. If file is a string or a Path, the
+        ``.npz`` extension will be appended to the filename if it is not
+        already there.
+    args : {dpnp.ndarray, usm_ndarray, array_like}
+        Arrays to save to the file. Please use keyword arguments (see `kwds`
+        below) to assign names to arrays. Arrays specified as args will be
+        named "arr_0", "arr_1", and so on.
+    allow_pickle : bool, optional
+        Allow saving object arrays using Python pickles. It is used only for
+        inputs which are not dpnp or USM arrays.
+
+        Default: ``True``.
+    kwds : {dpnp.ndarray, usm_ndarray, array_like}
+        Arrays to save to the file. Each array will be saved to the output
+        file with its corresponding keyword name.
+
+    Notes
+    -----
+    Every array is streamed into the archive by chunks the same way as by
+    :obj:`dpnp.save`.
+
+    See Also
+    --------
+    :obj:`dpnp.save` : Save a single array to a binary file in NumPy format.
+    :obj:`dpnp.savez_compressed` : Save several arrays into a compressed
+                                   ``.npz`` archive.
+    :obj:`dpnp.load` : Load arrays or pickled objects from files.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> x = np.arange(10)
+    >>> y = np.sin(x)
+    >>> np.savez(outfile, x=x, y=y)
+    >>> _ = outfile.seek(0)
+    >>> npzfile = np.load(outfile)
+    >>> sorted(npzfile.files)
+    ['x', 'y']
+    >>> npzfile["x"]
+    array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+    """
+
+    _savez(file, args, kwds, False, allow_pickle=allow_pickle)
+
+
+def savez_compressed(file, *args, allow_pickle=True, **kwds):
+    """
+    Save several arrays into a single file in compressed ``.npz`` format.
+
+    For full documentation refer to :obj:`numpy.savez_compressed`.
+
+    Parameters
+    ----------
+    file : {file, str, pathlib.Path}
+        Either the filename (string) or an open file (file-like object)
+        where the data will be saved. If file is a string or a Path, the
+        ``.npz`` extension will be appended to the filename if it is not
+        already there.
+    args : {dpnp.ndarray, usm_ndarray, array_like}
+        Arrays to save to the file. Please use keyword arguments (see `kwds`
+        below) to assign names to arrays. Arrays specified as args will be
+        named "arr_0", "arr_1", and so on.
+    allow_pickle : bool, optional
+        Allow saving object arrays using Python pickles. It is used only for
+        inputs which are not dpnp or USM arrays.
+
+        Default: ``True``.
+    kwds : {dpnp.ndarray, usm_ndarray, array_like}
+        Arrays to save to the file. Each array will be saved to the output
+        file with its corresponding keyword name.
+
+    See Also
+    --------
+    :obj:`dpnp.savez` : Save several arrays into an uncompressed ``.npz``
+                        file format.
+    :obj:`dpnp.load` : Load arrays or pickled objects from files.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> from tempfile import TemporaryFile
+    >>> outfile = TemporaryFile()
+    >>> a = np.arange(6).reshape(2, 3)
+    >>> np.savez_compressed(outfile, a=a)
+    >>> _ = outfile.seek(0)
+    >>> np.load(outfile)["a"]
+    array([[0, 1, 2],
+           [3, 4, 5]])
+
+    """
+
+    _savez(file, args, kwds, True, allow_pickle=allow_pickle)
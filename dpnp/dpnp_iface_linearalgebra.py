@@ -248,6 +248,10 @@ def einsum(
         algorithm. Also accepts an explicit contraction list from the
         :obj:`dpnp.einsum_path` function.
 
+        The parsed subscripts and the contraction path are cached for each
+        combination of subscripts, operand shapes and `optimize` value, so
+        repeated calls with the same expression do not repeat the path search.
+
         Default: ``False``.
 
     Returns
@@ -577,11 +581,23 @@ def einsum_path(*operands, optimize="greedy", einsum_call=False):
 
     """
 
-    # explicit casting to numpy array if applicable
-    operands = [
-        dpnp.asnumpy(x) if dpnp.is_supported_array_type(x) else x
-        for x in operands
-    ]
+    if einsum_call:
+        # explicit casting to numpy array if applicable
+        operands = [
+            dpnp.asnumpy(x) if dpnp.is_supported_array_type(x) else x
+            for x in operands
+        ]
+    else:
+        # the path depends only on shapes of operands, so there is no need
+        # to copy the data to the host, a zero-strided stand-in is enough
+        operands = [
+            (
+                numpy.broadcast_to(numpy.empty((), dtype=x.dtype), x.shape)
+                if dpnp.is_supported_array_type(x)
+                else x
+            )
+            for x in operands
+        ]
 
     return numpy.einsum_path(
         *operands,
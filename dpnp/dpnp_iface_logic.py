@@ -65,6 +65,7 @@ __all__ = [
     "iscomplexobj",
     "isfinite",
     "isfortran",
+    "isin",
     "isinf",
     "isnan",
     "isneginf",
@@ -82,6 +83,53 @@ __all__ = [
 ]
 
 
+def _isin_sort(ar1, ar2, invert):
+    """
+    Test whether each element of `ar1` is in 1-D array `ar2` by sorting `ar2`
+    and searching the sorted array for the elements of `ar1`.
+
+    """
+
+    dt = dpnp.result_type(ar1, ar2)
+    ar1 = dpnp.astype(ar1, dt, copy=False)
+    ar2 = dpnp.sort(dpnp.astype(ar2, dt, copy=False))
+
+    idx = dpnp.searchsorted(ar2, ar1, side="left")
+
+    # elements greater than all elements of `ar2` are compared with the last
+    dpnp.minimum(idx, ar2.size - 1, out=idx)
+    if invert:
+        return dpnp.not_equal(dpnp.take(ar2, idx), ar1)
+    return dpnp.equal(dpnp.take(ar2, idx), ar1)
+
+
+def _isin_table(ar1, ar2, ar2_min, ar2_max, invert):
+    """
+    Test whether each element of integer array `ar1` is in 1-D integer array
+    `ar2` with elements in range from `ar2_min` to `ar2_max` by a lookup
+    table of flags of the values in the range.
+
+    """
+
+    usm_type, exec_q = get_usm_allocations([ar1, ar2])
+    table = dpnp.zeros(
+        ar2_max - ar2_min + 1,
+        dtype=dpnp.bool,
+        usm_type=usm_type,
+        sycl_queue=exec_q,
+    )
+    table[dpnp.astype(ar2, dpnp.intp) - ar2_min] = True
+
+    ar1 = dpnp.astype(ar1, dpnp.intp)
+    in_range = (ar1 >= ar2_min) & (ar1 <= ar2_max)
+    idx = dpnp.where(in_range, ar1 - ar2_min, 0)
+
+    res = in_range & dpnp.take(table, idx)
+    if invert:
+        return dpnp.logical_not(res, out=res)
+    return res
+
+
 def all(a, /, axis=None, out=None, keepdims=False, *, where=True):
     """
     Test whether all array elements along a given axis evaluate to ``True``.
@@ -1115,6 +1163,148 @@ def isfortran(a):
     return a.flags.fnc
 
 
+def isin(
+    element, test_elements, assume_unique=False, invert=False, *, kind=None
+):
+    """
+    Calculates ``element in test_elements``, broadcasting over `element` only.
+    Returns a boolean array of the same shape as `element` that is ``True``
+    where an element of `element` is in `test_elements` and ``False``
+    otherwise.
+
+    For full documentation refer to :obj:`numpy.isin`.
+
+    Parameters
+    ----------
+    element : {dpnp.ndarray, usm_ndarray, scalar}
+        Input array.
+    test_elements : {dpnp.ndarray, usm_ndarray, scalar}
+        The values against which to test each value of `element`. This
+        argument is flattened if it is an array.
+    assume_unique : bool, optional
+        Ignored, since the elements of `test_elements` are not required to be
+        unique by any of the methods.
+
+        Default: ``False``.
+    invert : bool, optional
+        If ``True``, the values in the returned array are inverted, as if
+        calculating ``element not in test_elements``. This is faster than
+        inverting the result of the call.
+
+        Default: ``False``.
+    kind : {None, "sort", "table"}, optional
+        The algorithm to use.
+
+        - If ``"sort"``, `test_elements` is sorted and searched for every
+          element of `element` on the device.
+        - If ``"table"``, a lookup table of flags of the values in range from
+          the minimum to the maximum of `test_elements` is built on the
+          device. It is only supported for boolean and integer arrays, and
+          its memory usage is proportional to the range of `test_elements`.
+        - If ``None``, ``"table"`` is selected for boolean and integer arrays
+          if the range of `test_elements` is small compared to the sizes of
+          the arrays, otherwise ``"sort"`` is used.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        Has the same shape as `element`. The values ``element[isin]`` are in
+        `test_elements`.
+
+    Limitations
+    -----------
+    Arrays of ``uint64`` data type are always processed by ``"sort"`` method.
+
+    See Also
+    --------
+    :obj:`dpnp.searchsorted` : Find indices where elements should be inserted
+                               to maintain order.
+    :obj:`dpnp.intersect1d` : Find the intersection of two arrays.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> element = 2*np.arange(4).reshape((2, 2))
+    >>> element
+    array([[0, 2],
+           [4, 6]])
+    >>> test_elements = np.array([1, 2, 4, 8])
+    >>> mask = np.isin(element, test_elements)
+    >>> mask
+    array([[False,  True],
+           [ True, False]])
+    >>> element[mask]
+    array([2, 4])
+
+    The indices of the matched values can be obtained with `nonzero`:
+
+    >>> np.nonzero(mask)
+    (array([0, 1]), array([1, 0]))
+
+    The test can also be inverted:
+
+    >>> mask = np.isin(element, test_elements, invert=True)
+    >>> mask
+    array([[ True, False],
+           [False,  True]])
+    >>> element[mask]
+    array([0, 6])
+
+    """
+
+    dpnp.check_supported_arrays_type(element, test_elements, scalar_type=True)
+    if kind not in (None, "sort", "table"):
+        raise ValueError(
+            f"Invalid kind: '{kind}'. Please use None, 'sort' or 'table'."
+        )
+
+    if dpnp.isscalar(element):
+        element = dpnp.asarray(
+            element,
+            sycl_queue=test_elements.sycl_queue,
+            usm_type=test_elements.usm_type,
+        )
+    elif dpnp.isscalar(test_elements):
+        test_elements = dpnp.asarray(
+            test_elements,
+            sycl_queue=element.sycl_queue,
+            usm_type=element.usm_type,
+        )
+    test_elements = dpnp.ravel(test_elements)
+
+    is_int_arrays = all_integer = True
+    for x in (element, test_elements):
+        if not (dpnp.issubdtype(x.dtype, dpnp.integer) or x.dtype == dpnp.bool):
+            is_int_arrays = all_integer = False
+        elif not dpnp.can_cast(x.dtype, dpnp.intp):
+            # uint64 values may overflow in the lookup table indices
+            is_int_arrays = False
+
+    if kind == "table" and not all_integer:
+        raise ValueError(
+            "The 'table' method is only supported for boolean or integer "
+            "arrays. Please select 'sort' or None for kind."
+        )
+
+    if test_elements.size == 0:
+        return dpnp.full_like(element, invert, dtype=dpnp.bool)
+
+    if kind != "sort" and is_int_arrays:
+        bounds = dpnp.stack(
+            (dpnp.min(test_elements), dpnp.max(test_elements))
+        ).asnumpy()
+        ar2_min, ar2_max = int(bounds[0]), int(bounds[1])
+
+        # the table takes no more memory than the sorting would
+        if kind == "table" or ar2_max - ar2_min <= 6 * (
+            element.size + test_elements.size
+        ):
+            return _isin_table(element, test_elements, ar2_min, ar2_max, invert)
+    return _isin_sort(element, test_elements, invert)
+
+
 _ISINF_DOCSTRING = """
 Tests each element :math:`x_i` of the input array `x` to determine if equal to
 positive or negative infinity.
@@ -115,6 +115,7 @@ __all__ = [
     "hsplit",
     "hstack",
     "insert",
+    "intersect1d",
     "matrix_transpose",
     "moveaxis",
     "ndim",
@@ -130,6 +131,8 @@ __all__ = [
     "rollaxis",
     "rot90",
     "row_stack",
+    "setdiff1d",
+    "setxor1d",
     "shape",
     "size",
     "split",
@@ -139,6 +142,7 @@ __all__ = [
     "tile",
     "transpose",
     "trim_zeros",
+    "union1d",
     "unique",
     "unique_all",
     "unique_counts",
@@ -493,68 +497,22 @@ def _unique_build_sort_indices(a, index_sh):
     Build the indices of an input array (when axis is provided) which result
     in the unique array.
 
-    """
-
-    is_inexact = dpnp.issubdtype(a, dpnp.inexact)
-    if dpnp.issubdtype(a.dtype, numpy.unsignedinteger):
-        ar_cmp = a.astype(dpnp.intp)
-    elif dpnp.issubdtype(a.dtype, dpnp.bool):
-        ar_cmp = a.astype(numpy.int8)
-    else:
-        ar_cmp = a
-
-    def compare_axis_elems(idx1, idx2):
-        comp = dpnp.trim_zeros(ar_cmp[idx1] - ar_cmp[idx2], "f")
-        if comp.shape[0] > 0:
-            diff = comp[0]
-            if is_inexact and dpnp.isnan(diff):
-                isnan1 = dpnp.isnan(ar_cmp[idx1])
-                if not isnan1.any():  # no NaN in ar_cmp[idx1]
-                    return True  # ar_cmp[idx1] goes to left
+    The rows of 2D array `a` are sorted lexicographically on the device with
+    the first column as the primary key.
 
-                isnan2 = dpnp.isnan(ar_cmp[idx2])
-                if not isnan2.any():  # no NaN in ar_cmp[idx2]
-                    return False  # ar_cmp[idx1] goes to right
-
-                # for complex all NaNs are considered equivalent
-                if (isnan1 & isnan2).all():  # NaNs at the same places
-                    return False  # ar_cmp[idx1] goes to right
-
-                xor_nan_idx = dpnp.where(isnan1 ^ isnan2)[0]
-                if xor_nan_idx.size == 0:
-                    return False
-
-                if dpnp.isnan(ar_cmp[idx2][xor_nan_idx[0]]):
-                    # first NaN in XOR mask is from ar_cmp[idx2]
-                    return True  # ar_cmp[idx1] goes to left
-                return False
-            return diff < 0
-        return False
-
-    # sort the array `a` lexicographically using the first item
-    # of each element on the axis
-    sorted_indices = dpnp.empty_like(a, shape=index_sh, dtype=dpnp.intp)
-    queue = [(numpy.arange(0, index_sh, dtype=numpy.intp).tolist(), 0)]
-    while len(queue) != 0:
-        current, off = queue.pop(0)
-        if len(current) == 0:
-            continue
-
-        mid_elem = current[0]
-        left = []
-        right = []
-        for i in range(1, len(current)):
-            if compare_axis_elems(current[i], mid_elem):
-                left.append(current[i])
-            else:
-                right.append(current[i])
+    """
 
-        elem_pos = off + len(left)
-        queue.append((left, off))
-        queue.append((right, elem_pos + 1))
+    if a.shape[1] == 0:
+        # all rows are empty and equal
+        return dpnp.arange(
+            index_sh,
+            dtype=dpnp.intp,
+            usm_type=a.usm_type,
+            sycl_queue=a.sycl_queue,
+        )
 
-        sorted_indices[elem_pos] = mid_elem
-    return sorted_indices
+    # the last key passed to lexsort is the primary one
+    return dpnp.lexsort(a.T[::-1], axis=-1)
 
 
 def _unpack_tuple(a):
@@ -2356,6 +2314,100 @@ def insert(arr, obj, values, axis=None):
     return _insert_array_indices(params, indices, values, obj)
 
 
+def intersect1d(ar1, ar2, assume_unique=False, return_indices=False):
+    """
+    Find the intersection of two arrays.
+
+    Return the sorted, unique values that are in both of the input arrays.
+
+    For full documentation refer to :obj:`numpy.intersect1d`.
+
+    Parameters
+    ----------
+    ar1, ar2 : {dpnp.ndarray, usm_ndarray}
+        Input arrays. Will be flattened if not already 1-D.
+    assume_unique : bool, optional
+        If ``True``, the input arrays are both assumed to be unique, which can
+        speed up the calculation. If ``True`` but `ar1` or `ar2` are not
+        unique, incorrect results and out-of-bounds indices could result.
+
+        Default: ``False``.
+    return_indices : bool, optional
+        If ``True``, the indices which correspond to the intersection of the
+        two arrays are returned. The first instance of a value is used if
+        there are multiple.
+
+        Default: ``False``.
+
+    Returns
+    -------
+    intersect1d : dpnp.ndarray
+        Sorted 1-D array of common and unique elements.
+    comm1 : dpnp.ndarray
+        The indices of the first occurrences of the common values in `ar1`.
+        Only provided if `return_indices` is ``True``.
+    comm2 : dpnp.ndarray
+        The indices of the first occurrences of the common values in `ar2`.
+        Only provided if `return_indices` is ``True``.
+
+    See Also
+    --------
+    :obj:`dpnp.isin` : Test whether each element of an array is also present
+                       in a second array.
+    :obj:`dpnp.union1d` : Find the union of two arrays.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.intersect1d(np.array([1, 3, 4, 3]), np.array([3, 1, 2, 1]))
+    array([1, 3])
+
+    To return the indices of the values common to the input arrays along
+    with the intersected values:
+
+    >>> x = np.array([1, 1, 2, 3, 4])
+    >>> y = np.array([2, 1, 4, 6])
+    >>> xy, x_ind, y_ind = np.intersect1d(x, y, return_indices=True)
+    >>> x_ind, y_ind
+    (array([0, 2, 4]), array([1, 0, 2]))
+    >>> xy, x[x_ind], y[y_ind]
+    (array([1, 2, 4]), array([1, 2, 4]), array([1, 2, 4]))
+
+    """
+
+    dpnp.check_supported_arrays_type(ar1, ar2)
+
+    if assume_unique:
+        ar1 = dpnp.ravel(ar1)
+        ar2 = dpnp.ravel(ar2)
+    elif return_indices:
+        ar1, ind1 = dpnp.unique(ar1, return_index=True)
+        ar2, ind2 = dpnp.unique(ar2, return_index=True)
+    else:
+        ar1 = dpnp.unique(ar1)
+        ar2 = dpnp.unique(ar2)
+
+    # a common value is met twice in a row in the sorted concatenation
+    aux = dpnp.concatenate((ar1, ar2))
+    if return_indices:
+        aux_sort_indices = dpnp.argsort(aux, kind="stable")
+        aux = aux[aux_sort_indices]
+    else:
+        aux = dpnp.sort(aux)
+
+    mask = aux[1:] == aux[:-1]
+    int1d = aux[:-1][mask]
+
+    if return_indices:
+        ar1_indices = aux_sort_indices[:-1][mask]
+        ar2_indices = aux_sort_indices[1:][mask] - ar1.size
+        if not assume_unique:
+            ar1_indices = ind1[ar1_indices]
+            ar2_indices = ind2[ar2_indices]
+        return int1d, ar1_indices, ar2_indices
+    return int1d
+
+
 def matrix_transpose(x, /):
     """
     Transposes a matrix (or a stack of matrices) `x`.
@@ -3473,6 +3525,117 @@ def rot90(m, k=1, axes=(0, 1)):
     return dpnp.flip(dpnp.transpose(m, axes_list), axes[1])
 
 
+def setdiff1d(ar1, ar2, assume_unique=False):
+    """
+    Find the set difference of two arrays.
+
+    Return the unique values in `ar1` that are not in `ar2`.
+
+    For full documentation refer to :obj:`numpy.setdiff1d`.
+
+    Parameters
+    ----------
+    ar1 : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    ar2 : {dpnp.ndarray, usm_ndarray, scalar}
+        Input comparison array.
+    assume_unique : bool, optional
+        If ``True``, the input array `ar1` is assumed to be unique, which can
+        speed up the calculation.
+
+        Default: ``False``.
+
+    Returns
+    -------
+    setdiff1d : dpnp.ndarray
+        1-D array of values in `ar1` that are not in `ar2`. The result is
+        sorted when `assume_unique` is ``False``, but otherwise only sorted
+        if the input is sorted.
+
+    See Also
+    --------
+    :obj:`dpnp.isin` : Test whether each element of an array is also present
+                       in a second array.
+    :obj:`dpnp.setxor1d` : Find the set exclusive-or of two arrays.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([1, 2, 3, 2, 4, 1])
+    >>> b = np.array([3, 4, 5, 6])
+    >>> np.setdiff1d(a, b)
+    array([1, 2])
+
+    """
+
+    dpnp.check_supported_arrays_type(ar1)
+
+    if assume_unique:
+        ar1 = dpnp.ravel(ar1)
+    else:
+        ar1 = dpnp.unique(ar1)
+    return ar1[dpnp.isin(ar1, ar2, assume_unique=True, invert=True)]
+
+
+def setxor1d(ar1, ar2, assume_unique=False):
+    """
+    Find the set exclusive-or of two arrays.
+
+    Return the sorted, unique values that are in only one (not both) of the
+    input arrays.
+
+    For full documentation refer to :obj:`numpy.setxor1d`.
+
+    Parameters
+    ----------
+    ar1, ar2 : {dpnp.ndarray, usm_ndarray}
+        Input arrays.
+    assume_unique : bool, optional
+        If ``True``, the input arrays are both assumed to be unique, which can
+        speed up the calculation.
+
+        Default: ``False``.
+
+    Returns
+    -------
+    setxor1d : dpnp.ndarray
+        Sorted 1-D array of unique values that are in only one of the input
+        arrays.
+
+    See Also
+    --------
+    :obj:`dpnp.setdiff1d` : Find the set difference of two arrays.
+    :obj:`dpnp.union1d` : Find the union of two arrays.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([1, 2, 3, 2, 4])
+    >>> b = np.array([2, 3, 5, 7, 5])
+    >>> np.setxor1d(a, b)
+    array([1, 4, 5, 7])
+
+    """
+
+    dpnp.check_supported_arrays_type(ar1, ar2)
+
+    if not assume_unique:
+        ar1 = dpnp.unique(ar1)
+        ar2 = dpnp.unique(ar2)
+
+    aux = dpnp.concatenate((ar1, ar2), axis=None)
+    if aux.size == 0:
+        return aux
+
+    # a value is exclusive if it differs from both of its sorted neighbors
+    aux = dpnp.sort(aux)
+    flag = dpnp.empty_like(aux, shape=(aux.size + 1,), dtype=dpnp.bool)
+    flag[0] = True
+    flag[-1] = True
+    dpnp.not_equal(aux[1:], aux[:-1], out=flag[1:-1])
+    return aux[flag[1:] & flag[:-1]]
+
+
 def shape(a):
     """
     Return the shape of an array.
@@ -4117,6 +4280,42 @@ def trim_zeros(filt, trim="fb", axis=None):
     return filt[sl]
 
 
+def union1d(ar1, ar2):
+    """
+    Find the union of two arrays.
+
+    Return the unique, sorted array of values that are in either of the two
+    input arrays.
+
+    For full documentation refer to :obj:`numpy.union1d`.
+
+    Parameters
+    ----------
+    ar1, ar2 : {dpnp.ndarray, usm_ndarray}
+        Input arrays. They are flattened if they are not already 1-D.
+
+    Returns
+    -------
+    union1d : dpnp.ndarray
+        Unique, sorted union of the input arrays.
+
+    See Also
+    --------
+    :obj:`dpnp.intersect1d` : Find the intersection of two arrays.
+    :obj:`dpnp.setdiff1d` : Find the set difference of two arrays.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.union1d(np.array([-1, 0, 1]), np.array([-2, 0, 2]))
+    array([-2, -1,  0,  1,  2])
+
+    """
+
+    dpnp.check_supported_arrays_type(ar1, ar2)
+    return dpnp.unique(dpnp.concatenate((ar1, ar2), axis=None))
+
+
 def unique(
     ar,
     return_index=False,
@@ -113,6 +113,7 @@ __all__ = [
     "heaviside",
     "imag",
     "i0",
+    "interp",
     "lcm",
     "ldexp",
     "maximum",
@@ -324,6 +325,56 @@ def _gradient_num_diff_edges(
         )
 
 
+def _interp_linear(x, x0, x1, y0, y1):
+    """
+    Interpolate linearly real values `y0` and `y1` given at points `x0` and
+    `x1` to points `x`.
+
+    If the interpolation from the left end of an interval results in NaN,
+    it is repeated from the right end, and the value `y0` is used where both
+    ends have the same value.
+
+    """
+
+    slope = (y1 - y0) / (x1 - x0)
+    res = slope * (x - x0) + y0
+    res = dpnp.where(dpnp.isnan(res), slope * (x - x1) + y1, res)
+    res = dpnp.where(dpnp.isnan(res) & (y0 == y1), y0, res)
+    return dpnp.where(x == x0, y0, res)
+
+
+def _interp_search(xp, x):
+    """
+    Find the number of sample points `xp` not greater than each value of `x`.
+
+    The 1-D sample points are searched by :obj:`dpnp.searchsorted`. The batches
+    of sample points stored along the last axis are searched by a binary search
+    which processes all the batches at every step.
+
+    """
+
+    if xp.ndim == 1:
+        return dpnp.searchsorted(xp, x, side="right")
+
+    n = xp.shape[-1]
+    pos = dpnp.zeros_like(x, dtype=dpnp.intp)
+    step = 1 << (n.bit_length() - 1)
+    while step > 0:
+        ind = pos + step
+        val = dpnp.take_along_axis(xp, dpnp.minimum(ind, n) - 1, axis=-1)
+        pos = dpnp.where((ind <= n) & (val <= x), ind, pos)
+        step >>= 1
+    return pos
+
+
+def _interp_take(a, ind):
+    """Take elements of `a` along the last axis at indices `ind`."""
+
+    if a.ndim == 1:
+        return dpnp.take(a, ind)
+    return dpnp.take_along_axis(a, ind, axis=-1)
+
+
 def _process_ediff1d_args(arg, arg_name, ary_dtype, ary_sycl_queue, usm_type):
     """Process the argument for ediff1d."""
     if not dpnp.is_supported_array_type(arg):
@@ -2742,6 +2793,208 @@ imag = DPNPImag(
 )
 
 
+def interp(x, xp, fp, left=None, right=None, period=None):
+    """
+    One-dimensional linear interpolation for monotonically increasing sample
+    points.
+
+    Returns the one-dimensional piecewise linear interpolant to a function
+    with given discrete data points (`xp`, `fp`), evaluated at `x`.
+
+    For full documentation refer to :obj:`numpy.interp`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray, scalar}
+        The x-coordinates at which to evaluate the interpolated values.
+    xp : {dpnp.ndarray, usm_ndarray}
+        The x-coordinates of the data points, must be increasing if argument
+        `period` is not specified. Otherwise, `xp` is internally sorted after
+        normalizing the periodic boundaries with ``xp = xp % period``.
+    fp : {dpnp.ndarray, usm_ndarray}
+        The y-coordinates of the data points, same length along the last axis
+        as `xp`.
+    left : {None, scalar}, optional
+        Value to return for ``x < xp[0]``, ``None`` means ``fp[0]``.
+
+        Default: ``None``.
+    right : {None, scalar}, optional
+        Value to return for ``x > xp[-1]``, ``None`` means ``fp[-1]``.
+
+        Default: ``None``.
+    period : {None, scalar}, optional
+        A period for the x-coordinates. This parameter allows the proper
+        interpolation of angular x-coordinates. Parameters `left` and `right`
+        are ignored if `period` is specified.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    y : dpnp.ndarray
+        The interpolated values of the default floating-point data type of
+        the device, or of the corresponding complex data type if `fp` is
+        complex. If `xp` and `fp` are 1-D arrays, `y` has the same shape as
+        `x`.
+
+    Notes
+    -----
+    If `xp` or `fp` has more than one dimension, a batch of tables is
+    interpolated at once. The tables are stored along the last axis of `xp`
+    and `fp`, and the query points along the last axis of `x`. The leading
+    dimensions of all three arrays are broadcast against each other, and `y`
+    has the broadcast leading dimensions followed by the last dimension of
+    `x`. The sample points of all tables are searched together by a binary
+    search processing every table at each step.
+
+    Does not check that the x-coordinate sequence `xp` is increasing. If `xp`
+    is not increasing, the results are nonsense.
+
+    See Also
+    --------
+    :obj:`dpnp.digitize` : Return the indices of the bins to which each value
+                           in input array belongs.
+    :obj:`dpnp.searchsorted` : Find indices where elements should be inserted
+                               to maintain order.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> xp = np.array([1, 2, 3])
+    >>> fp = np.array([3, 2, 0])
+    >>> np.interp(2.5, xp, fp)
+    array(1.)
+    >>> np.interp(np.array([0, 1, 1.5, 2.72, 3.14]), xp, fp)
+    array([3.  , 3.  , 2.5 , 0.56, 0.  ])
+    >>> UNDEF = -99.0
+    >>> np.interp(3.14, xp, fp, right=UNDEF)
+    array(-99.)
+
+    Interpolation with periodic x-coordinates:
+
+    >>> x = np.array([-180, -170, -185, 185, -10, -5, 0, 365])
+    >>> xp = np.array([190, -190, 350, -350])
+    >>> fp = np.array([5, 10, 3, 4])
+    >>> np.interp(x, xp, fp, period=360)
+    array([7.5 , 5.  , 8.75, 6.25, 3.  , 3.25, 3.5 , 3.75])
+
+    Complex interpolation:
+
+    >>> x = np.array([1.5, 4.0])
+    >>> xp = np.array([2, 3, 5])
+    >>> fp = np.array([1.0j, 0, 2+3j])
+    >>> np.interp(x, xp, fp)
+    array([0.+1.j , 1.+1.5j])
+
+    Batched interpolation of two tables, each at its own query points:
+
+    >>> x = np.array([[0.5, 1.5], [1.5, 2.5]])
+    >>> xp = np.array([[0, 1, 2], [1, 2, 3]])
+    >>> fp = np.array([[0, 10, 20], [1, 0, 1]])
+    >>> np.interp(x, xp, fp)
+    array([[ 5. , 15. ],
+           [ 0.5,  0.5]])
+
+    """
+
+    dpnp.check_supported_arrays_type(xp, fp)
+    dpnp.check_supported_arrays_type(x, scalar_type=True)
+
+    usm_type, exec_q = get_usm_allocations([x, xp, fp])
+    if dpnp.isscalar(x):
+        x = dpnp.asarray(x, usm_type=usm_type, sycl_queue=exec_q)
+
+    if dpnp.issubdtype(x.dtype, dpnp.complexfloating) or dpnp.issubdtype(
+        xp.dtype, dpnp.complexfloating
+    ):
+        raise TypeError("x and xp may not be complex")
+    if xp.ndim == 0 or fp.ndim == 0:
+        raise ValueError("object of too small depth for desired array")
+    if xp.shape[-1] != fp.shape[-1]:
+        raise ValueError("fp and xp are not of the same length")
+    if xp.shape[-1] == 0:
+        raise ValueError("array of sample points is empty")
+    if period is not None and period == 0:
+        raise ValueError("period must be a non-zero value")
+
+    res_dt = dpnp.default_float_type(sycl_queue=exec_q)
+    x = dpnp.astype(x, res_dt, copy=False)
+    xp = dpnp.astype(xp, res_dt, copy=False)
+    if dpnp.issubdtype(fp.dtype, dpnp.complexfloating):
+        res_dt = dpnp.result_type(res_dt, dpnp.complex64)
+    fp = dpnp.astype(fp, res_dt, copy=False)
+
+    n = xp.shape[-1]
+    if xp.ndim == 1 and fp.ndim == 1:
+        # all the points are interpolated in the same table
+        res_shape = x.shape
+        x = x.reshape(-1)
+    else:
+        if x.ndim == 0:
+            raise ValueError("x must have the last axis in batched mode")
+
+        batch_shape = numpy.broadcast_shapes(
+            x.shape[:-1], xp.shape[:-1], fp.shape[:-1]
+        )
+        x = dpnp.broadcast_to(x, batch_shape + x.shape[-1:])
+        if xp.ndim > 1:
+            xp = dpnp.broadcast_to(xp, batch_shape + (n,))
+            fp = dpnp.broadcast_to(fp, batch_shape + (n,))
+        elif fp.ndim > 1:
+            fp = dpnp.broadcast_to(fp, batch_shape + (n,))
+        res_shape = x.shape
+
+    if period is not None:
+        left = right = None
+        period = abs(period)
+
+        x = dpnp.remainder(x, period)
+        xp = dpnp.remainder(xp, period)
+
+        ind = dpnp.argsort(xp, axis=-1)
+        xp = dpnp.take_along_axis(xp, ind, axis=-1)
+        if xp.ndim == 1:
+            fp = dpnp.take(fp, ind, axis=-1)
+        else:
+            fp = dpnp.take_along_axis(fp, ind, axis=-1)
+
+        xp = dpnp.concatenate(
+            (xp[..., -1:] - period, xp, xp[..., :1] + period), axis=-1
+        )
+        fp = dpnp.concatenate((fp[..., -1:], fp, fp[..., :1]), axis=-1)
+        n += 2
+
+    if n > 1:
+        # index of the interval containing each point
+        ind = dpnp.clip(_interp_search(xp, x) - 1, 0, n - 2)
+        x0 = _interp_take(xp, ind)
+        x1 = _interp_take(xp, ind + 1)
+        y0 = _interp_take(fp, ind)
+        y1 = _interp_take(fp, ind + 1)
+
+        if dpnp.issubdtype(res_dt, dpnp.complexfloating):
+            # real and imaginary parts are interpolated separately
+            res = dpnp.empty_like(y0)
+            res.real = _interp_linear(x, x0, x1, y0.real, y1.real)
+            res.imag = _interp_linear(x, x0, x1, y0.imag, y1.imag)
+        else:
+            res = _interp_linear(x, x0, x1, y0, y1)
+
+        # NaN in x is propagated as is
+        res = dpnp.where(dpnp.isnan(x), x, res)
+    else:
+        res = dpnp.broadcast_to(fp, x.shape)
+
+    res = dpnp.where(x == xp[..., -1:], fp[..., -1:], res)
+    res = dpnp.where(
+        x > xp[..., -1:], fp[..., -1:] if right is None else right, res
+    )
+    res = dpnp.where(
+        x < xp[..., :1], fp[..., :1] if left is None else left, res
+    )
+    return dpnp.astype(res, res_dt, copy=False).reshape(res_shape)
+
+
 _LCM_DOCSTRING = r"""
 Returns the lowest common multiple of :math:`\abs{x1}` and :math:`\abs{x2}`.
 
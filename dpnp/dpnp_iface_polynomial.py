@@ -0,0 +1,1153 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Interface of the polynomial functions of dpnp
+
+Notes
+-----
+This module is a face or public interface file for the library
+it contains:
+ - Interface functions
+ - documentation for the functions
+ - The functions parameters check
+
+"""
+
+# pylint: disable=invalid-name
+
+import operator
+import warnings
+
+import numpy
+
+import dpnp
+
+from .dpnp_utils import get_usm_allocations
+
+__all__ = [
+    "poly",
+    "poly1d",
+    "polyadd",
+    "polyder",
+    "polyfit",
+    "polyint",
+    "polymul",
+    "polysub",
+    "polyval",
+    "roots",
+]
+
+# RankWarning is a member of numpy.exceptions since NumPy 1.25
+RankWarning = getattr(numpy, "exceptions", numpy).RankWarning
+
+
+def _get_coeffs(*polys):
+    """
+    Return 1-D arrays of coefficients of polynomials `polys` given as arrays,
+    :class:`dpnp.poly1d` objects or scalars.
+
+    """
+
+    polys = [p.coeffs if isinstance(p, poly1d) else p for p in polys]
+    dpnp.check_supported_arrays_type(*polys, scalar_type=True)
+
+    usm_type, exec_q = get_usm_allocations(polys)
+    res = []
+    for p in polys:
+        if dpnp.isscalar(p):
+            p = dpnp.asarray(p, usm_type=usm_type, sycl_queue=exec_q)
+        if p.ndim > 1:
+            raise ValueError("Multidimensional inputs are not supported")
+        res.append(dpnp.atleast_1d(p))
+    return res
+
+
+def _to_inexact(a):
+    """
+    Cast array `a` of a boolean or an integer data type to the default
+    floating-point data type of the device.
+
+    """
+
+    if dpnp.issubdtype(a.dtype, dpnp.inexact):
+        return a
+    return dpnp.astype(
+        a, dpnp.default_float_type(sycl_queue=a.sycl_queue), copy=False
+    )
+
+
+def poly(seq_of_zeros):
+    """
+    Find the coefficients of a polynomial with the given sequence of roots.
+
+    For full documentation refer to :obj:`numpy.poly`.
+
+    Parameters
+    ----------
+    seq_of_zeros : {dpnp.ndarray, usm_ndarray}
+        A sequence of polynomial roots, or a square array or matrix object.
+
+    Returns
+    -------
+    c : {dpnp.ndarray, float}
+        1-D array of polynomial coefficients from highest to lowest degree,
+        or ``1.0`` if `seq_of_zeros` is empty.
+
+    Raises
+    ------
+    ValueError
+        If input is the wrong shape (the input must be a 1-D or square 2-D
+        array).
+
+    See Also
+    --------
+    :obj:`dpnp.polyval` : Compute polynomial values.
+    :obj:`dpnp.roots` : Return the roots of a polynomial.
+    :obj:`dpnp.polyfit` : Least squares polynomial fit.
+    :obj:`dpnp.poly1d` : A one-dimensional polynomial class.
+
+    Notes
+    -----
+    The coefficients are computed on the device by multiplying the polynomial
+    by ``x - z`` for every root ``z`` in place. The eigenvalues of a square
+    matrix are computed by :obj:`dpnp.linalg.eigvals`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+
+    Given a sequence of a polynomial's zeros:
+
+    >>> np.poly(np.array([0, 0, 0])) # Multiple root example
+    array([1., 0., 0., 0.])
+
+    The line above represents z**3 + 0*z**2 + 0*z + 0.
+
+    >>> np.poly(np.array([-1./2, 0, 1./2]))
+    array([ 1.  ,  0.  , -0.25,  0.  ])
+
+    The line above represents z**3 - z/4
+
+    Given a square array object:
+
+    >>> P = np.array([[0, 1./3], [-1./2, 0]])
+    >>> np.poly(P)
+    array([1.        , 0.        , 0.16666667])
+
+    """
+
+    dpnp.check_supported_arrays_type(seq_of_zeros)
+
+    seq_of_zeros = dpnp.atleast_1d(seq_of_zeros)
+    sh = seq_of_zeros.shape
+    if len(sh) == 2 and sh[0] == sh[1] and sh[0] != 0:
+        seq_of_zeros = dpnp.linalg.eigvals(seq_of_zeros)
+    elif len(sh) == 1:
+        if seq_of_zeros.dtype == dpnp.float16:
+            # half precision is promoted as integer data types
+            seq_of_zeros = dpnp.astype(
+                seq_of_zeros,
+                dpnp.default_float_type(sycl_queue=seq_of_zeros.sycl_queue),
+            )
+        seq_of_zeros = _to_inexact(seq_of_zeros)
+    else:
+        raise ValueError("input must be 1d or non-empty square 2d array.")
+
+    n = seq_of_zeros.size
+    if n == 0:
+        return 1.0
+
+    a = dpnp.zeros_like(seq_of_zeros, shape=(n + 1,))
+    a[0] = 1
+    for k in range(n):
+        # multiply the polynomial by (x - seq_of_zeros[k])
+        a[1 : k + 2] -= seq_of_zeros[k] * a[: k + 1]
+
+    if dpnp.issubdtype(a.dtype, dpnp.complexfloating):
+        # complex roots come as conjugate pairs
+        roots_sorted = dpnp.sort(seq_of_zeros)
+        if dpnp.all(roots_sorted == dpnp.sort(seq_of_zeros.conj())):
+            a = a.real.copy()
+    return a
+
+
+class poly1d:
+    """
+    A one-dimensional polynomial class.
+
+    A convenience class, used to encapsulate "natural" operations on
+    polynomials so that said operations may take on their customary form
+    in code.
+
+    For full documentation refer to :obj:`numpy.poly1d`.
+
+    Parameters
+    ----------
+    c_or_r : {dpnp.ndarray, usm_ndarray, numpy.ndarray, dpnp.poly1d, \
+              numpy.poly1d, sequence, scalar}
+        The polynomial's coefficients, in decreasing powers, or if the value
+        of the second parameter is ``True``, the polynomial's roots (values
+        where the polynomial evaluates to 0).
+    r : bool, optional
+        If ``True``, `c_or_r` specifies the polynomial's roots.
+
+        Default: ``False``.
+    variable : {None, str}, optional
+        Changes the variable used when printing the polynomial from ``x`` to
+        `variable`.
+
+        Default: ``None``.
+
+    See Also
+    --------
+    :obj:`dpnp.poly` : Find the coefficients of a polynomial with the given
+                       sequence of roots.
+    :obj:`dpnp.polyval` : Compute polynomial values.
+
+    Examples
+    --------
+    >>> import dpnp as np
+
+    Construct the polynomial :math:`x^2 + 2x + 3`:
+
+    >>> p = np.poly1d([1, 2, 3])
+    >>> print(p)
+       2
+    1 x + 2 x + 3
+
+    Evaluate the polynomial at :math:`x = 0.5`:
+
+    >>> p(0.5)
+    array(4.25)
+
+    Find the roots:
+
+    >>> p.r
+    array([-1.+1.41421356j, -1.-1.41421356j])
+
+    Show the coefficients:
+
+    >>> p.c
+    array([1, 2, 3])
+
+    Display the order (the leading zero-coefficients are removed):
+
+    >>> p.order
+    2
+
+    Polynomials can be added, subtracted, multiplied, and raised to
+    non-negative integer powers:
+
+    >>> p * p
+    poly1d([ 1,  4, 10, 12,  9])
+    >>> p**2
+    poly1d([ 1,  4, 10, 12,  9])
+
+    Construct a polynomial from its roots:
+
+    >>> np.poly1d(np.array([1, 2]), True)
+    poly1d([ 1., -3.,  2.])
+
+    """
+
+    __hash__ = None
+
+    def __init__(self, c_or_r, r=False, variable=None):
+        if isinstance(c_or_r, (poly1d, numpy.poly1d)):
+            self._variable = c_or_r.variable
+            self._coeffs = dpnp.asarray(c_or_r.coeffs)
+            if variable is not None:
+                self._variable = variable
+            return
+
+        if r:
+            c_or_r = poly(c_or_r)
+
+        c_or_r = dpnp.atleast_1d(dpnp.asarray(c_or_r))
+        if c_or_r.ndim > 1:
+            raise ValueError("Polynomial must be 1d only.")
+
+        c_or_r = dpnp.trim_zeros(c_or_r, trim="f")
+        if c_or_r.size == 0:
+            c_or_r = dpnp.zeros_like(c_or_r, shape=(1,))
+        self._coeffs = c_or_r
+        self._variable = "x" if variable is None else variable
+
+    @property
+    def coeffs(self):
+        """The polynomial coefficients."""
+        return self._coeffs
+
+    @coeffs.setter
+    def coeffs(self, value):
+        # allowing this makes p.coeffs *= 2 legal
+        if value is not self._coeffs:
+            raise AttributeError("Cannot set attribute")
+
+    @property
+    def order(self):
+        """The order or degree of the polynomial."""
+        return self._coeffs.size - 1
+
+    @property
+    def roots(self):
+        """The roots of the polynomial, where ``self(x) == 0``."""
+        return roots(self._coeffs)
+
+    @property
+    def variable(self):
+        """The name of the polynomial variable."""
+        return self._variable
+
+    # alias attributes
+    c = coef = coefficients = coeffs
+    o = order
+    r = roots
+
+    def __add__(self, other):
+        return polyadd(self, other)
+
+    def __call__(self, val):
+        return polyval(self._coeffs, val)
+
+    def __eq__(self, other):
+        if not isinstance(other, poly1d):
+            return NotImplemented
+        if self._coeffs.shape != other.coeffs.shape:
+            return False
+        return bool((self._coeffs == other.coeffs).all())
+
+    def __getitem__(self, val):
+        if val < 0 or val > self.order:
+            return dpnp.zeros_like(self._coeffs, shape=())
+        return self._coeffs[self.order - val]
+
+    def __iter__(self):
+        return iter(self._coeffs)
+
+    def __len__(self):
+        return self.order
+
+    def __mul__(self, other):
+        if dpnp.isscalar(other):
+            return poly1d(self._coeffs * other)
+        return polymul(self, other)
+
+    def __ne__(self, other):
+        if not isinstance(other, poly1d):
+            return NotImplemented
+        return not self.__eq__(other)
+
+    def __neg__(self):
+        return poly1d(-self._coeffs)
+
+    def __pos__(self):
+        return self
+
+    def __pow__(self, val):
+        if not dpnp.isscalar(val) or int(val) != val or val < 0:
+            raise ValueError("Power to non-negative integers only.")
+
+        # raise to the power by repeated squaring
+        val = operator.index(val)
+        res = poly1d(dpnp.ones_like(self._coeffs, shape=(1,)))
+        base = self
+        while val > 0:
+            if val & 1:
+                res = polymul(res, base)
+            val >>= 1
+            if val > 0:
+                base = polymul(base, base)
+        return res
+
+    def __radd__(self, other):
+        return polyadd(other, self)
+
+    def __repr__(self):
+        vals = repr(self._coeffs)
+        vals = vals[6:-1]
+        return f"poly1d({vals})"
+
+    def __rmul__(self, other):
+        if dpnp.isscalar(other):
+            return poly1d(other * self._coeffs)
+        return polymul(other, self)
+
+    def __rsub__(self, other):
+        return polysub(other, self)
+
+    def __setitem__(self, key, val):
+        if key < 0:
+            raise ValueError("Does not support negative powers.")
+
+        ind = self.order - key
+        if key > self.order:
+            zr = dpnp.zeros_like(self._coeffs, shape=(key - self.order,))
+            self._coeffs = dpnp.concatenate((zr, self._coeffs))
+            ind = 0
+        self._coeffs[ind] = val
+
+    def __str__(self):
+        return str(self.asnumpy())
+
+    def __sub__(self, other):
+        return polysub(self, other)
+
+    def __truediv__(self, other):
+        if dpnp.isscalar(other):
+            return poly1d(self._coeffs / other)
+        return NotImplemented
+
+    def asnumpy(self):
+        """
+        Copy the polynomial into :class:`numpy.poly1d` instance.
+
+        Returns
+        -------
+        out : numpy.poly1d
+            An instance of :class:`numpy.poly1d` with the same coefficients
+            and variable.
+
+        """
+
+        return numpy.poly1d(self._coeffs.asnumpy(), variable=self._variable)
+
+    def deriv(self, m=1):
+        """
+        Return a derivative of this polynomial.
+
+        Refer to :obj:`dpnp.polyder` for full documentation.
+
+        """
+
+        return poly1d(polyder(self._coeffs, m=m))
+
+    def integ(self, m=1, k=0):
+        """
+        Return an antiderivative (indefinite integral) of this polynomial.
+
+        Refer to :obj:`dpnp.polyint` for full documentation.
+
+        """
+
+        return poly1d(polyint(self._coeffs, m=m, k=k))
+
+    def set(self, p):
+        """
+        Copy the coefficients and the variable of :class:`numpy.poly1d`
+        instance `p` into the polynomial.
+
+        """
+
+        if not isinstance(p, numpy.poly1d):
+            raise TypeError(f"Only numpy.poly1d can be set, but got {type(p)}")
+
+        self._coeffs = dpnp.asarray(
+            p.coeffs,
+            usm_type=self._coeffs.usm_type,
+            sycl_queue=self._coeffs.sycl_queue,
+        )
+        self._variable = p.variable
+
+
+def polyadd(a1, a2):
+    """
+    Find the sum of two polynomials.
+
+    For full documentation refer to :obj:`numpy.polyadd`.
+
+    Parameters
+    ----------
+    a1, a2 : {dpnp.ndarray, usm_ndarray, dpnp.poly1d, scalar}
+        Input polynomials, at least one of them must be an array or
+        a :class:`dpnp.poly1d` object.
+
+    Returns
+    -------
+    out : {dpnp.ndarray, dpnp.poly1d}
+        The sum of the inputs. If either input is a :class:`dpnp.poly1d`
+        object, then the output is also a :class:`dpnp.poly1d` object.
+        Otherwise, it is a 1-D array of polynomial coefficients from highest
+        to lowest degree.
+
+    See Also
+    --------
+    :obj:`dpnp.poly1d` : A one-dimensional polynomial class.
+    :obj:`dpnp.poly` : Find the coefficients of a polynomial with the given
+                       sequence of roots.
+    :obj:`dpnp.polysub` : Difference (subtraction) of two polynomials.
+    :obj:`dpnp.polymul` : Find the product of two polynomials.
+    :obj:`dpnp.polyval` : Compute polynomial values.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.polyadd(np.array([1, 2]), np.array([9, 5, 4]))
+    array([9, 6, 6])
+
+    Using :class:`dpnp.poly1d` objects:
+
+    >>> p1 = np.poly1d([1, 2])
+    >>> p2 = np.poly1d([9, 5, 4])
+    >>> print(p1 + p2)
+       2
+    9 x + 6 x + 6
+
+    """
+
+    truepoly = isinstance(a1, poly1d) or isinstance(a2, poly1d)
+    a1, a2 = _get_coeffs(a1, a2)
+
+    diff = a2.size - a1.size
+    if diff > 0:
+        a1 = dpnp.concatenate((dpnp.zeros_like(a1, shape=(diff,)), a1))
+    elif diff < 0:
+        a2 = dpnp.concatenate((dpnp.zeros_like(a2, shape=(-diff,)), a2))
+
+    val = a1 + a2
+    if truepoly:
+        val = poly1d(val)
+    return val
+
+
+def polyder(p, m=1):
+    """
+    Return the derivative of the specified order of a polynomial.
+
+    For full documentation refer to :obj:`numpy.polyder`.
+
+    Parameters
+    ----------
+    p : {dpnp.ndarray, usm_ndarray, dpnp.poly1d}
+        Polynomial to differentiate. A sequence is interpreted as polynomial
+        coefficients.
+    m : int, optional
+        Order of differentiation.
+
+        Default: ``1``.
+
+    Returns
+    -------
+    der : {dpnp.ndarray, dpnp.poly1d}
+        A new polynomial representing the derivative.
+
+    See Also
+    --------
+    :obj:`dpnp.polyint` : Anti-derivative of a polynomial.
+    :obj:`dpnp.poly1d` : Class for one-dimensional polynomials.
+
+    Examples
+    --------
+    >>> import dpnp as np
+
+    The derivative of the polynomial :math:`x^3 + x^2 + x^1 + 1` is:
+
+    >>> p = np.poly1d([1, 1, 1, 1])
+    >>> p2 = np.polyder(p)
+    >>> p2
+    poly1d([3, 2, 1])
+
+    We can verify this, approximating the derivative with
+    ``(f(x + h) - f(x))/h``:
+
+    >>> p2(2.)
+    array(17.)
+    >>> (p(2. + 0.001) - p(2.)) / 0.001
+    array(17.007001)
+
+    The fourth-order derivative of a 3rd-order polynomial is zero:
+
+    >>> np.polyder(p, 2)
+    poly1d([6, 2])
+    >>> np.polyder(p, 3)
+    poly1d([6])
+    >>> np.polyder(p, 4)
+    poly1d([0])
+
+    """
+
+    m = int(m)
+    if m < 0:
+        raise ValueError("Order of derivative must be positive (see polyint)")
+
+    truepoly = isinstance(p, poly1d)
+    (val,) = _get_coeffs(p)
+
+    for _ in range(m):
+        n = val.size - 1
+        val = val[:-1] * dpnp.arange(
+            n, 0, -1, usm_type=val.usm_type, sycl_queue=val.sycl_queue
+        )
+
+    if truepoly:
+        val = poly1d(val)
+    return val
+
+
+def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False):
+    """
+    Least squares polynomial fit.
+
+    Fit a polynomial ``p(x) = p[0] * x**deg + ... + p[deg]`` of degree `deg`
+    to points `(x, y)`. Returns a vector of coefficients `p` that minimises
+    the squared error in the order `deg`, `deg-1`, ... `0`.
+
+    For full documentation refer to :obj:`numpy.polyfit`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        x-coordinates of the `M` sample points ``(x[i], y[i])``, an array of
+        shape ``(M,)``.
+    y : {dpnp.ndarray, usm_ndarray}
+        y-coordinates of the sample points, an array of shape ``(M,)`` or
+        ``(M, K)``. Several data sets of sample points sharing the same
+        x-coordinates can be fitted at once by passing in a 2-D array that
+        contains one dataset per column.
+    deg : int
+        Degree of the fitting polynomial.
+    rcond : {None, float}, optional
+        Relative condition number of the fit. Singular values smaller than
+        this relative to the largest singular value will be ignored. ``None``
+        means ``len(x)*eps``, where `eps` is the relative precision of the
+        floating-point data type.
+
+        Default: ``None``.
+    full : bool, optional
+        Switch determining nature of return value. When it is ``False`` just
+        the coefficients are returned, when ``True`` diagnostic information
+        from the singular value decomposition is also returned.
+
+        Default: ``False``.
+    w : {None, dpnp.ndarray, usm_ndarray}, optional
+        Weights of shape ``(M,)``. If not ``None``, the weight ``w[i]``
+        applies to the unsquared residual ``y[i] - y_hat[i]`` at ``x[i]``.
+
+        Default: ``None``.
+    cov : {bool, "unscaled"}, optional
+        If given and not ``False``, return not just the estimate but also its
+        covariance matrix. By default, the covariance are scaled by
+        ``chi2/dof``, where ``dof = M - (deg + 1)``. If ``cov="unscaled"``,
+        this scaling is omitted.
+
+        Default: ``False``.
+
+    Returns
+    -------
+    p : dpnp.ndarray
+        Polynomial coefficients, highest power first, of shape ``(deg + 1,)``
+        or ``(deg + 1, K)`` if `y` is a 2-D array, in which case the
+        coefficients for the `k`-th data set are in ``p[:, k]``.
+    residuals, rank, singular_values, rcond
+        These values are only returned if ``full == True``:
+
+        - residuals -- sum of squared residuals of the least squares fit
+        - rank -- the effective rank of the scaled Vandermonde coefficient
+          matrix
+        - singular_values -- singular values of the scaled Vandermonde
+          coefficient matrix
+        - rcond -- value of `rcond`.
+
+        For more details, see :obj:`dpnp.linalg.lstsq`.
+    V : dpnp.ndarray
+        The covariance matrix of the polynomial coefficient estimates of
+        shape ``(deg + 1, deg + 1)`` or ``(deg + 1, deg + 1, K)``. Present
+        only if ``full == False`` and ``cov == True``.
+
+    Warns
+    -----
+    RankWarning
+        The rank of the coefficient matrix in the least-squares fit is
+        deficient. The warning is only raised if ``full == False``.
+
+    See Also
+    --------
+    :obj:`dpnp.polyval` : Compute polynomial values.
+    :obj:`dpnp.linalg.lstsq` : Computes a least-squares fit.
+    :obj:`dpnp.vander` : Generate a Vandermonde matrix.
+
+    Notes
+    -----
+    The Vandermonde matrix of `x` is built by :obj:`dpnp.vander` and all the
+    data sets stored in the columns of `y` are fitted by a single call of
+    :obj:`dpnp.linalg.lstsq`, which decomposes the matrix only once.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> x = np.array([0.0, 1.0, 2.0, 3.0,  4.0,  5.0])
+    >>> y = np.array([0.0, 0.8, 0.9, 0.1, -0.8, -1.0])
+    >>> z = np.polyfit(x, y, 3)
+    >>> z
+    array([ 0.08703704, -0.81349206,  1.69312169, -0.03968254]) # may vary
+
+    Fit two data sets at once:
+
+    >>> y2 = np.stack((y, 2 * y), axis=1)
+    >>> np.polyfit(x, y2, 1)
+    array([[-0.30285714, -0.60571429],
+           [ 0.75714286,  1.51428571]]) # may vary
+
+    """
+
+    dpnp.check_supported_arrays_type(x, y)
+
+    order = int(deg) + 1
+    if deg < 0:
+        raise ValueError("expected deg >= 0")
+    if x.ndim != 1:
+        raise TypeError("expected 1D vector for x")
+    if x.size == 0:
+        raise TypeError("expected non-empty vector for x")
+    if y.ndim < 1 or y.ndim > 2:
+        raise TypeError("expected 1D or 2D array for y")
+    if x.shape[0] != y.shape[0]:
+        raise TypeError("expected x and y to have same length")
+    if dpnp.float16 in (x.dtype, y.dtype):
+        raise TypeError("array type float16 is unsupported in linalg")
+
+    x = _to_inexact(x)
+    y = _to_inexact(y)
+
+    # set rcond
+    if rcond is None:
+        rcond = x.size * dpnp.finfo(x.dtype).eps
+
+    # set up least squares equation for powers of x
+    lhs = dpnp.vander(x, order)
+    rhs = y
+
+    # apply weighting
+    if w is not None:
+        dpnp.check_supported_arrays_type(w)
+        if w.ndim != 1:
+            raise TypeError("expected a 1-d array for weights")
+        if w.shape[0] != y.shape[0]:
+            raise TypeError("expected w and y to have the same length")
+
+        w = _to_inexact(w)
+        lhs *= w[:, None]
+        rhs = rhs * (w[:, None] if rhs.ndim == 2 else w)
+
+    res_dt = dpnp.result_type(lhs, rhs)
+    lhs = dpnp.astype(lhs, res_dt, copy=False)
+    rhs = dpnp.astype(rhs, res_dt, copy=False)
+
+    # scale lhs to improve condition number and solve
+    scale = dpnp.sqrt((lhs * lhs).sum(axis=0))
+    lhs /= scale
+    c, resids, rank, s = dpnp.linalg.lstsq(lhs, rhs, rcond)
+    c = (c.T / scale).T  # broadcast scale coefficients
+
+    # warn on rank reduction, which indicates an ill conditioned matrix
+    if rank != order and not full:
+        msg = "Polyfit may be poorly conditioned"
+        warnings.warn(msg, RankWarning, stacklevel=2)
+
+    if full:
+        return c, resids, rank, s, rcond
+    if cov:
+        Vbase = dpnp.linalg.inv(dpnp.dot(lhs.T, lhs))
+        Vbase /= dpnp.outer(scale, scale)
+        if cov == "unscaled":
+            fac = 1
+        else:
+            if x.size <= order:
+                raise ValueError(
+                    "the number of data points must exceed order "
+                    "to scale the covariance matrix"
+                )
+            # note, this used to be: fac = resids / (len(x) - order - 2.0)
+            # it was decided that the "- 2" (originally justified by "Bayesian
+            # uncertainty analysis") is not what the user expects
+            # (see numpy/numpy#11196 and numpy/numpy#11197)
+            fac = resids / (x.size - order)
+        if y.ndim == 1:
+            return c, Vbase * fac
+        return c, Vbase[:, :, None] * fac
+    return c
+
+
+def polyint(p, m=1, k=None):
+    """
+    Return an antiderivative (indefinite integral) of a polynomial.
+
+    For full documentation refer to :obj:`numpy.polyint`.
+
+    Parameters
+    ----------
+    p : {dpnp.ndarray, usm_ndarray, dpnp.poly1d}
+        Polynomial to integrate. A sequence is interpreted as polynomial
+        coefficients.
+    m : int, optional
+        Order of the antiderivative.
+
+        Default: ``1``.
+    k : {None, list, scalar, dpnp.ndarray, usm_ndarray}, optional
+        Integration constants. They are given in the order of integration:
+        those corresponding to highest-order terms come first. If ``None``,
+        all constants are assumed to be zero. If ``m = 1``, a single scalar
+        can be given instead of a list.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : {dpnp.ndarray, dpnp.poly1d}
+        A new polynomial representing the antiderivative.
+
+    See Also
+    --------
+    :obj:`dpnp.polyder` : Derivative of a polynomial.
+    :obj:`dpnp.poly1d.integ` : Equivalent method.
+
+    Examples
+    --------
+    >>> import dpnp as np
+
+    The defining property of the antiderivative:
+
+    >>> p = np.poly1d([1, 1, 1])
+    >>> P = np.polyint(p)
+    >>> P
+    poly1d([0.33333333, 0.5       , 1.        , 0.        ]) # may vary
+    >>> np.polyder(P) == p
+    True
+
+    The integration constants default to zero, but can be specified:
+
+    >>> P = np.polyint(p, 3)
+    >>> P(0)
+    array(0.)
+    >>> P = np.polyint(p, 3, k=[6, 5, 3])
+    >>> P
+    poly1d([ 0.01666667,  0.04166667,  0.16666667,  3. ,  5. ,  3. ]) # may vary
+
+    """
+
+    m = int(m)
+    if m < 0:
+        raise ValueError("Order of integral must be positive (see polyder)")
+
+    truepoly = isinstance(p, poly1d)
+    (val,) = _get_coeffs(p)
+
+    res_dt = dpnp.default_float_type(sycl_queue=val.sycl_queue)
+    if dpnp.issubdtype(val.dtype, dpnp.complexfloating):
+        res_dt = dpnp.result_type(res_dt, dpnp.complex64)
+
+    if k is None:
+        k = dpnp.zeros_like(val, shape=(m,), dtype=res_dt)
+    else:
+        if not dpnp.is_supported_array_type(k):
+            k = dpnp.asarray(
+                k, usm_type=val.usm_type, sycl_queue=val.sycl_queue
+            )
+        k = dpnp.atleast_1d(k)
+        if k.size == 1 and m > 1:
+            k = dpnp.broadcast_to(k[:1], (m,))
+        if k.size < m:
+            raise ValueError(
+                "k must be a scalar or a rank-1 array of length 1 or >m."
+            )
+        k = dpnp.astype(k, dpnp.result_type(res_dt, k), copy=False)
+
+    for i in range(m):
+        divisor = dpnp.arange(
+            val.size, 0, -1, usm_type=val.usm_type, sycl_queue=val.sycl_queue
+        )
+        val = dpnp.concatenate((val / divisor, k[i : i + 1]))
+
+    if truepoly:
+        val = poly1d(val)
+    return val
+
+
+def polymul(a1, a2):
+    """
+    Find the product of two polynomials.
+
+    For full documentation refer to :obj:`numpy.polymul`.
+
+    Parameters
+    ----------
+    a1, a2 : {dpnp.ndarray, usm_ndarray, dpnp.poly1d, scalar}
+        Input polynomials, at least one of them must be an array or
+        a :class:`dpnp.poly1d` object.
+
+    Returns
+    -------
+    out : {dpnp.ndarray, dpnp.poly1d}
+        The polynomial resulting from the multiplication of the inputs. If
+        either input is a :class:`dpnp.poly1d` object, then the output is
+        also a :class:`dpnp.poly1d` object. Otherwise, it is a 1-D array of
+        polynomial coefficients from highest to lowest degree.
+
+    See Also
+    --------
+    :obj:`dpnp.poly1d` : A one-dimensional polynomial class.
+    :obj:`dpnp.poly` : Find the coefficients of a polynomial with the given
+                       sequence of roots.
+    :obj:`dpnp.polyadd` : Find the sum of two polynomials.
+    :obj:`dpnp.polysub` : Difference (subtraction) of two polynomials.
+    :obj:`dpnp.polyval` : Compute polynomial values.
+    :obj:`dpnp.convolve` : Returns the discrete, linear convolution of two
+                           one-dimensional sequences.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.polymul(np.array([1, 2, 3]), np.array([9, 5, 1]))
+    array([ 9, 23, 38, 17,  3])
+
+    Using :class:`dpnp.poly1d` objects:
+
+    >>> p1 = np.poly1d([1, 2, 3])
+    >>> p2 = np.poly1d([9, 5, 1])
+    >>> print(p1 * p2)
+       4      3      2
+    9 x + 23 x + 38 x + 17 x + 3
+
+    """
+
+    truepoly = isinstance(a1, poly1d) or isinstance(a2, poly1d)
+    a1, a2 = _get_coeffs(a1, a2)
+
+    val = dpnp.convolve(poly1d(a1).coeffs, poly1d(a2).coeffs)
+    if truepoly:
+        val = poly1d(val)
+    return val
+
+
+def polysub(a1, a2):
+    """
+    Difference (subtraction) of two polynomials.
+
+    For full documentation refer to :obj:`numpy.polysub`.
+
+    Parameters
+    ----------
+    a1, a2 : {dpnp.ndarray, usm_ndarray, dpnp.poly1d, scalar}
+        Minuend and subtrahend polynomials, respectively. At least one of them
+        must be an array or a :class:`dpnp.poly1d` object.
+
+    Returns
+    -------
+    out : {dpnp.ndarray, dpnp.poly1d}
+        Array or :class:`dpnp.poly1d` object of the difference polynomial's
+        coefficients.
+
+    See Also
+    --------
+    :obj:`dpnp.polyval` : Compute polynomial values.
+    :obj:`dpnp.polyadd` : Find the sum of two polynomials.
+    :obj:`dpnp.polymul` : Find the product of two polynomials.
+    :obj:`dpnp.poly1d` : A one-dimensional polynomial class.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.polysub(np.array([2, 10, -2]), np.array([3, 10, -4]))
+    array([-1,  0,  2])
+
+    """
+
+    truepoly = isinstance(a1, poly1d) or isinstance(a2, poly1d)
+    a1, a2 = _get_coeffs(a1, a2)
+
+    diff = a2.size - a1.size
+    if diff > 0:
+        a1 = dpnp.concatenate((dpnp.zeros_like(a1, shape=(diff,)), a1))
+    elif diff < 0:
+        a2 = dpnp.concatenate((dpnp.zeros_like(a2, shape=(-diff,)), a2))
+
+    val = a1 - a2
+    if truepoly:
+        val = poly1d(val)
+    return val
+
+
+def polyval(p, x):
+    """
+    Evaluate a polynomial at specific values.
+
+    For full documentation refer to :obj:`numpy.polyval`.
+
+    Parameters
+    ----------
+    p : {dpnp.ndarray, usm_ndarray, dpnp.poly1d}
+        1-D array of polynomial coefficients (including coefficients equal to
+        zero) from highest degree to the constant term, or an instance of
+        :class:`dpnp.poly1d`.
+    x : {dpnp.ndarray, usm_ndarray, dpnp.poly1d, scalar}
+        A number, an array of numbers, or an instance of :class:`dpnp.poly1d`,
+        at which to evaluate `p`.
+
+    Returns
+    -------
+    values : {dpnp.ndarray, dpnp.poly1d}
+        If `x` is a :class:`dpnp.poly1d` instance, the result is the
+        composition of the two polynomials, i.e., `x` is "substituted" in `p`
+        and the simplified result is returned. Otherwise, an array of the
+        shape of `x` is returned.
+
+    See Also
+    --------
+    :obj:`dpnp.poly1d` : A polynomial class.
+
+    Notes
+    -----
+    Horner's scheme is used to evaluate the polynomial. Every step of the
+    scheme updates the result in place, so no temporary arrays are allocated
+    whatever the degree of the polynomial is.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.polyval(np.array([3, 0, 1]), 5)  # 3 * 5**2 + 0 * 5**1 + 1
+    array(76)
+    >>> np.polyval(np.array([3, 0, 1]), np.poly1d([5]))
+    poly1d([76])
+    >>> np.polyval(np.poly1d([3, 0, 1]), 5)
+    array(76)
+    >>> np.polyval(np.poly1d([3, 0, 1]), np.poly1d([5]))
+    poly1d([76])
+
+    """
+
+    if isinstance(p, poly1d):
+        p = p.coeffs
+    if not dpnp.is_supported_array_type(p) or p.ndim == 0:
+        raise TypeError("p must be 1d array or poly1d object")
+    if p.ndim > 1:
+        raise ValueError("p must be 1d array")
+
+    if isinstance(x, poly1d):
+        res = poly1d(dpnp.zeros_like(p, shape=(1,)))
+        for i in range(p.size):
+            res = res * x + p[i]
+        return res
+
+    dpnp.check_supported_arrays_type(x, scalar_type=True)
+    res_dt = dpnp.result_type(p, x.dtype if isinstance(x, numpy.generic) else x)
+
+    usm_type, exec_q = get_usm_allocations([p, x])
+    if dpnp.isscalar(x):
+        x = dpnp.asarray(x, dtype=res_dt, usm_type=usm_type, sycl_queue=exec_q)
+
+    res = dpnp.zeros_like(x, dtype=res_dt, usm_type=usm_type)
+    for i in range(p.size):
+        dpnp.multiply(res, x, out=res)
+        dpnp.add(res, p[i], out=res)
+    return res
+
+
+def roots(p):
+    """
+    Return the roots of a polynomial with coefficients given in `p`.
+
+    The values in the rank-1 array `p` are coefficients of a polynomial.
+    If the length of `p` is ``n+1`` then the polynomial is described by::
+
+        p[0] * x**n + p[1] * x**(n-1) + ... + p[n-1]*x + p[n]
+
+    For full documentation refer to :obj:`numpy.roots`.
+
+    Parameters
+    ----------
+    p : {dpnp.ndarray, usm_ndarray, dpnp.poly1d}
+        Rank-1 array of polynomial coefficients.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        An array containing the roots of the polynomial.
+
+    Raises
+    ------
+    ValueError
+        When `p` cannot be converted to a rank-1 array.
+
+    See Also
+    --------
+    :obj:`dpnp.poly` : Find the coefficients of a polynomial with a given
+                       sequence of roots.
+    :obj:`dpnp.polyval` : Compute polynomial values.
+    :obj:`dpnp.polyfit` : Least squares polynomial fit.
+    :obj:`dpnp.poly1d` : A one-dimensional polynomial class.
+
+    Notes
+    -----
+    The algorithm relies on computing the eigenvalues of the companion matrix
+    by :obj:`dpnp.linalg.eigvals`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> coeff = np.array([3.2, 2, 1])
+    >>> np.roots(coeff)
+    array([-0.3125+0.46351241j, -0.3125-0.46351241j])
+
+    """
+
+    if isinstance(p, poly1d):
+        p = p.coeffs
+    dpnp.check_supported_arrays_type(p)
+    if p.ndim == 0:
+        raise TypeError("Input must be a rank-1 array, but got 0-d array.")
+    if p.ndim != 1:
+        raise ValueError("Input must be a rank-1 array.")
+
+    res_dt = dpnp.default_float_type(sycl_queue=p.sycl_queue)
+
+    # find non-zero array entries
+    non_zero = dpnp.nonzero(p)[0]
+
+    # return an empty array if polynomial is all zeros
+    if non_zero.size == 0:
+        return dpnp.empty_like(p, shape=(0,), dtype=res_dt)
+
+    # find the number of trailing zeros -- this is the number of roots at 0
+    first, last = int(non_zero[0]), int(non_zero[-1])
+    trailing_zeros = p.size - last - 1
+
+    # strip leading and trailing zeros
+    p = p[first : last + 1]
+    p = _to_inexact(p)
+
+    n = p.size
+    if n > 1:
+        # build companion matrix and find its eigenvalues (the roots)
+        a = dpnp.diag(dpnp.ones_like(p, shape=(n - 2,)), -1)
+        a[0, :] = -p[1:] / p[0]
+        res = dpnp.linalg.eigvals(a)
+    else:
+        res = dpnp.empty_like(p, shape=(0,), dtype=res_dt)
+
+    # tack any zeros onto the back of the array
+    return dpnp.concatenate(
+        (res, dpnp.zeros_like(res, shape=(trailing_zeros,)))
+    )
@@ -43,6 +43,10 @@ import dpctl.tensor._tensor_impl as dti
 import dpnp
 
 from .dpnp_array import dpnp_array
+from .dpnp_utils.dpnp_utils_bitmask import (
+    dpnp_packed_nonzero,
+    dpnp_unpack_mask,
+)
 from .dpnp_utils.dpnp_utils_reduction import dpnp_wrap_reduction_call
 
 __all__ = ["argmax", "argmin", "argwhere", "searchsorted", "where"]
@@ -382,7 +386,17 @@ def searchsorted(a, v, side="left", sorter=None):
     )
 
 
-def where(condition, x=None, y=None, /, *, order="K", out=None):
+def where(
+    condition,
+    x=None,
+    y=None,
+    /,
+    *,
+    order="K",
+    out=None,
+    packed=False,
+    bitorder="big",
+):
     """
     Return elements chosen from `x` or `y` depending on `condition`.
 
@@ -410,6 +424,19 @@ def where(condition, x=None, y=None, /, *, order="K", out=None):
         If ``None`` then a new array is returned.
 
         Default: ``None``.
+    packed : bool, optional
+        If ``True``, `condition` is a flattened boolean mask packed to bits of
+        a 1-D array of ``uint8`` data type, as returned by
+        :obj:`dpnp.packbits`. The mask is unpacked to the shape of `x` and `y`
+        broadcast together. If only `condition` is provided, the mask is
+        unpacked by chunks, so the unpacked mask is never allocated in full.
+
+        Default: ``False``.
+    bitorder : {"big", "little"}, optional
+        The order of the bits in packed `condition`. Ignored if `packed` is
+        ``False``.
+
+        Default: ``"big"``.
 
     Returns
     -------
@@ -456,6 +483,16 @@ def where(condition, x=None, y=None, /, *, order="K", out=None):
            [ 0,  2, -1],
            [ 0,  3, -1]])
 
+    The condition can be passed as a packed boolean mask:
+
+    >>> m = np.packbits(a < 4)
+    >>> np.where(m, a, -1, packed=True)
+    array([[ 0,  1,  2],
+           [ 0,  2, -1],
+           [ 0,  3, -1]])
+    >>> np.where(m, packed=True)
+    (array([0, 1, 2, 3, 4, 6, 7]),)
+
     """
 
     missing = (x is None, y is None).count(True)
@@ -463,8 +500,14 @@ def where(condition, x=None, y=None, /, *, order="K", out=None):
         raise ValueError("Must provide both 'x' and 'y' or neither.")
 
     if missing == 2:
+        if packed:
+            return (dpnp_packed_nonzero(condition, bitorder=bitorder),)
         return dpnp.nonzero(condition)
 
+    if packed:
+        shape = dpnp.broadcast_shapes(dpnp.shape(x), dpnp.shape(y))
+        condition = dpnp_unpack_mask(condition, shape, bitorder=bitorder)
+
     usm_x = dpnp.get_usm_ndarray_or_scalar(x)
     usm_y = dpnp.get_usm_ndarray_or_scalar(y)
     usm_condition = dpnp.get_usm_ndarray(condition)
@@ -54,7 +54,7 @@ from .dpnp_utils import (
     map_dtype_to_device,
 )
 
-__all__ = ["argsort", "partition", "sort", "sort_complex"]
+__all__ = ["argsort", "lexsort", "partition", "sort", "sort_complex"]
 
 
 def _wrap_sort_argsort(
@@ -202,6 +202,102 @@ def argsort(
     )
 
 
+def lexsort(keys, axis=-1):
+    """
+    Perform an indirect stable sort using a sequence of keys.
+
+    For full documentation refer to :obj:`numpy.lexsort`.
+
+    Parameters
+    ----------
+    keys : {dpnp.ndarray, usm_ndarray, sequence of dpnp.ndarray or \
+            usm_ndarray}
+        The `k` keys to be sorted. The last key (e.g, the last row if `keys`
+        is a 2D array) is the primary sort key. Each element of `keys` along
+        the zeroth axis must be an array of the same shape.
+    axis : int, optional
+        Axis to be indirectly sorted. By default, sort over the last axis of
+        each sequence.
+
+        Default: ``-1``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        Array of indices that sort the keys along the specified axis.
+        The return array has default array index data type.
+
+    Notes
+    -----
+    The keys are sorted by a sequence of stable sorts on the device, from
+    the first key to the primary one, each of them permuting the indices
+    sorted by the previous keys. So the number of kernels submitted grows
+    linearly with the number of keys and not with the size of the keys.
+
+    See Also
+    --------
+    :obj:`dpnp.argsort` : Indirect sort.
+    :obj:`dpnp.sort` : Return a sorted copy of an array.
+
+    Examples
+    --------
+    Sort names: first by surname, then by name.
+
+    >>> import dpnp as np
+    >>> surnames = np.array([3, 1, 2, 1])
+    >>> first_names = np.array([2, 0, 1, 1])
+    >>> np.lexsort((first_names, surnames))
+    array([1, 3, 2, 0])
+
+    Sort according to two numerical keys, first by elements of ``a``, then
+    by elements of ``b``:
+
+    >>> a = np.array([1, 5, 1, 4, 3, 4, 4])  # First sequence
+    >>> b = np.array([9, 4, 0, 4, 0, 2, 1])  # Second sequence
+    >>> np.lexsort((b, a))  # Sort by `a`, then by `b`
+    array([2, 0, 4, 6, 5, 3, 1])
+
+    """
+
+    if dpnp.is_supported_array_type(keys):
+        if keys.ndim == 0:
+            raise TypeError("need sequence of keys with len > 0 in lexsort")
+        usm_keys = dpnp.get_usm_ndarray(keys)
+        usm_keys = [usm_keys[i] for i in range(usm_keys.shape[0])]
+    else:
+        dpnp.check_supported_arrays_type(*keys)
+        usm_keys = [dpnp.get_usm_ndarray(key) for key in keys]
+
+    if len(usm_keys) == 0:
+        raise TypeError("need sequence of keys with len > 0 in lexsort")
+
+    shape = usm_keys[0].shape
+    if any(key.shape != shape for key in usm_keys[1:]):
+        raise ValueError("all keys need to be the same shape")
+
+    if len(shape) == 0:
+        # a single element is sorted
+        usm_res = dpt.zeros(
+            (),
+            dtype=dpt.intp,
+            usm_type=usm_keys[0].usm_type,
+            sycl_queue=usm_keys[0].sycl_queue,
+        )
+        return dpnp_array._create_from_usm_ndarray(usm_res)
+
+    axis = normalize_axis_index(axis, ndim=len(shape))
+
+    # sort by the first key and refine the order by the next keys, so the
+    # primary key is sorted the last and stability keeps the previous order
+    # of equal elements
+    usm_res = dpt.argsort(usm_keys[0], axis=axis, stable=True)
+    for key in usm_keys[1:]:
+        usm_key = dpt.take_along_axis(key, usm_res, axis=axis)
+        usm_ind = dpt.argsort(usm_key, axis=axis, stable=True)
+        usm_res = dpt.take_along_axis(usm_res, usm_ind, axis=axis)
+    return dpnp_array._create_from_usm_ndarray(usm_res)
+
+
 def partition(x1, kth, axis=-1, kind="introselect", order=None):
     """
     Return a partitioned copy of an array.
@@ -38,6 +38,7 @@ it contains:
 """
 
 import math
+import operator
 
 import dpctl.tensor as dpt
 import dpctl.tensor._tensor_elementwise_impl as ti
@@ -75,6 +76,11 @@ __all__ = [
     "var",
 ]
 
+# the largest filter size for which a batched convolution is computed
+# directly rather than through FFT, as the direct method submits kernels
+# per element of the filter
+_BATCHED_DIRECT_MAX_FILTER_SIZE = 16
+
 
 def _count_reduce_items(arr, axis, where=True):
     """
@@ -359,13 +365,20 @@ def average(a, axis=None, weights=None, returned=False, *, keepdims=False):
 
 
 def _convolve_impl(a, v, mode, method, rdtype):
-    l_pad, r_pad = _get_padding(a.size, v.size, mode)
+    l_pad, r_pad = _get_padding(a.shape[-1], v.shape[-1], mode)
 
     if method == "auto":
         method = _choose_conv_method(a, v, rdtype)
 
     if method == "direct":
-        r = _run_native_sliding_dot_product1d(a, v[::-1], l_pad, r_pad, rdtype)
+        if a.ndim > 1 or v.ndim > 1:
+            r = _run_batched_sliding_dot_product(
+                a, v[..., ::-1], l_pad, r_pad, rdtype
+            )
+        else:
+            r = _run_native_sliding_dot_product1d(
+                a, v[::-1], l_pad, r_pad, rdtype
+            )
     elif method == "fft":
         r = _convolve_fft(a, v, l_pad, r_pad, rdtype)
     else:
@@ -376,7 +389,47 @@ def _convolve_impl(a, v, mode, method, rdtype):
     return r
 
 
-def convolve(a, v, mode="full", method="auto"):
+def _normalize_conv_axis(a, v, axis):
+    """
+    Prepare input arrays for a batched convolution along `axis`.
+
+    A one-dimensional input is treated as a single sequence applied to every
+    sequence of the other array. Otherwise both arrays must have the same
+    number of dimensions and are broadcast against each other in all
+    dimensions other than `axis`.
+
+    Returns both arrays with `axis` moved to the last position together with
+    the normalized axis.
+
+    """
+
+    ndim = max(a.ndim, v.ndim)
+    axis = normalize_axis_index(operator.index(axis), ndim)
+
+    def _expand(x):
+        if x.ndim == 1 and ndim > 1:
+            shape = [1] * ndim
+            shape[axis] = x.size
+            return dpnp.reshape(x, shape)
+        return x
+
+    a, v = _expand(a), _expand(v)
+    if a.ndim != v.ndim:
+        raise ValueError(
+            "Input arrays must be one-dimensional or have the same number "
+            f"of dimensions. Received shapes: a.shape={a.shape}, "
+            f"v.shape={v.shape}"
+        )
+
+    a = dpnp.moveaxis(a, axis, -1)
+    v = dpnp.moveaxis(v, axis, -1)
+
+    # validate that all dimensions other than axis are broadcastable
+    dpnp.broadcast_shapes(a.shape[:-1], v.shape[:-1])
+    return a, v, axis
+
+
+def convolve(a, v, mode="full", method="auto", *, axis=None):
     r"""
     Returns the discrete, linear convolution of two one-dimensional sequences.
     The convolution operator is often seen in signal processing, where it
@@ -387,6 +440,9 @@ def convolve(a, v, mode="full", method="auto"):
 
     If `v` is longer than `a`, the arrays are swapped before computation.
 
+    If `axis` is specified, stacks of sequences are convolved along that axis
+    at once, either with a single filter or with a filter per sequence.
+
     For full documentation refer to :obj:`numpy.convolve`.
 
     Parameters
@@ -420,6 +476,16 @@ def convolve(a, v, mode="full", method="auto"):
         Use ``method='direct'`` when your input contains NAN or INF values.
 
         Default: ``'auto'``.
+    axis : {None, int}, optional
+        Axis along which the sequences are convolved. If ``None``, both `a`
+        and `v` must be one-dimensional. Otherwise, a one-dimensional input
+        is treated as a single sequence applied along `axis` of the other
+        array, and multi-dimensional inputs must have the same number of
+        dimensions and are broadcast against each other in all dimensions
+        other than `axis`. All sequences are processed by a single batched
+        computation.
+
+        Default: ``None``.
 
     Returns
     -------
@@ -472,6 +538,13 @@ def convolve(a, v, mode="full", method="auto"):
     >>> np.convolve(a, v, 'valid')
     array([2.5], dtype=float32)
 
+    Convolve every row of a stack of signals with the same filter:
+
+    >>> s = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
+    >>> np.convolve(s, v, 'same', axis=-1)
+    array([[1. , 2.5, 4. ],
+           [4. , 7. , 8.5]], dtype=float32)
+
     """
 
     a, v = dpnp.atleast_1d(a, v)
@@ -481,20 +554,25 @@ def convolve(a, v, mode="full", method="auto"):
             f"Array arguments cannot be empty. "
             f"Received sizes: a.size={a.size}, v.size={v.size}"
         )
-    if a.ndim > 1 or v.ndim > 1:
-        raise ValueError(
-            f"Only 1-dimensional arrays are supported. "
-            f"Received shapes: a.shape={a.shape}, v.shape={v.shape}"
-        )
+    if axis is None:
+        if a.ndim > 1 or v.ndim > 1:
+            raise ValueError(
+                f"Only 1-dimensional arrays are supported. "
+                f"Received shapes: a.shape={a.shape}, v.shape={v.shape}"
+            )
+    else:
+        a, v, axis = _normalize_conv_axis(a, v, axis)
 
     device = a.sycl_device
     rdtype = result_type_for_device([a.dtype, v.dtype], device)
 
-    if v.size > a.size:
+    if v.shape[-1] > a.shape[-1]:
         a, v = v, a
 
     r = _convolve_impl(a, v, mode, method, rdtype)
 
+    if axis is not None:
+        r = dpnp.moveaxis(r, -1, axis)
     return dpnp.asarray(r, dtype=rdtype, order="C")
 
 
@@ -641,12 +719,17 @@ def _get_padding(a_size, v_size, mode):
 
 
 def _choose_conv_method(a, v, rdtype):
-    assert a.size >= v.size
+    a_len, v_len = a.shape[-1], v.shape[-1]
+    assert a_len >= v_len
     if rdtype == dpnp.bool:
         # to avoid accuracy issues
         return "direct"
 
-    if v.size < 10**4 or a.size < 10**4:
+    if a.ndim > 1 or v.ndim > 1:
+        # batched direct method submits kernels per element of the filter
+        if v_len <= _BATCHED_DIRECT_MAX_FILTER_SIZE:
+            return "direct"
+    elif v_len < 10**4 or a_len < 10**4:
         # direct method is faster for small arrays
         return "direct"
 
@@ -709,14 +792,55 @@ def _run_native_sliding_dot_product1d(a, v, l_pad, r_pad, rdtype):
     return out
 
 
+def _run_batched_sliding_dot_product(a, v, l_pad, r_pad, rdtype):
+    """
+    Compute sliding dot product of every sequence along the last axis of `a`
+    with the matching sequence along the last axis of `v`.
+
+    All sequences of the stack are processed at once, submitting a multiply
+    and an add kernel per element of the filter `v` rather than a kernel per
+    sequence.
+
+    """
+
+    a_len, v_len = a.shape[-1], v.shape[-1]
+    out_len = l_pad + r_pad + a_len - v_len + 1
+    batch_shape = dpnp.broadcast_shapes(a.shape[:-1], v.shape[:-1])
+
+    usm_type, queue = get_usm_allocations([a, v])
+
+    a_padded = dpnp.zeros(
+        a.shape[:-1] + (a_len + l_pad + r_pad,),
+        dtype=rdtype,
+        usm_type=usm_type,
+        sycl_queue=queue,
+    )
+    a_padded[..., l_pad : l_pad + a_len] = a
+    v = dpnp.astype(v, rdtype, copy=False)
+
+    out = dpnp.zeros(
+        batch_shape + (out_len,),
+        dtype=rdtype,
+        usm_type=usm_type,
+        sycl_queue=queue,
+    )
+    for k in range(v_len):
+        out += a_padded[..., k : k + out_len] * v[..., k, None]
+
+    return out
+
+
 def _convolve_fft(a, v, l_pad, r_pad, rtype):
-    assert a.size >= v.size
-    assert l_pad < v.size
+    a_len, v_len = a.shape[-1], v.shape[-1]
+    assert a_len >= v_len
+    assert l_pad < v_len
 
     # +1 is needed to avoid circular convolution
-    padded_size = a.size + r_pad + 1
+    padded_size = a_len + r_pad + 1
     fft_size = 2 ** int(math.ceil(math.log2(padded_size)))
 
+    # FFT is computed along the last axis, so stacked sequences are
+    # transformed by a single batched call
     af = dpnp.fft.fft(a, fft_size)  # pylint: disable=no-member
     vf = dpnp.fft.fft(v, fft_size)  # pylint: disable=no-member
 
@@ -726,13 +850,13 @@ def _convolve_fft(a, v, l_pad, r_pad, rtype):
     elif dpnp.issubdtype(rtype, dpnp.integer) or rtype == dpnp.bool:
         r = r.real.round()
 
-    start = v.size - 1 - l_pad
+    start = v_len - 1 - l_pad
     end = padded_size - 1
 
-    return r[start:end]
+    return r[..., start:end]
 
 
-def correlate(a, v, mode="valid", method="auto"):
+def correlate(a, v, mode="valid", method="auto", *, axis=None):
     r"""
     Cross-correlation of two 1-dimensional sequences.
 
@@ -771,6 +895,11 @@ def correlate(a, v, mode="valid", method="auto"):
         Use method='direct' when your input contains NAN or INF values.
 
         Default: ``"auto"``.
+    axis : {None, int}, optional
+        Axis along which the sequences are correlated. Refer to the
+        :obj:`dpnp.convolve` docstring for the broadcasting rules.
+
+        Default: ``None``.
 
     Returns
     -------
@@ -823,6 +952,13 @@ def correlate(a, v, mode="valid", method="auto"):
     >>> np.correlate(vc, ac, 'full')
     array([0. +0.j , 3. +1.j , 1.5+1.5j, 1. +0.j , 0.5+0.5j], dtype=complex64)
 
+    Correlate every row of a stack of signals with the same sequence:
+
+    >>> s = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
+    >>> np.correlate(s, v, axis=1)
+    array([[3.5],
+           [8. ]], dtype=float32)
+
     """
 
     dpnp.check_supported_arrays_type(a, v)
@@ -832,11 +968,14 @@ def correlate(a, v, mode="valid", method="auto"):
             f"Array arguments cannot be empty. "
             f"Received sizes: a.size={a.size}, v.size={v.size}"
         )
-    if a.ndim != 1 or v.ndim != 1:
-        raise ValueError(
-            f"Only 1-dimensional arrays are supported. "
-            f"Received shapes: a.shape={a.shape}, v.shape={v.shape}"
-        )
+    if axis is None:
+        if a.ndim != 1 or v.ndim != 1:
+            raise ValueError(
+                f"Only 1-dimensional arrays are supported. "
+                f"Received shapes: a.shape={a.shape}, v.shape={v.shape}"
+            )
+    else:
+        a, v, axis = _normalize_conv_axis(a, v, axis)
 
     supported_methods = ["auto", "direct", "fft"]
     if method not in supported_methods:
@@ -851,15 +990,17 @@ def correlate(a, v, mode="valid", method="auto"):
         v = dpnp.conj(v)
 
     revert = False
-    if v.size > a.size:
+    if v.shape[-1] > a.shape[-1]:
         revert = True
         a, v = v, a
 
-    r = _convolve_impl(a, v[::-1], mode, method, rdtype)
+    r = _convolve_impl(a, v[..., ::-1], mode, method, rdtype)
 
     if revert:
-        r = r[::-1]
+        r = r[..., ::-1]
 
+    if axis is not None:
+        r = dpnp.moveaxis(r, -1, axis)
     return dpnp.asarray(r, dtype=rdtype, order="C")
 
 
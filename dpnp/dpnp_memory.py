@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Memory pools caching USM allocations.
+
+Notes
+-----
+A block allocated from a pool returns to it once the last USM array or
+memory object referring to the block is released, and the block is reused
+by later requests of the same size class. It avoids the costs of USM
+allocation and release on every call.
+
+"""
+
+import collections
+import contextvars
+import threading
+
+import dpctl.memory as dpm
+
+__all__ = [
+    "MemoryPool",
+    "PinnedMemoryPool",
+    "get_default_pinned_memory_pool",
+    "get_memory_pool",
+    "set_memory_pool",
+]
+
+# the smallest size class of the pools
+_MIN_BLOCK_BYTES = 512
+
+# USM memory classes per USM type
+_USM_MEMORY = {
+    "device": dpm.MemoryUSMDevice,
+    "shared": dpm.MemoryUSMShared,
+    "host": dpm.MemoryUSMHost,
+}
+
+# the memory pool allocating dpnp arrays in the current context, if any
+_memory_pool = contextvars.ContextVar("dpnp_memory_pool", default=None)
+
+
+def _round_size(nbytes):
+    """
+    Return the size class of an allocation of `nbytes` bytes.
+
+    The sizes are rounded up to a multiple of a quarter of the power of two
+    below them, so less than 25% of a block is wasted.
+
+    """
+
+    if nbytes <= _MIN_BLOCK_BYTES:
+        return _MIN_BLOCK_BYTES
+
+    step = 1 << ((nbytes - 1).bit_length() - 3)
+    return -(-nbytes // step) * step
+
+
+class _PooledBlock:
+    """
+    A block of a memory pool exposing ``__sycl_usm_array_interface__``, which
+    returns the block to the pool when it is garbage collected.
+
+    """
+
+    def __init__(self, pool, key, mem):
+        self._pool = pool
+        self._key = key
+        self._mem = mem
+
+    def __del__(self):
+        self._pool._release(self._key, self._mem)
+
+    @property
+    def __sycl_usm_array_interface__(self):
+        return self._mem.__sycl_usm_array_interface__
+
+
+class _CachingPool:
+    """Base class of the memory pools."""
+
+    def __init__(self, limit=None, max_cached_bytes=None):
+        # blocks may be returned by garbage collection within the lock
+        self._lock = threading.RLock()
+        self._free = collections.defaultdict(list)
+        self._free_bytes = 0
+        self._used_bytes = 0
+        self._peak_bytes = 0
+        self._limit = None
+        self._max_cached_bytes = None
+        self.set_limit(limit)
+        self.set_max_cached_bytes(max_cached_bytes)
+
+    def _allocate(self, size, key, sycl_queue):
+        """Allocate a new block of `size` bytes."""
+
+        raise NotImplementedError
+
+    def _malloc(self, nbytes, key, sycl_queue):
+        """Return a memory object of a block of at least `nbytes` bytes."""
+
+        size = _round_size(nbytes)
+        with self._lock:
+            blocks = self._free.get((key, size))
+            if blocks:
+                mem = blocks.pop()
+                self._free_bytes -= size
+            else:
+                mem = None
+                if self._limit is not None:
+                    self._trim(self._limit - self._used_bytes - size)
+                    if self._used_bytes + size > self._limit:
+                        raise MemoryError(
+                            f"Allocation of {size} bytes exceeds the limit "
+                            f"of the memory pool of {self._limit} bytes with "
+                            f"{self._used_bytes} bytes in use"
+                        )
+
+            self._used_bytes += size
+            self._peak_bytes = max(self._peak_bytes, self._used_bytes)
+
+        if mem is None:
+            try:
+                mem = self._allocate(size, key, sycl_queue)
+            except dpm.USMAllocationError:
+                # release the cached blocks and retry once
+                self.free_all_blocks()
+                try:
+                    mem = self._allocate(size, key, sycl_queue)
+                except dpm.USMAllocationError:
+                    with self._lock:
+                        self._used_bytes -= size
+                    raise
+
+        return dpm.as_usm_memory(_PooledBlock(self, key, mem))
+
+    def _release(self, key, mem):
+        """Return block `mem` to the pool."""
+
+        with self._lock:
+            self._used_bytes -= mem.nbytes
+            max_cached_bytes = self._max_cached_bytes
+            if (
+                max_cached_bytes is None
+                or self._free_bytes + mem.nbytes <= max_cached_bytes
+            ):
+                self._free[key, mem.nbytes].append(mem)
+                self._free_bytes += mem.nbytes
+
+    def _trim(self, size):
+        """Release cached blocks until at most `size` bytes are cached."""
+
+        for key in list(self._free):
+            blocks = self._free[key]
+            while blocks and self._free_bytes > size:
+                self._free_bytes -= blocks.pop().nbytes
+            if not blocks:
+                del self._free[key]
+
+    def free_all_blocks(self):
+        """Release all cached blocks."""
+
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+
+    def free_bytes(self):
+        """Return the number of bytes kept cached by the pool."""
+
+        return self._free_bytes
+
+    def get_limit(self):
+        """Return the limit of bytes both used and cached by the pool."""
+
+        return self._limit
+
+    def get_max_cached_bytes(self):
+        """Return the limit of bytes kept cached by the pool."""
+
+        return self._max_cached_bytes
+
+    def n_free_blocks(self):
+        """Return the number of blocks kept cached by the pool."""
+
+        with self._lock:
+            return sum(len(blocks) for blocks in self._free.values())
+
+    def peak_bytes(self):
+        """Return the peak number of bytes of blocks in use."""
+
+        return self._peak_bytes
+
+    def reset_peak_bytes(self):
+        """Reset the peak number of bytes to the number of bytes in use."""
+
+        with self._lock:
+            self._peak_bytes = self._used_bytes
+
+    def set_limit(self, size=None):
+        """
+        Set the limit of bytes both used and cached by the pool.
+
+        When an allocation would exceed the limit, cached blocks are released
+        first, and :class:`MemoryError` is raised if it is still exceeded.
+
+        Parameters
+        ----------
+        size : {None, int}, optional
+            The new limit, ``None`` means no limit.
+
+            Default: ``None``.
+
+        """
+
+        if size is not None and size < 0:
+            raise ValueError(f"The limit must be non-negative, but got {size}")
+
+        with self._lock:
+            self._limit = size
+
+    def set_max_cached_bytes(self, size=None):
+        """
+        Set the limit of bytes kept cached by the pool.
+
+        A returned block exceeding the limit is released instead of being
+        cached, and cached blocks are released until the cached bytes fit
+        the new limit.
+
+        Parameters
+        ----------
+        size : {None, int}, optional
+            The new limit, ``None`` means no limit.
+
+            Default: ``None``.
+
+        """
+
+        if size is not None and size < 0:
+            raise ValueError(f"The limit must be non-negative, but got {size}")
+
+        with self._lock:
+            self._max_cached_bytes = size
+            if size is not None:
+                self._trim(size)
+
+    def total_bytes(self):
+        """Return the number of bytes both used and cached by the pool."""
+
+        return self._used_bytes + self._free_bytes
+
+    def used_bytes(self):
+        """Return the number of bytes of blocks in use."""
+
+        return self._used_bytes
+
+
+class MemoryPool(_CachingPool):
+    """
+    Memory pool caching USM allocations of dpnp arrays.
+
+    The requested sizes are rounded up to a size class, and released blocks
+    are cached per SYCL queue, USM type and size class for reuse.
+
+    The pool allocates the arrays created by dpnp functions such as
+    :obj:`dpnp.empty`, :obj:`dpnp.zeros`, :obj:`dpnp.ones` and
+    :obj:`dpnp.full` while it is in use, either within ``with`` statement
+    or after :obj:`dpnp.set_memory_pool` call. Temporary arrays of the same
+    size allocated repeatedly are then served from the cache.
+
+    Parameters
+    ----------
+    limit : {None, int}, optional
+        The limit of bytes both used and cached by the pool. When
+        an allocation would exceed the limit, cached blocks are released
+        first, and :class:`MemoryError` is raised if it is still exceeded.
+        ``None`` means no limit.
+
+        Default: ``None``.
+    max_cached_bytes : {None, int}, optional
+        The limit of bytes kept cached by the pool. A released block
+        exceeding the limit is freed instead of being cached. ``None`` means
+        no limit.
+
+        Default: ``None``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> pool = np.MemoryPool()
+    >>> with pool:
+    ...     for _ in range(10):
+    ...         a = np.empty(10**6)
+    >>> del a
+    >>> pool.n_free_blocks(), pool.used_bytes(), pool.peak_bytes()
+    (2, 0, 16777216)
+    >>> pool.free_all_blocks()
+
+    """
+
+    def __init__(self, limit=None, max_cached_bytes=None):
+        super().__init__(limit=limit, max_cached_bytes=max_cached_bytes)
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_memory_pool.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _memory_pool.reset(self._tokens.pop())
+
+    def _allocate(self, size, key, sycl_queue):
+        return _USM_MEMORY[key[1]](size, queue=sycl_queue)
+
+    def malloc(self, nbytes, usm_type, sycl_queue):
+        """
+        Return a USM memory object of at least `nbytes` bytes.
+
+        The block of the memory object returns to the pool once the memory
+        object and all USM arrays referring to it are released.
+
+        Parameters
+        ----------
+        nbytes : int
+            The requested number of bytes.
+        usm_type : {"device", "shared", "host"}
+            The type of SYCL USM allocation.
+        sycl_queue : dpctl.SyclQueue
+            A SYCL queue the block is allocated with.
+
+        Returns
+        -------
+        out : {dpctl.memory.MemoryUSMDevice, dpctl.memory.MemoryUSMShared,
+               dpctl.memory.MemoryUSMHost}
+            The memory object of a cached block if any of the same size
+            class, otherwise of a new allocation.
+
+        """
+
+        return self._malloc(nbytes, (sycl_queue, usm_type), sycl_queue)
+
+
+class PinnedMemoryPool(_CachingPool):
+    """
+    Memory pool caching host USM (pinned) allocations.
+
+    The pool is used to stage data transfers between the host and devices.
+    The requested sizes are rounded up to a size class, and released blocks
+    are cached per SYCL context and size class for reuse.
+
+    Parameters
+    ----------
+    limit : {None, int}, optional
+        The limit of bytes both used and cached by the pool.
+        ``None`` means no limit.
+
+        Default: ``None``.
+    max_cached_bytes : {None, int}, optional
+        The limit of bytes kept cached by the pool. A released block
+        exceeding the limit is freed instead of being cached. ``None`` means
+        no limit.
+
+        Default: ``None``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> pool = np.get_default_pinned_memory_pool()
+    >>> a = np.ones(10**7)
+    >>> b = np.asnumpy(a)
+    >>> pool.n_free_blocks()
+    2
+    >>> pool.free_all_blocks()
+    >>> pool.n_free_blocks()
+    0
+
+    """
+
+    def _allocate(self, size, key, sycl_queue):
+        return dpm.MemoryUSMHost(size, queue=sycl_queue)
+
+    def malloc(self, nbytes, sycl_queue):
+        """
+        Return a host USM memory object of at least `nbytes` bytes.
+
+        The block of the memory object returns to the pool once the memory
+        object and all arrays referring to it are released.
+
+        Parameters
+        ----------
+        nbytes : int
+            The requested number of bytes.
+        sycl_queue : dpctl.SyclQueue
+            A SYCL queue whose context the block is bound to.
+
+        Returns
+        -------
+        out : dpctl.memory.MemoryUSMHost
+            The memory object of a cached block if any of the same size
+            class, otherwise of a new allocation.
+
+        """
+
+        return self._malloc(nbytes, sycl_queue.sycl_context, sycl_queue)
+
+
+_pinned_memory_pool = PinnedMemoryPool()
+
+
+def get_default_pinned_memory_pool():
+    """
+    Return the default pool of host USM (pinned) memory.
+
+    The pool holds the staging buffers of data transfers made by
+    :obj:`dpnp.asnumpy`, :obj:`dpnp.asarray`, :obj:`dpnp.ndarray.set`,
+    :obj:`dpnp.save` and :obj:`dpnp.load`.
+
+    Returns
+    -------
+    out : dpnp.PinnedMemoryPool
+        The default pinned memory pool.
+
+    """
+
+    return _pinned_memory_pool
+
+
+def get_memory_pool():
+    """
+    Return the memory pool allocating dpnp arrays in the current context.
+
+    Returns
+    -------
+    out : {None, dpnp.MemoryPool}
+        The memory pool in use, or ``None`` if arrays are allocated directly.
+
+    """
+
+    return _memory_pool.get()
+
+
+def set_memory_pool(pool=None):
+    """
+    Set the memory pool allocating dpnp arrays in the current context.
+
+    Parameters
+    ----------
+    pool : {None, dpnp.MemoryPool}, optional
+        The memory pool to be used, or ``None`` to allocate arrays directly.
+
+        Default: ``None``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> pool = np.MemoryPool(max_cached_bytes=2**30)
+    >>> np.set_memory_pool(pool)
+    >>> a = np.zeros(10)
+    >>> pool.used_bytes()
+    512
+    >>> np.set_memory_pool(None)
+
+    """
+
+    if pool is not None and not isinstance(pool, MemoryPool):
+        raise TypeError(f"Expected dpnp.MemoryPool, but got {type(pool)}")
+    _memory_pool.set(pool)
@@ -0,0 +1,811 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Implementation of the dpnp profiler.
+
+The calls of element-wise functions, host synchronizations, allocations of
+arrays and fallbacks on NumPy are reported by hooks in the dispatch layer,
+which check :data:`_active` profiler first and cost a single comparison
+otherwise. The other public functions are replaced by recording wrappers
+only while a profiler is active, see :func:`register_public_functions`.
+
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import types
+import weakref
+
+import dpctl.tensor as dpt
+import dpctl.utils as dpu
+
+import dpnp
+
+__all__ = ["profiler"]
+
+
+# the profiler which is currently recording, if any
+_active = None
+_active_lock = threading.Lock()
+
+# name of the record collecting the events made outside of the recorded calls
+_OTHER = "(other)"
+
+# public functions replaced by recording wrappers while a profiler is active,
+# as tuples of a namespace, a name, the function and its wrapper
+_public_functions = []
+
+# directories of the dpnp library and of its tests
+_LIB_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_TESTS_DIR = os.path.join(_LIB_DIR, "tests") + os.sep
+
+
+class _Call:
+    """Record of a single profiled call."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "tid",
+        "depth",
+        "start",
+        "end",
+        "kernels",
+        "fallbacks",
+        "host_syncs",
+        "bytes_allocated",
+    )
+
+    def __init__(self, name, kind, tid, depth):
+        self.name = name
+        self.kind = kind
+        self.tid = tid
+        self.depth = depth
+        self.start = self.end = 0
+        self.kernels = []
+        self.fallbacks = 0
+        self.host_syncs = 0
+        self.bytes_allocated = 0
+
+
+class _RecordingOrderManager:
+    """
+    Order manager of a queue reporting the submitted kernels to a profiler
+    and delegating everything else to the wrapped manager.
+
+    """
+
+    def __init__(self, prof, manager):
+        self._prof = prof
+        self._manager = manager
+
+    def __getattr__(self, name):
+        return getattr(self._manager, name)
+
+    def add_event_pair(self, host_task_ev, comp_ev):
+        self._manager.add_event_pair(host_task_ev, comp_ev)
+        self._prof._record_kernels(comp_ev)
+
+
+class _RecordingOrderManagerMap(dict):
+    """
+    Map of queues to order managers, which wraps the managers of `managers`
+    map, so the order of tasks is kept when the profiler is done.
+
+    """
+
+    def __init__(self, prof, managers):
+        super().__init__()
+        self._prof = prof
+        self._managers = managers
+
+    def __missing__(self, q):
+        res = self[q] = _RecordingOrderManager(self._prof, self._managers[q])
+        return res
+
+
+class _RecordingOrderManagerMapProxy(_RecordingOrderManagerMap):
+    """
+    Replacement of :data:`dpctl.utils.SequentialOrderManager` recording the
+    kernels when the map keeps no context variable to substitute the
+    managers in.
+
+    """
+
+    def clear(self):
+        super().clear()
+        self._managers.clear()
+
+
+def _arrays(obj):
+    """Yield USM arrays in `obj`."""
+
+    if isinstance(obj, (tuple, list)):
+        for x in obj:
+            yield from _arrays(x)
+    elif isinstance(obj, dict):
+        for x in obj.values():
+            yield from _arrays(x)
+    elif isinstance(obj, (dpnp.ndarray, dpt.usm_ndarray)):
+        yield dpnp.get_usm_ndarray(obj)
+
+
+def _caller_name():
+    """
+    Return the name of the outermost dpnp function on the Python stack of
+    the current thread or ``None`` if it is called from outside of dpnp.
+
+    """
+
+    name = None
+    frame = sys._getframe(2)  # pylint: disable=protected-access
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if _is_library_frame(frame, module):
+            # name the function by its namespace, e.g. `linalg.norm`
+            parts = module.split(".")[1:-1]
+            if module == "dpnp.dpnp_array":
+                parts = ["ndarray"]
+            name = ".".join(parts + [frame.f_code.co_name])
+        frame = frame.f_back
+    return name
+
+
+def _is_library_frame(frame, module):
+    """
+    Return whether `frame` of a function of `module` belongs to the dpnp
+    library, excluding the profiler itself and the tests.
+
+    """
+
+    if not module.startswith("dpnp.") or module == __name__:
+        return False
+
+    filename = frame.f_code.co_filename
+    return filename.startswith(_LIB_DIR) and not filename.startswith(_TESTS_DIR)
+
+
+def _is_interface_function(func):
+    """Return whether `func` is a function of a dpnp interface module."""
+
+    if not isinstance(func, types.FunctionType):
+        return False
+
+    package, _, module = (func.__module__ or "").rpartition(".")
+    return package.split(".")[0] == "dpnp" and module.startswith("dpnp_iface_")
+
+
+def _event_times(event):
+    """
+    Return a tuple of start and end time of the event in nanoseconds or
+    ``None`` if the queue the event was submitted to has no profiling enabled.
+
+    """
+
+    try:
+        event.wait()
+        return event.profiling_info_start, event.profiling_info_end
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def host_sync(func):
+    """
+    Decorate `func` making an implicit host synchronization to be recorded
+    by the active profiler.
+
+    """
+
+    name = func.__name__
+    if func.__qualname__.startswith("dpnp_array."):
+        name = "ndarray." + name
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        prof = _active
+        if prof is None:
+            return func(*args, **kwargs)
+        return prof._run(name, "sync", func, args, kwargs)
+
+    return wrapper
+
+
+def _record_public(func, name):
+    """
+    Decorate public function `func` to be recorded by the active profiler
+    under `name`.
+
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        prof = _active
+        if prof is None:
+            return func(*args, **kwargs)
+        return prof._run(name, "call", func, args, kwargs)
+
+    return wrapper
+
+
+def record_call(method):
+    """
+    Decorate `method` of an element-wise function object to be recorded by
+    the active profiler under the name of the function.
+
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        prof = _active
+        if prof is None:
+            return method(self, *args, **kwargs)
+        return prof._run(self.name_, "call", method, (self,) + args, kwargs)
+
+    return wrapper
+
+
+def _install_public_functions(install):
+    """Replace the registered public functions by their wrappers or back."""
+
+    for module, name, func, wrapper in _public_functions:
+        setattr(module, name, wrapper if install else func)
+
+
+def register_public_functions(namespaces):
+    """
+    Register the public functions of dpnp interface modules exposed in
+    `namespaces` to be recorded by a profiler.
+
+    `namespaces` is a sequence of pairs of a module and the prefix of the
+    names of its functions, e.g. ``(dpnp.linalg, "linalg.")``. While
+    a profiler is active, a function is replaced by the wrapper in all the
+    namespaces and in the module it is defined in, so it is the same object
+    everywhere.
+
+    """
+
+    wrappers = {}
+    for module, prefix in namespaces:
+        for name in module.__all__:
+            func = getattr(module, name, None)
+            if not _is_interface_function(func):
+                continue
+
+            wrapper = wrappers.get(func)
+            if wrapper is None:
+                wrapper = wrappers[func] = _record_public(func, prefix + name)
+                defining = sys.modules[func.__module__]
+                if getattr(defining, func.__name__, None) is func:
+                    _public_functions.append(
+                        (defining, func.__name__, func, wrapper)
+                    )
+            _public_functions.append((module, name, func, wrapper))
+
+
+class profiler:
+    """
+    Context manager profiling dpnp calls.
+
+    While the context is active, the profiler records:
+
+    - calls of public functions, like :obj:`dpnp.add`, :obj:`dpnp.sum` or
+      :obj:`dpnp.linalg.norm`, with the host time spent in the call, i.e. the
+      Python dispatch time which also includes the time of waiting for the
+      device if any;
+    - implicit host synchronizations, such as conversion of an array to
+      a Python scalar, to a list or to a NumPy array;
+    - regions of code marked by :meth:`record_function`;
+    - the kernels submitted within these calls and their device time taken
+      from SYCL event profiling;
+    - the number of bytes allocated for the arrays created within these
+      calls, including the temporary ones;
+    - the number of fallbacks on NumPy implementation.
+
+    Calls made within a recorded call are recorded as well, and the kernels,
+    allocations, fallbacks and host synchronizations are attributed to all
+    the calls on the stack. The ones made outside of the recorded calls, e.g.
+    by methods of :class:`dpnp.ndarray`, are attributed to the outermost dpnp
+    function on the Python stack, like ``ndarray.__setitem__``, with no calls
+    and host time counted.
+
+    Notes
+    -----
+    The device time is available only for kernels submitted to a queue with
+    profiling enabled, i.e. created with ``property="enable_profiling"``, and
+    is reported as ``None`` otherwise. The device time is collected when the
+    results are requested, so profiling does not add synchronization points.
+
+    The kernels are recorded when they are submitted from the context, e.g.
+    the thread, the profiler is entered in. With a version of dpctl which
+    keeps no context variable of order managers, the kernels submitted from
+    all the threads are recorded. The allocations are recorded when
+    a dpnp array is created, so memory allocated by a kernel for its internal
+    use is not counted.
+
+    The public functions, like :obj:`dpnp.sum`, are replaced by recording
+    wrappers while the profiler is active, so the calls made through
+    references taken before entering the profiler are not recorded. The
+    element-wise functions are always recorded.
+
+    Only one profiler can be active at a time.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> with np.profiler() as prof:
+    ...     a = np.arange(10.0)
+    ...     with prof.record_function("norm"):
+    ...         s = np.sqrt(np.sum(a * a)).item()
+    >>> print(prof.table())  # doctest: +SKIP
+    >>> prof.export_chrome_trace("trace.json")  # doctest: +SKIP
+
+    """
+
+    def __init__(self):
+        self._calls = []
+        self._kernels = []
+        self._fallbacks = []
+        self._others = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._arrays = {}
+        self._token = None
+        self._order_managers = None
+        self._event_times = {}
+        self._start = self._end = 0
+
+    def __enter__(self):
+        global _active
+
+        with _active_lock:
+            if _active is not None:
+                raise RuntimeError("Another dpnp profiler is already active")
+            _active = self
+
+        _install_public_functions(True)
+        self._calls = []
+        self._kernels = []
+        self._fallbacks = []
+        self._others = {}
+        self._arrays = {}
+        self._event_times = {}
+
+        order_managers = dpu.SequentialOrderManager
+        context_var = getattr(order_managers, "_map", None)
+        if isinstance(context_var, contextvars.ContextVar):
+            # record kernels submitted in the current context only
+            self._token = context_var.set(
+                _RecordingOrderManagerMap(self, context_var.get())
+            )
+        else:
+            self._order_managers = order_managers
+            dpu.SequentialOrderManager = _RecordingOrderManagerMapProxy(
+                self, order_managers
+            )
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active
+
+        self._end = time.perf_counter_ns()
+        if self._token is not None:
+            # pylint: disable=protected-access
+            dpu.SequentialOrderManager._map.reset(self._token)
+            self._token = None
+        if self._order_managers is not None:
+            dpu.SequentialOrderManager = self._order_managers
+            self._order_managers = None
+        self._arrays = {}
+        _install_public_functions(False)
+        with _active_lock:
+            _active = None
+
+        for call in self._others.values():
+            call.start, call.end = self._start, self._start
+            self._calls.append(call)
+
+    def _stack(self):
+        """Return the stack of the active calls of the current thread."""
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _owners(self):
+        """
+        Return the calls on the stack of the current thread, or the record of
+        the outermost dpnp function on the Python stack if there is none.
+
+        """
+
+        stack = self._stack()
+        if stack:
+            return stack
+
+        name = _caller_name() or _OTHER
+        with self._lock:
+            call = self._others.get(name)
+            if call is None:
+                call = _Call(name, "other", threading.get_ident(), 0)
+                self._others[name] = call
+        return [call]
+
+    def _register(self, x):
+        """
+        Register USM array `x` and return ``True`` if its memory is not used
+        by any registered array alive.
+
+        """
+
+        mem = x.usm_data
+        with self._lock:
+            arrays = self._arrays.get(id(mem))
+            is_new = arrays is None or len(arrays) == 0
+            if is_new:
+                arrays = self._arrays[id(mem)] = weakref.WeakSet()
+            arrays.add(x)
+        return is_new
+
+    def _run(self, name, kind, func, args, kwargs):
+        """Call `func` recording the call under `name`."""
+
+        # the inputs are not allocated by the call, neither their views
+        for x in _arrays((args, kwargs)):
+            self._register(x)
+
+        stack = self._stack()
+        call = _Call(name, kind, threading.get_ident(), len(stack))
+        if kind == "sync" and all(c.kind != "sync" for c in stack):
+            # a synchronization made by another one is not counted twice
+            call.host_syncs = 1
+            for c in stack:
+                c.host_syncs += 1
+
+        stack.append(call)
+        call.start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            call.end = time.perf_counter_ns()
+            stack.pop()
+            with self._lock:
+                self._calls.append(call)
+
+    def _record_array(self, x):
+        """Attribute the allocation of a new USM array `x` to the calls."""
+
+        if not self._register(x):
+            return
+
+        nbytes = x.usm_data.nbytes
+        for c in self._owners():
+            c.bytes_allocated += nbytes
+
+    def _record_kernels(self, events):
+        """Attribute submitted kernels to the calls."""
+
+        if not isinstance(events, (list, tuple)):
+            events = [events]
+        if not events:
+            return
+
+        owners = self._owners()
+        for c in owners:
+            c.kernels.extend(events)
+
+        owner = owners[-1].name
+        ts = time.perf_counter_ns()
+        with self._lock:
+            self._kernels.extend((ev, owner, ts) for ev in events)
+
+    def _record_fallback(self, name):
+        """Attribute a fallback on NumPy `name` function to the calls."""
+
+        owners = self._owners()
+        for c in owners:
+            c.fallbacks += 1
+
+        owner = owners[-1].name
+        with self._lock:
+            self._fallbacks.append(
+                (name, owner, threading.get_ident(), time.perf_counter_ns())
+            )
+
+    def _device_time(self, events):
+        """
+        Return the total device time of `events` in nanoseconds or ``None``
+        if any of the events has no profiling information.
+
+        """
+
+        total = 0
+        for ev in events:
+            key = id(ev)
+            if key not in self._event_times:
+                self._event_times[key] = _event_times(ev)
+
+            times = self._event_times[key]
+            if times is None:
+                return None
+            total += times[1] - times[0]
+        return total
+
+    @contextlib.contextmanager
+    def record_function(self, name):
+        """
+        Return a context manager recording the code in its scope as a call
+        named `name`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the call.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> with np.profiler() as prof:
+        ...     with prof.record_function("step"):
+        ...         a = np.ones(10).sum()
+        >>> [r["calls"] for r in prof.stats() if r["name"] == "step"]
+        [1]
+
+        """
+
+        stack = self._stack()
+        call = _Call(name, "region", threading.get_ident(), len(stack))
+        stack.append(call)
+        call.start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            call.end = time.perf_counter_ns()
+            stack.pop()
+            with self._lock:
+                self._calls.append(call)
+
+    def stats(self, sort_by="host_time"):
+        """
+        Return statistics aggregated by the name of the profiled function.
+
+        Parameters
+        ----------
+        sort_by : {"host_time", "device_time", "calls", "kernels",
+                   "bytes_allocated", "fallbacks", "host_syncs", "name"}, \
+                   optional
+            Key to sort the rows by, in descending order for the numeric keys.
+
+            Default: ``"host_time"``.
+
+        Returns
+        -------
+        out : list of dict
+            Row per function with the number of calls, total host time and
+            device time in seconds (``None`` if unknown), number of submitted
+            kernels, bytes allocated, number of fallbacks and host
+            synchronizations. The number of calls and host time are zeros for
+            functions which are not recorded, but are attributed the events
+            made outside of the recorded calls.
+
+        """
+
+        rows = {}
+        for call in self._calls:
+            row = rows.get(call.name)
+            if row is None:
+                row = rows[call.name] = {
+                    "name": call.name,
+                    "calls": 0,
+                    "host_time": 0.0,
+                    "device_time": 0.0,
+                    "kernels": 0,
+                    "bytes_allocated": 0,
+                    "fallbacks": 0,
+                    "host_syncs": 0,
+                }
+
+            if call.kind != "other":
+                row["calls"] += 1
+                row["host_time"] += (call.end - call.start) * 1e-9
+            row["kernels"] += len(call.kernels)
+            row["bytes_allocated"] += call.bytes_allocated
+            row["fallbacks"] += call.fallbacks
+            row["host_syncs"] += call.host_syncs
+
+            device_time = self._device_time(call.kernels)
+            if device_time is None or row["device_time"] is None:
+                row["device_time"] = None
+            else:
+                row["device_time"] += device_time * 1e-9
+
+        if sort_by == "name":
+            return sorted(rows.values(), key=lambda r: r["name"])
+        if sort_by not in (
+            "host_time",
+            "device_time",
+            "calls",
+            "kernels",
+            "bytes_allocated",
+            "fallbacks",
+            "host_syncs",
+        ):
+            raise ValueError(f"Unknown sort key: {sort_by}")
+        return sorted(
+            rows.values(),
+            key=lambda r: -1 if r[sort_by] is None else r[sort_by],
+            reverse=True,
+        )
+
+    def table(self, sort_by="host_time", limit=None):
+        """
+        Return the aggregated statistics formatted as a table.
+
+        Parameters
+        ----------
+        sort_by : str, optional
+            Key to sort the rows by, see :meth:`stats`.
+
+            Default: ``"host_time"``.
+        limit : {None, int}, optional
+            Maximal number of rows in the table.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : str
+            The table.
+
+        """
+
+        rows = self.stats(sort_by=sort_by)[:limit]
+        width = max([len("Name")] + [len(r["name"]) for r in rows])
+
+        header = (
+            f"{'Name':<{width}}  {'Calls':>7}  {'Host, ms':>10}  "
+            f"{'Avg host, us':>12}  {'Device, ms':>10}  {'Kernels':>7}  "
+            f"{'Allocated, B':>13}  {'Fallbacks':>9}  {'Host syncs':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for r in rows:
+            device_time = r["device_time"]
+            device_time = (
+                "n/a" if device_time is None else f"{device_time * 1e3:.3f}"
+            )
+            lines.append(
+                f"{r['name']:<{width}}  {r['calls']:>7}  "
+                f"{r['host_time'] * 1e3:>10.3f}  "
+                f"{r['host_time'] * 1e6 / max(r['calls'], 1):>12.2f}  "
+                f"{device_time:>10}  {r['kernels']:>7}  "
+                f"{r['bytes_allocated']:>13}  {r['fallbacks']:>9}  "
+                f"{r['host_syncs']:>10}"
+            )
+        return os.linesep.join(lines)
+
+    def to_chrome_trace(self):
+        """
+        Return the recorded events in Chrome trace event format.
+
+        The result can be loaded into ``chrome://tracing`` or Perfetto UI.
+        The calls are placed on the track of the thread they were made from,
+        the kernels are placed on a separate device track. The device clock
+        differs from the host one, so the device track is aligned to the host
+        timeline by the first submitted kernel.
+
+        Returns
+        -------
+        out : dict
+            The trace.
+
+        """
+
+        pid = os.getpid()
+        start = self._start
+        events = []
+        for call in self._calls:
+            if call.kind == "other":
+                continue
+
+            events.append(
+                {
+                    "name": call.name,
+                    "cat": call.kind,
+                    "ph": "X",
+                    "ts": (call.start - start) * 1e-3,
+                    "dur": (call.end - call.start) * 1e-3,
+                    "pid": pid,
+                    "tid": call.tid,
+                    "args": {
+                        "kernels": len(call.kernels),
+                        "bytes_allocated": call.bytes_allocated,
+                        "fallbacks": call.fallbacks,
+                        "host_syncs": call.host_syncs,
+                    },
+                }
+            )
+
+        for name, owner, tid, ts in self._fallbacks:
+            events.append(
+                {
+                    "name": "fallback: " + name,
+                    "cat": "fallback",
+                    "ph": "i",
+                    "s": "t",
+                    "ts": (ts - start) * 1e-3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"caller": owner},
+                }
+            )
+
+        device_offset = None
+        for ev, owner, ts in self._kernels:
+            key = id(ev)
+            if key not in self._event_times:
+                self._event_times[key] = _event_times(ev)
+
+            times = self._event_times[key]
+            if times is None:
+                continue
+            if device_offset is None:
+                device_offset = times[0] - (ts - start)
+
+            events.append(
+                {
+                    "name": owner or "kernel",
+                    "cat": "kernel",
+                    "ph": "X",
+                    "ts": (times[0] - device_offset) * 1e-3,
+                    "dur": (times[1] - times[0]) * 1e-3,
+                    "pid": pid,
+                    "tid": "device",
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """
+        Write the recorded events in Chrome trace event format to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the output JSON file.
+
+        """
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
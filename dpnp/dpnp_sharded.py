@@ -0,0 +1,673 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Sharded arrays partitioned along one axis across several SYCL queues.
+
+Notes
+-----
+Every shard is a :class:`dpnp.ndarray` allocated on its own queue, so the
+kernels computing the shards are submitted to all queues one after another
+and run concurrently, e.g. on NUMA sub-devices of a CPU device.
+
+"""
+
+import math
+
+import dpctl
+import numpy
+from dpctl.tensor._numpy_helper import (
+    normalize_axis_index,
+    normalize_axis_tuple,
+)
+
+import dpnp
+
+__all__ = ["ShardedArray", "shard"]
+
+
+def _matmul(a, b):
+    """Return the matrix product of a sharded and another operand."""
+
+    if isinstance(a, ShardedArray) and isinstance(b, ShardedArray):
+        b_axis = b.ndim - 2 if b.ndim > 1 else 0
+        if a.axis != a.ndim - 1 or b.axis != b_axis or a._sizes != b._sizes:
+            raise ValueError(
+                "Both operands must be sharded along the contracted axis with "
+                "the same shard sizes"
+            )
+
+        # partial products are summed up on the queue of the first shard
+        exec_q = a._shards[0].sycl_queue
+        result = None
+        for x, y in zip(a._shards, b._shards):
+            part = dpnp.asarray(dpnp.matmul(x, y), sycl_queue=exec_q)
+            if result is None:
+                result = part
+            else:
+                result += part
+        return result
+
+    if isinstance(a, ShardedArray):
+        sharded, other = a, b
+        contracted = a.ndim - 1
+    else:
+        sharded, other = b, a
+        contracted = b.ndim - 2 if b.ndim > 1 else 0
+
+    if sharded.axis == contracted:
+        raise ValueError(
+            "The operand sharded along the contracted axis requires the other "
+            "operand sharded along the contracted axis too"
+        )
+    if dpnp.ndim(other) > 2:
+        raise NotImplementedError(
+            "Only 1-D or 2-D array can be multiplied by a sharded array"
+        )
+
+    shards = []
+    for s, q in zip(sharded._shards, sharded.sycl_queues):
+        x = dpnp.asarray(other, sycl_queue=q)
+        shards.append(dpnp.matmul(s, x) if sharded is a else dpnp.matmul(x, s))
+
+    res_ndim = shards[0].ndim
+    axis = res_ndim - (sharded.ndim - sharded.axis)
+    if sharded is a:
+        axis += dpnp.ndim(other) == 1
+    else:
+        axis += dpnp.ndim(other) == 1 and sharded.axis != sharded.ndim - 1
+    return ShardedArray(shards, axis=axis)
+
+
+def _numa_queues(device):
+    """
+    Return queues of NUMA sub-devices of `device`, sharing a SYCL context, or
+    a queue of `device` itself if it cannot be partitioned.
+
+    """
+
+    try:
+        sub_devices = device.create_sub_devices(partition="numa")
+    except (dpctl.SyclSubDeviceCreationError, ValueError):
+        return [dpctl.SyclQueue(device)]
+
+    ctx = dpctl.SyclContext(sub_devices)
+    return [dpctl.SyclQueue(ctx, dev) for dev in sub_devices]
+
+
+def _split_sizes(n, parts):
+    """Return sizes of `parts` nearly equal parts of `n` elements."""
+
+    return [n // parts + (i < n % parts) for i in range(parts)]
+
+
+class ShardedArray:
+    """
+    An array partitioned along one axis into shards allocated on different
+    SYCL queues.
+
+    Elementwise operations, reductions and matrix products are computed
+    shard by shard on the queue of every shard. Partial results of
+    reductions along the sharded axis are combined on the queue of the first
+    shard.
+
+    Use :obj:`dpnp.shard` to partition an array.
+
+    Parameters
+    ----------
+    shards : sequence of {dpnp.ndarray, usm_ndarray}
+        The shards of the array in order. All of them must have the same data
+        type and the same shape except the size along `axis`.
+    axis : int, optional
+        The axis the array is partitioned along.
+
+        Default: ``0``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> x = np.shard(np.arange(6.0), axis=0)
+    >>> y = (x * 2 + 1).sum()
+    >>> y
+    array(36.)
+
+    """
+
+    def __init__(self, shards, axis=0):
+        shards = tuple(shards)
+        if not shards:
+            raise ValueError("At least one shard is required")
+        dpnp.check_supported_arrays_type(*shards)
+        shards = tuple(dpnp.asarray(s) for s in shards)
+
+        ref = shards[0]
+        if ref.ndim == 0:
+            raise ValueError("A shard must have at least one dimension")
+        axis = normalize_axis_index(axis, ref.ndim)
+
+        def _other_dims(s):
+            return s.shape[:axis] + s.shape[axis + 1 :]
+
+        for s in shards[1:]:
+            if s.ndim != ref.ndim or _other_dims(s) != _other_dims(ref):
+                raise ValueError(
+                    f"Shards of shapes {ref.shape} and {s.shape} cannot be "
+                    f"concatenated along axis {axis}"
+                )
+            if s.dtype != ref.dtype:
+                raise TypeError(
+                    f"Shards must have the same data type, but got "
+                    f"{ref.dtype} and {s.dtype}"
+                )
+
+        self._shards = shards
+        self._axis = axis
+        self._sizes = tuple(s.shape[axis] for s in shards)
+
+    # NumPy arrays defer binary operators to the reflected ones
+    __array_ufunc__ = None
+
+    def __abs__(self):
+        r"""Return ``\|self\|``."""
+        return self.map(dpnp.abs)
+
+    def __add__(self, other):
+        """Return ``self+value``."""
+        return self.map(dpnp.add, other)
+
+    def __eq__(self, other):
+        """Return ``self==value``."""
+        return self.map(dpnp.equal, other)
+
+    def __ge__(self, other):
+        """Return ``self>=value``."""
+        return self.map(dpnp.greater_equal, other)
+
+    def __gt__(self, other):
+        """Return ``self>value``."""
+        return self.map(dpnp.greater, other)
+
+    __hash__ = None
+
+    def __le__(self, other):
+        """Return ``self<=value``."""
+        return self.map(dpnp.less_equal, other)
+
+    def __len__(self):
+        """Return ``len(self)``."""
+        return self.shape[0]
+
+    def __lt__(self, other):
+        """Return ``self<value``."""
+        return self.map(dpnp.less, other)
+
+    def __matmul__(self, other):
+        """Return ``self@value``."""
+        return _matmul(self, other)
+
+    def __mul__(self, other):
+        """Return ``self*value``."""
+        return self.map(dpnp.multiply, other)
+
+    def __ne__(self, other):
+        """Return ``self!=value``."""
+        return self.map(dpnp.not_equal, other)
+
+    def __neg__(self):
+        """Return ``-self``."""
+        return self.map(dpnp.negative)
+
+    def __pow__(self, other):
+        """Return ``self**value``."""
+        return self.map(dpnp.power, other)
+
+    def __radd__(self, other):
+        """Return ``value+self``."""
+        return self._apply(dpnp.add, (other, self))
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return (
+            f"ShardedArray(shape={self.shape}, dtype={self.dtype}, "
+            f"axis={self._axis}, shards={len(self._shards)})"
+        )
+
+    def __rmatmul__(self, other):
+        """Return ``value@self``."""
+        return _matmul(other, self)
+
+    def __rmul__(self, other):
+        """Return ``value*self``."""
+        return self._apply(dpnp.multiply, (other, self))
+
+    def __rpow__(self, other):
+        """Return ``value**self``."""
+        return self._apply(dpnp.power, (other, self))
+
+    def __rsub__(self, other):
+        """Return ``value-self``."""
+        return self._apply(dpnp.subtract, (other, self))
+
+    def __rtruediv__(self, other):
+        """Return ``value/self``."""
+        return self._apply(dpnp.divide, (other, self))
+
+    def __sub__(self, other):
+        """Return ``self-value``."""
+        return self.map(dpnp.subtract, other)
+
+    def __truediv__(self, other):
+        """Return ``self/value``."""
+        return self.map(dpnp.divide, other)
+
+    def _apply(self, func, args, kwargs=None):
+        """
+        Call `func` on every shard with `args`, where sharded arrays are
+        replaced with their shards and other arrays are sliced or broadcast
+        and copied to the queue of the shard.
+
+        """
+
+        per_shard = [[] for _ in self._shards]
+        for arg in args:
+            if isinstance(arg, ShardedArray):
+                self._check_aligned(arg)
+                parts = arg._shards
+            elif dpnp.isscalar(arg):
+                parts = [arg] * len(self._shards)
+            else:
+                parts = self._split_operand(arg)
+
+            for ops, part in zip(per_shard, parts):
+                ops.append(part)
+
+        kwargs = {} if kwargs is None else kwargs
+        return ShardedArray(
+            [func(*ops, **kwargs) for ops in per_shard], axis=self._axis
+        )
+
+    def _check_aligned(self, other):
+        """Check `other` sharded array is partitioned the same way."""
+
+        if (
+            other.shape != self.shape
+            or other.axis != self._axis
+            or other._sizes != self._sizes
+        ):
+            raise ValueError(
+                f"Sharded arrays of shapes {self.shape} and {other.shape} "
+                f"partitioned along axes {self._axis} and {other.axis} into "
+                f"shards of sizes {self._sizes} and {other._sizes} are not "
+                "aligned"
+            )
+
+    def _reduce(self, func, axis, keepdims, **kwargs):
+        """
+        Reduce the array by `func` shard by shard, combining the partial
+        results by `func` if the sharded axis is reduced.
+
+        """
+
+        axes = normalize_axis_tuple(
+            tuple(range(self.ndim)) if axis is None else axis, self.ndim
+        )
+        if self._axis not in axes:
+            shards = [
+                func(s, axis=axes, keepdims=keepdims, **kwargs)
+                for s in self._shards
+            ]
+            new_axis = self._axis
+            if not keepdims:
+                new_axis -= sum(ax < self._axis for ax in axes)
+            return ShardedArray(shards, axis=new_axis)
+
+        # empty shards do not contribute to the result
+        shards = [s for s in self._shards if s.shape[self._axis]]
+        exec_q = self._shards[0].sycl_queue
+        partials = [
+            dpnp.asarray(
+                func(s, axis=axes, keepdims=True, **kwargs), sycl_queue=exec_q
+            )
+            for s in shards or self._shards[:1]
+        ]
+        res = func(
+            dpnp.concatenate(partials, axis=self._axis),
+            axis=self._axis,
+            keepdims=True,
+            **kwargs,
+        )
+        return res if keepdims else dpnp.squeeze(res, axis=axes)
+
+    def _split_operand(self, x):
+        """
+        Return parts of array `x` broadcast against the sharded array, which
+        are copied to the queues of the shards.
+
+        """
+
+        if not dpnp.is_supported_array_type(x):
+            x = numpy.asarray(x)
+        if x.ndim > self.ndim:
+            raise ValueError(
+                f"Operand of shape {x.shape} cannot be broadcast to the "
+                f"sharded array of shape {self.shape}"
+            )
+
+        axis = self._axis - (self.ndim - x.ndim)
+        parts = []
+        start = 0
+        for size, q in zip(self._sizes, self.sycl_queues):
+            if axis < 0 or x.shape[axis] == 1:
+                # the operand is broadcast along the sharded axis
+                part = x
+            else:
+                key = (slice(None),) * axis + (slice(start, start + size),)
+                part = x[key]
+            parts.append(dpnp.asarray(part, sycl_queue=q))
+            start += size
+        return parts
+
+    def all(self, axis=None, keepdims=False):
+        """
+        Test whether all array elements along a given axis evaluate to
+        ``True``.
+
+        Refer to :obj:`dpnp.all` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.all, axis, keepdims)
+
+    def any(self, axis=None, keepdims=False):
+        """
+        Test whether any array element along a given axis evaluates to
+        ``True``.
+
+        Refer to :obj:`dpnp.any` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.any, axis, keepdims)
+
+    def asnumpy(self):
+        """
+        Copy content of the array into :class:`numpy.ndarray` instance.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            The array assembled from the shards on the host.
+
+        """
+
+        return numpy.concatenate(
+            [dpnp.asnumpy(s) for s in self._shards], axis=self._axis
+        )
+
+    def astype(self, dtype):
+        """
+        Copy the array with data type casting.
+
+        Refer to :obj:`dpnp.astype` for full documentation.
+
+        """
+
+        return self.map(dpnp.astype, dtype=dtype)
+
+    @property
+    def axis(self):
+        """The axis the array is partitioned along."""
+
+        return self._axis
+
+    @property
+    def dtype(self):
+        """Returns NumPy's dtype corresponding to the type of the array."""
+
+        return self._shards[0].dtype
+
+    def gather(self, sycl_queue=None):
+        """
+        Assemble the shards into a single array.
+
+        Parameters
+        ----------
+        sycl_queue : {None, SyclQueue}, optional
+            The queue to allocate the result on. ``None`` means the queue of
+            the first shard.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The array assembled from the shards.
+
+        """
+
+        if sycl_queue is None:
+            sycl_queue = self._shards[0].sycl_queue
+        return dpnp.concatenate(
+            [dpnp.asarray(s, sycl_queue=sycl_queue) for s in self._shards],
+            axis=self._axis,
+        )
+
+    def map(self, func, *args, **kwargs):
+        """
+        Call `func` on every shard.
+
+        Parameters
+        ----------
+        func : callable
+            An elementwise function preserving the sharded axis, which is
+            called as ``func(shard, *args, **kwargs)`` on every shard.
+        args : {scalar, array_like, ShardedArray}
+            Other positional arguments of `func`. Sharded arrays must be
+            partitioned the same way as the array and are replaced with
+            their shards. Other arrays are broadcast against the array,
+            sliced along the sharded axis and copied to the queue of
+            the shard.
+        kwargs : dict
+            Keyword arguments of `func`.
+
+        Returns
+        -------
+        out : ShardedArray
+            The array of the results of `func`.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> x = np.shard(np.array([0.0, 1.0, 4.0, 9.0]))
+        >>> x.map(np.sqrt).gather()
+        array([0., 1., 2., 3.])
+
+        """
+
+        return self._apply(func, (self,) + args, kwargs)
+
+    def max(self, axis=None, keepdims=False):
+        """
+        Return the maximum along an axis.
+
+        Refer to :obj:`dpnp.max` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.max, axis, keepdims)
+
+    def mean(self, axis=None, dtype=None, keepdims=False):
+        """
+        Return the arithmetic mean along an axis.
+
+        Refer to :obj:`dpnp.mean` for full documentation.
+
+        """
+
+        axes = normalize_axis_tuple(
+            tuple(range(self.ndim)) if axis is None else axis, self.ndim
+        )
+        count = math.prod(self.shape[ax] for ax in axes)
+
+        res = self.sum(axis=axes, dtype=dtype, keepdims=keepdims)
+        if isinstance(res, ShardedArray):
+            return res.map(dpnp.divide, count)
+        return dpnp.divide(res, count)
+
+    def min(self, axis=None, keepdims=False):
+        """
+        Return the minimum along a given axis.
+
+        Refer to :obj:`dpnp.min` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.min, axis, keepdims)
+
+    @property
+    def ndim(self):
+        """Return the number of dimensions of the array."""
+
+        return self._shards[0].ndim
+
+    def prod(self, axis=None, dtype=None, keepdims=False):
+        """
+        Return the product of the array elements over the given axis.
+
+        Refer to :obj:`dpnp.prod` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.prod, axis, keepdims, dtype=dtype)
+
+    @property
+    def shape(self):
+        """Tuple of array dimensions."""
+
+        shape = list(self._shards[0].shape)
+        shape[self._axis] = sum(self._sizes)
+        return tuple(shape)
+
+    @property
+    def shards(self):
+        """Tuple of the shards of the array."""
+
+        return self._shards
+
+    @property
+    def size(self):
+        """Number of elements in the array."""
+
+        return math.prod(self.shape)
+
+    def sum(self, axis=None, dtype=None, keepdims=False):
+        """
+        Return the sum along a given axis.
+
+        Refer to :obj:`dpnp.sum` for full documentation.
+
+        """
+
+        return self._reduce(dpnp.sum, axis, keepdims, dtype=dtype)
+
+    @property
+    def sycl_queues(self):
+        """Tuple of the SYCL queues of the shards."""
+
+        return tuple(s.sycl_queue for s in self._shards)
+
+
+def shard(a, sycl_queues=None, axis=0):
+    """
+    Partition an array along an axis into shards allocated on different
+    SYCL queues.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray, array_like}
+        Input array with at least one dimension.
+    sycl_queues : {None, sequence of SyclQueue}, optional
+        The queues to allocate the shards on. ``None`` means queues of NUMA
+        sub-devices of the device of `a`, or of the default device for
+        array_like input, sharing a SYCL context. If the device cannot be
+        partitioned by NUMA domains, a single shard is allocated on it.
+
+        Default: ``None``.
+    axis : int, optional
+        The axis to partition `a` along. The sizes of the shards along the
+        axis differ by at most one.
+
+        Default: ``0``.
+
+    Returns
+    -------
+    out : dpnp.ShardedArray
+        The sharded copy of `a`.
+
+    See Also
+    --------
+    :obj:`dpnp.ShardedArray.gather` : Assemble the shards into a single
+                                      array.
+
+    Examples
+    --------
+    >>> import dpnp as np, dpctl
+    >>> queues = [dpctl.SyclQueue(), dpctl.SyclQueue()]
+    >>> x = np.shard(np.ones((5, 3)), queues, axis=0)
+    >>> [s.shape for s in x.shards]
+    [(3, 3), (2, 3)]
+    >>> (x @ np.ones(3)).gather()
+    array([3., 3., 3., 3., 3.])
+
+    """
+
+    if sycl_queues is None:
+        if dpnp.is_supported_array_type(a):
+            device = a.sycl_device
+        else:
+            device = dpctl.select_default_device()
+        sycl_queues = _numa_queues(device)
+
+    sycl_queues = list(sycl_queues)
+    if not sycl_queues:
+        raise ValueError("At least one SYCL queue is required")
+
+    if not dpnp.is_supported_array_type(a):
+        # the host data are copied to every queue directly
+        a = numpy.asarray(a)
+    if a.ndim == 0:
+        raise ValueError("A 0-d array cannot be sharded")
+    axis = normalize_axis_index(axis, a.ndim)
+
+    shards = []
+    start = 0
+    for size, q in zip(
+        _split_sizes(a.shape[axis], len(sycl_queues)), sycl_queues
+    ):
+        key = (slice(None),) * axis + (slice(start, start + size),)
+        shards.append(dpnp.array(a[key], sycl_queue=q))
+        start += size
+    return ShardedArray(shards, axis=axis)
@@ -32,6 +32,8 @@ This module contains different helpers and utilities
 
 """
 
+import time
+
 import dpctl
 import dpctl.utils as dpu
 import numpy
@@ -103,6 +105,15 @@ def convert_list_args(input_list):
     return result_list
 
 
+def get_device_nbytes(item):
+    """Return the number of bytes of USM arrays in the object."""
+    if hasattr(item, "__sycl_usm_array_interface__"):
+        return item.nbytes
+    elif isinstance(item, (list, tuple)):
+        return sum(get_device_nbytes(x) for x in item)
+    return 0
+
+
 def copy_from_origin(dst, src):
     """Copy origin result to output result."""
     if hasattr(dst, "__sycl_usm_array_interface__"):
@@ -121,11 +132,12 @@ def call_origin(function, *args, **kwargs):
 
     allow_fallback = kwargs.pop("allow_fallback", False)
 
-    if not allow_fallback and config.__DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK__ == 1:
-        raise NotImplementedError(f"Requested function={function.__name__} with args={args} and kwargs={kwargs} "
-                                   "isn't currently supported and would fall back on NumPy implementation. "
-                                   "Define environment variable `DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK` to `0` "
-                                   "if the fall back is required to be supported without raising an exception.")
+    config._apply_fallback_policy(function.__name__, allow_fallback,
+                                  details=f" with args={args} and kwargs={kwargs}")
+
+    start_time = time.perf_counter()
+    bytes_to_host = get_device_nbytes(args) + get_device_nbytes(list(kwargs.values()))
+    bytes_to_device = 0
 
     dpnp_inplace = kwargs.pop("dpnp_inplace", False)
     sycl_queue = kwargs.pop("sycl_queue", None)
@@ -170,6 +182,7 @@ def call_origin(function, *args, **kwargs):
             arg, arg_new = args[0], args_new[0]
             if isinstance(arg_new, numpy.ndarray):
                 copy_from_origin(arg, arg_new)
+                bytes_to_device += get_device_nbytes(arg)
             elif isinstance(arg_new, list):
                 for i, val in enumerate(arg_new):
                     arg[i] = val
@@ -187,6 +200,7 @@ def call_origin(function, *args, **kwargs):
             result = kwargs_out
 
         copy_from_origin(result, result_origin)
+        bytes_to_device += get_device_nbytes(result)
 
     elif isinstance(result, tuple):
         # convert tuple(fallback_array) to tuple(result_array)
@@ -200,10 +214,12 @@ def call_origin(function, *args, **kwargs):
                     result_dtype = res_origin.d_type
                 res = dpnp_container.empty(res_origin.shape, dtype=result_dtype, sycl_queue=exec_q)
                 copy_from_origin(res, res_origin)
+                bytes_to_device += get_device_nbytes(res)
             result_list.append(res)
 
         result = tuple(result_list)
 
+    config._record_fallback(function.__name__, bytes_to_host, bytes_to_device, time.perf_counter() - start_time)
     return result
 
 
@@ -0,0 +1,155 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Helpers selecting elements of arrays by packed boolean masks.
+
+A packed mask is a 1-D ``uint8`` array holding the bits of a flattened
+boolean mask as returned by :obj:`dpnp.packbits`. The mask is unpacked by
+chunks of bounded size, so the unpacked mask is never allocated in full.
+
+"""
+
+import math
+
+import dpnp
+
+__all__ = [
+    "dpnp_packed_count",
+    "dpnp_packed_extract",
+    "dpnp_packed_nonzero",
+    "dpnp_unpack_mask",
+]
+
+# number of bytes of a packed mask unpacked at once
+_CHUNK_BYTES = 1 << 24
+
+
+def _check_packed_mask(mask, flat=True):
+    """Check `mask` is a packed mask, which is 1-D if `flat` is ``True``."""
+
+    dpnp.check_supported_arrays_type(mask)
+    if mask.dtype != dpnp.uint8:
+        raise TypeError(
+            f"Packed mask must be of unsigned byte data type, got {mask.dtype}"
+        )
+    if flat and mask.ndim != 1:
+        raise ValueError(f"Packed mask must be a 1-D array, got {mask.ndim}-D")
+
+
+def _iter_chunks(mask, count, bitorder):
+    """
+    Yield the offsets of chunks of the first `count` bits of packed `mask`
+    and the chunks unpacked to ``uint8`` arrays of zeros and ones.
+
+    """
+
+    count = min(count, mask.size * 8)
+    for start in range(0, -(-count // 8), _CHUNK_BYTES):
+        offset = start * 8
+        chunk = mask[start : start + _CHUNK_BYTES]
+        n = min(chunk.size * 8, count - offset)
+        yield offset, dpnp.unpackbits(chunk, count=n, bitorder=bitorder)
+
+
+def dpnp_packed_count(mask, axis=None, keepdims=False, out=None):
+    """
+    Return the number of set bits of packed `mask` along `axis`.
+
+    The bits are counted without unpacking, since padding bits of a packed
+    mask are zeros.
+
+    """
+
+    _check_packed_mask(mask, flat=False)
+    return dpnp.sum(
+        dpnp.bitwise_count(mask),
+        axis=axis,
+        dtype=dpnp.intp,
+        keepdims=keepdims,
+        out=out,
+    )
+
+
+def dpnp_packed_extract(mask, a, bitorder="big"):
+    """Return elements of flattened `a` where bits of packed `mask` are set."""
+
+    _check_packed_mask(mask)
+    if mask.size != -(-a.size // 8):
+        raise ValueError(
+            f"Packed mask of {mask.size} bytes does not match array of "
+            f"{a.size} elements"
+        )
+
+    a = dpnp.ravel(a)
+    res = [
+        dpnp.extract(bits, a[offset : offset + bits.size])
+        for offset, bits in _iter_chunks(mask, a.size, bitorder)
+    ]
+    if len(res) == 1:
+        return res[0]
+    if not res:
+        return a[:0].copy()
+    return dpnp.concatenate(res)
+
+
+def dpnp_packed_nonzero(mask, count=None, bitorder="big"):
+    """
+    Return the indices of set bits among the first `count` bits of packed
+    `mask`.
+
+    """
+
+    _check_packed_mask(mask)
+    if count is None:
+        count = mask.size * 8
+
+    res = []
+    for offset, bits in _iter_chunks(mask, count, bitorder):
+        (ind,) = dpnp.nonzero(bits)
+        res.append(ind + offset if offset else ind)
+    if len(res) == 1:
+        return res[0]
+    if not res:
+        return dpnp.empty_like(mask, dtype=dpnp.intp, shape=(0,))
+    return dpnp.concatenate(res)
+
+
+def dpnp_unpack_mask(mask, shape, bitorder="big"):
+    """
+    Return packed `mask` unpacked to an array of `shape` of ``uint8`` zeros
+    and ones.
+
+    """
+
+    _check_packed_mask(mask)
+    size = math.prod(shape)
+    if mask.size != -(-size // 8):
+        raise ValueError(
+            f"Packed mask of {mask.size} bytes does not match shape {shape}"
+        )
+
+    bits = dpnp.unpackbits(mask, count=size, bitorder=bitorder)
+    return bits.reshape(shape)
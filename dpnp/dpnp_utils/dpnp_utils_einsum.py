@@ -24,8 +24,10 @@
 # *****************************************************************************
 
 import copy
+import functools
 import itertools
 import operator
+import types
 import warnings
 
 import dpctl
@@ -38,6 +40,9 @@ from dpnp.dpnp_utils import get_usm_allocations, map_dtype_to_device
 
 _einsum_symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# maximum number of entries kept by each of einsum plan caches
+_einsum_plan_cache_size = 512
+
 
 __all__ = ["dpnp_einsum"]
 
@@ -327,6 +332,89 @@ def _flatten_transpose(a, axeses):
     )
 
 
+def _flatten_transpose_view(a, axeses):
+    """
+    Transpose and flatten each group of axes without making a copy.
+
+    Each group of axes is merged into a single axis of a strided view over
+    the memory of `a`. This is only possible when the axes of each group
+    follow one another in memory in the given order.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    axeses : sequence of sequences of ints
+        Axeses
+
+    Returns
+    -------
+    out : {None, dpnp.ndarray}
+        A view of `a` with its axes permutated and flatten, or ``None`` if
+        such view does not exist.
+    shapes : list
+        flattened shapes.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.dpnp_utils.dpnp_utils_einsum as np_util
+    >>> a = np.arange(24).reshape(2, 3, 4).transpose(1, 0, 2)
+    >>> out, shapes = np_util._flatten_transpose_view(a, [(0, 2), (1,)])
+    >>> out.shape, out.strides
+    ((12, 2), (1, 12))
+    >>> shapes
+    [[3, 4], [2]]
+    >>> out, _ = np_util._flatten_transpose_view(a, [(1, 2), (0,)])
+    >>> out is None
+    True
+
+    """
+
+    a_shape = a.shape
+    a_strides = a.strides
+
+    shape = []
+    strides = []
+    shapes = []
+    view_exists = True
+    for axes in axeses:
+        sub_shape = [a_shape[axis] for axis in axes]
+        shapes.append(sub_shape)
+
+        size = int(numpy.prod(sub_shape))
+        stride = a_strides[axes[-1]] if axes else 0
+        if any(a_strides[axis] < 0 for axis in axes):
+            # gemm_batch does not handle negative strides
+            view_exists = False
+        elif stride == 0 and size > 1:
+            # broadcast axes can't be passed to gemm_batch
+            view_exists = False
+        elif any(
+            a_strides[axes[i]] != a_strides[axes[i + 1]] * a_shape[axes[i + 1]]
+            for i in range(len(axes) - 1)
+        ):
+            view_exists = False
+
+        shape.append(size)
+        strides.append(stride)
+
+    if not view_exists:
+        return None, shapes
+
+    a_usm = dpnp.get_usm_ndarray(a)
+    out = dpnp_array(
+        tuple(shape),
+        dtype=a.dtype,
+        buffer=a_usm,
+        offset=a_usm._element_offset,
+        strides=tuple(strides),
+        usm_type=a.usm_type,
+        sycl_queue=a.sycl_queue,
+    )
+    return out, shapes
+
+
 def _flop_count(idx_contraction, inner, num_terms, size_dictionary):
     """
     Copied from _flop_count in numpy/core/einsumfunc.py
@@ -607,6 +695,61 @@ def _optimal_path(input_sets, output_set, idx_dict, memory_limit):
     return path
 
 
+@functools.lru_cache(maxsize=_einsum_plan_cache_size)
+def _optimize_path(
+    algo_name, memory_limit, input_subscripts, output_subscript, dimension_items
+):
+    """
+    Compute the contraction path using a path finding algorithm.
+
+    The path depends only on the subscripts and on the size of each label,
+    so it is cached to avoid running a path search (which is exponential
+    in the number of operands for ``"optimal"`` algorithm) on every call
+    with the same expression and shapes.
+
+    Parameters
+    ----------
+    algo_name : {"greedy", "optimal"}
+        The path finding algorithm.
+    memory_limit : int
+        The maximum number of elements in a temporary array.
+    input_subscripts : tuple of tuples of ints
+        The subscripts of each operand.
+    output_subscript : tuple of ints
+        The subscripts of the output.
+    dimension_items : tuple of tuples
+        The pairs of label and its size.
+
+    Returns
+    -------
+    path : tuple of tuples of ints
+        The contraction path.
+
+    """
+
+    optimize_algorithms = {
+        "greedy": _greedy_path,
+        "optimal": _optimal_path,
+    }
+    algo = optimize_algorithms[algo_name]
+
+    input_sets = [set(sub) for sub in input_subscripts]
+    output_set = set(output_subscript)
+    path = algo(input_sets, output_set, dict(dimension_items), memory_limit)
+    return tuple(tuple(indices) for indices in path)
+
+
+def _order_axes_by_strides(a, axes):
+    """
+    Return the permutation which sorts `axes` of array `a` by decreasing
+    absolute value of their strides, i.e. in the order they follow one
+    another in memory.
+
+    """
+
+    return sorted(range(len(axes)), key=lambda i: -abs(a.strides[axes[i]]))
+
+
 def _parse_einsum_input(args):
     """
     Copied from _parse_einsum_input in cupy/core/_einsum.py
@@ -710,6 +853,7 @@ def _parse_einsum_input(args):
     return input_subscripts, output_subscript, operands
 
 
+@functools.lru_cache(maxsize=_einsum_plan_cache_size)
 def _parse_ellipsis_subscript(subscript, idx, ndim=None, ellipsis_len=None):
     """
     Copied from _parse_ellipsis_subscript in cupy/core/_einsum.py
@@ -773,6 +917,101 @@ def _parse_ellipsis_subscript(subscript, idx, ndim=None, ellipsis_len=None):
         )
 
 
+def _parse_einsum_subscripts(input_subscripts, output_subscript, shapes):
+    """
+    Parse einsum subscripts and validate them against the operand shapes.
+
+    The result depends only on the subscripts and on the shapes of operands,
+    so it is cached to avoid parsing the same expression on every call.
+
+    Parameters
+    ----------
+    input_subscripts : tuple of str
+        The subscripts of each operand where "..." is replaced by "@".
+    output_subscript : {None, str}
+        The subscripts of the output where "..." is replaced by "@".
+    shapes : tuple of tuples of ints
+        The shapes of operands.
+
+    Returns
+    -------
+    input_subscripts : tuple of tuples of ints
+        The parsed subscripts of each operand.
+    output_subscript : tuple of ints
+        The parsed subscripts of the output.
+    dimension_dict : mappingproxy
+        Read-only mapping of each label to its size.
+
+    """
+
+    input_subscripts = tuple(
+        tuple(_parse_ellipsis_subscript(sub, idx, ndim=len(shape)))
+        for idx, (sub, shape) in enumerate(zip(input_subscripts, shapes))
+    )
+
+    # Get length of each unique dimension and ensure all dimensions are correct
+    dimension_dict = {}
+    for idx, sub in enumerate(input_subscripts):
+        sh = shapes[idx]
+        for axis, label in enumerate(sub):
+            dim = sh[axis]
+            if label in dimension_dict.keys():
+                # For broadcasting cases we always want the largest dim size
+                if dimension_dict[label] == 1:
+                    dimension_dict[label] = dim
+                elif dim not in (1, dimension_dict[label]):
+                    dim_old = dimension_dict[label]
+                    raise ValueError(
+                        f"Size of label '{_chr(label)}' for operand {idx} ({dim}) "
+                        f"does not match previous terms ({dim_old})."
+                    )
+            else:
+                dimension_dict[label] = dim
+
+    if output_subscript is None:
+        # Build output subscripts
+        tmp_subscripts = list(itertools.chain.from_iterable(input_subscripts))
+        output_subscript = [
+            label
+            for label in sorted(set(tmp_subscripts))
+            if label < 0 or tmp_subscripts.count(label) == 1
+        ]
+    else:
+        if "@" not in output_subscript and -1 in dimension_dict:
+            raise ValueError(
+                "output has more dimensions than subscripts "
+                "given in einstein sum, but no '...' ellipsis "
+                "provided to broadcast the extra dimensions."
+            )
+        output_subscript = _parse_ellipsis_subscript(
+            output_subscript,
+            None,
+            ellipsis_len=sum(label < 0 for label in dimension_dict.keys()),
+        )
+
+        # Make sure output subscripts are in the input
+        tmp_subscripts = set(itertools.chain.from_iterable(input_subscripts))
+        for label in output_subscript:
+            if label not in tmp_subscripts:
+                raise ValueError(
+                    "einstein sum subscripts string included output subscript "
+                    f"'{_chr(label)}' which never appeared in an input."
+                )
+        if len(output_subscript) != len(set(output_subscript)):
+            repeated_subscript = []
+            for label in output_subscript:
+                if output_subscript.count(label) >= 2:
+                    repeated_subscript.append(_chr(label))
+            raise ValueError(
+                "einstein sum subscripts string includes output "
+                f"subscript {set(repeated_subscript)} multiple times."
+            )
+
+    # the result is shared between calls, so expose only a read-only view
+    dimension_dict = types.MappingProxyType(dimension_dict)
+    return input_subscripts, tuple(output_subscript), dimension_dict
+
+
 def _parse_int_subscript(list_subscript):
     """Copied from _parse_int_subscript in cupy/core/_einsum.py"""
 
@@ -875,7 +1114,80 @@ def _parse_possible_contraction(
 
 
 def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
-    """Copied from _reduced_binary_einsum in cupy/core/_einsum.py"""
+    """Adopted from _reduced_binary_einsum in cupy/core/_einsum.py"""
+
+    axes0, axes1, sub_out = _reduced_binary_einsum_plan(
+        tuple(sub0), tuple(sub1), tuple(sub_others)
+    )
+    sub_out = list(sub_out)
+
+    if axes0 is None:
+        # Use element-wise multiply when no contraction is needed
+        if sub0 and sub1:
+            arr0 = _expand_dims_transpose(arr0, sub0, sub_out)
+            arr1 = _expand_dims_transpose(arr1, sub1, sub_out)
+        return arr0 * arr1, sub_out
+
+    (bs0, ts0, cs0), (bs1, cs1, ts1) = axes0, axes1
+
+    # Reorder axes inside of each group to follow the memory layout, so the
+    # groups can be merged into a strided view passed to gemm_batch without
+    # making a copy. Batch and contracted axes are shared by both operands
+    # and have to be reordered consistently.
+    perm = _order_axes_by_strides(arr0, bs0)
+    bs0, bs1 = [bs0[i] for i in perm], [bs1[i] for i in perm]
+    perm = _order_axes_by_strides(arr0, cs0)
+    cs0, cs1 = [cs0[i] for i in perm], [cs1[i] for i in perm]
+    ts0 = [ts0[i] for i in _order_axes_by_strides(arr0, ts0)]
+    ts1 = [ts1[i] for i in _order_axes_by_strides(arr1, ts1)]
+    sub_out = [sub0[axis] for axis in bs0 + ts0] + [sub1[axis] for axis in ts1]
+
+    tmp0, shapes0 = _flatten_transpose_view(arr0, [bs0, ts0, cs0])
+    if tmp0 is None:
+        # no valid strided mapping exists, fall back to a copy
+        tmp0, shapes0 = _flatten_transpose(arr0, [bs0, ts0, cs0])
+
+    tmp1, shapes1 = _flatten_transpose_view(arr1, [bs1, cs1, ts1])
+    if tmp1 is None:
+        tmp1, shapes1 = _flatten_transpose(arr1, [bs1, cs1, ts1])
+
+    shapes_out = shapes0[0] + shapes0[1] + shapes1[2]
+    assert shapes0[0] == shapes1[0]
+    arr_out = dpnp.matmul(tmp0, tmp1).reshape(shapes_out)
+    return arr_out, sub_out
+
+
+@functools.lru_cache(maxsize=_einsum_plan_cache_size)
+def _reduced_binary_einsum_plan(sub0, sub1, sub_others):
+    """
+    Adopted from _reduced_binary_einsum in cupy/core/_einsum.py
+
+    Compute the transpose plan of the reduced binary einsum.
+
+    The plan depends only on the subscripts, so it is cached to avoid
+    recomputing it on every call with the same expression.
+
+    Parameters
+    ----------
+    sub0 : tuple of ints
+        The subscripts of the first operand.
+    sub1 : tuple of ints
+        The subscripts of the second operand.
+    sub_others : tuple of ints
+        The subscripts of the output and of the remaining operands.
+
+    Returns
+    -------
+    axes0 : {None, tuple of tuples of ints}
+        Batch, free and contracted axes of the first operand, or ``None``
+        when no contraction is needed.
+    axes1 : {None, tuple of tuples of ints}
+        Batch, contracted and free axes of the second operand, or ``None``
+        when no contraction is needed.
+    sub_out : tuple of ints
+        The subscripts of the result.
+
+    """
 
     set0 = set(sub0)
     set1 = set(sub1)
@@ -883,7 +1195,7 @@ def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
     assert len(set1) == len(sub1), "operand 1 should be reduced: diagonal"
 
     if len(sub0) == 0 or len(sub1) == 0:
-        return arr0 * arr1, sub0 + sub1
+        return None, None, sub0 + sub1
 
     set_others = set(sub_others)
     shared = set0 & set1
@@ -898,24 +1210,16 @@ def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
     sub_l = [sub0[axis] for axis in ts0]
     sub_r = [sub1[axis] for axis in ts1]
 
-    sub_out = sub_b + sub_l + sub_r
+    sub_out = tuple(sub_b + sub_l + sub_r)
     assert set(sub_out) <= set_others, "operands should be reduced: unary sum"
 
     if len(contract_dims) == 0:
-        # Use element-wise multiply when no contraction is needed
         if len(sub_out) == len(sub_others):
             # to assure final output of einsum is C-contiguous
             sub_out = sub_others
-        arr0 = _expand_dims_transpose(arr0, sub0, sub_out)
-        arr1 = _expand_dims_transpose(arr1, sub1, sub_out)
-        return arr0 * arr1, sub_out
+        return None, None, sub_out
 
-    tmp0, shapes0 = _flatten_transpose(arr0, [bs0, ts0, cs0])
-    tmp1, shapes1 = _flatten_transpose(arr1, [bs1, cs1, ts1])
-    shapes_out = shapes0[0] + shapes0[1] + shapes1[2]
-    assert shapes0[0] == shapes1[0]
-    arr_out = dpnp.matmul(tmp0, tmp1).reshape(shapes_out)
-    return arr_out, sub_out
+    return (bs0, ts0, cs0), (bs1, cs1, ts1), sub_out
 
 
 def _transpose_ex(a, axeses):
@@ -945,11 +1249,13 @@ def _transpose_ex(a, axeses):
         stride = sum(a.strides[axis] for axis in axes)
         strides.append(stride)
 
-    # TODO: replace with a.view() when it is implemented in dpnp
+    # the offset is counted from the beginning of the allocation
+    a_usm = dpnp.get_usm_ndarray(a)
     return dpnp_array(
         shape,
         dtype=a.dtype,
-        buffer=a,
+        buffer=a_usm,
+        offset=a_usm._element_offset,
         strides=strides,
         usm_type=a.usm_type,
         sycl_queue=a.sycl_queue,
@@ -1037,68 +1343,15 @@ def dpnp_einsum(
     if order is not None and order in "aA":
         order = "F" if all(arr.flags.fnc for arr in arrays) else "C"
 
-    input_subscripts = [
-        _parse_ellipsis_subscript(sub, idx, ndim=arr.ndim)
-        for idx, (sub, arr) in enumerate(zip(input_subscripts, operands))
-    ]
-
-    # Get length of each unique dimension and ensure all dimensions are correct
-    dimension_dict = {}
-    for idx, sub in enumerate(input_subscripts):
-        sh = operands[idx].shape
-        for axis, label in enumerate(sub):
-            dim = sh[axis]
-            if label in dimension_dict.keys():
-                # For broadcasting cases we always want the largest dim size
-                if dimension_dict[label] == 1:
-                    dimension_dict[label] = dim
-                elif dim not in (1, dimension_dict[label]):
-                    dim_old = dimension_dict[label]
-                    raise ValueError(
-                        f"Size of label '{_chr(label)}' for operand {idx} ({dim}) "
-                        f"does not match previous terms ({dim_old})."
-                    )
-            else:
-                dimension_dict[label] = dim
-
-    if output_subscript is None:
-        # Build output subscripts
-        tmp_subscripts = list(itertools.chain.from_iterable(input_subscripts))
-        output_subscript = [
-            label
-            for label in sorted(set(tmp_subscripts))
-            if label < 0 or tmp_subscripts.count(label) == 1
-        ]
-    else:
-        if "@" not in output_subscript and -1 in dimension_dict:
-            raise ValueError(
-                "output has more dimensions than subscripts "
-                "given in einstein sum, but no '...' ellipsis "
-                "provided to broadcast the extra dimensions."
-            )
-        output_subscript = _parse_ellipsis_subscript(
+    input_subscripts, output_subscript, dimension_dict = (
+        _parse_einsum_subscripts(
+            tuple(input_subscripts),
             output_subscript,
-            None,
-            ellipsis_len=sum(label < 0 for label in dimension_dict.keys()),
+            tuple(arr.shape for arr in operands),
         )
-
-        # Make sure output subscripts are in the input
-        tmp_subscripts = set(itertools.chain.from_iterable(input_subscripts))
-        for label in output_subscript:
-            if label not in tmp_subscripts:
-                raise ValueError(
-                    "einstein sum subscripts string included output subscript "
-                    f"'{_chr(label)}' which never appeared in an input."
-                )
-        if len(output_subscript) != len(set(output_subscript)):
-            repeated_subscript = []
-            for label in output_subscript:
-                if output_subscript.count(label) >= 2:
-                    repeated_subscript.append(_chr(label))
-            raise ValueError(
-                "einstein sum subscripts string includes output "
-                f"subscript {set(repeated_subscript)} multiple times."
-            )
+    )
+    input_subscripts = [list(sub) for sub in input_subscripts]
+    output_subscript = list(output_subscript)
 
     _einsum_diagonals(input_subscripts, operands)
 
@@ -1151,8 +1404,7 @@ def dpnp_einsum(
             operands[idx] = operands[idx].sum(axis=sum_axes, dtype=result_dtype)
 
     if returns_view:
-        # TODO: replace with a.view() when it is implemented in dpnp
-        operands = [a for a in operands]
+        operands = [dpnp.asarray(a).view() for a in operands]
     else:
         operands = [
             dpnp.astype(a, result_dtype, copy=False, casting=casting)
@@ -1160,29 +1412,33 @@ def dpnp_einsum(
         ]
 
     # no more casts
-    optimize_algorithms = {
-        "greedy": _greedy_path,
-        "optimal": _optimal_path,
-    }
+    optimize_algorithms = ("greedy", "optimal")
     if optimize is False:
         path = [tuple(range(len(operands)))]
     elif len(optimize) and (optimize[0] == "einsum_path"):
         path = optimize[1:]
     else:
-        try:
-            if len(optimize) == 2 and isinstance(optimize[1], (int, float)):
-                algo = optimize_algorithms[optimize[0]]
-                memory_limit = int(optimize[1])
-            else:
-                algo = optimize_algorithms[optimize]
-                memory_limit = 2**31
-        except (TypeError, KeyError):  # unhashable type or not found
+        if (
+            len(optimize) == 2
+            and isinstance(optimize[1], (int, float))
+            and optimize[0] in optimize_algorithms
+        ):
+            algo_name = optimize[0]
+            memory_limit = int(optimize[1])
+        elif isinstance(optimize, str) and optimize in optimize_algorithms:
+            algo_name = optimize
+            memory_limit = 2**31
+        else:
             raise TypeError(
                 f"Did not understand the path (optimize): {str(optimize)}"
             )
-        input_sets = [set(sub) for sub in input_subscripts]
-        output_set = set(output_subscript)
-        path = algo(input_sets, output_set, dimension_dict, memory_limit)
+        path = _optimize_path(
+            algo_name,
+            memory_limit,
+            tuple(tuple(sub) for sub in input_subscripts),
+            tuple(output_subscript),
+            tuple(dimension_dict.items()),
+        )
         if any(len(indices) > 2 for indices in path):
             warnings.warn(
                 "memory efficient einsum is not supported yet",
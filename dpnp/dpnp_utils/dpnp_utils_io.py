@@ -0,0 +1,217 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Helpers streaming data of USM arrays from and to files by chunks.
+
+The data are staged through two host USM (pinned) buffers, so reading or
+writing of a chunk on the host overlaps with copying of the next chunk
+to or from the device.
+
+"""
+
+import ast
+import struct
+
+import numpy
+
+from .dpnp_utils_transfer import dpnp_stage_from_host, dpnp_stage_to_host
+
+__all__ = [
+    "dpnp_read_array",
+    "dpnp_write_array",
+    "read_npy_header",
+    "write_npy_header",
+]
+
+# size in bytes of a chunk staged in a host buffer
+_CHUNK_BYTES = 1 << 24
+
+# maximum length of NPY header safe to parse, the same as in numpy.load
+_MAX_HEADER_SIZE = 10000
+
+
+def _as_bytes(buf):
+    """Return a 1-D view of bytes of C-contiguous NumPy array `buf`."""
+
+    return buf.reshape(-1).view(numpy.uint8)
+
+
+def _read_array_header_3_0(fh):
+    """
+    Read the header of an array in NPY format version 3.0 from file `fh`.
+
+    The version 3.0 differs from 2.0 only by UTF-8 encoding of the header,
+    but NumPy provides no public function to read it.
+
+    """
+
+    hlength = _read_bytes(fh, 4, "array header length")
+    (hlength,) = struct.unpack("<I", hlength)
+    if hlength > _MAX_HEADER_SIZE:
+        raise ValueError(
+            f"Header info length ({hlength}) is large and may not be safe "
+            "to load securely"
+        )
+
+    header = _read_bytes(fh, hlength, "array header").decode("utf8")
+    try:
+        d = ast.literal_eval(header)
+    except (SyntaxError, ValueError) as e:
+        raise ValueError(f"Cannot parse header: {header!r}") from e
+
+    keys = {"descr", "fortran_order", "shape"}
+    if not isinstance(d, dict) or d.keys() != keys:
+        raise ValueError(f"Header does not contain the correct keys: {d!r}")
+
+    shape = d["shape"]
+    if not isinstance(shape, tuple) or not all(
+        isinstance(x, int) for x in shape
+    ):
+        raise ValueError(f"shape is not valid: {shape!r}")
+    if not isinstance(d["fortran_order"], bool):
+        raise ValueError(
+            f"fortran_order is not a valid bool: {d['fortran_order']!r}"
+        )
+
+    dtype = numpy.lib.format.descr_to_dtype(d["descr"])
+    return shape, d["fortran_order"], dtype
+
+
+def _read_bytes(fh, size, what):
+    """Read exactly `size` bytes of `what` from file `fh`."""
+
+    data = fh.read(size)
+    if len(data) != size:
+        raise ValueError(
+            f"EOF: reading {what}, expected {size} bytes got {len(data)}"
+        )
+    return data
+
+
+def _readinto(fh, buf):
+    """Fill `buf` with the data read from file `fh`."""
+
+    view = memoryview(_as_bytes(buf))
+    readinto = getattr(fh, "readinto", None)
+
+    n = 0
+    while n < len(view):
+        if readinto is not None:
+            k = readinto(view[n:])
+        else:
+            data = fh.read(len(view) - n)
+            k = len(data)
+            view[n : n + k] = data
+
+        if not k:
+            raise ValueError(
+                f"EOF: reading array data, expected {len(view)} bytes got {n}"
+            )
+        n += k
+
+
+def dpnp_read_array(fh, a, order="C", chunk_bytes=None):
+    """
+    Fill array `a` with the data read from file `fh` in `order` layout.
+
+    The data are read by chunks of `chunk_bytes` bytes into a pair of host USM
+    buffers: while a chunk is copied from one buffer to the device, the next
+    chunk is read into the other one.
+
+    """
+
+    if chunk_bytes is None:
+        chunk_bytes = _CHUNK_BYTES
+
+    dpnp_stage_from_host(
+        a,
+        lambda buf, _: _readinto(fh, buf),
+        order=order,
+        chunk_bytes=chunk_bytes,
+    )
+
+
+def dpnp_write_array(fh, a, order="C", chunk_bytes=None):
+    """
+    Write the data of array `a` in `order` layout to file `fh`.
+
+    The data are copied from the device by chunks of `chunk_bytes` bytes into
+    a pair of host USM buffers: while a chunk is written from one buffer to
+    the file, the next chunk is copied into the other one.
+
+    """
+
+    if chunk_bytes is None:
+        chunk_bytes = _CHUNK_BYTES
+
+    dpnp_stage_to_host(
+        a,
+        lambda buf, _: fh.write(_as_bytes(buf).data),
+        order=order,
+        chunk_bytes=chunk_bytes,
+    )
+
+
+def read_npy_header(fh):
+    """
+    Read the header of an array in NPY format from file `fh`.
+
+    Returns
+    -------
+    out : tuple
+        Shape, memory order and data type of the array.
+
+    """
+
+    version = numpy.lib.format.read_magic(fh)
+    if version == (1, 0):
+        header = numpy.lib.format.read_array_header_1_0(fh)
+    elif version == (2, 0):
+        header = numpy.lib.format.read_array_header_2_0(fh)
+    elif version == (3, 0):
+        header = _read_array_header_3_0(fh)
+    else:
+        raise ValueError(f"Unsupported NPY format version {version}")
+
+    shape, fortran_order, dtype = header
+    if dtype.hasobject:
+        raise ValueError("Arrays of object data type are not supported")
+    return shape, "F" if fortran_order else "C", dtype
+
+
+def write_npy_header(fh, a, order):
+    """Write the header of array `a` in `order` layout in NPY format."""
+
+    header = {
+        "descr": numpy.lib.format.dtype_to_descr(numpy.dtype(a.dtype)),
+        "fortran_order": order == "F",
+        "shape": a.shape,
+    }
+    try:
+        numpy.lib.format.write_array_header_1_0(fh, header)
+    except ValueError:
+        # the header does not fit into 65535 bytes
+        numpy.lib.format.write_array_header_2_0(fh, header)
@@ -200,6 +200,37 @@ def _get_linear_ramps(padded, axis, width_pair, end_value_pair):
     return left_ramp, right_ramp
 
 
+def _get_pad_indices(size, width_pair, mode):
+    """
+    Get the indices of the elements of an axis of length `size`, which are
+    copied to every position of the axis padded by `width_pair` in `mode`.
+
+    The padded values of modes ``"edge"``, ``"wrap"``, ``"symmetric"`` and
+    ``"reflect"`` with even reflection are copies of the original values, so
+    the padded axis is a periodic or clipped extension of the original one.
+
+    """
+
+    left, right = width_pair
+    idx = numpy.arange(-left, size + right, dtype=numpy.intp)
+    if mode == "edge" or size == 1:
+        # extending singleton dimension for 'reflect' is legacy behavior
+        return numpy.clip(idx, 0, size - 1, out=idx)
+    if mode == "wrap":
+        return numpy.mod(idx, size, out=idx)
+
+    if mode == "symmetric":
+        # the edge value is repeated in the reflection
+        period = 2 * size
+        mirror = period - 1
+    else:
+        period = 2 * size - 2
+        mirror = period
+
+    idx = numpy.mod(idx, period, out=idx)
+    return numpy.where(idx < size, idx, mirror - idx)
+
+
 def _get_stats(padded, axis, width_pair, length_pair, stat_func):
     """
     Copied from numpy/lib/_arraypad_impl.py
@@ -273,6 +304,36 @@ def _get_stats(padded, axis, width_pair, length_pair, stat_func):
     return left_stat, right_stat
 
 
+def _pad_by_indices(array, pad_width, mode):
+    """
+    Pad `array` in `mode` by a single gather of the original values.
+
+    An index array is built on the host for every padded axis, and all
+    elements of the padded array are copied from `array` at once, instead of
+    filling the pad area axis by axis and period by period.
+
+    """
+
+    if array.flags.fnc:
+        # gather into the transposed array to keep F-contiguous layout
+        return _pad_by_indices(array.T, pad_width[::-1], mode).T
+
+    axes = [i for i, width_pair in enumerate(pad_width) if any(width_pair)]
+    if not axes:
+        return dpnp.copy(array)
+
+    # index arrays of adjacent axes keep the axes in place in the result
+    first, last = axes[0], axes[-1]
+    key = [slice(None)] * array.ndim
+    for axis in range(first, last + 1):
+        idx = _get_pad_indices(array.shape[axis], pad_width[axis], mode)
+        idx = idx.reshape((-1,) + (1,) * (last - axis))
+        key[axis] = dpnp.asarray(
+            idx, usm_type=array.usm_type, sycl_queue=array.sycl_queue
+        )
+    return array[tuple(key)]
+
+
 def _pad_simple(array, pad_width, fill_value=None):
     """
     Copied from numpy/lib/_arraypad_impl.py
@@ -469,88 +530,6 @@ def _set_reflect_both(
     return left_pad, right_pad
 
 
-def _set_wrap_both(padded, axis, width_pair, original_period):
-    """
-    Copied from numpy/lib/_arraypad_impl.py
-
-    Pad `axis` of `arr` with wrapped values.
-
-    Parameters
-    ----------
-    padded : dpnp.ndarray
-        Input array of arbitrary shape.
-    axis : int
-        Axis along which to pad `arr`.
-    width_pair : (int, int)
-        Pair of widths that mark the pad area on both sides in the given
-        dimension.
-    original_period : int
-        Original length of data on `axis` of `arr`.
-
-    Returns
-    -------
-    pad_amt : tuple of ints, length 2
-        New index positions of padding to do along the `axis`. If these are
-        both 0, padding is done in this dimension.
-
-    """
-
-    left_pad, right_pad = width_pair
-    period = padded.shape[axis] - right_pad - left_pad
-    # Avoid wrapping with only a subset of the original area by ensuring period
-    # can only be a multiple of the original area's length.
-    period = period // original_period * original_period
-
-    # If the current dimension of `arr` doesn't contain enough valid values
-    # (not part of the undefined pad area) we need to pad multiple times.
-    # Each time the pad area shrinks on both sides which is communicated with
-    # these variables.
-    new_left_pad = 0
-    new_right_pad = 0
-
-    if left_pad > 0:
-        # Pad with wrapped values on left side
-        # First slice chunk from right side of the non-pad area.
-        # Use min(period, left_pad) to ensure that chunk is not larger than
-        # pad area
-        slice_end = left_pad + period
-        slice_start = slice_end - min(period, left_pad)
-        right_slice = _slice_at_axis(slice(slice_start, slice_end), axis)
-        right_chunk = padded[right_slice]
-
-        if left_pad > period:
-            # Chunk is smaller than pad area
-            pad_area = _slice_at_axis(slice(left_pad - period, left_pad), axis)
-            new_left_pad = left_pad - period
-        else:
-            # Chunk matches pad area
-            pad_area = _slice_at_axis(slice(None, left_pad), axis)
-        padded[pad_area] = right_chunk
-
-    if right_pad > 0:
-        # Pad with wrapped values on right side
-        # First slice chunk from left side of the non-pad area.
-        # Use min(period, right_pad) to ensure that chunk is not larger than
-        # pad area
-        slice_start = -right_pad - period
-        slice_end = slice_start + min(period, right_pad)
-        left_slice = _slice_at_axis(slice(slice_start, slice_end), axis)
-        left_chunk = padded[left_slice]
-
-        if right_pad > period:
-            # Chunk is smaller than pad area
-            pad_area = _slice_at_axis(
-                slice(-right_pad, -right_pad + period), axis
-            )
-            new_right_pad = right_pad - period
-        else:
-            # Chunk matches pad area
-            pad_area = _slice_at_axis(slice(-right_pad, None), axis)
-        padded[pad_area] = left_chunk
-
-    return new_left_pad, new_right_pad
-
-
 def _slice_at_axis(sl, axis):
     """
     Copied from numpy/lib/_arraypad_impl.py
@@ -688,6 +667,14 @@ def dpnp_pad(array, pad_width, mode="constant", **kwargs):
             # faster path for 1d arrays or small n-dimensional arrays
             return _pad_simple(array, pad_width, 0)[0]
 
+    if (
+        mode in ("edge", "wrap")
+        or mode in ("reflect", "symmetric")
+        and kwargs.get("reflect_type", "even") == "even"
+    ) and array.size > 0:
+        # the pad area is filled with copies of the original values
+        return _pad_by_indices(array, pad_width, mode)
+
     stat_functions = {
         "maximum": dpnp.amax,
         "minimum": dpnp.amin,
@@ -724,12 +711,6 @@ def dpnp_pad(array, pad_width, mode="constant", **kwargs):
         # passed, don't need to do anything more as _pad_simple already
         # returned the correct result
 
-    elif mode == "edge":
-        for axis, width_pair in zip(axes, pad_width):
-            roi = _view_roi(padded, original_area_slice, axis)
-            edge_pair = _get_edges(roi, axis, width_pair)
-            _set_pad_area(roi, axis, width_pair, edge_pair)
-
     elif mode == "linear_ramp":
         end_values = kwargs.get("end_values", 0)
         end_values = _as_pairs(end_values, padded.ndim)
@@ -774,17 +755,4 @@ def dpnp_pad(array, pad_width, mode="constant", **kwargs):
                     include_edge,
                 )
 
-    else:  # mode == "wrap":
-        assert mode == "wrap"
-        for axis, (left_index, right_index) in zip(axes, pad_width):
-            roi = _view_roi(padded, original_area_slice, axis)
-            original_period = padded.shape[axis] - right_index - left_index
-            while left_index > 0 or right_index > 0:
-                # Iteratively pad until dimension is filled with wrapped
-                # values. This is necessary if the pad area is larger than
-                # the length of the original values in the current dimension.
-                left_index, right_index = _set_wrap_both(
-                    roi, axis, (left_index, right_index), original_period
-                )
-
     return padded
@@ -24,9 +24,158 @@
 # *****************************************************************************
 
 
+from dpctl.tensor._numpy_helper import normalize_axis_index
+
 import dpnp
 
-__all__ = ["dpnp_wrap_reduction_call"]
+__all__ = ["ChunkedReduction", "dpnp_wrap_reduction_call"]
+
+
+class ChunkedReduction:
+    """
+    Reduction of an array passed by chunks, which combines the partial
+    results of the chunks.
+
+    The reduction is computed over the axis `axis` the array is chunked
+    along, or over all elements of the array chunked along axis 0 if `axis`
+    is ``None``. The partial results are kept on the device of the chunks.
+
+    Sums and products of the chunks are added and multiplied, maximum and
+    minimum values are compared, means and variances are merged with
+    the counts of elements by Chan's parallel formulas, and indices of
+    maximum and minimum values are shifted by the offsets of the chunks.
+
+    """
+
+    _names = (
+        "argmax",
+        "argmin",
+        "max",
+        "mean",
+        "min",
+        "prod",
+        "std",
+        "sum",
+        "var",
+    )
+
+    def __init__(self, name, axis=None, ddof=0):
+        if name not in self._names:
+            raise ValueError(
+                f"Reduction must be one of {self._names}, but got {name}"
+            )
+
+        self._name = name
+        self._axis = axis
+        self._ddof = ddof
+        self._state = None
+
+    def _count(self, x):
+        """Return the number of reduced elements of chunk `x`."""
+
+        return x.size if self._axis is None else x.shape[self._axis]
+
+    def _partial(self, x, offset):
+        """Return the partial result of chunk `x` at `offset`."""
+
+        name, axis = self._name, self._axis
+        if name in ("argmax", "argmin"):
+            idx = getattr(dpnp, name)(x, axis=axis)
+            if axis is None:
+                val = dpnp.take(dpnp.ravel(x), idx)
+                if x.ndim > 0 and x.shape[0] > 0:
+                    # flat index of the first element of the chunk
+                    offset *= x.size // x.shape[0]
+            else:
+                val = dpnp.take_along_axis(
+                    x, dpnp.expand_dims(idx, axis), axis=axis
+                )
+                val = dpnp.squeeze(val, axis=axis)
+            return val, idx + offset
+
+        if name in ("mean", "std", "var"):
+            n = self._count(x)
+            mean = dpnp.mean(x, axis=axis)
+            if name == "mean":
+                return n, mean
+            return n, mean, dpnp.var(x, axis=axis) * n
+
+        return (getattr(dpnp, name)(x, axis=axis),)
+
+    def _combine(self, a, b):
+        """Combine partial results `a` and `b` of consecutive chunks."""
+
+        name = self._name
+        if name in ("argmax", "argmin"):
+            val_a, idx_a = a
+            val_b, idx_b = b
+            if name == "argmax":
+                take_b = val_b > val_a
+            else:
+                take_b = val_b < val_a
+            if dpnp.issubdtype(val_a.dtype, dpnp.inexact):
+                # the first NaN value is the result as in NumPy
+                take_b |= dpnp.isnan(val_b) & ~dpnp.isnan(val_a)
+            return (
+                dpnp.where(take_b, val_b, val_a),
+                dpnp.where(take_b, idx_b, idx_a),
+            )
+
+        if name in ("mean", "std", "var"):
+            n_a, n_b = a[0], b[0]
+            n = n_a + n_b
+            delta = b[1] - a[1]
+            mean = a[1] + delta * (n_b / n)
+            if name == "mean":
+                return n, mean
+
+            if dpnp.issubdtype(delta.dtype, dpnp.complexfloating):
+                delta = dpnp.abs(delta)
+            m2 = a[2] + b[2] + delta * delta * (n_a * n_b / n)
+            return n, mean, m2
+
+        if name == "sum":
+            return (a[0] + b[0],)
+        if name == "prod":
+            return (a[0] * b[0],)
+        if name == "max":
+            return (dpnp.maximum(a[0], b[0]),)
+        return (dpnp.minimum(a[0], b[0]),)
+
+    def result(self):
+        """Return the reduction of the chunks passed so far."""
+
+        if self._state is None:
+            raise ValueError("No chunks were passed to the reduction")
+
+        name = self._name
+        if name in ("argmax", "argmin"):
+            return self._state[1]
+        if name in ("std", "var"):
+            n, _, m2 = self._state
+            res = m2 / max(n - self._ddof, 0)
+            return dpnp.sqrt(res) if name == "std" else res
+        return self._state[-1] if name == "mean" else self._state[0]
+
+    def update(self, x, offset=0):
+        """
+        Pass chunk `x` starting at index `offset` along the chunked axis of
+        the array.
+
+        """
+
+        if self._axis is not None:
+            self._axis = normalize_axis_index(self._axis, x.ndim)
+
+        if self._state is not None and self._count(x) == 0:
+            # an empty chunk does not change the result
+            return
+
+        state = self._partial(x, offset)
+        if self._state is None:
+            self._state = state
+        else:
+            self._state = self._combine(self._state, state)
 
 
 def dpnp_wrap_reduction_call(usm_a, out, _reduction_fn, res_dt, **kwargs):
@@ -0,0 +1,392 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Helpers transferring data of USM arrays between the host and devices by
+chunks.
+
+Every chunk is staged through a pair of host USM (pinned) buffers taken from
+the default pinned memory pool, so the host processing of one chunk
+overlaps with the device copy of the next one.
+
+"""
+
+# pylint: disable=protected-access
+
+import concurrent.futures
+import math
+import threading
+
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_impl as ti
+import dpctl.utils as dpu
+import numpy
+
+import dpnp
+from dpnp.dpnp_memory import get_default_pinned_memory_pool
+
+from .dpnp_algo_utils import map_dtype_to_device
+
+__all__ = [
+    "dpnp_asarray_from_host",
+    "dpnp_asnumpy",
+    "dpnp_copy_from_host",
+    "dpnp_copy_to_host",
+    "dpnp_stage_from_host",
+    "dpnp_stage_to_host",
+    "is_device_dtype",
+    "submit_transfer",
+]
+
+# size in bytes of a chunk staged in a host buffer, arrays fitting in a single
+# chunk are transferred by dpctl in one copy unless an overlap is requested
+_CHUNK_BYTES = 1 << 22
+
+# the executor running asynchronous transfers, created on the first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _allocate_buffers(x, chunk_size):
+    """
+    Return two host USM buffers to stage chunks of `x`, which return to
+    the pinned memory pool once released.
+
+    """
+
+    nbytes = min(chunk_size, x.size) * x.itemsize
+    pool = get_default_pinned_memory_pool()
+    return [pool.malloc(nbytes, x.sycl_queue) for _ in range(2)]
+
+
+def _chunk_keys(shape, chunk_size):
+    """
+    Yield keys to index the chunks covering an array of `shape` in C order,
+    where every chunk is contiguous and has at most `chunk_size` elements.
+
+    """
+
+    if len(shape) == 0:
+        yield ()
+        return
+
+    if len(shape) == 1:
+        for start in range(0, shape[0], chunk_size):
+            yield (slice(start, start + chunk_size),)
+        return
+
+    row_size = math.prod(shape[1:])
+    if row_size <= chunk_size:
+        rows = chunk_size // row_size
+        for start in range(0, shape[0], rows):
+            yield (slice(start, start + rows),)
+    else:
+        for i in range(shape[0]):
+            for key in _chunk_keys(shape[1:], chunk_size):
+                yield (i,) + key
+
+
+def _chunk_size(x, chunk_bytes):
+    """Return the number of elements of `x` in a chunk of `chunk_bytes`."""
+
+    if chunk_bytes is None:
+        chunk_bytes = _CHUNK_BYTES
+    return max(1, chunk_bytes // x.itemsize)
+
+
+def _device_view(mem, dtype, shape):
+    """Return a C-contiguous USM array of `shape` on host buffer `mem`."""
+
+    return dpt.usm_ndarray(shape, dtype=dtype, buffer=mem)
+
+
+def _get_order(x, order):
+    """
+    Return ``"C"`` or ``"F"`` layout to transfer the data of `x` in for
+    `order` keyword.
+
+    """
+
+    if order in ("C", "F"):
+        return order
+
+    flags = x.flags
+    return "F" if flags.f_contiguous and not flags.c_contiguous else "C"
+
+
+def _host_view(mem, dtype, shape):
+    """Return a C-contiguous NumPy array of `shape` on host buffer `mem`."""
+
+    count = math.prod(shape)
+    return numpy.frombuffer(mem, dtype=dtype, count=count).reshape(shape)
+
+
+def _order_view(x, order):
+    """Return a view of `x` with elements ordered in `order` layout."""
+
+    return x.T if order == "F" else x
+
+
+def _wait_events(events):
+    """Wait for `events` to complete, so staging buffers can be released."""
+
+    for ev in events:
+        if ev is not None:
+            ev.wait()
+
+
+def dpnp_asarray_from_host(
+    x, dtype=None, order="K", usm_type=None, sycl_queue=None
+):
+    """
+    Copy NumPy array `x` to a new USM array by chunks.
+
+    Returns ``None`` if `x` fits in a single chunk, or if a cast of data type
+    is needed, so it has to be copied by dpctl.
+
+    """
+
+    x = numpy.asarray(x)
+    if x.nbytes <= _CHUNK_BYTES:
+        return None
+
+    if dtype is not None and numpy.dtype(dtype) != x.dtype:
+        return None
+
+    if not is_device_dtype(x.dtype, sycl_queue=sycl_queue):
+        return None
+
+    res = dpt.empty(
+        x.shape,
+        dtype=x.dtype,
+        order=_get_order(x, order),
+        usm_type="device" if usm_type is None else usm_type,
+        sycl_queue=sycl_queue,
+    )
+    dpnp_copy_from_host(res, x)
+    return res
+
+
+def dpnp_asnumpy(a, order="K", out=None, blocking=True):
+    """
+    Copy USM array `a` to a NumPy array by chunks.
+
+    If `blocking` is ``False``, the copy runs in a background thread and
+    :class:`concurrent.futures.Future` resolving to the NumPy array is
+    returned.
+
+    """
+
+    x = dpnp.get_usm_ndarray(a)
+    if out is None:
+        order = _get_order(x, order)
+        if blocking and x.nbytes <= _CHUNK_BYTES:
+            return numpy.asarray(dpt.asnumpy(x), order=order)
+        out = numpy.empty(x.shape, dtype=x.dtype, order=order)
+    elif not isinstance(out, numpy.ndarray):
+        raise TypeError(
+            f"Output array must be numpy.ndarray, but got {type(out)}"
+        )
+    elif out.shape != x.shape or out.dtype != x.dtype:
+        raise ValueError(
+            f"Output array of shape {out.shape} and dtype {out.dtype} "
+            f"does not match input array of shape {x.shape} and "
+            f"dtype {x.dtype}"
+        )
+
+    if blocking:
+        return dpnp_copy_to_host(x, out)
+    return submit_transfer(dpnp_copy_to_host, x, out)
+
+
+def dpnp_copy_from_host(dst, src, depends=None, chunk_bytes=None):
+    """
+    Copy the data of NumPy array `src` to USM array `dst` of the same shape
+    by chunks.
+
+    """
+
+    x = dpnp.get_usm_ndarray(dst)
+    order = _get_order(x, "K")
+    host = _order_view(src, order)
+
+    def _fill(buf, key):
+        numpy.copyto(buf, host[key])
+
+    dpnp_stage_from_host(
+        x, _fill, order=order, chunk_bytes=chunk_bytes, depends=depends
+    )
+    return dst
+
+
+def dpnp_copy_to_host(src, dst, depends=None, chunk_bytes=None):
+    """
+    Copy the data of USM array `src` to NumPy array `dst` of the same shape
+    by chunks.
+
+    """
+
+    order = _get_order(dst, "K")
+    host = _order_view(dst, order)
+
+    def _drain(buf, key):
+        host[key] = buf
+
+    dpnp_stage_to_host(
+        src, _drain, order=order, chunk_bytes=chunk_bytes, depends=depends
+    )
+    return dst
+
+
+def dpnp_stage_from_host(a, fill, order="C", chunk_bytes=None, depends=None):
+    """
+    Fill array `a` in `order` layout by chunks of `chunk_bytes` bytes.
+
+    Every chunk is filled on the host by ``fill(buf, key)`` call, where `buf`
+    is a C-contiguous NumPy array on a host USM buffer to be filled and `key`
+    indexes the chunk in `a` viewed in `order` layout. While a chunk is
+    copied from one buffer to the device, the next chunk is filled in
+    the other one.
+
+    """
+
+    x = _order_view(dpnp.get_usm_ndarray(a), order)
+    if x.size == 0:
+        return
+
+    chunk_size = _chunk_size(x, chunk_bytes)
+
+    exec_q = x.sycl_queue
+    _manager = dpu.SequentialOrderManager[exec_q]
+    if depends is None:
+        depends = _manager.submitted_events
+
+    bufs = _allocate_buffers(x, chunk_size)
+    copy_evs = [None, None]
+    try:
+        for k, key in enumerate(_chunk_keys(x.shape, chunk_size)):
+            j = k % 2
+            if copy_evs[j] is not None:
+                # the buffer is still being copied to the device
+                copy_evs[j].wait()
+
+            dst = x[key]
+            fill(_host_view(bufs[j], x.dtype, dst.shape), key)
+
+            ht_ev, copy_evs[j] = ti._copy_usm_ndarray_into_usm_ndarray(
+                src=_device_view(bufs[j], x.dtype, dst.shape),
+                dst=dst,
+                sycl_queue=exec_q,
+                depends=depends,
+            )
+            _manager.add_event_pair(ht_ev, copy_evs[j])
+    finally:
+        _wait_events(copy_evs)
+
+
+def dpnp_stage_to_host(a, drain, order="C", chunk_bytes=None, depends=None):
+    """
+    Pass the data of array `a` in `order` layout by chunks of `chunk_bytes`
+    bytes to the host.
+
+    Every chunk is passed by ``drain(buf, key)`` call, where `buf` is
+    a C-contiguous NumPy array on a host USM buffer holding the chunk and
+    `key` indexes the chunk in `a` viewed in `order` layout. While a chunk is
+    drained from one buffer, the next chunk is copied into the other one.
+
+    """
+
+    x = _order_view(dpnp.get_usm_ndarray(a), order)
+    if x.size == 0:
+        return
+
+    chunk_size = _chunk_size(x, chunk_bytes)
+
+    exec_q = x.sycl_queue
+    _manager = dpu.SequentialOrderManager[exec_q]
+    if depends is None:
+        depends = _manager.submitted_events
+
+    bufs = _allocate_buffers(x, chunk_size)
+    copy_evs = [None, None]
+    pending = None
+    try:
+        for k, key in enumerate(_chunk_keys(x.shape, chunk_size)):
+            j = k % 2
+            src = x[key]
+            ht_ev, copy_evs[j] = ti._copy_usm_ndarray_into_usm_ndarray(
+                src=src,
+                dst=_device_view(bufs[j], x.dtype, src.shape),
+                sycl_queue=exec_q,
+                depends=depends,
+            )
+            _manager.add_event_pair(ht_ev, copy_evs[j])
+
+            # drain the previous chunk while the current one is being copied
+            if pending is not None:
+                copy_evs[1 - j].wait()
+                drain(_host_view(bufs[1 - j], x.dtype, pending[1]), pending[0])
+            pending = (key, src.shape)
+
+        copy_evs[j].wait()
+        drain(_host_view(bufs[j], x.dtype, pending[1]), pending[0])
+    finally:
+        _wait_events(copy_evs)
+
+
+def is_device_dtype(dtype, device=None, sycl_queue=None):
+    """Check if `dtype` data can be stored on the device without a cast."""
+
+    dtype = numpy.dtype(dtype)
+    if not dtype.isnative or dtype.kind not in "biufc":
+        return False
+
+    exec_q = dpnp.get_normalized_queue_device(
+        device=device, sycl_queue=sycl_queue
+    )
+    return map_dtype_to_device(dtype, exec_q.sycl_device) == dtype
+
+
+def submit_transfer(func, *args):
+    """
+    Call ``func(*args, depends=...)`` in a background thread and return
+    :class:`concurrent.futures.Future` of its result.
+
+    The transfer depends on the kernels submitted so far in the calling
+    thread to the queue of the first argument.
+
+    """
+
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dpnp_transfer"
+            )
+
+    exec_q = dpnp.get_usm_ndarray(args[0]).sycl_queue
+    depends = dpu.SequentialOrderManager[exec_q].submitted_events
+    return _executor.submit(func, *args, depends=depends)
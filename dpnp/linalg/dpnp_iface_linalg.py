@@ -543,11 +543,13 @@ def eig(a):
 
     # Since geev function from OneMKL LAPACK is not implemented yet,
     # use NumPy for this calculation.
-    w_np, v_np = numpy.linalg.eig(dpnp.asnumpy(a))
-    return EigResult(
-        dpnp.array(w_np, sycl_queue=a_sycl_queue, usm_type=a_usm_type),
-        dpnp.array(v_np, sycl_queue=a_sycl_queue, usm_type=a_usm_type),
-    )
+    with dpnp.config._Fallback("eig", allow_fallback=True) as fallback:
+        w_np, v_np = numpy.linalg.eig(dpnp.asnumpy(a))
+        w = dpnp.array(w_np, sycl_queue=a_sycl_queue, usm_type=a_usm_type)
+        v = dpnp.array(v_np, sycl_queue=a_sycl_queue, usm_type=a_usm_type)
+        fallback.bytes_to_host = a.nbytes
+        fallback.bytes_to_device = w.nbytes + v.nbytes
+    return EigResult(w, v)
 
 
 def eigh(a, UPLO="L"):
@@ -689,8 +691,12 @@ def eigvals(a):
 
     # Since geev function from OneMKL LAPACK is not implemented yet,
     # use NumPy for this calculation.
-    w_np = numpy.linalg.eigvals(dpnp.asnumpy(a))
-    return dpnp.array(w_np, sycl_queue=a.sycl_queue, usm_type=a.usm_type)
+    with dpnp.config._Fallback("eigvals", allow_fallback=True) as fallback:
+        w_np = numpy.linalg.eigvals(dpnp.asnumpy(a))
+        w = dpnp.array(w_np, sycl_queue=a.sycl_queue, usm_type=a.usm_type)
+        fallback.bytes_to_host = a.nbytes
+        fallback.bytes_to_device = w.nbytes
+    return w
 
 
 def eigvalsh(a, UPLO="L"):
@@ -1284,12 +1284,14 @@ def _nrm2_last_axis(x):
     """
 
     real_dtype = _real_type(x.dtype)
-    # TODO: use dpnp.sum(dpnp.square(dpnp.view(x)), axis=-1, dtype=real_dtype)
-    # w/a since dpnp.view() in not implemented yet
-    # Сalculate and sum the squares of both real and imaginary parts for
-    # compelex array.
     if dpnp.issubdtype(x.dtype, dpnp.complexfloating):
-        y = dpnp.abs(x) ** 2
+        if x.strides[-1] == 1 or x.shape[-1] == 1:
+            # view real and imaginary parts of the last axis as pairs to sum
+            # up their squares
+            y = dpnp.asarray(x).view(dpnp.finfo(x.dtype).dtype)
+            y = dpnp.square(y)
+        else:
+            y = dpnp.abs(x) ** 2
     else:
         y = dpnp.square(x)
     return dpnp.sum(y, axis=-1, dtype=real_dtype)
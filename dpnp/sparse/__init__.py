@@ -0,0 +1,47 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+``dpnp.sparse``
+================
+
+Sparse matrices in compressed sparse row (CSR), compressed sparse column
+(CSC) and coordinate (COO) formats, which store the values and the indices
+of the nonzero elements in USM arrays.
+
+Products of a matrix in CSR or CSC format and a dense vector or matrix are
+computed on the device by ``gemv`` or ``gemm`` routines of OneMKL sparse BLAS
+library, with a CSC matrix handled as the transpose of a CSR one. Matrices in
+COO format, and data types not supported by the library, fall back on the
+coordinates of the stored elements, summing the products of every row by a
+weighted histogram kernel.
+
+"""
+
+from dpnp.sparse import linalg
+from dpnp.sparse.dpnp_iface_sparse import *
+from dpnp.sparse.dpnp_iface_sparse import __all__ as __all__sparse
+
+__all__ = __all__sparse
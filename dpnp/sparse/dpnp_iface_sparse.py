@@ -0,0 +1,911 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Interface of the sparse matrices of the DPNP
+
+Notes
+-----
+This module is a face or public interface file for the library
+it contains:
+ - Sparse matrix classes
+ - documentation for the classes and functions
+ - The functions parameters check
+
+"""
+
+# pylint: disable=protected-access
+
+import dpnp
+from dpnp.dpnp_utils import get_usm_allocations
+
+from .dpnp_utils_sparse import (
+    dpnp_compress_coo,
+    dpnp_coo_matmul,
+    dpnp_coo_todense,
+    dpnp_csr_matmul,
+    dpnp_expand_indptr,
+)
+
+__all__ = [
+    "coo_matrix",
+    "csc_matrix",
+    "csr_matrix",
+    "issparse",
+    "isspmatrix_coo",
+    "isspmatrix_csc",
+    "isspmatrix_csr",
+]
+
+
+def _get_arrays(arrays, dtypes):
+    """
+    Return `arrays` allocated on a common SYCL queue and casted to `dtypes`.
+
+    A data type of ``None`` keeps the data type of the array.
+
+    """
+
+    usm_type, queue = get_usm_allocations(arrays)
+    res = []
+    for a, dt in zip(arrays, dtypes):
+        a = dpnp.asarray(a, usm_type=usm_type, sycl_queue=queue)
+        if dt is not None:
+            a = dpnp.astype(a, dt, copy=False)
+        if a.ndim != 1:
+            raise ValueError(
+                f"Expected 1-D arrays of data and indices, but got {a.ndim}-D"
+            )
+        res.append(a)
+    return res
+
+
+def _get_shape(shape):
+    """Return `shape` as a tuple of two non-negative integers."""
+
+    try:
+        m, n = (int(dim) for dim in shape)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Invalid shape of a sparse matrix {shape}") from e
+    if m < 0 or n < 0:
+        raise ValueError(f"Invalid shape of a sparse matrix {shape}")
+    return m, n
+
+
+def _is_shape(arg):
+    """Return whether `arg` is a tuple of two integers."""
+
+    return (
+        isinstance(arg, tuple)
+        and len(arg) == 2
+        and all(dpnp.isscalar(x) and float(x).is_integer() for x in arg)
+    )
+
+
+def _max_index(indices):
+    """Return the size needed to store all `indices` along an axis."""
+
+    return int(indices.max()) + 1 if indices.size > 0 else 0
+
+
+class _spmatrix:
+    """
+    Base class of sparse matrices with the methods computed on the COO view
+    of the matrix.
+
+    """
+
+    format = None
+    _format_name = None
+
+    # NumPy arrays defer binary operators to the reflected ones
+    __array_ufunc__ = None
+
+    def __abs__(self):
+        r"""Return ``\|self\|``."""
+        return self._with_data(dpnp.abs(self.data))
+
+    def __len__(self):
+        raise TypeError("sparse matrix length is ambiguous; use shape[0]")
+
+    def __matmul__(self, other):
+        """Return ``self@value``."""
+        if issparse(other):
+            return NotImplemented
+        if dpnp.isscalar(other):
+            raise ValueError("Scalar operands are not allowed, use '*' instead")
+        return self.dot(other)
+
+    def __mul__(self, other):
+        """Return ``self*value``."""
+        if issparse(other):
+            return NotImplemented
+        if dpnp.isscalar(other):
+            return self.multiply(other)
+        return self.dot(other)
+
+    def __neg__(self):
+        """Return ``-self``."""
+        return self._with_data(dpnp.negative(self.data))
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return (
+            f"<{self._format_name} sparse matrix of dtype '{self.dtype}'\n"
+            f"\twith {self.nnz} stored elements and shape {self.shape}>"
+        )
+
+    def __rmatmul__(self, other):
+        """Return ``value@self``."""
+        if dpnp.isscalar(other):
+            raise ValueError("Scalar operands are not allowed, use '*' instead")
+        dpnp.check_supported_arrays_type(other)
+        if other.ndim == 1:
+            return self.transpose().dot(other)
+        return self.transpose().dot(other.T).T
+
+    def __rmul__(self, other):
+        """Return ``value*self``."""
+        if dpnp.isscalar(other):
+            return self.multiply(other)
+        return self.__rmatmul__(other)
+
+    def __truediv__(self, other):
+        """Return ``self/value``."""
+        if dpnp.isscalar(other):
+            return self._with_data(dpnp.true_divide(self.data, other))
+        return NotImplemented
+
+    def _coo(self):
+        """Return row indices, column indices and data of stored elements."""
+        raise NotImplementedError  # pragma: no cover
+
+    def _with_data(self, data):
+        """Return a matrix of the same structure with `data` values."""
+        raise NotImplementedError  # pragma: no cover
+
+    @property
+    def device(self):
+        """
+        Return :class:`dpctl.tensor.Device` object representing residence of
+        the matrix data.
+
+        """
+        return self.data.device
+
+    @property
+    def dtype(self):
+        """Returns NumPy's dtype corresponding to the type of the elements."""
+        return self.data.dtype
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the matrix, which is always ``2``."""
+        return 2
+
+    @property
+    def nnz(self):
+        """Number of stored elements, including explicit zeros."""
+        return self.data.size
+
+    @property
+    def shape(self):
+        """Shape of the matrix."""
+        return self._shape
+
+    @property
+    def sycl_queue(self):
+        """Return :class:`dpctl.SyclQueue` object of the matrix data."""
+        return self.data.sycl_queue
+
+    @property
+    def T(self):
+        """View of the transposed matrix."""
+        return self.transpose()
+
+    @property
+    def usm_type(self):
+        """USM type of underlying memory of the matrix data."""
+        return self.data.usm_type
+
+    def asformat(self, format, copy=False):
+        """
+        Return this matrix in the passed `format`.
+
+        Parameters
+        ----------
+        format : {"coo", "csc", "csr"}
+            The desired sparse matrix format.
+        copy : bool, optional
+            If ``True``, the result is guaranteed to not share data with self.
+
+            Default: ``False``.
+
+        Returns
+        -------
+        out : {coo_matrix, csc_matrix, csr_matrix}
+            The matrix in the passed `format`.
+
+        """
+
+        try:
+            convert = getattr(self, "to" + format)
+        except (AttributeError, TypeError) as e:
+            raise ValueError(f"Format {format} is unknown") from e
+        return convert(copy=copy)
+
+    def astype(self, dtype, copy=True):
+        """
+        Cast the stored elements of the matrix to a specified type.
+
+        Parameters
+        ----------
+        dtype : {str, dtype}
+            Type code or data-type to which the elements are cast.
+        copy : bool, optional
+            If ``False`` and the data type is already `dtype`, the matrix
+            itself is returned.
+
+            Default: ``True``.
+
+        Returns
+        -------
+        out : {coo_matrix, csc_matrix, csr_matrix}
+            The matrix of the same format with elements of `dtype`.
+
+        """
+
+        if not copy and self.dtype == dpnp.dtype(dtype):
+            return self
+        return self._with_data(dpnp.astype(self.data, dtype, copy=copy))
+
+    def conj(self, copy=True):
+        """
+        Return the element-wise complex conjugation of the matrix.
+
+        If the matrix is of non-complex data type and `copy` is ``False``,
+        this method does nothing and the data is not copied.
+
+        """
+
+        if not dpnp.issubdtype(self.dtype, dpnp.complexfloating):
+            return self.copy() if copy else self
+        return self._with_data(dpnp.conj(self.data))
+
+    conjugate = conj
+
+    def copy(self):
+        """Return a copy of the matrix."""
+        return self._with_data(self.data.copy())
+
+    def dot(self, other):
+        """
+        Return the product of the matrix and a dense vector or matrix.
+
+        Parameters
+        ----------
+        other : {dpnp.ndarray, usm_ndarray}
+            Dense 1-D array of shape ``(N,)`` or 2-D array of shape
+            ``(N, K)``, where ``N`` is the number of columns of the matrix.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Dense array of shape ``(M,)`` or ``(M, K)``, where ``M`` is the
+            number of rows of the matrix.
+
+        """
+
+        dpnp.check_supported_arrays_type(other)
+        row, col, data = self._coo()
+        return dpnp_coo_matmul(row, col, data, self.shape, other)
+
+    def multiply(self, other):
+        """
+        Return the element-wise product of the matrix and a scalar or a dense
+        array broadcastable to the shape of the matrix.
+
+        Only the stored elements are multiplied, so the result has the same
+        sparsity structure and format as the matrix.
+
+        """
+
+        if dpnp.isscalar(other):
+            return self._with_data(dpnp.multiply(self.data, other))
+
+        dpnp.check_supported_arrays_type(other)
+        row, col, data = self._coo()
+        other = dpnp.broadcast_to(other, self.shape)
+        return self._with_data(dpnp.multiply(data, other[row, col]))
+
+    def sum(self, axis=None):
+        """
+        Return the sum of the matrix elements over a given axis.
+
+        Parameters
+        ----------
+        axis : {None, 0, 1, -1, -2}, optional
+            Axis along which the sum is computed. The default is to compute
+            the sum of all the matrix elements.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The sum of all elements as a 0-D array if `axis` is ``None``,
+            otherwise a 1-D array of sums of the columns or the rows.
+
+        """
+
+        if axis is None:
+            return dpnp.sum(self.data)
+
+        if axis not in (0, 1, -1, -2):
+            raise ValueError(f"axis {axis} is out of bounds for 2-D matrix")
+
+        mat = self if axis in (1, -1) else self.transpose()
+        dtype = dpnp.intp if self.dtype == dpnp.bool else None
+        ones = dpnp.ones_like(self.data, shape=(mat.shape[1],), dtype=dtype)
+        return mat.dot(ones)
+
+    def toarray(self, order=None):
+        """
+        Return a dense array representation of the matrix.
+
+        Parameters
+        ----------
+        order : {None, "C", "F"}, optional
+            Whether to store the result in C-contiguous (row-major) or
+            F-contiguous (column-major) order. ``None`` means ``"C"``.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Dense 2-D array with the same shape and data type as the matrix.
+            The duplicate entries of the matrix are summed.
+
+        """
+
+        if order not in (None, "C", "F", "c", "f"):
+            raise ValueError(f"order must be None, 'C' or 'F', got {order}")
+
+        row, col, data = self._coo()
+        order = "F" if order in ("F", "f") else "C"
+        return dpnp_coo_todense(row, col, data, self.shape, order=order)
+
+    def tocoo(self, copy=False):
+        """
+        Return the matrix in COO format.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            If ``True``, the result is guaranteed to not share data with self.
+
+            Default: ``False``.
+
+        Returns
+        -------
+        out : coo_matrix
+            The matrix in COO format.
+
+        """
+
+        row, col, data = self._coo()
+        return coo_matrix((data, (row, col)), shape=self.shape, copy=copy)
+
+    def tocsc(self, copy=False):
+        """
+        Return the matrix in compressed sparse column format.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            If ``True``, the result is guaranteed to not share data with self.
+
+            Default: ``False``.
+
+        Returns
+        -------
+        out : csc_matrix
+            The matrix in CSC format.
+
+        """
+
+        return csc_matrix(self, copy=copy)
+
+    def tocsr(self, copy=False):
+        """
+        Return the matrix in compressed sparse row format.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            If ``True``, the result is guaranteed to not share data with self.
+
+            Default: ``False``.
+
+        Returns
+        -------
+        out : csr_matrix
+            The matrix in CSR format.
+
+        """
+
+        return csr_matrix(self, copy=copy)
+
+    def transpose(self):
+        """Return the transposed matrix without copying the data."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class coo_matrix(_spmatrix):
+    """
+    A sparse matrix in coordinate (COO) format.
+
+    The stored elements are kept in the order they are passed and the
+    duplicate entries are summed when the matrix is multiplied or converted
+    to a dense array or to a compressed format.
+
+    Parameters
+    ----------
+    arg1 : {dpnp.ndarray, usm_ndarray, tuple, coo_matrix, csc_matrix, \
+            csr_matrix}
+        Arguments for the initializer:
+
+        - ``coo_matrix(D)`` with a dense 2-D array `D`;
+        - ``coo_matrix(S)`` with another sparse matrix `S`;
+        - ``coo_matrix((M, N))`` to construct an empty matrix of shape
+          ``(M, N)``;
+        - ``coo_matrix((data, (row, col)))`` to construct a matrix with
+          ``A[row[k], col[k]] = data[k]``.
+    shape : {None, tuple of two ints}, optional
+        Shape of the matrix. If ``None``, it is inferred from the maximum
+        indices.
+
+        Default: ``None``.
+    dtype : {None, str, dtype object}, optional
+        Data type of the matrix elements. If ``None``, it is inferred from
+        the data.
+
+        Default: ``None``.
+    copy : bool, optional
+        If ``True``, the arrays of data and indices are copied.
+
+        Default: ``False``.
+
+    Attributes
+    ----------
+    data : dpnp.ndarray
+        Values of the stored elements.
+    row : dpnp.ndarray
+        Row indices of the stored elements.
+    col : dpnp.ndarray
+        Column indices of the stored elements.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> row = np.array([0, 3, 1, 0])
+    >>> col = np.array([0, 3, 1, 2])
+    >>> data = np.array([4, 5, 7, 9])
+    >>> a = np.sparse.coo_matrix((data, (row, col)), shape=(4, 4))
+    >>> a.toarray()
+    array([[4, 0, 9, 0],
+           [0, 7, 0, 0],
+           [0, 0, 0, 0],
+           [0, 0, 0, 5]])
+
+    """
+
+    format = "coo"
+    _format_name = "COOrdinate"
+
+    def __init__(self, arg1, shape=None, dtype=None, copy=False):
+        if issparse(arg1):
+            row, col, data = arg1._coo()
+            if shape is None:
+                shape = arg1.shape
+        elif _is_shape(arg1):
+            if dtype is None:
+                dtype = dpnp.default_float_type()
+            data = dpnp.empty(0, dtype=dtype)
+            row = col = dpnp.empty(0, dtype=dpnp.intp)
+            shape = arg1
+        elif isinstance(arg1, tuple) and len(arg1) == 2:
+            try:
+                data, (row, col) = arg1
+            except (TypeError, ValueError) as e:
+                raise TypeError("Invalid input format") from e
+        elif dpnp.is_supported_array_type(arg1):
+            if arg1.ndim != 2:
+                raise TypeError("Expected a dense 2-D array")
+            row, col = dpnp.nonzero(arg1)
+            data = arg1[row, col]
+            shape = arg1.shape
+        else:
+            raise TypeError(
+                f"Unrecognized coo_matrix constructor usage: {type(arg1)}"
+            )
+
+        data, row, col = _get_arrays(
+            [data, row, col], [dtype, dpnp.intp, dpnp.intp]
+        )
+        if not data.size == row.size == col.size:
+            raise ValueError(
+                "row, column, and data arrays must have the same length"
+            )
+        if copy:
+            data, row, col = data.copy(), row.copy(), col.copy()
+
+        if shape is None:
+            if data.size == 0:
+                raise ValueError(
+                    "Cannot infer dimensions from zero sized index arrays"
+                )
+            shape = (_max_index(row), _max_index(col))
+
+        self.data = data
+        self.row = row
+        self.col = col
+        self._shape = _get_shape(shape)
+
+    def _coo(self):
+        return self.row, self.col, self.data
+
+    def _with_data(self, data):
+        return coo_matrix((data, (self.row, self.col)), shape=self.shape)
+
+    def tocoo(self, copy=False):
+        return self.copy() if copy else self
+
+    def transpose(self):
+        return coo_matrix(
+            (self.data, (self.col, self.row)), shape=self.shape[::-1]
+        )
+
+
+class _compressed_matrix(_spmatrix):
+    """
+    Base class of sparse matrices in compressed formats storing indices
+    along the minor axis and index pointers along the major axis.
+
+    """
+
+    def __init__(self, arg1, shape=None, dtype=None, copy=False):
+        # COO view of the matrix if it has to be compressed
+        coo = None
+        presorted = False
+
+        if isinstance(arg1, type(self)):
+            data, indices, indptr = arg1.data, arg1.indices, arg1.indptr
+            shape = arg1.shape if shape is None else shape
+        elif issparse(arg1):
+            coo = arg1._coo()
+            shape = arg1.shape if shape is None else shape
+        elif _is_shape(arg1):
+            shape = arg1
+            if dtype is None:
+                dtype = dpnp.default_float_type()
+            data = dpnp.empty(0, dtype=dtype)
+            indices = dpnp.empty(0, dtype=dpnp.intp)
+            indptr = dpnp.zeros(
+                self._swap(_get_shape(shape))[0] + 1, dtype=dpnp.intp
+            )
+        elif isinstance(arg1, tuple) and len(arg1) == 2:
+            try:
+                data, (row, col) = arg1
+            except (TypeError, ValueError) as e:
+                raise TypeError("Invalid input format") from e
+            coo = row, col, data
+        elif isinstance(arg1, tuple) and len(arg1) == 3:
+            data, indices, indptr = arg1
+        elif dpnp.is_supported_array_type(arg1):
+            if arg1.ndim != 2:
+                raise TypeError("Expected a dense 2-D array")
+
+            # nonzero elements are found in the order of the major axis
+            major, minor = dpnp.nonzero(self._swap((arg1, arg1.T))[0])
+            row, col = self._swap((major, minor))
+            coo = row, col, arg1[row, col]
+            shape = arg1.shape
+            presorted = True
+        else:
+            raise TypeError(
+                f"Unrecognized {self.format}_matrix constructor usage: "
+                f"{type(arg1)}"
+            )
+
+        if coo is not None:
+            row, col, data = coo
+            data, row, col = _get_arrays(
+                [data, row, col], [None, dpnp.intp, dpnp.intp]
+            )
+            if data.size != row.size or data.size != col.size:
+                raise ValueError(
+                    "row, column, and data arrays must have the same length"
+                )
+            if shape is None:
+                shape = (_max_index(row), _max_index(col))
+
+            major, minor = self._swap((row, col))
+            n_major = self._swap(_get_shape(shape))[0]
+            data, indices, indptr = dpnp_compress_coo(
+                major, minor, data, n_major, presorted=presorted
+            )
+            copy = False
+
+        data, indices, indptr = _get_arrays(
+            [data, indices, indptr], [dtype, dpnp.intp, dpnp.intp]
+        )
+        if data.size != indices.size:
+            raise ValueError("indices and data should have the same size")
+        if copy:
+            data, indices, indptr = data.copy(), indices.copy(), indptr.copy()
+
+        if shape is None:
+            shape = self._swap((indptr.size - 1, _max_index(indices)))
+        shape = _get_shape(shape)
+        if indptr.size != self._swap(shape)[0] + 1:
+            raise ValueError(
+                f"index pointer size {indptr.size} should be "
+                f"{self._swap(shape)[0] + 1}"
+            )
+
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self._shape = shape
+        self._major = (None, None)
+
+    def _coo(self):
+        # indices along the major axis are expanded once per index pointers
+        if self._major[0] is not self.indptr:
+            major = dpnp_expand_indptr(self.indptr, self.indices.size)
+            self._major = (self.indptr, major)
+        row, col = self._swap((self._major[1], self.indices))
+        return row, col, self.data
+
+    @staticmethod
+    def _swap(x):
+        """Swap a pair of row and column items to major and minor ones."""
+        raise NotImplementedError  # pragma: no cover
+
+    def dot(self, other):
+        dpnp.check_supported_arrays_type(other)
+
+        # a CSC matrix is the transpose of the CSR matrix of swapped shape
+        res = dpnp_csr_matmul(
+            self.indptr,
+            self.indices,
+            self.data,
+            self._swap(self.shape),
+            other,
+            transpose=self.format == "csc",
+        )
+        if res is None:
+            return super().dot(other)
+        return res
+
+    def _with_data(self, data):
+        res = type(self)(
+            (data, self.indices, self.indptr), shape=self.shape, copy=False
+        )
+        res._major = self._major
+        return res
+
+
+class csc_matrix(_compressed_matrix):
+    """
+    A sparse matrix in compressed sparse column (CSC) format.
+
+    Parameters
+    ----------
+    arg1 : {dpnp.ndarray, usm_ndarray, tuple, coo_matrix, csc_matrix, \
+            csr_matrix}
+        Arguments for the initializer:
+
+        - ``csc_matrix(D)`` with a dense 2-D array `D`;
+        - ``csc_matrix(S)`` with another sparse matrix `S`;
+        - ``csc_matrix((M, N))`` to construct an empty matrix of shape
+          ``(M, N)``;
+        - ``csc_matrix((data, (row, col)))`` to construct a matrix with
+          ``A[row[k], col[k]] = data[k]``;
+        - ``csc_matrix((data, indices, indptr))`` with the standard CSC
+          representation, where the row indices for column ``i`` are stored
+          in ``indices[indptr[i]:indptr[i+1]]`` and their corresponding values
+          are stored in ``data[indptr[i]:indptr[i+1]]``.
+    shape : {None, tuple of two ints}, optional
+        Shape of the matrix. If ``None``, it is inferred from the indices.
+
+        Default: ``None``.
+    dtype : {None, str, dtype object}, optional
+        Data type of the matrix elements. If ``None``, it is inferred from
+        the data.
+
+        Default: ``None``.
+    copy : bool, optional
+        If ``True``, the arrays of data and indices are copied.
+
+        Default: ``False``.
+
+    Attributes
+    ----------
+    data : dpnp.ndarray
+        Values of the stored elements.
+    indices : dpnp.ndarray
+        Row indices of the stored elements.
+    indptr : dpnp.ndarray
+        Index pointers to the stored elements of every column.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[1, 0, 4], [0, 0, 5], [2, 3, 6]])
+    >>> b = np.sparse.csc_matrix(a)
+    >>> b.indptr, b.indices, b.data
+    (array([0, 2, 3, 6]), array([0, 2, 2, 0, 1, 2]), array([1, 2, 3, 4, 5, 6]))
+    >>> b @ np.ones(3, dtype=np.int64)
+    array([ 5,  5, 11])
+
+    """
+
+    format = "csc"
+    _format_name = "Compressed Sparse Column"
+
+    @staticmethod
+    def _swap(x):
+        return x[1], x[0]
+
+    def tocsc(self, copy=False):
+        return self.copy() if copy else self
+
+    def transpose(self):
+        return csr_matrix(
+            (self.data, self.indices, self.indptr), shape=self.shape[::-1]
+        )
+
+
+class csr_matrix(_compressed_matrix):
+    """
+    A sparse matrix in compressed sparse row (CSR) format.
+
+    Parameters
+    ----------
+    arg1 : {dpnp.ndarray, usm_ndarray, tuple, coo_matrix, csc_matrix, \
+            csr_matrix}
+        Arguments for the initializer:
+
+        - ``csr_matrix(D)`` with a dense 2-D array `D`;
+        - ``csr_matrix(S)`` with another sparse matrix `S`;
+        - ``csr_matrix((M, N))`` to construct an empty matrix of shape
+          ``(M, N)``;
+        - ``csr_matrix((data, (row, col)))`` to construct a matrix with
+          ``A[row[k], col[k]] = data[k]``;
+        - ``csr_matrix((data, indices, indptr))`` with the standard CSR
+          representation, where the column indices for row ``i`` are stored
+          in ``indices[indptr[i]:indptr[i+1]]`` and their corresponding values
+          are stored in ``data[indptr[i]:indptr[i+1]]``.
+    shape : {None, tuple of two ints}, optional
+        Shape of the matrix. If ``None``, it is inferred from the indices.
+
+        Default: ``None``.
+    dtype : {None, str, dtype object}, optional
+        Data type of the matrix elements. If ``None``, it is inferred from
+        the data.
+
+        Default: ``None``.
+    copy : bool, optional
+        If ``True``, the arrays of data and indices are copied.
+
+        Default: ``False``.
+
+    Attributes
+    ----------
+    data : dpnp.ndarray
+        Values of the stored elements.
+    indices : dpnp.ndarray
+        Column indices of the stored elements.
+    indptr : dpnp.ndarray
+        Index pointers to the stored elements of every row.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> indptr = np.array([0, 2, 3, 6])
+    >>> indices = np.array([0, 2, 2, 0, 1, 2])
+    >>> data = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    >>> a = np.sparse.csr_matrix((data, indices, indptr), shape=(3, 3))
+    >>> a.toarray()
+    array([[1., 0., 2.],
+           [0., 0., 3.],
+           [4., 5., 6.]])
+    >>> a @ np.array([1.0, 2.0, 3.0])
+    array([ 7.,  9., 32.])
+
+    """
+
+    format = "csr"
+    _format_name = "Compressed Sparse Row"
+
+    @staticmethod
+    def _swap(x):
+        return x[0], x[1]
+
+    def tocsr(self, copy=False):
+        return self.copy() if copy else self
+
+    def transpose(self):
+        return csc_matrix(
+            (self.data, self.indices, self.indptr), shape=self.shape[::-1]
+        )
+
+
+def issparse(x):
+    """
+    Return whether `x` is a sparse matrix.
+
+    Parameters
+    ----------
+    x : object
+        Object to check for being a sparse matrix.
+
+    Returns
+    -------
+    out : bool
+        ``True`` if `x` is a sparse matrix, ``False`` otherwise.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> np.sparse.issparse(np.sparse.csr_matrix((2, 3)))
+    True
+    >>> np.sparse.issparse(np.eye(3))
+    False
+
+    """
+
+    return isinstance(x, _spmatrix)
+
+
+def isspmatrix_coo(x):
+    """Return whether `x` is a sparse matrix in COO format."""
+
+    return isinstance(x, coo_matrix)
+
+
+def isspmatrix_csc(x):
+    """Return whether `x` is a sparse matrix in CSC format."""
+
+    return isinstance(x, csc_matrix)
+
+
+def isspmatrix_csr(x):
+    """Return whether `x` is a sparse matrix in CSR format."""
+
+    return isinstance(x, csr_matrix)
@@ -0,0 +1,298 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Helping functions to implement the sparse matrices interface.
+
+Products of matrices in CSR format, or their transposes for CSC format, and
+dense arrays are computed by ``gemv`` or ``gemm`` routines of OneMKL sparse
+BLAS library through the sparse extension, when the library is available and
+supports the data types.
+
+Otherwise a sparse matrix is processed through its coordinate (COO) view,
+i.e. arrays of row indices, column indices and values of the stored elements.
+Accumulation of the values to the rows of the result is done by a weighted
+histogram kernel of the statistics extension with the bounds of the bins
+known in advance, so no synchronization with the host is required.
+
+"""
+
+# pylint: disable=no-name-in-module
+# pylint: disable=protected-access
+
+import dpctl.utils as dpu
+
+import dpnp
+import dpnp.backend.extensions.sparse._sparse_impl as si
+import dpnp.backend.extensions.statistics._statistics_impl as statistics_ext
+from dpnp.dpnp_utils import get_usm_allocations
+
+__all__ = [
+    "dpnp_compress_coo",
+    "dpnp_coo_matmul",
+    "dpnp_coo_todense",
+    "dpnp_csr_matmul",
+    "dpnp_expand_indptr",
+]
+
+# maximum number of products of stored elements and dense values computed
+# at once while multiplying a matrix in COO format
+_CHUNK_SIZE = 1 << 24
+
+
+def _bincount(hist, ids, values):
+    """Add `values` to the elements of `hist` with indices `ids` in place."""
+
+    if hist.size > 0 and ids.size > 0:
+        ids = dpnp.ascontiguousarray(ids, dtype=dpnp.int64)
+        weights = dpnp.ascontiguousarray(values, dtype=hist.dtype)
+
+        _manager = dpu.SequentialOrderManager[hist.sycl_queue]
+        mem_ev, ht_ev = statistics_ext.bincount(
+            dpnp.get_usm_ndarray(ids),
+            0,
+            hist.size - 1,
+            dpnp.get_usm_ndarray(weights),
+            dpnp.get_usm_ndarray(hist),
+            depends=_manager.submitted_events,
+        )
+        _manager.add_event_pair(mem_ev, ht_ev)
+
+
+def _check_matmul_operand(shape, other):
+    """Check `other` can be multiplied by a sparse matrix of `shape`."""
+
+    if other.ndim not in (1, 2):
+        raise ValueError(
+            f"Expected 1-D or 2-D dense operand, but got {other.ndim}-D array"
+        )
+    if other.shape[0] != shape[1]:
+        raise ValueError(
+            f"Dimension mismatch: sparse matrix of shape {shape} and dense "
+            f"operand of shape {other.shape}"
+        )
+
+
+def _get_hist(size, dtype, usm_type, sycl_queue):
+    """
+    Return a zero-initialized array of `size` elements to accumulate values
+    of real `dtype`.
+
+    """
+
+    if dtype == dpnp.float64:
+        hist_dt = dpnp.float64
+    elif dpnp.issubdtype(dtype, dpnp.inexact):
+        hist_dt = dpnp.float32
+    else:
+        hist_dt = dpnp.int64
+
+    # the histogram kernel uses atomics which do not work with host memory
+    usm_type = "device" if usm_type == "host" else usm_type
+    return dpnp.zeros(
+        size, dtype=hist_dt, usm_type=usm_type, sycl_queue=sycl_queue
+    )
+
+
+def _scatter_add(ids, values, size):
+    """
+    Return an array of `size` elements with sums of `values` having the same
+    index in `ids`.
+
+    """
+
+    if dpnp.issubdtype(values.dtype, dpnp.complexfloating):
+        res = dpnp.empty_like(values, shape=(size,))
+        res.real = _scatter_add(ids, values.real, size)
+        res.imag = _scatter_add(ids, values.imag, size)
+        return res
+
+    hist = _get_hist(size, values.dtype, values.usm_type, values.sycl_queue)
+    _bincount(hist, ids, values)
+    return dpnp.asarray(hist, usm_type=values.usm_type)
+
+
+def dpnp_compress_coo(major, minor, data, n_major, presorted=False):
+    """
+    Return data, indices and index pointers of a compressed format from the
+    COO view with `major` indices along the compressed axis.
+
+    The stored elements are sorted by major and then by minor indices unless
+    `presorted` is ``True``, and the duplicates are kept.
+
+    """
+
+    if presorted:
+        indices = minor
+    else:
+        order = dpnp.lexsort((minor, major))
+        major = dpnp.take(major, order)
+        indices = dpnp.take(minor, order)
+        data = dpnp.take(data, order)
+
+    bounds = dpnp.arange(
+        n_major + 1,
+        dtype=major.dtype,
+        usm_type=major.usm_type,
+        sycl_queue=major.sycl_queue,
+    )
+    indptr = dpnp.searchsorted(major, bounds, side="left")
+    return data, indices, dpnp.astype(indptr, indices.dtype, copy=False)
+
+
+def dpnp_coo_matmul(row, col, data, shape, other):
+    """
+    Return the product of a sparse matrix of `shape` given by its COO view
+    and a dense vector or matrix `other`.
+
+    """
+
+    _check_matmul_operand(shape, other)
+
+    m, n = shape
+    k = 1 if other.ndim == 1 else other.shape[1]
+    dense = other.reshape(n, k)
+    res_dt = dpnp.result_type(data, other)
+    usm_type, exec_q = get_usm_allocations([data, other])
+
+    # real and imaginary parts are accumulated separately
+    is_complex = dpnp.issubdtype(res_dt, dpnp.complexfloating)
+    hists = [
+        _get_hist(m * k, res_dt, usm_type, exec_q)
+        for _ in range(2 if is_complex else 1)
+    ]
+
+    # every column of the result is accumulated to its own bins
+    col_ids = dpnp.arange(k, dtype=row.dtype, sycl_queue=exec_q)
+
+    # the products are computed by chunks of stored elements, so the size
+    # of temporary arrays is bounded regardless of the number of them
+    chunk = max(_CHUNK_SIZE // max(k, 1), 1)
+    for start in range(0, data.size, chunk):
+        sl = slice(start, start + chunk)
+        values = dpnp.multiply(
+            data[sl, None], dpnp.take(dense, col[sl], axis=0), dtype=res_dt
+        ).ravel()
+        ids = dpnp.add(col_ids, row[sl, None] * k).ravel()
+
+        if is_complex:
+            _bincount(hists[0], ids, values.real)
+            _bincount(hists[1], ids, values.imag)
+        else:
+            _bincount(hists[0], ids, values)
+
+    if is_complex:
+        res = dpnp.empty_like(hists[0], dtype=res_dt)
+        res.real = hists[0]
+        res.imag = hists[1]
+    else:
+        res = dpnp.astype(hists[0], res_dt, copy=False)
+    res = dpnp.asarray(res, usm_type=usm_type)
+    return res.reshape((m,) + other.shape[1:])
+
+
+def dpnp_coo_todense(row, col, data, shape, order="C"):
+    """
+    Return a dense matrix of `shape` with the elements of the COO view,
+    summing duplicate entries.
+
+    """
+
+    m, n = shape
+    if order == "F":
+        res = _scatter_add(col * m + row, data, m * n).reshape(n, m).T
+    else:
+        res = _scatter_add(row * n + col, data, m * n).reshape(m, n)
+    return dpnp.astype(res, data.dtype, copy=False)
+
+
+def dpnp_csr_matmul(indptr, indices, data, shape, other, transpose=False):
+    """
+    Return the product of a sparse matrix of `shape` in CSR format, or of its
+    transpose if `transpose` is ``True``, and a dense vector or matrix
+    `other` computed by OneMKL sparse BLAS library.
+
+    Returns ``None`` if the library does not support the data types.
+
+    """
+
+    res_shape = shape[::-1] if transpose else shape
+    _check_matmul_operand(res_shape, other)
+
+    res_dt = dpnp.result_type(data, other)
+    if (
+        not si._is_available()
+        or res_dt == dpnp.float16
+        or not dpnp.issubdtype(res_dt, dpnp.inexact)
+        or indices.dtype not in (dpnp.int32, dpnp.int64)
+        or indptr.dtype != indices.dtype
+        or data.size == 0
+        or other.size == 0
+    ):
+        return None
+
+    usm_type, exec_q = get_usm_allocations([data, other])
+    data = dpnp.ascontiguousarray(data, dtype=res_dt)
+    dense = dpnp.ascontiguousarray(other, dtype=res_dt)
+    res = dpnp.empty(
+        res_shape[:1] + other.shape[1:],
+        dtype=res_dt,
+        usm_type=usm_type,
+        sycl_queue=exec_q,
+    )
+
+    _manager = dpu.SequentialOrderManager[exec_q]
+    ht_ev, matmul_ev = si._csr_matmul(
+        exec_q,
+        shape[0],
+        shape[1],
+        dpnp.get_usm_ndarray(dpnp.ascontiguousarray(indptr)),
+        dpnp.get_usm_ndarray(dpnp.ascontiguousarray(indices)),
+        dpnp.get_usm_ndarray(data),
+        dpnp.get_usm_ndarray(dense),
+        dpnp.get_usm_ndarray(res),
+        transpose,
+        depends=_manager.submitted_events,
+    )
+    _manager.add_event_pair(ht_ev, matmul_ev)
+    return res
+
+
+def dpnp_expand_indptr(indptr, nnz):
+    """
+    Return indices along the compressed axis of every one of `nnz` stored
+    elements given by index pointers `indptr`.
+
+    """
+
+    pos = dpnp.arange(
+        nnz,
+        dtype=indptr.dtype,
+        usm_type=indptr.usm_type,
+        sycl_queue=indptr.sycl_queue,
+    )
+    res = dpnp.searchsorted(indptr, pos, side="right")
+    res -= 1
+    return res
@@ -0,0 +1,967 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Interface of the sparse linear algebra part of the DPNP
+
+Notes
+-----
+This module is a face or public interface file for the library
+it contains:
+ - Interface functions
+ - documentation for the functions
+ - The functions parameters check
+
+"""
+
+import dpnp
+from dpnp.dpnp_utils import get_usm_allocations
+from dpnp.sparse.dpnp_iface_sparse import issparse
+
+__all__ = ["bicgstab", "cg", "eigsh", "gmres", "svds"]
+
+# number of iterations run on the device between checks of the convergence
+_CHECK_INTERVAL = 10
+
+
+def _axpy(y, a, x, tmp, subtract=False):
+    """Compute ``y += a*x`` or ``y -= a*x`` in place using `tmp` buffer."""
+
+    dpnp.multiply(x, a, out=tmp)
+    if subtract:
+        dpnp.subtract(y, tmp, out=y)
+    else:
+        dpnp.add(y, tmp, out=y)
+
+
+def _get_dtype(*objects):
+    """
+    Return the inexact data type of at least single precision to compute
+    with the arrays among `objects`, and USM type and SYCL queue to allocate
+    new arrays with.
+
+    """
+
+    usm_type, queue = get_usm_allocations(list(objects))
+    dtypes = [obj.dtype for obj in objects if hasattr(obj, "dtype")]
+    dtype = dpnp.result_type(*dtypes) if dtypes else None
+    if dtype is None or not dpnp.issubdtype(dtype, dpnp.inexact):
+        dtype = dpnp.default_float_type(sycl_queue=queue)
+
+    # half precision is not supported by BLAS functions
+    return dpnp.result_type(dtype, dpnp.float32), usm_type, queue
+
+
+def _get_operator(A, n, name):
+    """
+    Return a function computing the product of `A` of shape ``(n, n)`` and
+    a vector.
+
+    """
+
+    if issparse(A) or dpnp.is_supported_array_type(A):
+        if A.shape != (n, n):
+            raise ValueError(
+                f"{name} of shape {A.shape} does not match the system of "
+                f"size {n}"
+            )
+        if issparse(A):
+            return A.dot
+        return lambda x: dpnp.matmul(A, x)
+
+    matvec = getattr(A, "matvec", A)
+    if not callable(matvec):
+        raise TypeError(
+            f"{name} must be an array, a sparse matrix or a callable, "
+            f"but got {type(A)}"
+        )
+    return matvec
+
+
+def _get_system(A, b, x0, M):
+    """
+    Validate the linear system and return the functions computing products
+    of the system matrix and of the preconditioner, the initial guess and
+    the right-hand side.
+
+    """
+
+    dpnp.check_supported_arrays_type(b)
+    if b.ndim == 2 and b.shape[1] == 1:
+        b = b.ravel()
+    if b.ndim != 1:
+        raise ValueError(
+            f"Expected 1-D right-hand side, but got shape {b.shape}"
+        )
+
+    n = b.size
+    matvec = _get_operator(A, n, "A")
+    psolve = None if M is None else _get_operator(M, n, "M")
+
+    res_dt, _, _ = _get_dtype(A, b)
+    b = dpnp.astype(b, res_dt, copy=False)
+
+    if x0 is None:
+        x = dpnp.zeros_like(b)
+    else:
+        dpnp.check_supported_arrays_type(x0)
+        if x0.size != n:
+            raise ValueError(
+                f"Initial guess of shape {x0.shape} does not match the "
+                f"system of size {n}"
+            )
+        x = dpnp.astype(x0.reshape(n), res_dt, copy=True)
+    return matvec, psolve, x, b
+
+
+def _get_tolerance(b, rtol, atol):
+    """Return the squared tolerance of the residual norm and the norm of `b`."""
+
+    bnrm = float(dpnp.linalg.norm(b))
+    return max(float(atol), float(rtol) * bnrm) ** 2, bnrm
+
+
+def _matmat(a, x, conj=False):
+    """
+    Return the product of dense or sparse matrix `a` and dense `x`, or
+    ``conj(a @ conj(x))`` if `conj` is ``True``.
+
+    """
+
+    if conj:
+        x = x.conj()
+    res = a.dot(x) if issparse(a) else dpnp.matmul(a, x)
+    return res.conj() if conj else res
+
+
+def _orthogonalize(w, basis, is_complex):
+    """
+    Orthogonalize `w` in place against the orthonormal rows of `basis` by the
+    classical Gram-Schmidt process with reorthogonalization, and return the
+    projection coefficients.
+
+    """
+
+    h = dpnp.zeros_like(w, shape=(basis.shape[0],))
+    for _ in range(2):
+        # projections on the basis are conj(w^H V^T) for complex data
+        if is_complex:
+            proj = dpnp.matmul(w.conj(), basis.T).conj()
+        else:
+            proj = dpnp.matmul(basis, w)
+        w -= dpnp.matmul(proj, basis)
+        h += proj
+    return h
+
+
+def _random_normal(shape, dtype, usm_type, sycl_queue, random_state):
+    """Return an array of `shape` of standard normally distributed values."""
+
+    if not isinstance(random_state, dpnp.random.RandomState):
+        random_state = dpnp.random.RandomState(
+            random_state, sycl_queue=sycl_queue
+        )
+
+    is_complex = dpnp.issubdtype(dtype, dpnp.complexfloating)
+    real_dt = dpnp.finfo(dtype).dtype
+
+    res = random_state.normal(size=shape, dtype=real_dt, usm_type=usm_type)
+    if is_complex:
+        res = res + 1j * random_state.normal(
+            size=shape, dtype=real_dt, usm_type=usm_type
+        )
+    return dpnp.asarray(res, dtype=dtype, sycl_queue=sycl_queue)
+
+
+def _residual(matvec, x, b, out=None):
+    """Return ``b - A x`` written to `out` if provided."""
+
+    return dpnp.subtract(b, matvec(x), out=out)
+
+
+def _safe_divide(a, b):
+    """
+    Return ``a / b`` computed on the device, or zero where `b` is zero, so a
+    breakdown of the iterations stops updating the solution.
+
+    """
+
+    return dpnp.where(b == 0, 0, a / b)
+
+
+def _select(values, k, which):
+    """Return indices of `k` eigenvalues of `which` kind among `values`."""
+
+    if which == "LA":
+        return dpnp.argsort(values)[-k:]
+    if which == "SA":
+        return dpnp.argsort(values)[:k]
+    return dpnp.argsort(dpnp.abs(values))[-k:]
+
+
+def _squared_norm(x):
+    """Return the squared norm of vector `x` as a 0-D array."""
+
+    return dpnp.vdot(x, x).real
+
+
+def bicgstab(
+    A, b, x0=None, *, rtol=1e-5, atol=0.0, maxiter=None, M=None, callback=None
+):
+    """
+    Use BIConjugate Gradient STABilized iteration to solve ``Ax = b``.
+
+    For full documentation refer to :obj:`scipy.sparse.linalg.bicgstab`.
+
+    Parameters
+    ----------
+    A : {dpnp.ndarray, usm_ndarray, sparse matrix, callable}
+        The real or complex N-by-N matrix of the linear system, or a function
+        returning the product of the matrix and a vector.
+    b : {dpnp.ndarray, usm_ndarray}
+        Right hand side of the linear system. Has shape ``(N,)`` or
+        ``(N, 1)``.
+    x0 : {None, dpnp.ndarray, usm_ndarray}, optional
+        Starting guess for the solution.
+
+        Default: ``None``.
+    rtol, atol : float, optional
+        Parameters for the convergence test. For convergence,
+        ``norm(b - A @ x) <= max(rtol*norm(b), atol)`` should be satisfied.
+
+        Default: ``rtol=1e-5``, ``atol=0.0``.
+    maxiter : {None, int}, optional
+        Maximum number of iterations. Iteration will stop after `maxiter`
+        steps even if the specified tolerance has not been achieved. If
+        ``None``, ``10*N`` is used.
+
+        Default: ``None``.
+    M : {None, dpnp.ndarray, usm_ndarray, sparse matrix, callable}, optional
+        Preconditioner for `A`. It should approximate the inverse of `A`.
+
+        Default: ``None``.
+    callback : {None, callable}, optional
+        User-supplied function to call after each iteration. It is called as
+        ``callback(xk)``, where `xk` is the current solution vector.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    x : dpnp.ndarray
+        The converged solution.
+    info : int
+        Provides convergence information: ``0`` means successful exit and
+        ``>0`` means convergence to tolerance not achieved, number of
+        iterations.
+
+    See Also
+    --------
+    :obj:`dpnp.sparse.linalg.cg` : Use Conjugate Gradient iteration to solve
+                                   ``Ax = b``.
+    :obj:`dpnp.sparse.linalg.gmres` : Use Generalized Minimal RESidual
+                                      iteration to solve ``Ax = b``.
+
+    Notes
+    -----
+    The convergence is checked on the host every few iterations only, so
+    a few more iterations than needed may be done. A breakdown of the method
+    stops the updates of the solution, and the iterations end with a positive
+    `info`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[4.0, 1.0, 0.0], [2.0, 5.0, 1.0], [0.0, 1.0, 3.0]])
+    >>> b = np.array([1.0, 2.0, 3.0])
+    >>> x, info = np.sparse.linalg.bicgstab(a, b)
+    >>> info
+    0
+    >>> np.allclose(a @ x, b)
+    array(True)
+
+    """
+
+    matvec, psolve, x, b = _get_system(A, b, x0, M)
+    if maxiter is None:
+        maxiter = b.size * 10
+
+    tol2, bnrm = _get_tolerance(b, rtol, atol)
+    if bnrm == 0.0:
+        return b.copy(), 0
+
+    r = _residual(matvec, x, b)
+    rtilde = r.copy()
+    p = dpnp.zeros_like(b)
+    v = dpnp.zeros_like(b)
+    tmp = dpnp.empty_like(b)
+    rho_prev = alpha = omega = dpnp.ones_like(b, shape=())
+
+    for k in range(maxiter):
+        if (callback is not None or k % _CHECK_INTERVAL == 0) and float(
+            _squared_norm(r)
+        ) <= tol2:
+            return x, 0
+
+        rho = dpnp.vdot(rtilde, r)
+        beta = _safe_divide(rho, rho_prev) * _safe_divide(alpha, omega)
+
+        # p = r + beta * (p - omega * v)
+        _axpy(p, omega, v, tmp, subtract=True)
+        dpnp.multiply(p, beta, out=p)
+        dpnp.add(p, r, out=p)
+
+        phat = p if psolve is None else psolve(p)
+        v = matvec(phat)
+        alpha = _safe_divide(rho, dpnp.vdot(rtilde, v))
+
+        # r is updated to s = r - alpha * v
+        _axpy(r, alpha, v, tmp, subtract=True)
+        _axpy(x, alpha, phat, tmp)
+
+        shat = r if psolve is None else psolve(r)
+        t = matvec(shat)
+        omega = _safe_divide(dpnp.vdot(t, r), _squared_norm(t))
+
+        _axpy(x, omega, shat, tmp)
+        _axpy(r, omega, t, tmp, subtract=True)
+        rho_prev = rho
+
+        if callback is not None:
+            callback(x)
+
+    if float(_squared_norm(r)) <= tol2:
+        return x, 0
+    return x, maxiter
+
+
+def cg(
+    A, b, x0=None, *, rtol=1e-5, atol=0.0, maxiter=None, M=None, callback=None
+):
+    """
+    Use Conjugate Gradient iteration to solve ``Ax = b``.
+
+    For full documentation refer to :obj:`scipy.sparse.linalg.cg`.
+
+    Parameters
+    ----------
+    A : {dpnp.ndarray, usm_ndarray, sparse matrix, callable}
+        The real symmetric or complex Hermitian positive definite N-by-N
+        matrix of the linear system, or a function returning the product of
+        the matrix and a vector.
+    b : {dpnp.ndarray, usm_ndarray}
+        Right hand side of the linear system. Has shape ``(N,)`` or
+        ``(N, 1)``.
+    x0 : {None, dpnp.ndarray, usm_ndarray}, optional
+        Starting guess for the solution.
+
+        Default: ``None``.
+    rtol, atol : float, optional
+        Parameters for the convergence test. For convergence,
+        ``norm(b - A @ x) <= max(rtol*norm(b), atol)`` should be satisfied.
+
+        Default: ``rtol=1e-5``, ``atol=0.0``.
+    maxiter : {None, int}, optional
+        Maximum number of iterations. Iteration will stop after `maxiter`
+        steps even if the specified tolerance has not been achieved. If
+        ``None``, ``10*N`` is used.
+
+        Default: ``None``.
+    M : {None, dpnp.ndarray, usm_ndarray, sparse matrix, callable}, optional
+        Preconditioner for `A`. It should approximate the inverse of `A` and
+        be Hermitian positive definite.
+
+        Default: ``None``.
+    callback : {None, callable}, optional
+        User-supplied function to call after each iteration. It is called as
+        ``callback(xk)``, where `xk` is the current solution vector.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    x : dpnp.ndarray
+        The converged solution.
+    info : int
+        Provides convergence information: ``0`` means successful exit and
+        ``>0`` means convergence to tolerance not achieved, number of
+        iterations.
+
+    See Also
+    --------
+    :obj:`dpnp.sparse.linalg.bicgstab` : Use BIConjugate Gradient STABilized
+                                         iteration to solve ``Ax = b``.
+    :obj:`dpnp.sparse.linalg.gmres` : Use Generalized Minimal RESidual
+                                      iteration to solve ``Ax = b``.
+    :obj:`dpnp.linalg.solve` : Solve a linear matrix equation.
+
+    Notes
+    -----
+    The step sizes of the iterations are kept in 0-D arrays on the device and
+    the vectors are updated in place. The convergence is checked on the host
+    every few iterations only, so a few more iterations than needed may be
+    done.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]])
+    >>> m = np.sparse.csr_matrix(a)
+    >>> b = np.array([1.0, 2.0, 3.0])
+    >>> x, info = np.sparse.linalg.cg(m, b, rtol=1e-8)
+    >>> info
+    0
+    >>> np.allclose(a @ x, b)
+    array(True)
+
+    """
+
+    matvec, psolve, x, b = _get_system(A, b, x0, M)
+    if maxiter is None:
+        maxiter = b.size * 10
+
+    tol2, bnrm = _get_tolerance(b, rtol, atol)
+    if bnrm == 0.0:
+        return b.copy(), 0
+
+    r = _residual(matvec, x, b)
+    z = r if psolve is None else psolve(r)
+    p = z.copy()
+    tmp = dpnp.empty_like(b)
+    rho = dpnp.vdot(r, z)
+
+    for k in range(maxiter):
+        if (callback is not None or k % _CHECK_INTERVAL == 0) and float(
+            _squared_norm(r)
+        ) <= tol2:
+            return x, 0
+
+        q = matvec(p)
+        alpha = _safe_divide(rho, dpnp.vdot(p, q))
+        _axpy(x, alpha, p, tmp)
+        _axpy(r, alpha, q, tmp, subtract=True)
+
+        z = r if psolve is None else psolve(r)
+        rho_next = dpnp.vdot(r, z)
+        beta = _safe_divide(rho_next, rho)
+        rho = rho_next
+
+        # p = z + beta * p
+        dpnp.multiply(p, beta, out=p)
+        dpnp.add(p, z, out=p)
+
+        if callback is not None:
+            callback(x)
+
+    if float(_squared_norm(r)) <= tol2:
+        return x, 0
+    return x, maxiter
+
+
+def eigsh(
+    A,
+    k=6,
+    *,
+    which="LM",
+    ncv=None,
+    maxiter=None,
+    tol=0,
+    v0=None,
+    return_eigenvectors=True,
+):
+    """
+    Find `k` eigenvalues and eigenvectors of the real symmetric or complex
+    Hermitian square matrix `A`.
+
+    For full documentation refer to :obj:`scipy.sparse.linalg.eigsh`.
+
+    Parameters
+    ----------
+    A : {dpnp.ndarray, usm_ndarray, sparse matrix, callable}
+        The real symmetric or complex Hermitian N-by-N matrix, or a function
+        returning the product of the matrix and a vector. If `A` is
+        a function, `v0` has to be passed.
+    k : int, optional
+        The number of eigenvalues and eigenvectors to compute. Must be
+        ``1 <= k < N``.
+
+        Default: ``6``.
+    which : {"LM", "LA", "SA"}, optional
+        Which `k` eigenvalues to find: ``"LM"`` for the largest in magnitude,
+        ``"LA"`` for the largest algebraic and ``"SA"`` for the smallest
+        algebraic ones.
+
+        Default: ``"LM"``.
+    ncv : {None, int}, optional
+        The number of Lanczos vectors generated. Must be ``k < ncv <= N``. If
+        ``None``, ``min(max(2*k + 1, 20), N)`` is used.
+
+        Default: ``None``.
+    maxiter : {None, int}, optional
+        Maximum number of restarts. If ``None``, ``10*N`` is used.
+
+        Default: ``None``.
+    tol : float, optional
+        Relative accuracy of the eigenvalues. The value ``0`` implies machine
+        precision.
+
+        Default: ``0``.
+    v0 : {None, dpnp.ndarray, usm_ndarray}, optional
+        Starting vector of the iteration. If ``None``, a random vector is
+        used.
+
+        Default: ``None``.
+    return_eigenvectors : bool, optional
+        Whether to return the eigenvectors in addition to the eigenvalues.
+
+        Default: ``True``.
+
+    Returns
+    -------
+    w : dpnp.ndarray
+        Array of `k` eigenvalues in ascending order.
+    v : dpnp.ndarray
+        Array of shape ``(N, k)`` whose columns are the eigenvectors
+        corresponding to the eigenvalues `w`. Returned only if
+        `return_eigenvectors` is ``True``.
+
+    See Also
+    --------
+    :obj:`dpnp.sparse.linalg.svds` : Compute the largest singular values and
+                                     vectors of a matrix.
+    :obj:`dpnp.linalg.eigh` : Compute all eigenvalues and eigenvectors of
+                              a dense Hermitian matrix.
+
+    Notes
+    -----
+    The eigenpairs are found by the thick-restart Lanczos method. The Lanczos
+    basis is orthogonalized by the classical Gram-Schmidt process with
+    reorthogonalization and kept on the device, and only a small
+    ``(ncv, ncv)`` eigenvalue problem is solved at every restart, when the
+    convergence is checked on the host. The method is efficient when `k` is
+    much smaller than ``N`` and only a few restarts are needed. If the
+    eigenvalues do not converge in `maxiter` restarts, the latest
+    approximations are returned.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.diag(np.arange(1.0, 101.0))
+    >>> w, v = np.sparse.linalg.eigsh(a, k=3)
+    >>> w
+    array([ 98.,  99., 100.])
+    >>> v.shape
+    (100, 3)
+
+    """
+
+    if which not in ("LM", "LA", "SA"):
+        raise ValueError(f"which must be 'LM', 'LA' or 'SA', but got {which}")
+
+    if hasattr(A, "shape"):
+        if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError(f"A must be a square matrix, but got {A.shape}")
+        n = A.shape[0]
+    elif v0 is not None:
+        n = v0.size
+    else:
+        raise TypeError("v0 must be passed when A is a function")
+    matvec = _get_operator(A, n, "A")
+
+    if not 0 < k < n:
+        raise ValueError(f"k must be between 1 and {n - 1}, but got {k}")
+    if ncv is None:
+        ncv = min(max(2 * k + 1, 20), n)
+    elif not k < ncv <= n:
+        raise ValueError(f"ncv must be k < ncv <= {n}, but got {ncv}")
+    if maxiter is None:
+        maxiter = n * 10
+    elif maxiter < 1:
+        raise ValueError("maxiter must be a positive integer")
+
+    if v0 is None:
+        res_dt, usm_type, queue = _get_dtype(A)
+        v = _random_normal((n,), res_dt, usm_type, queue, None)
+    else:
+        dpnp.check_supported_arrays_type(v0)
+        if v0.size != n:
+            raise ValueError(
+                f"Starting vector of shape {v0.shape} does not match the "
+                f"matrix of size {n}"
+            )
+        res_dt, _, _ = _get_dtype(A, v0)
+        v = dpnp.astype(v0.reshape(n), res_dt, copy=False)
+
+    if tol == 0:
+        tol = dpnp.finfo(res_dt).eps
+
+    is_complex = dpnp.issubdtype(res_dt, dpnp.complexfloating)
+    basis = dpnp.empty_like(v, shape=(ncv + 1, n))
+    tridiag = dpnp.zeros_like(v, shape=(ncv, ncv))
+    dpnp.divide(v, dpnp.linalg.norm(v), out=basis[0])
+
+    start = 0
+    for it in range(maxiter):
+        # Lanczos process with full reorthogonalization
+        for j in range(start, ncv):
+            w = matvec(basis[j])
+            h = _orthogonalize(w, basis[: j + 1], is_complex)
+
+            beta = dpnp.linalg.norm(w)
+            tridiag[: j + 1, j] = h
+            if j + 1 < ncv:
+                tridiag[j + 1, j] = beta
+            dpnp.divide(w, dpnp.where(beta == 0, 1, beta), out=basis[j + 1])
+
+        # Ritz pairs from the projected problem
+        theta, s = dpnp.linalg.eigh(tridiag)
+        idx = _select(theta, k, which)
+        theta = theta[idx]
+        s = s[:, idx]
+
+        # residual norm of a Ritz pair is beta times last row of the vector
+        beta_s = beta * s[ncv - 1]
+        if it == maxiter - 1 or bool(
+            dpnp.all(dpnp.abs(beta_s) <= tol * dpnp.abs(theta))
+        ):
+            break
+
+        # restart the process with the Ritz vectors kept
+        basis[:k] = dpnp.matmul(s.T, basis[:ncv])
+        basis[k] = basis[ncv]
+        tridiag.fill(0)
+        tridiag[:k, :k] = dpnp.diag(theta)
+        tridiag[k, :k] = beta_s
+        start = k
+
+    order = dpnp.argsort(theta)
+    if not return_eigenvectors:
+        return theta[order]
+    return theta[order], dpnp.matmul(s[:, order].T, basis[:ncv]).T
+
+
+def gmres(
+    A,
+    b,
+    x0=None,
+    *,
+    rtol=1e-5,
+    atol=0.0,
+    restart=None,
+    maxiter=None,
+    M=None,
+    callback=None,
+):
+    """
+    Use Generalized Minimal RESidual iteration to solve ``Ax = b``.
+
+    For full documentation refer to :obj:`scipy.sparse.linalg.gmres`.
+
+    Parameters
+    ----------
+    A : {dpnp.ndarray, usm_ndarray, sparse matrix, callable}
+        The real or complex N-by-N matrix of the linear system, or a function
+        returning the product of the matrix and a vector.
+    b : {dpnp.ndarray, usm_ndarray}
+        Right hand side of the linear system. Has shape ``(N,)`` or
+        ``(N, 1)``.
+    x0 : {None, dpnp.ndarray, usm_ndarray}, optional
+        Starting guess for the solution.
+
+        Default: ``None``.
+    rtol, atol : float, optional
+        Parameters for the convergence test. For convergence,
+        ``norm(b - A @ x) <= max(rtol*norm(b), atol)`` should be satisfied.
+
+        Default: ``rtol=1e-5``, ``atol=0.0``.
+    restart : {None, int}, optional
+        Number of iterations between restarts. Larger values increase
+        iteration cost, but may be necessary for convergence. If ``None``,
+        ``20`` is used.
+
+        Default: ``None``.
+    maxiter : {None, int}, optional
+        Maximum number of restart cycles. Iteration will stop after `maxiter`
+        cycles even if the specified tolerance has not been achieved. If
+        ``None``, ``10*N`` is used.
+
+        Default: ``None``.
+    M : {None, dpnp.ndarray, usm_ndarray, sparse matrix, callable}, optional
+        Preconditioner for `A`. It should approximate the inverse of `A`. It
+        is applied on the right, so the residual of the original system is
+        minimized.
+
+        Default: ``None``.
+    callback : {None, callable}, optional
+        User-supplied function to call after each restart cycle. It is called
+        as ``callback(xk)``, where `xk` is the current solution vector.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    x : dpnp.ndarray
+        The converged solution.
+    info : int
+        Provides convergence information: ``0`` means successful exit and
+        ``>0`` means convergence to tolerance not achieved, number of
+        restart cycles.
+
+    See Also
+    --------
+    :obj:`dpnp.sparse.linalg.bicgstab` : Use BIConjugate Gradient STABilized
+                                         iteration to solve ``Ax = b``.
+    :obj:`dpnp.sparse.linalg.cg` : Use Conjugate Gradient iteration to solve
+                                   ``Ax = b``.
+
+    Notes
+    -----
+    The Krylov basis is orthogonalized by the classical Gram-Schmidt process
+    with reorthogonalization, which computes the projections on the whole
+    basis by matrix-vector products. The convergence is checked on the host
+    once per restart cycle.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[3.0, 2.0, 0.0], [1.0, -1.0, 0.0], [0.0, 5.0, 1.0]])
+    >>> b = np.array([2.0, 4.0, -1.0])
+    >>> x, info = np.sparse.linalg.gmres(a, b, rtol=1e-8)
+    >>> info
+    0
+    >>> np.allclose(a @ x, b)
+    array(True)
+
+    """
+
+    matvec, psolve, x, b = _get_system(A, b, x0, M)
+    n = b.size
+    if maxiter is None:
+        maxiter = n * 10
+    if restart is None:
+        restart = 20
+    restart = min(int(restart), n)
+    if restart < 1:
+        raise ValueError("restart must be a positive integer")
+
+    tol2, bnrm = _get_tolerance(b, rtol, atol)
+    if bnrm == 0.0:
+        return b.copy(), 0
+
+    is_complex = dpnp.issubdtype(b.dtype, dpnp.complexfloating)
+    basis = dpnp.empty_like(b, shape=(restart + 1, n))
+    hess = dpnp.empty_like(b, shape=(restart + 1, restart))
+    rhs = dpnp.empty_like(b, shape=(restart + 1,))
+    r = dpnp.empty_like(b)
+
+    for _ in range(maxiter):
+        _residual(matvec, x, b, out=r)
+        rnrm = dpnp.linalg.norm(r)
+        if float(rnrm) ** 2 <= tol2:
+            return x, 0
+
+        dpnp.divide(r, rnrm, out=basis[0])
+        hess.fill(0)
+        rhs.fill(0)
+        rhs[0] = rnrm
+
+        # Arnoldi process with the Krylov basis stored in rows of the basis
+        for j in range(restart):
+            v = basis[j] if psolve is None else psolve(basis[j])
+            w = matvec(v)
+            h = _orthogonalize(w, basis[: j + 1], is_complex)
+
+            hnrm = dpnp.linalg.norm(w)
+            hess[: j + 1, j] = h
+            hess[j + 1, j] = hnrm
+            dpnp.divide(w, dpnp.where(hnrm == 0, 1, hnrm), out=basis[j + 1])
+
+        y = dpnp.linalg.lstsq(hess, rhs, rcond=None)[0]
+        dx = dpnp.matmul(y, basis[:restart])
+        if psolve is not None:
+            dx = psolve(dx)
+        x += dx
+
+        if callback is not None:
+            callback(x)
+
+    _residual(matvec, x, b, out=r)
+    if float(_squared_norm(r)) <= tol2:
+        return x, 0
+    return x, maxiter
+
+
+def svds(
+    A,
+    k=6,
+    *,
+    ncv=None,
+    which="LM",
+    maxiter=None,
+    return_singular_vectors=True,
+    random_state=None,
+):
+    """
+    Compute the largest `k` singular values and vectors of the matrix `A`.
+
+    For full documentation refer to :obj:`scipy.sparse.linalg.svds`.
+
+    Parameters
+    ----------
+    A : {dpnp.ndarray, usm_ndarray, sparse matrix}
+        The M-by-N matrix to decompose.
+    k : int, optional
+        The number of singular values and vectors to compute. Must be
+        ``1 <= k <= min(M, N)``.
+
+        Default: ``6``.
+    ncv : {None, int}, optional
+        The dimension of the random subspace the singular vectors are found
+        in. Must be ``k <= ncv <= min(M, N)``. Larger values increase the
+        accuracy. If ``None``, ``min(k + 10, M, N)`` is used.
+
+        Default: ``None``.
+    which : {"LM"}, optional
+        Which `k` singular values to find. Only the largest ones are
+        supported.
+
+        Default: ``"LM"``.
+    maxiter : {None, int}, optional
+        The number of power iterations refining the subspace. Larger values
+        increase the accuracy when the singular values decay slowly. If
+        ``None``, ``4`` is used.
+
+        Default: ``None``.
+    return_singular_vectors : {bool, "u", "vh"}, optional
+        Whether to return the left singular vectors, the right singular
+        vectors, both of them or none.
+
+        Default: ``True``.
+    random_state : {None, int, dpnp.random.RandomState}, optional
+        A seed or a generator of the random test matrix.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    u : {None, dpnp.ndarray}
+        Array of shape ``(M, k)`` with the left singular vectors as columns.
+        ``None`` if `return_singular_vectors` is ``"vh"``.
+    s : dpnp.ndarray
+        Array of `k` singular values in ascending order.
+    vh : {None, dpnp.ndarray}
+        Array of shape ``(k, N)`` with the right singular vectors as rows.
+        ``None`` if `return_singular_vectors` is ``"u"``.
+
+    If `return_singular_vectors` is ``False``, only `s` is returned.
+
+    See Also
+    --------
+    :obj:`dpnp.sparse.linalg.eigsh` : Find a few eigenvalues and eigenvectors
+                                      of a Hermitian matrix.
+    :obj:`dpnp.linalg.svd` : Compute the full singular value decomposition of
+                             a dense matrix.
+
+    Notes
+    -----
+    The decomposition is computed by the randomized subspace iteration of
+    Halko, Martinsson and Tropp. The range of `A` is sampled by the product
+    with a random Gaussian ``(N, ncv)`` matrix and refined by `maxiter` power
+    iterations, each of them followed by a QR factorization. The small
+    ``(ncv, N)`` projection of `A` on this range is then decomposed by
+    :obj:`dpnp.linalg.svd`. All the steps are done on the device by matrix
+    products and dense factorizations, which is much faster than the full
+    decomposition when `k` is much smaller than ``min(M, N)``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.diag(np.arange(1.0, 11.0))
+    >>> u, s, vh = np.sparse.linalg.svds(a, k=3, random_state=0)
+    >>> s
+    array([ 8.,  9., 10.])
+    >>> u.shape, vh.shape
+    ((10, 3), (3, 10))
+
+    """
+
+    if which == "SM":
+        raise NotImplementedError("which='SM' is not supported")
+    if which != "LM":
+        raise ValueError(f"which must be 'LM' or 'SM', but got {which}")
+    if return_singular_vectors not in (True, False, "u", "vh"):
+        raise ValueError(
+            "return_singular_vectors must be True, False, 'u' or 'vh', but "
+            f"got {return_singular_vectors}"
+        )
+
+    if not issparse(A):
+        dpnp.check_supported_arrays_type(A)
+    if A.ndim != 2:
+        raise ValueError(f"A must be a 2-D matrix, but got {A.ndim}-D array")
+
+    m, n = A.shape
+    if not 0 < k <= min(m, n):
+        raise ValueError(f"k must be between 1 and {min(m, n)}, but got {k}")
+    if ncv is None:
+        ncv = min(k + 10, m, n)
+    elif not k <= ncv <= min(m, n):
+        raise ValueError(f"ncv must be k <= ncv <= {min(m, n)}, but got {ncv}")
+    if maxiter is None:
+        maxiter = 4
+    elif maxiter < 0:
+        raise ValueError("maxiter must be a non-negative integer")
+
+    res_dt, usm_type, queue = _get_dtype(A)
+    is_complex = dpnp.issubdtype(res_dt, dpnp.complexfloating)
+    if issparse(A):
+        A = A.astype(res_dt, copy=False)
+    else:
+        A = dpnp.astype(A, res_dt, copy=False)
+    a_t = A.T
+
+    omega = _random_normal((n, ncv), res_dt, usm_type, queue, random_state)
+    q, _ = dpnp.linalg.qr(_matmat(A, omega))
+    for _ in range(maxiter):
+        q, _ = dpnp.linalg.qr(_matmat(a_t, q, conj=is_complex))
+        q, _ = dpnp.linalg.qr(_matmat(A, q))
+
+    # decompose the projection Q^H A of shape (ncv, N)
+    proj = _matmat(a_t, q, conj=is_complex).T
+    if is_complex:
+        proj = proj.conj()
+    ub, s, vh = dpnp.linalg.svd(proj, full_matrices=False)
+
+    # singular values in ascending order as the largest ones are first
+    s = s[k - 1 :: -1]
+    if return_singular_vectors is False:
+        return s
+
+    u = None
+    if return_singular_vectors != "vh":
+        u = dpnp.matmul(q, ub[:, k - 1 :: -1])
+    if return_singular_vectors == "u":
+        return u, s, None
+    return u, s, vh[k - 1 :: -1]
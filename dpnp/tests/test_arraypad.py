@@ -420,6 +420,26 @@ class TestPad:
         result = dpnp.pad(a_dp, pad_width, "wrap")
         assert_array_equal(result, expected)
 
+    @pytest.mark.parametrize("mode", ["edge", "reflect", "symmetric", "wrap"])
+    @pytest.mark.parametrize(
+        "pad_width",
+        [
+            ((0, 0), (7, 2), (0, 0)),
+            ((3, 0), (0, 0), (1, 9)),
+            ((2, 5), (4, 4), (0, 1)),
+        ],
+    )
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_copy_modes_nd(self, mode, pad_width, order):
+        a_np = numpy.arange(24).reshape(2, 3, 4)
+        a_np = numpy.asarray(a_np, order=order)
+        a_dp = dpnp.array(a_np)
+        expected = numpy.pad(a_np, pad_width, mode=mode)
+        result = dpnp.pad(a_dp, pad_width, mode=mode)
+        assert_array_equal(result, expected)
+        if order == "F":
+            assert result.flags.f_contiguous
+
     def test_empty(self):
         a_np = numpy.arange(24).reshape(4, 6)
         a_dp = dpnp.array(a_np)
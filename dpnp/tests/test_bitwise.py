@@ -1,6 +1,7 @@
 import numpy
 import pytest
-from numpy.testing import assert_array_equal
+from dpctl.tensor._numpy_helper import AxisError
+from numpy.testing import assert_array_equal, assert_raises
 
 import dpnp
 
@@ -269,3 +270,127 @@ class TestBitwiseUnary:
             _ = self._test_unary("bitwise_invert", val, dtype)
         ia, a = self._test_unary("invert", val, dtype)
         assert_array_equal(~ia, ~a)
+
+
+class TestPackBits:
+    @pytest.mark.parametrize("dtype", [dpnp.bool] + get_integer_dtypes())
+    @pytest.mark.parametrize("shape", [(0,), (13,), (3, 0, 5), (4, 9, 17)])
+    @pytest.mark.parametrize("bitorder", ["big", "little"])
+    def test_packbits(self, dtype, shape, bitorder):
+        a = numpy.arange(numpy.prod(shape)).reshape(shape) % 3
+        a = a.astype(dtype)
+        ia = dpnp.array(a)
+
+        for axis in [None] + list(range(-a.ndim, a.ndim)):
+            result = dpnp.packbits(ia, axis=axis, bitorder=bitorder)
+            expected = numpy.packbits(a, axis=axis, bitorder=bitorder)
+            assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("shape", [(5,), (3, 4), (2, 3, 7)])
+    @pytest.mark.parametrize("count", [None, 0, 3, -2, 100])
+    @pytest.mark.parametrize("bitorder", ["big", "little"])
+    def test_unpackbits(self, shape, count, bitorder):
+        a = (numpy.arange(numpy.prod(shape)) * 37 % 256).reshape(shape)
+        a = a.astype(numpy.uint8)
+        ia = dpnp.array(a)
+
+        for axis in [None] + list(range(-a.ndim, a.ndim)):
+            result = dpnp.unpackbits(
+                ia, axis=axis, count=count, bitorder=bitorder
+            )
+            expected = numpy.unpackbits(
+                a, axis=axis, count=count, bitorder=bitorder
+            )
+            assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    def test_roundtrip(self, axis):
+        a = numpy.arange(77).reshape(7, 11) % 5 == 0
+        ia = dpnp.array(a)
+
+        packed = dpnp.packbits(ia, axis=axis)
+        count = a.size if axis is None else a.shape[axis]
+        result = dpnp.unpackbits(packed, axis=axis, count=count)
+        if axis is None:
+            result = result.reshape(a.shape)
+        assert_array_equal(result, a.astype(numpy.uint8))
+        assert dpnp.bitwise_count(packed).sum() == numpy.count_nonzero(a)
+
+    def test_error(self):
+        ia = dpnp.arange(10, dtype=dpnp.uint8)
+        assert_raises(ValueError, dpnp.packbits, ia, bitorder="b")
+        assert_raises(ValueError, dpnp.unpackbits, ia, bitorder=None)
+        assert_raises(ValueError, dpnp.unpackbits, ia, count=-81)
+        assert_raises(TypeError, dpnp.packbits, ia.astype(dpnp.float32))
+        assert_raises(TypeError, dpnp.unpackbits, ia.astype(dpnp.int8))
+        assert_raises(TypeError, dpnp.unpackbits, ia, count=1.5)
+        assert_raises(AxisError, dpnp.packbits, ia, axis=1)
+
+
+class TestPackedMask:
+    @staticmethod
+    def _get_mask(shape, bitorder="big"):
+        mask = numpy.arange(numpy.prod(shape)).reshape(shape) % 3 == 1
+        packed = dpnp.packbits(dpnp.array(mask), bitorder=bitorder)
+        return mask, packed
+
+    @pytest.mark.parametrize("shape", [(0,), (13,), (4, 9)])
+    def test_count_nonzero(self, shape):
+        mask, packed = self._get_mask(shape)
+        result = dpnp.count_nonzero(packed, packed=True)
+        assert result == numpy.count_nonzero(mask)
+
+    @pytest.mark.parametrize("shape", [(0,), (13,), (4, 9)])
+    @pytest.mark.parametrize("bitorder", ["big", "little"])
+    def test_extract(self, monkeypatch, shape, bitorder):
+        monkeypatch.setattr(
+            "dpnp.dpnp_utils.dpnp_utils_bitmask._CHUNK_BYTES", 2
+        )
+        mask, packed = self._get_mask(shape, bitorder)
+        a = numpy.arange(mask.size).reshape(shape) * 3
+        ia = dpnp.array(a)
+
+        result = dpnp.extract(packed, ia, packed=True, bitorder=bitorder)
+        assert_array_equal(result, numpy.extract(mask, a))
+
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    @pytest.mark.parametrize("bitorder", ["big", "little"])
+    def test_compress(self, monkeypatch, axis, bitorder):
+        monkeypatch.setattr(
+            "dpnp.dpnp_utils.dpnp_utils_bitmask._CHUNK_BYTES", 1
+        )
+        a = numpy.arange(99).reshape(9, 11)
+        ia = dpnp.array(a)
+        mask, packed = self._get_mask(a.size if axis is None else 10, bitorder)
+
+        result = dpnp.compress(
+            packed, ia, axis=axis, packed=True, bitorder=bitorder
+        )
+        assert_array_equal(result, numpy.compress(mask, a, axis=axis))
+
+    @pytest.mark.parametrize("bitorder", ["big", "little"])
+    def test_where(self, monkeypatch, bitorder):
+        monkeypatch.setattr(
+            "dpnp.dpnp_utils.dpnp_utils_bitmask._CHUNK_BYTES", 1
+        )
+        mask, packed = self._get_mask((5, 7), bitorder)
+        x = numpy.arange(7)
+        ix = dpnp.array(x)
+
+        result = dpnp.where(packed, ix, -1, packed=True, bitorder=bitorder)
+        assert_array_equal(result, numpy.where(mask, x, -1))
+
+        (result,) = dpnp.where(packed, packed=True, bitorder=bitorder)
+        assert_array_equal(result, numpy.flatnonzero(mask))
+
+    def test_error(self):
+        _, packed = self._get_mask((13,))
+        ia = dpnp.arange(20)
+        assert_raises(ValueError, dpnp.extract, packed, ia, packed=True)
+        assert_raises(ValueError, dpnp.where, packed, ia, 0, packed=True)
+        assert_raises(
+            ValueError, dpnp.extract, packed.reshape(2, 1), ia[:13], packed=True
+        )
+        assert_raises(
+            TypeError, dpnp.count_nonzero, packed.astype("i1"), packed=True
+        )
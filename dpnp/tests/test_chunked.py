@@ -0,0 +1,164 @@
+import numpy
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal, assert_raises
+
+import dpnp
+
+from .helper import (
+    generate_random_numpy_array,
+    get_all_dtypes,
+    has_support_aspect64,
+)
+
+
+class TestMapChunks:
+    @pytest.mark.parametrize("chunk_size", [None, 1, 3, 7, 20])
+    def test_device_result(self, chunk_size):
+        a = numpy.arange(14.0, dtype="f4").reshape(7, 2)
+        b = numpy.ones((7, 2), dtype="f4")
+
+        result = dpnp.map_chunks(
+            lambda x, y: x * 2 + y, a, b, chunk_size=chunk_size
+        )
+        assert isinstance(result, dpnp.ndarray)
+        assert_allclose(result, a * 2 + b)
+
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    def test_host_out(self, axis):
+        a = generate_random_numpy_array((5, 6, 4), dtype="f4")
+        out = numpy.empty_like(a)
+
+        result = dpnp.map_chunks(dpnp.sin, a, axis=axis, chunk_size=2, out=out)
+        assert result is out
+        assert_allclose(out, numpy.sin(a), rtol=1e-6)
+
+    def test_memmap(self, tmp_path):
+        a = numpy.lib.format.open_memmap(
+            tmp_path / "a.npy", mode="w+", dtype="i4", shape=(100, 3)
+        )
+        a[...] = numpy.arange(300, dtype="i4").reshape(100, 3)
+        out = numpy.lib.format.open_memmap(
+            tmp_path / "out.npy", mode="w+", dtype="i4", shape=(100,)
+        )
+
+        dpnp.map_chunks(
+            lambda x: dpnp.sum(x, axis=1), a, chunk_size=16, out=out
+        )
+        out.flush()
+        assert_array_equal(numpy.load(tmp_path / "out.npy"), a.sum(axis=1))
+
+    def test_device_input(self):
+        a = numpy.arange(10, dtype="i4")
+        b = dpnp.arange(10, dtype="i4")
+
+        result = dpnp.map_chunks(dpnp.add, a, b, chunk_size=3)
+        assert result.sycl_queue == b.sycl_queue
+        assert_array_equal(result, 2 * a)
+
+    def test_cast_out(self):
+        a = numpy.arange(10, dtype="i4")
+        out = numpy.empty(10, dtype="i8")
+
+        dpnp.map_chunks(lambda x: x + 1, a, chunk_size=4, out=out)
+        assert_array_equal(out, a + 1)
+
+    def test_empty(self):
+        a = numpy.empty((0, 3), dtype="f4")
+        result = dpnp.map_chunks(dpnp.negative, a)
+        assert result.shape == (0, 3)
+
+    def test_error(self):
+        a = numpy.arange(10)
+        assert_raises(TypeError, dpnp.map_chunks, None, a)
+        assert_raises(TypeError, dpnp.map_chunks, dpnp.abs)
+        assert_raises(ValueError, dpnp.map_chunks, dpnp.add, a, a[:5])
+        assert_raises(ValueError, dpnp.map_chunks, dpnp.abs, a, chunk_size=0)
+        assert_raises(ValueError, dpnp.map_chunks, dpnp.sum, a, chunk_size=3)
+        assert_raises(
+            ValueError, dpnp.map_chunks, dpnp.abs, a, out=numpy.empty(5)
+        )
+        assert_raises(
+            TypeError, dpnp.map_chunks, dpnp.abs, a, out=dpnp.empty(10)
+        )
+
+
+class TestReduceChunks:
+    @pytest.mark.parametrize(
+        "dtype", get_all_dtypes(no_none=True, no_bool=True, no_complex=True)
+    )
+    @pytest.mark.parametrize(
+        "reduction", ["sum", "max", "min", "mean", "argmax", "argmin"]
+    )
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    def test_reduction(self, dtype, reduction, axis):
+        a = generate_random_numpy_array((11, 4), dtype=dtype, low=-5, high=5)
+
+        result = dpnp.reduce_chunks(
+            None, a, reduction=reduction, axis=axis, chunk_size=3
+        )
+        expected = getattr(numpy, reduction)(a, axis=axis)
+        assert_allclose(result, expected, rtol=1e-5)
+
+    @pytest.mark.parametrize("reduction", ["var", "std"])
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    @pytest.mark.parametrize("ddof", [0, 1])
+    def test_variance(self, reduction, axis, ddof):
+        dtype = dpnp.default_float_type()
+        a = generate_random_numpy_array((11, 6), dtype=dtype) + 1000
+
+        result = dpnp.reduce_chunks(
+            None, a, reduction=reduction, axis=axis, ddof=ddof, chunk_size=4
+        )
+        expected = getattr(numpy, reduction)(a, axis=axis, ddof=ddof)
+        assert_allclose(result, expected, rtol=1e-4)
+
+    def test_func(self):
+        a = numpy.arange(12.0, dtype="f4").reshape(6, 2)
+        b = numpy.full((6, 2), 2.0, dtype="f4")
+
+        result = dpnp.reduce_chunks(lambda x, y: x * y, a, b, chunk_size=4)
+        assert_allclose(result, (a * b).sum())
+
+    def test_prod(self):
+        a = numpy.arange(1, 9, dtype="i8")
+        result = dpnp.reduce_chunks(None, a, reduction="prod", chunk_size=3)
+        assert result == numpy.prod(a)
+
+    @pytest.mark.parametrize("reduction", ["argmax", "argmin", "max", "min"])
+    def test_nan(self, reduction):
+        a = numpy.array([1.0, 2.0, numpy.nan, 4.0, numpy.nan, 0.0], dtype="f4")
+        result = dpnp.reduce_chunks(None, a, reduction=reduction, chunk_size=2)
+        assert_array_equal(result, getattr(numpy, reduction)(a))
+
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    def test_keepdims(self, axis):
+        a = numpy.arange(12, dtype="f4").reshape(4, 3)
+        result = dpnp.reduce_chunks(
+            None, a, axis=axis, keepdims=True, chunk_size=3
+        )
+        assert_allclose(result, a.sum(axis=axis, keepdims=True))
+
+    def test_memmap(self, tmp_path):
+        a = numpy.lib.format.open_memmap(
+            tmp_path / "a.npy", mode="w+", dtype="f4", shape=(1000, 2)
+        )
+        a[...] = generate_random_numpy_array((1000, 2), dtype="f4")
+
+        result = dpnp.reduce_chunks(
+            None, a, reduction="mean", axis=0, chunk_size=64
+        )
+        assert_allclose(result, a.mean(axis=0), rtol=1e-5)
+
+    @pytest.mark.skipif(not has_support_aspect64(), reason="fp64 required")
+    def test_big_endian(self):
+        a = numpy.arange(10, dtype=">f8")
+        result = dpnp.reduce_chunks(None, a, chunk_size=3)
+        assert result.dtype == numpy.float64
+        assert result == 45
+
+    def test_error(self):
+        a = numpy.arange(10)
+        assert_raises(TypeError, dpnp.reduce_chunks, None, a, a)
+        assert_raises(TypeError, dpnp.reduce_chunks, 1, a)
+        assert_raises(ValueError, dpnp.reduce_chunks, None, a, reduction="x")
+        assert_raises(ValueError, dpnp.reduce_chunks, None, numpy.array(1))
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+import dpnp
+
+
+@pytest.fixture
+def fallback_config(monkeypatch):
+    monkeypatch.setattr(dpnp.config, "_fallback_default_policy", None)
+    monkeypatch.setattr(dpnp.config, "_fallback_policies", {})
+    monkeypatch.setattr(dpnp.config, "_fallback_stats", {})
+
+
+@pytest.mark.usefixtures("fallback_config")
+class TestFallback:
+    def test_default_policy(self, monkeypatch):
+        monkeypatch.setattr(
+            dpnp.config, "__DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK__", 1
+        )
+        assert dpnp.config.get_fallback_policy() == "raise"
+        assert dpnp.config.get_fallback_policy("choice") == "raise"
+
+        monkeypatch.setattr(
+            dpnp.config, "__DPNP_RAISE_EXCEPION_ON_NUMPY_FALLBACK__", 0
+        )
+        assert dpnp.config.get_fallback_policy() == "allow"
+
+    def test_set_policy(self):
+        dpnp.config.set_fallback_policy("warn")
+        dpnp.config.set_fallback_policy("raise", "choice")
+        assert dpnp.config.get_fallback_policy() == "warn"
+        assert dpnp.config.get_fallback_policy("choice") == "raise"
+        assert dpnp.config.get_fallback_policy("beta") == "warn"
+
+        dpnp.config.set_fallback_policy(None, "choice")
+        assert dpnp.config.get_fallback_policy("choice") == "warn"
+
+    def test_set_policy_error(self):
+        with pytest.raises(ValueError):
+            dpnp.config.set_fallback_policy("ignore")
+
+    def test_raise(self):
+        dpnp.config.set_fallback_policy("raise", "choice")
+        with pytest.raises(NotImplementedError):
+            dpnp.random.choice(dpnp.arange(10), 3)
+        assert dpnp.config.get_fallback_stats() == {}
+
+    def test_warn(self):
+        dpnp.config.set_fallback_policy("warn", "choice")
+        with pytest.warns(dpnp.config.NumPyFallbackWarning):
+            dpnp.random.choice(dpnp.arange(10), 3)
+
+    def test_stats(self):
+        dpnp.config.set_fallback_policy("allow", "choice")
+        a = dpnp.arange(10)
+        for _ in range(2):
+            res = dpnp.random.choice(a, 3)
+
+        stats = dpnp.config.get_fallback_stats()
+        assert list(stats) == ["choice"]
+        assert stats["choice"]["count"] == 2
+        assert stats["choice"]["bytes_to_host"] == 2 * a.nbytes
+        assert stats["choice"]["bytes_to_device"] == 2 * res.nbytes
+        assert stats["choice"]["time"] > 0
+
+        # the returned statistics is a copy
+        stats["choice"]["count"] = 0
+        assert dpnp.config.get_fallback_stats()["choice"]["count"] == 2
+
+        dpnp.config.reset_fallback_stats()
+        assert dpnp.config.get_fallback_stats() == {}
+
+    def test_allowed_fallback(self):
+        # seed is implemented by a fallback only and allowed by default
+        dpnp.config.set_fallback_policy("raise")
+        dpnp.random.seed(1)
+        assert dpnp.config.get_fallback_stats()["seed"]["count"] == 1
+
+        dpnp.config.set_fallback_policy("raise", "seed")
+        with pytest.raises(NotImplementedError):
+            dpnp.random.seed(1)
+
+    def test_eig(self):
+        a = dpnp.array([[1.0, 2.0], [3.0, 4.0]])
+        dpnp.linalg.eig(a)
+        dpnp.linalg.eigvals(a)
+        stats = dpnp.config.get_fallback_stats()
+        assert stats["eig"]["count"] == 1
+        assert stats["eig"]["bytes_to_host"] == a.nbytes
+        assert stats["eigvals"]["count"] == 1
+
+        dpnp.config.set_fallback_policy("raise", "eig")
+        with pytest.raises(NotImplementedError):
+            dpnp.linalg.eig(a)
+        assert dpnp.config.get_fallback_stats()["eig"]["count"] == 1
+
+    def test_loadtxt(self):
+        res = dpnp.loadtxt(io.StringIO("1 2\n3 4"))
+        stats = dpnp.config.get_fallback_stats()
+        assert stats["loadtxt"]["count"] == 1
+        assert stats["loadtxt"]["bytes_to_device"] == res.nbytes
+
+        dpnp.config.set_fallback_policy("raise", "loadtxt")
+        with pytest.raises(NotImplementedError):
+            dpnp.loadtxt(io.StringIO("1 2\n3 4"))
+
+        dpnp.config.set_fallback_policy("warn", "fromfunction")
+        with pytest.warns(dpnp.config.NumPyFallbackWarning):
+            dpnp.fromfunction(lambda i: i, (3,))
@@ -27,6 +27,54 @@ class TestFlatiter:
         for dp_val, np_val in zip(a_dp.flat, a.flat):
             assert dp_val == np_val
 
+    @pytest.mark.parametrize("block_size", [1, 3, 65536])
+    def test_flat_iteration_blocks(self, monkeypatch, block_size):
+        monkeypatch.setattr(dpnp.flatiter, "block_size", block_size)
+
+        a = np.arange(24).reshape(2, 3, 4).transpose(2, 0, 1)
+        a_dp = dpnp.array(a)
+        result = list(a_dp.flat)
+        assert result == list(a.flat)
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            slice(None),
+            slice(1, 5),
+            slice(None, None, -2),
+            [0, 3, 5],
+            np.array([[1, 2], [4, 0]]),
+            np.array([True, False, True, True, False, False]),
+        ],
+        ids=["slice", "slice(1, 5)", "reverse", "list", "2D array", "mask"],
+    )
+    def test_flat_getitem_vectorized(self, index):
+        a = np.arange(1, 7).reshape(2, 3).T
+        a_dp = dpnp.array(a)
+        index_dp = dpnp.array(index) if isinstance(index, np.ndarray) else index
+
+        result = a_dp.flat[index_dp]
+        expected = a.flat[index]
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            slice(1, 5),
+            [0, 3, 5],
+            np.array([True, False, True, True, False, False]),
+        ],
+        ids=["slice", "list", "mask"],
+    )
+    def test_flat_setitem_vectorized(self, index):
+        a = np.arange(1, 7).reshape(2, 3).T
+        a_dp = dpnp.array(a)
+        index_dp = dpnp.array(index) if isinstance(index, np.ndarray) else index
+
+        a_dp.flat[index_dp] = -1
+        a.flat[index] = -1
+        assert_array_equal(a_dp, a)
+
     def test_init_error(self):
         assert_raises(TypeError, dpnp.flatiter, [1, 2, 3])
 
@@ -50,3 +98,22 @@ class TestFlatiter:
         flat = dpnp.flatiter(a_dp)
         with pytest.raises(IndexError):
             _ = flat[10]
+
+    def test_flat_slice_copy(self):
+        a_dp = dpnp.arange(6)
+        result = a_dp.flat[1:4]
+        result[0] = -1
+        assert_array_equal(a_dp, np.arange(6))
+
+    @pytest.mark.parametrize(
+        "index",
+        [[0, 6], [-7], np.array([True, False]), np.ones((2, 3), dtype=bool)],
+        ids=["list", "negative", "short mask", "2D mask"],
+    )
+    def test_flat_index_error(self, index):
+        a_dp = dpnp.arange(6).reshape(2, 3)
+        index_dp = dpnp.array(index)
+        with pytest.raises(IndexError):
+            _ = a_dp.flat[index_dp]
+        with pytest.raises(IndexError):
+            a_dp.flat[index_dp] = 0
@@ -4,7 +4,11 @@ from numpy.testing import assert_array_equal, assert_raises
 
 import dpnp
 
-from .helper import get_all_dtypes
+from .helper import (
+    assert_dtype_allclose,
+    generate_random_numpy_array,
+    get_all_dtypes,
+)
 
 
 class TestApplyAlongAxis:
@@ -47,6 +51,77 @@ class TestApplyAlongAxis:
         result = dpnp.apply_along_axis(dpnp.mean, 0, ia, 0, dtype, None, True)
         assert_array_equal(result, expected)
 
+    @pytest.mark.parametrize(
+        "func", ["sum", "argmax", "cumsum", "sort", "median", "abs"]
+    )
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    def test_axis_aware_func(self, func, axis):
+        a = generate_random_numpy_array((4, 5, 6), seed_value=0)
+        ia = dpnp.array(a)
+
+        expected = numpy.apply_along_axis(getattr(numpy, func), axis, a)
+        result = dpnp.apply_along_axis(getattr(dpnp, func), axis, ia)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    def test_vectorized(self, axis):
+        a = numpy.arange(60).reshape(3, 4, 5)
+        ia = dpnp.array(a)
+
+        def func1d(x):
+            return x[[0, -1]] * 2
+
+        def vfunc(x):
+            return dpnp.stack((x[..., 0], x[..., -1]), axis=-1) * 2
+
+        expected = numpy.apply_along_axis(func1d, axis, a)
+        result = dpnp.apply_along_axis(vfunc, axis, ia, vectorized=True)
+        assert_array_equal(result, expected)
+
+        # function reducing the slices
+        expected = numpy.apply_along_axis(numpy.sum, axis, a)
+        result = dpnp.apply_along_axis(
+            lambda x: x.sum(axis=-1), axis, ia, vectorized=True
+        )
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("host", [True, False])
+    def test_chunked(self, monkeypatch, host):
+        monkeypatch.setattr(dpnp.dpnp_iface_functional, "_CHUNK_SLICES", 4)
+        a = numpy.arange(60.0).reshape(3, 4, 5)
+        ia = dpnp.array(a)
+
+        def func1d(x):
+            res = x[::2] * x[-1]
+            return res.asnumpy() if host else res
+
+        expected = numpy.apply_along_axis(lambda x: x[::2] * x[-1], 1, a)
+        result = dpnp.apply_along_axis(func1d, 1, ia)
+        assert_array_equal(result, expected)
+
+    def test_vectorized_error(self):
+        ia = dpnp.ones((3, 4))
+        assert_raises(
+            ValueError,
+            dpnp.apply_along_axis,
+            lambda x: x.sum(),
+            0,
+            ia,
+            vectorized=True,
+        )
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_empty(self, vectorized):
+        ia = dpnp.ones((0, 4))
+        assert_raises(
+            ValueError,
+            dpnp.apply_along_axis,
+            dpnp.sum,
+            1,
+            ia,
+            vectorized=vectorized,
+        )
+
 
 class TestApplyOverAxes:
     @pytest.mark.parametrize("func", ["sum", "cumsum"])
@@ -1168,6 +1168,35 @@ class TestRavelIndex:
         result = dpnp.ravel_multi_index(x_dp, (4, 4), mode=("clip", "wrap"))
         assert_equal(expected, result)
 
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize(
+        "mode",
+        ["wrap", "clip", ("clip", "raise", "wrap"), ("wrap", "clip", "raise")],
+    )
+    def test_mode_broadcast(self, mode, order):
+        a = numpy.array([[2, 0, -1], [-4, 1, 5]])
+        b = numpy.array([[1], [3]])
+        c = numpy.array(4)
+        ia, ib, ic = dpnp.array(a), dpnp.array(b), dpnp.array(c)
+
+        expected = numpy.ravel_multi_index(
+            (a, b, c), (3, 4, 5), mode=mode, order=order
+        )
+        result = dpnp.ravel_multi_index(
+            (ia, ib, ic), (3, 4, 5), mode=mode, order=order
+        )
+        assert_equal(result, expected)
+
+    def test_mode_raise_mixed_error(self):
+        x = dpnp.array([[3, 6, 6], [4, 5, 1]])
+        assert_raises(
+            ValueError,
+            dpnp.ravel_multi_index,
+            x,
+            (4, 6),
+            mode=("clip", "raise"),
+        )
+
     def test_order_f(self):
         x_np = numpy.array([[3, 6, 6], [4, 5, 1]])
         x_dp = dpnp.array([[3, 6, 6], [4, 5, 1]])
@@ -1233,6 +1262,19 @@ class TestUnravelIndex:
         result = dpnp.unravel_index(x_dp, (7, 6), order="F")
         assert_equal(expected, result)
 
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize("shape", [(60,), (3, 20), (3, 4, 5), (2, 1, 6, 5)])
+    def test_round_trip(self, shape, order):
+        a = numpy.arange(60).reshape(6, 10)
+        ia = dpnp.array(a)
+
+        expected = numpy.unravel_index(a, shape, order=order)
+        result = dpnp.unravel_index(ia, shape, order=order)
+        assert_equal(result, expected)
+
+        result = dpnp.ravel_multi_index(result, shape, order=order)
+        assert_equal(result, a)
+
     def test_new_shape(self):
         expected = numpy.unravel_index(numpy.array(2), shape=(2, 2))
         result = dpnp.unravel_index(dpnp.array(2), shape=(2, 2))
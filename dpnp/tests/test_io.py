@@ -0,0 +1,189 @@
+import io
+import tempfile
+import zipfile
+
+import numpy
+import pytest
+from numpy.testing import assert_array_equal
+
+import dpnp
+from dpnp.dpnp_utils import dpnp_utils_io
+
+from .helper import get_all_dtypes
+
+
+@pytest.fixture(params=[None, 24], ids=["default_chunk", "small_chunk"])
+def chunk_bytes(request, monkeypatch):
+    # small chunks to cover streaming with many chunks and reused buffers
+    if request.param is not None:
+        monkeypatch.setattr(dpnp_utils_io, "_CHUNK_BYTES", request.param)
+    return request.param
+
+
+@pytest.mark.usefixtures("chunk_bytes")
+class TestSaveLoad:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("shape", [(), (0,), (7,), (3, 5), (2, 3, 4)])
+    def test_roundtrip(self, tmp_path, dtype, shape):
+        a = numpy.arange(numpy.prod(shape)).astype(dtype).reshape(shape)
+        ia = dpnp.array(a)
+
+        path = tmp_path / "a.npy"
+        dpnp.save(path, ia)
+        assert_array_equal(numpy.load(path), a)
+
+        result = dpnp.load(path)
+        assert isinstance(result, dpnp.ndarray)
+        assert result.dtype == ia.dtype
+        assert_array_equal(result, a)
+
+    @pytest.mark.parametrize(
+        "slices",
+        [
+            (slice(None), slice(None)),
+            (slice(None, None, 2), slice(None)),
+            (slice(None), slice(None, None, -3)),
+            (slice(1, None), slice(2, 9)),
+        ],
+        ids=["full", "rows", "negative", "offset"],
+    )
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_layout(self, slices, order):
+        a = numpy.arange(6 * 11, dtype="f4").reshape(6, 11, order=order)
+        ia = dpnp.array(a, order=order)
+        a, ia = a[slices], ia[slices]
+
+        fh = io.BytesIO()
+        dpnp.save(fh, ia)
+        fh.seek(0)
+        expected = numpy.load(fh)
+        assert_array_equal(expected, a)
+        assert expected.flags.f_contiguous == (
+            a.flags.f_contiguous and not a.flags.c_contiguous
+        )
+
+        fh.seek(0)
+        result = dpnp.load(fh)
+        assert result.flags.f_contiguous == expected.flags.f_contiguous
+        assert_array_equal(result, a)
+
+    def test_load_numpy_file(self, tmp_path):
+        a = numpy.asfortranarray(numpy.arange(24).reshape(2, 3, 4))
+        numpy.save(tmp_path / "a.npy", a)
+
+        result = dpnp.load(tmp_path / "a.npy", usm_type="host")
+        assert result.usm_type == "host"
+        assert_array_equal(result, a)
+
+    def test_suffix(self, tmp_path):
+        dpnp.save(str(tmp_path / "a"), dpnp.ones(3))
+        assert (tmp_path / "a.npy").exists()
+
+    def test_save_array_like(self, tmp_path):
+        dpnp.save(tmp_path / "a.npy", [[1, 2], [3, 4]])
+        assert_array_equal(dpnp.load(tmp_path / "a.npy"), [[1, 2], [3, 4]])
+
+    def test_mmap_mode(self, tmp_path):
+        a = numpy.arange(20).reshape(4, 5)
+        dpnp.save(tmp_path / "a.npy", dpnp.array(a))
+
+        mm = dpnp.load(tmp_path / "a.npy", mmap_mode="r")
+        assert isinstance(mm, numpy.memmap)
+        assert_array_equal(dpnp.asarray(mm[1:3]), a[1:3])
+
+    @pytest.mark.parametrize("version", [(1, 0), (2, 0), (3, 0)])
+    def test_load_format_version(self, version):
+        a = numpy.arange(12, dtype="f4").reshape(3, 4)
+        fh = io.BytesIO()
+        numpy.lib.format.write_array(fh, a, version=version)
+
+        fh.seek(0)
+        result = dpnp.load(fh)
+        assert_array_equal(result, a)
+
+    def test_truncated(self):
+        fh = io.BytesIO()
+        dpnp.save(fh, dpnp.arange(10))
+        fh = io.BytesIO(fh.getvalue()[:-4])
+        with pytest.raises(ValueError):
+            dpnp.load(fh)
+
+
+@pytest.mark.usefixtures("chunk_bytes")
+class TestSavez:
+    @pytest.mark.parametrize("func", ["savez", "savez_compressed"])
+    def test_basic(self, tmp_path, func):
+        a = numpy.arange(10, dtype="i4")
+        b = numpy.arange(12, dtype="f4").reshape(3, 4).T
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        getattr(dpnp, func)(tmp_path / "x", ia, b=ib)
+        with numpy.load(tmp_path / "x.npz") as data:
+            assert sorted(data.files) == ["arr_0", "b"]
+            assert_array_equal(data["arr_0"], a)
+            assert_array_equal(data["b"], b)
+
+        with dpnp.load(tmp_path / "x.npz") as data:
+            assert sorted(data.files) == ["arr_0", "b"]
+            assert isinstance(data["b"], dpnp.ndarray)
+            assert_array_equal(data["arr_0"], a)
+            assert_array_equal(data["b.npy"], b)
+            with pytest.raises(KeyError):
+                data["c"]
+
+    def test_not_npy_member(self, tmp_path):
+        dpnp.savez(tmp_path / "x", a=dpnp.arange(3))
+        with zipfile.ZipFile(tmp_path / "x.npz", mode="a") as zipf:
+            zipf.writestr("raw.txt", b"raw data")
+
+        with dpnp.load(tmp_path / "x.npz") as data:
+            assert data["raw.txt"] == b"raw data"
+            assert_array_equal(data["a"], numpy.arange(3))
+
+    def test_name_conflict(self, tmp_path):
+        with pytest.raises(ValueError):
+            dpnp.savez(tmp_path / "x", dpnp.ones(2), arr_0=dpnp.ones(2))
+
+
+@pytest.mark.usefixtures("chunk_bytes")
+class TestToFile:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_binary(self, tmp_path, dtype):
+        a = numpy.arange(30).astype(dtype).reshape(5, 6)[::2, 1:].T
+        ia = dpnp.array(numpy.arange(30).astype(dtype).reshape(5, 6))
+        ia = ia[::2, 1:].T
+
+        ia.tofile(tmp_path / "a.bin")
+        expected = numpy.fromfile(tmp_path / "a.bin", dtype=dtype)
+        assert_array_equal(expected, a.ravel())
+
+        result = dpnp.fromfile(tmp_path / "a.bin", dtype=dtype)
+        assert_array_equal(result, a.ravel())
+
+    def test_text(self, tmp_path):
+        a = numpy.arange(5, dtype="f4")
+        dpnp.array(a).tofile(tmp_path / "a.txt", sep=",", format="%.1f")
+        assert (tmp_path / "a.txt").read_text() == "0.0,1.0,2.0,3.0,4.0"
+
+    def test_fromfile_count_offset(self):
+        a = numpy.arange(10, dtype="i2")
+        with tempfile.TemporaryFile() as fh:
+            dpnp.array(a).tofile(fh)
+            fh.seek(0)
+            result = dpnp.fromfile(fh, dtype="i2", count=4, offset=4)
+            assert_array_equal(result, a[2:6])
+            assert fh.tell() == 12
+
+    @pytest.mark.parametrize("count", [-1, 8, 20])
+    def test_fromfile_count_exceeds(self, count):
+        a = numpy.arange(10, dtype="i2")
+        with tempfile.TemporaryFile() as fh:
+            a.tofile(fh)
+            fh.seek(4)
+            expected = numpy.fromfile(fh, dtype="i2", count=count)
+            expected_pos = fh.tell()
+
+            fh.seek(4)
+            result = dpnp.fromfile(fh, dtype="i2", count=count)
+            assert_array_equal(result, expected)
+            assert fh.tell() == expected_pos
@@ -15,6 +15,7 @@ from numpy.testing import (
 )
 
 import dpnp
+from dpnp.dpnp_utils import dpnp_utils_einsum
 
 from .helper import (
     assert_dtype_allclose,
@@ -1676,6 +1677,89 @@ class TestEinsum:
         assert expected[0] == result[0]
         assert expected[1] == result[1]
 
+    @pytest.mark.parametrize("optimize", ["greedy", "optimal"])
+    def test_einsum_plan_cache(self, optimize):
+        a = numpy.random.rand(2, 3)
+        b = numpy.random.rand(3, 4)
+        c = numpy.random.rand(4, 5)
+        a_dp, b_dp, c_dp = dpnp.array(a), dpnp.array(b), dpnp.array(c)
+
+        subscripts = "ij,jk,kl->il"
+        expected = numpy.einsum(subscripts, a, b, c, optimize=optimize)
+
+        path_cache = dpnp_utils_einsum._optimize_path
+        result = dpnp.einsum(subscripts, a_dp, b_dp, c_dp, optimize=optimize)
+        hits = path_cache.cache_info().hits
+        for _ in range(3):
+            result = dpnp.einsum(
+                subscripts, a_dp, b_dp, c_dp, optimize=optimize
+            )
+            assert_dtype_allclose(result, expected)
+        assert path_cache.cache_info().hits == hits + 3
+
+        # different shapes must not reuse the cached path
+        result = dpnp.einsum(
+            subscripts, a_dp[:1], b_dp, c_dp, optimize=optimize
+        )
+        assert_dtype_allclose(result, expected[:1])
+        assert path_cache.cache_info().hits == hits + 3
+
+    def test_einsum_parse_cache_read_only(self):
+        parse = dpnp_utils_einsum._parse_einsum_subscripts
+        _, _, dimension_dict = parse(("ij", "jk"), "ik", ((2, 3), (3, 4)))
+        with pytest.raises(TypeError):
+            dimension_dict[0] = 5
+
+        _, _, dimension_dict = parse(("ij", "jk"), "ik", ((2, 3), (3, 4)))
+        assert dict(dimension_dict) == {ord("i"): 2, ord("j"): 3, ord("k"): 4}
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    @pytest.mark.parametrize(
+        "axes_a, axes_b",
+        [
+            ((0, 1, 2, 3), (0, 1, 2, 3)),
+            ((2, 3, 0, 1), (1, 0, 3, 2)),
+            ((3, 2, 1, 0), (2, 3, 0, 1)),
+            ((1, 3, 0, 2), (3, 1, 2, 0)),
+        ],
+    )
+    def test_einsum_strided_operands(self, dtype, axes_a, axes_b):
+        # operands with different memory layouts to cover both contraction
+        # through strided views and the fallback with copying
+        a = generate_random_numpy_array((4, 5, 6, 3), dtype, seed_value=0)
+        b = generate_random_numpy_array((6, 3, 5, 7), dtype, seed_value=1)
+        a = numpy.ascontiguousarray(a.transpose(axes_a))
+        b = numpy.ascontiguousarray(b.transpose(axes_b))
+        ia = dpnp.array(a).transpose(numpy.argsort(axes_a))
+        ib = dpnp.array(b).transpose(numpy.argsort(axes_b))
+        a = a.transpose(numpy.argsort(axes_a))
+        b = b.transpose(numpy.argsort(axes_b))
+
+        for subscripts in ["abcd,cdbe->abe", "abcd,cdbe->eba", "abcd,cdbe"]:
+            expected = numpy.einsum(subscripts, a, b)
+            result = dpnp.einsum(subscripts, ia, ib)
+            assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("subscripts", ["ii->i", "iij->ji", "ijj"])
+    def test_einsum_diagonal_offset_view(self, subscripts):
+        a = numpy.arange(4 * 4 * 4).reshape(4, 4, 4)[1:, 1:, 1:]
+        ia = dpnp.arange(4 * 4 * 4).reshape(4, 4, 4)[1:, 1:, 1:]
+        if subscripts == "ii->i":
+            a, ia = a[0], ia[0]
+
+        expected = numpy.einsum(subscripts, a)
+        result = dpnp.einsum(subscripts, ia)
+        assert_array_equal(result, expected)
+
+    def test_einsum_path_reuse(self):
+        a = dpnp.ones((2, 3))
+        b = dpnp.ones((3, 4))
+        c = dpnp.ones((4, 5))
+
+        path, _ = dpnp.einsum_path("ij,jk,kl->il", a, b, c)
+        result = dpnp.einsum("ij,jk,kl->il", a, b, c, optimize=path)
+        assert_array_equal(result, dpnp.full((2, 5), 12.0))
+
 
 class TestInv:
     @pytest.mark.parametrize(
@@ -463,6 +463,71 @@ class TestIsFortran:
         assert_raises(TypeError, dpnp.isfortran, [1, 2, 3])
 
 
+class TestIsin:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("kind", [None, "sort", "table"])
+    @pytest.mark.parametrize("invert", [False, True])
+    def test_basic(self, dtype, kind, invert):
+        a = numpy.arange(24).reshape(2, 3, 4).astype(dtype)
+        b = numpy.array([3, 1, 8, 30, 8, 0]).astype(dtype)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        if kind == "table" and dpnp.issubdtype(dtype, dpnp.inexact):
+            assert_raises(ValueError, dpnp.isin, ia, ib, kind=kind)
+            return
+
+        result = dpnp.isin(ia, ib, invert=invert, kind=kind)
+        expected = numpy.isin(a, b, invert=invert)
+        assert_equal(result, expected)
+
+    def test_large_range(self):
+        a = numpy.array([-(2**40), 0, 5, 2**40], dtype="i8")
+        b = numpy.array([2**40, 5, -7], dtype="i8")
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        assert_equal(dpnp.isin(ia, ib), numpy.isin(a, b))
+
+    @pytest.mark.parametrize(
+        "dt1, dt2", [("i1", "i8"), ("u1", "i2"), ("i4", "f4"), ("u8", "i4")]
+    )
+    def test_mixed_dtypes(self, dt1, dt2):
+        a = numpy.arange(0, 15).astype(dt1)
+        b = numpy.array([0, 3, 9, 100]).astype(dt2)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        assert_equal(dpnp.isin(ia, ib), numpy.isin(a, b))
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_nan(self, dtype):
+        a = numpy.array([1, numpy.nan, 3, 4], dtype=dtype)
+        b = numpy.array([numpy.nan, 3], dtype=dtype)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        assert_equal(dpnp.isin(ia, ib), numpy.isin(a, b))
+
+    def test_scalar(self):
+        ia = dpnp.array([1, 2, 3])
+        assert_equal(dpnp.isin(2, ia), numpy.isin(2, [1, 2, 3]))
+        assert_equal(dpnp.isin(ia, 2), numpy.isin([1, 2, 3], 2))
+
+    @pytest.mark.parametrize("invert", [False, True])
+    def test_empty(self, invert):
+        a = numpy.arange(5)
+        b = numpy.array([], dtype=a.dtype)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = dpnp.isin(ia, ib, invert=invert)
+        assert_equal(result, numpy.isin(a, b, invert=invert))
+        result = dpnp.isin(ib, ia, invert=invert)
+        assert_equal(result, numpy.isin(b, a, invert=invert))
+
+    def test_error(self):
+        ia = dpnp.arange(5)
+        assert_raises(TypeError, dpnp.isin, numpy.arange(5), ia)
+        assert_raises(TypeError, dpnp.isin, 1, 2)
+        assert_raises(ValueError, dpnp.isin, ia, ia, kind="hash")
+
+
 @pytest.mark.parametrize("func", ["isneginf", "isposinf"])
 @pytest.mark.parametrize(
     "data",
@@ -14,6 +14,7 @@ import dpnp
 
 from .helper import (
     assert_dtype_allclose,
+    generate_random_numpy_array,
     get_all_dtypes,
     get_array,
     get_complex_dtypes,
@@ -1422,6 +1423,75 @@ class TestTranspose:
         assert_array_equal(result, expected)
 
 
+class TestSetOps:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize(
+        "func", ["intersect1d", "setdiff1d", "setxor1d", "union1d"]
+    )
+    def test_basic(self, func, dtype):
+        a = generate_random_numpy_array((4, 5), "i4", low=0, high=10)
+        b = generate_random_numpy_array(7, "i4", low=5, high=15, seed_value=1)
+        a, b = a.astype(dtype), b.astype(dtype)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = getattr(dpnp, func)(ia, ib)
+        expected = getattr(numpy, func)(a, b)
+        assert_array_equal(result, expected)
+        assert result.sycl_queue == ia.sycl_queue
+
+    @pytest.mark.parametrize("func", ["intersect1d", "setdiff1d", "setxor1d"])
+    def test_assume_unique(self, func):
+        a = numpy.array([5, 1, 7, 3, 9])
+        b = numpy.array([2, 3, 8, 5])
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = getattr(dpnp, func)(ia, ib, assume_unique=True)
+        expected = getattr(numpy, func)(a, b, assume_unique=True)
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("assume_unique", [False, True])
+    def test_intersect1d_return_indices(self, assume_unique):
+        a = numpy.array([7, 2, 9, 4, 1])
+        b = numpy.array([4, 6, 1, 2, 8, 3])
+        if not assume_unique:
+            a = numpy.concatenate((a, a[::-1]))
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = dpnp.intersect1d(
+            ia, ib, assume_unique=assume_unique, return_indices=True
+        )
+        expected = numpy.intersect1d(
+            a, b, assume_unique=assume_unique, return_indices=True
+        )
+        for iv, v in zip(result, expected):
+            assert_array_equal(iv, v)
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    @pytest.mark.parametrize(
+        "func", ["intersect1d", "setdiff1d", "setxor1d", "union1d"]
+    )
+    def test_nan(self, func, dtype):
+        a = numpy.array([1, numpy.nan, 3, numpy.nan], dtype=dtype)
+        b = numpy.array([numpy.nan, 3, 5], dtype=dtype)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = getattr(dpnp, func)(ia, ib)
+        expected = getattr(numpy, func)(a, b)
+        assert_array_equal(result, expected)
+
+    def test_setdiff1d_scalar(self):
+        a = numpy.array([3, 1, 2, 3])
+        ia = dpnp.array(a)
+        assert_array_equal(dpnp.setdiff1d(ia, 3), numpy.setdiff1d(a, 3))
+
+    @pytest.mark.parametrize(
+        "func", ["intersect1d", "setdiff1d", "setxor1d", "union1d"]
+    )
+    def test_error(self, func):
+        a = numpy.arange(5)
+        assert_raises(TypeError, getattr(dpnp, func), a, dpnp.array(a))
+
+
 class TestTrimZeros:
     @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
     def test_basic(self, dtype):
@@ -1762,6 +1832,20 @@ class TestUnique:
         for iv, v in zip(result, expected):
             assert_array_equal(iv, v)
 
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("axis", [0, 1])
+    def test_2d_axis_duplicates(self, dt, axis):
+        a = generate_random_numpy_array((200, 4), "i4", low=0, high=2)
+        a = a.astype(dt)
+        if axis == 1:
+            a = a.T
+        ia = dpnp.array(a)
+
+        result = dpnp.unique(ia, True, True, True, axis=axis)
+        expected = numpy.unique(a, True, True, True, axis=axis)
+        for iv, v in zip(result, expected):
+            assert_array_equal(iv, v.reshape(iv.shape))
+
     @pytest.mark.parametrize("axis", [0, 1])
     def test_2d_axis_zeros(self, axis):
         a = numpy.empty(shape=(2, 0), dtype=numpy.int8)
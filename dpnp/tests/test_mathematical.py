@@ -1143,6 +1143,141 @@ class TestI0:
         assert_raises((ValueError, TypeError), xp.i0, a)
 
 
+class TestInterp:
+    @pytest.mark.parametrize("dtype_y", get_all_dtypes(no_bool=True))
+    @pytest.mark.parametrize(
+        "dtype_x", get_all_dtypes(no_bool=True, no_complex=True)
+    )
+    def test_basic(self, dtype_x, dtype_y):
+        x = numpy.arange(12).astype(dtype_x)
+        xp = numpy.arange(1, 10, 2).astype(dtype_x)
+        fp = numpy.arange(5, 0, -1).astype(dtype_y)
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp)
+        expected = numpy.interp(x, xp, fp)
+        assert_dtype_allclose(result, expected)
+
+        result = dpnp.interp(ix, ixp, ifp, left=-1, right=10)
+        expected = numpy.interp(x, xp, fp, left=-1, right=10)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    @pytest.mark.parametrize("period", [360, -360, 400])
+    def test_period(self, dtype, period):
+        x = numpy.array([-180, -170, -185, 185, -10, -5, 0, 365])
+        xp = numpy.array([190, -190, 350, -350, 3])
+        fp = numpy.array([5, 10, 3, 4, 1], dtype=dtype)
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp, period=period)
+        expected = numpy.interp(x, xp, fp, period=period)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_non_finite(self, dtype):
+        x = numpy.array([0.5, 1.0, 2.5, numpy.nan, 4.0, numpy.inf])
+        xp = numpy.array([0.0, 1.0, 2.0, 3.0, numpy.inf])
+        fp = numpy.array([0, numpy.inf, 2, numpy.nan, 4], dtype=dtype)
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp)
+        expected = numpy.interp(x, xp, fp)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("shape", [(), (4,), (2, 3)])
+    def test_shape(self, shape):
+        x = numpy.linspace(0, 5, num=numpy.prod(shape, dtype=int)).reshape(
+            shape
+        )
+        xp = numpy.array([1.0, 2.0, 4.0])
+        fp = numpy.array([3.0, -1.0, 2.0])
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp)
+        expected = numpy.interp(x, xp, fp)
+        assert_dtype_allclose(result, expected)
+
+    def test_scalar(self):
+        xp = numpy.array([1, 2, 3])
+        fp = numpy.array([3, 2, 0])
+        ixp, ifp = dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(2.5, ixp, ifp)
+        expected = numpy.interp(2.5, xp, fp)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("period", [None, 3.0])
+    @pytest.mark.parametrize(
+        "shape_x, shape_xp, shape_fp",
+        [
+            ((4, 9), (4, 7), (4, 7)),
+            ((9,), (4, 7), (4, 7)),
+            ((4, 9), (7,), (4, 7)),
+            ((4, 9), (4, 7), (7,)),
+            ((2, 1, 9), (3, 7), (1, 7)),
+        ],
+    )
+    def test_batched(self, shape_x, shape_xp, shape_fp, period):
+        x = generate_random_numpy_array(shape_x, low=-1, high=11)
+        xp = numpy.sort(generate_random_numpy_array(shape_xp, low=0, high=10))
+        fp = generate_random_numpy_array(shape_fp, dtype=numpy.complex64)
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp, period=period)
+
+        batch_shape = numpy.broadcast_shapes(
+            shape_x[:-1], shape_xp[:-1], shape_fp[:-1]
+        )
+        x = numpy.broadcast_to(x, batch_shape + shape_x[-1:])
+        xp = numpy.broadcast_to(xp, batch_shape + shape_xp[-1:])
+        fp = numpy.broadcast_to(fp, batch_shape + shape_fp[-1:])
+        expected = numpy.empty(x.shape, dtype=result.dtype)
+        for idx in numpy.ndindex(batch_shape):
+            expected[idx] = numpy.interp(
+                x[idx], xp[idx], fp[idx], period=period
+            )
+        assert_dtype_allclose(result, expected)
+
+    def test_size1(self):
+        x = numpy.array([0, 5, 10])
+        xp, fp = numpy.array([5]), numpy.array([2.0])
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp, left=-1, right=1)
+        expected = numpy.interp(x, xp, fp, left=-1, right=1)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("fp", [[1.0, 2.0, 2.0], [1.0, 2.0, 2.0 + 1j]])
+    def test_nan_x(self, fp):
+        # NaN is propagated also over an interval with equal values of fp
+        x = numpy.array([0.5, numpy.nan, 1.5])
+        xp, fp = numpy.array([0.0, 1.0, 2.0]), numpy.array(fp)
+        ix, ixp, ifp = dpnp.array(x), dpnp.array(xp), dpnp.array(fp)
+
+        result = dpnp.interp(ix, ixp, ifp)
+        expected = numpy.interp(x, xp, fp)
+        assert_dtype_allclose(result, expected)
+
+    def test_errors(self):
+        x = dpnp.arange(5)
+        xp = dpnp.arange(4)
+
+        # complex x or xp
+        assert_raises(TypeError, dpnp.interp, x + 1j, xp, xp)
+        assert_raises(TypeError, dpnp.interp, x, xp + 1j, xp)
+
+        # fp and xp of different lengths
+        assert_raises(ValueError, dpnp.interp, x, xp, x)
+
+        # empty or 0-D xp
+        assert_raises(ValueError, dpnp.interp, x, xp[:0], xp[:0])
+        assert_raises(ValueError, dpnp.interp, x, xp[0], xp[0])
+
+        # zero period
+        assert_raises(ValueError, dpnp.interp, x, xp, xp, period=0)
+
+
 @pytest.mark.parametrize(
     "rhs", [[[1, 2, 3], [4, 5, 6]], [2.0, 1.5, 1.0], 3, 0.3]
 )
@@ -0,0 +1,295 @@
+import concurrent.futures
+
+import dpctl
+import numpy
+import pytest
+from numpy.testing import assert_array_equal
+
+import dpnp
+from dpnp.dpnp_utils import dpnp_utils_transfer
+
+from .helper import get_all_dtypes
+
+
+@pytest.fixture
+def pinned_pool():
+    pool = dpnp.get_default_pinned_memory_pool()
+    pool.free_all_blocks()
+    yield pool
+    pool.free_all_blocks()
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # stage even small arrays by many chunks
+    monkeypatch.setattr(dpnp_utils_transfer, "_CHUNK_BYTES", 40)
+
+
+class TestMemoryPool:
+    def test_reuse(self):
+        pool = dpnp.MemoryPool()
+        q = dpctl.SyclQueue()
+
+        mem = pool.malloc(1000, "device", q)
+        assert isinstance(mem, dpctl.memory.MemoryUSMDevice)
+        assert mem.nbytes == 1024
+        assert pool.used_bytes() == 1024
+        assert pool.n_free_blocks() == 0
+
+        ptr = mem._pointer
+        del mem
+        assert pool.used_bytes() == 0
+        assert pool.free_bytes() == 1024
+        assert pool.n_free_blocks() == 1
+
+        mem = pool.malloc(900, "device", q)
+        assert mem._pointer == ptr
+        assert pool.n_free_blocks() == 0
+        assert pool.total_bytes() == 1024
+
+        # no block of other USM type or size class is reused
+        other = [pool.malloc(1000, "shared", q), pool.malloc(2000, "device", q)]
+        assert isinstance(other[0], dpctl.memory.MemoryUSMShared)
+        assert all(m._pointer != ptr for m in other)
+        assert pool.peak_bytes() == 2 * 1024 + 2048
+
+        del mem, other
+        assert pool.n_free_blocks() == 3
+        pool.reset_peak_bytes()
+        assert pool.peak_bytes() == 0
+
+    def test_size_class(self):
+        pool = dpnp.MemoryPool()
+        q = dpctl.SyclQueue()
+
+        for nbytes, size in [
+            (0, 512),
+            (513, 640),
+            (1025, 1280),
+            (10**6, 2**20),
+        ]:
+            assert pool.malloc(nbytes, "device", q).nbytes == size
+
+    def test_limit(self):
+        pool = dpnp.MemoryPool(limit=4096)
+        q = dpctl.SyclQueue()
+
+        mem = pool.malloc(2048, "device", q)
+        cached = pool.malloc(1024, "device", q)
+        del cached
+        assert pool.n_free_blocks() == 1
+
+        # the cached block is released to fit the limit
+        mem2 = pool.malloc(2048, "device", q)
+        assert pool.n_free_blocks() == 0
+        assert pool.total_bytes() == 4096
+
+        with pytest.raises(MemoryError):
+            pool.malloc(1, "device", q)
+        assert pool.used_bytes() == 4096
+        del mem, mem2
+
+        with pytest.raises(ValueError):
+            pool.set_limit(-1)
+
+    def test_max_cached_bytes(self):
+        pool = dpnp.MemoryPool(max_cached_bytes=2048)
+        q = dpctl.SyclQueue()
+
+        blocks = [pool.malloc(1024, "device", q) for _ in range(3)]
+        del blocks
+        assert pool.n_free_blocks() == 2
+        assert pool.get_max_cached_bytes() == 2048
+
+        pool.set_max_cached_bytes(1024)
+        assert pool.n_free_blocks() == 1
+        assert pool.free_bytes() == 1024
+
+        pool.free_all_blocks()
+        assert pool.n_free_blocks() == 0
+        assert pool.total_bytes() == 0
+
+    def test_context_manager(self):
+        pool = dpnp.MemoryPool()
+        assert dpnp.get_memory_pool() is None
+
+        with pool as p:
+            assert p is pool
+            assert dpnp.get_memory_pool() is pool
+            with dpnp.MemoryPool() as inner:
+                assert dpnp.get_memory_pool() is inner
+            assert dpnp.get_memory_pool() is pool
+
+            a = dpnp.empty((10, 10), dtype="f4", order="F")
+            assert a.flags.f_contiguous
+            assert pool.used_bytes() == 512
+        assert dpnp.get_memory_pool() is None
+
+        b = dpnp.empty((10, 10), dtype="f4")
+        assert pool.used_bytes() == 512
+        del a, b
+        assert pool.used_bytes() == 0
+        assert pool.n_free_blocks() == 1
+
+    def test_set_memory_pool(self):
+        pool = dpnp.MemoryPool()
+        dpnp.set_memory_pool(pool)
+        try:
+            assert dpnp.get_memory_pool() is pool
+            a = dpnp.ones(10, dtype="i4")
+        finally:
+            dpnp.set_memory_pool(None)
+        assert dpnp.get_memory_pool() is None
+        assert pool.used_bytes() == 512
+        assert_array_equal(a, numpy.ones(10, dtype="i4"))
+
+        with pytest.raises(TypeError):
+            dpnp.set_memory_pool(dpnp.PinnedMemoryPool())
+
+    @pytest.mark.parametrize("usm_type", ["device", "shared", "host"])
+    def test_creation(self, usm_type):
+        with dpnp.MemoryPool() as pool:
+            for _ in range(5):
+                a = dpnp.zeros((3, 4), usm_type=usm_type)
+                b = dpnp.ones((3, 4), dtype="c8", usm_type=usm_type)
+                c = dpnp.full((3, 4), 7, dtype="i2", usm_type=usm_type)
+                d = dpnp.empty_like(a)
+
+        assert a.usm_type == usm_type
+        assert_array_equal(a, numpy.zeros((3, 4)))
+        assert_array_equal(b, numpy.ones((3, 4), dtype="c8"))
+        assert_array_equal(c, numpy.full((3, 4), 7, dtype="i2"))
+        assert d.shape == a.shape
+
+        # released blocks are reused by the next iterations
+        dpnp.synchronize_array_data(a)
+        assert pool.used_bytes() == 4 * 512
+        assert pool.total_bytes() <= 8 * 512
+
+
+class TestPinnedMemoryPool:
+    def test_reuse(self):
+        pool = dpnp.PinnedMemoryPool()
+        q = dpctl.SyclQueue()
+
+        mem = pool.malloc(1000, q)
+        assert isinstance(mem, dpctl.memory.MemoryUSMHost)
+        assert mem.nbytes == 1024
+        assert pool.used_bytes() == 1024
+
+        ptr = mem._pointer
+        del mem
+        assert pool.n_free_blocks() == 1
+        assert pool.malloc(900, q)._pointer == ptr
+
+
+@pytest.mark.usefixtures("small_chunks")
+class TestStagedTransfer:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("shape", [(), (0,), (17,), (5, 7), (3, 4, 5)])
+    def test_asnumpy(self, pinned_pool, dtype, shape):
+        a = numpy.arange(numpy.prod(shape)).astype(dtype).reshape(shape)
+        ia = dpnp.array(a)
+
+        result = dpnp.asnumpy(ia)
+        assert isinstance(result, numpy.ndarray)
+        assert result.dtype == a.dtype
+        assert_array_equal(result, a)
+        dpnp.synchronize_array_data(ia)
+        assert pinned_pool.used_bytes() == 0
+
+    @pytest.mark.parametrize("order", ["C", "F", "A", "K"])
+    def test_asnumpy_order(self, order):
+        a = numpy.arange(60, dtype="i4").reshape(6, 10, order="F")
+        a = a[::2, 7:1:-1]
+        ia = dpnp.array(numpy.arange(60, dtype="i4").reshape(6, 10, order="F"))
+        ia = ia[::2, 7:1:-1]
+
+        result = dpnp.asnumpy(ia, order=order)
+        assert_array_equal(result, a)
+        assert result.flags.f_contiguous == (order == "F")
+
+    @pytest.mark.parametrize("usm_array", [False, True])
+    def test_asnumpy_default_order(self, usm_array):
+        ia = dpnp.ones((6, 10), dtype="i4", order="F")
+        if usm_array:
+            ia = dpnp.get_usm_ndarray(ia)
+
+        result = dpnp.asnumpy(ia)
+        assert result.flags.f_contiguous
+        assert_array_equal(result, numpy.ones((6, 10), dtype="i4"))
+
+    def test_asnumpy_out(self):
+        ia = dpnp.arange(30, dtype="f4").reshape(5, 6)
+        out = numpy.empty((6, 5), dtype="f4").T
+
+        result = dpnp.asnumpy(ia, out=out)
+        assert result is out
+        assert_array_equal(out, numpy.arange(30, dtype="f4").reshape(5, 6))
+
+    @pytest.mark.parametrize(
+        "out",
+        [numpy.empty(3, dtype="f4"), numpy.empty(4, dtype="i4"), [0, 0, 0]],
+        ids=["shape", "dtype", "list"],
+    )
+    def test_asnumpy_out_error(self, out):
+        ia = dpnp.arange(4, dtype="f4")
+        with pytest.raises((TypeError, ValueError)):
+            dpnp.asnumpy(ia, out=out)
+
+    def test_asnumpy_async(self, pinned_pool):
+        ia = dpnp.arange(100, dtype="i4").reshape(10, 10)
+
+        future = dpnp.asnumpy(ia, blocking=False)
+        assert isinstance(future, concurrent.futures.Future)
+        assert_array_equal(future.result(), numpy.arange(100).reshape(10, 10))
+        dpnp.synchronize_array_data(ia)
+        assert pinned_pool.used_bytes() == 0
+
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("order", ["C", "F", "K"])
+    def test_asarray(self, dtype, order):
+        a = numpy.arange(60).astype(dtype).reshape(3, 4, 5, order="F")
+
+        result = dpnp.asarray(a, order=order)
+        assert result.dtype == a.dtype
+        assert_array_equal(result, a)
+        assert result.flags.f_contiguous == (order != "C")
+
+    def test_asarray_strided(self):
+        a = numpy.arange(200, dtype="f4").reshape(10, 20)[::3, ::-2]
+
+        result = dpnp.array(a, usm_type="host")
+        assert result.usm_type == "host"
+        assert_array_equal(result, a)
+
+    def test_set(self):
+        a = numpy.arange(60, dtype="i8").reshape(6, 10)
+        ia = dpnp.empty((10, 6), dtype="i8").T
+
+        assert ia.set(a) is None
+        assert_array_equal(ia, a)
+
+    def test_set_async(self, pinned_pool):
+        a = numpy.arange(60, dtype="i8").reshape(6, 10)
+        ia = dpnp.zeros((6, 10), dtype="i8")
+
+        future = ia.set(a, blocking=False)
+        assert future.result() is ia
+        assert_array_equal(ia, a)
+        dpnp.synchronize_array_data(ia)
+        assert pinned_pool.used_bytes() == 0
+
+    @pytest.mark.parametrize(
+        "arr, error",
+        [
+            (numpy.ones(3, dtype="i8"), ValueError),
+            (numpy.ones(4, dtype="i4"), TypeError),
+            ([1, 2, 3, 4], TypeError),
+        ],
+        ids=["shape", "dtype", "list"],
+    )
+    def test_set_error(self, arr, error):
+        ia = dpnp.empty(4, dtype="i8")
+        with pytest.raises(error):
+            ia.set(arr)
@@ -1,3 +1,5 @@
+import pickle
+
 import dpctl.tensor as dpt
 import numpy
 import pytest
@@ -247,6 +249,139 @@ class TestItem:
             ia.item()
 
 
+class TestPickle:
+    @pytest.mark.parametrize("protocol", [2, 4, 5])
+    @pytest.mark.parametrize("usm_type", ["device", "shared", "host"])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_basic(self, protocol, usm_type, dtype):
+        a = numpy.arange(12).reshape(3, 4).astype(dtype)
+        ia = dpnp.array(a, usm_type=usm_type)
+
+        result = pickle.loads(pickle.dumps(ia, protocol=protocol))
+        assert isinstance(result, dpnp.ndarray)
+        assert result.usm_type == usm_type
+        assert result.sycl_device == ia.sycl_device
+        assert result.dtype == ia.dtype
+        assert_array_equal(result, a)
+
+    @pytest.mark.parametrize("usm_type", ["device", "shared", "host"])
+    @pytest.mark.parametrize(
+        "slices",
+        [
+            (slice(None), slice(None)),
+            (slice(1, None), slice(None)),
+            (slice(None), slice(None, None, 2)),
+            (slice(None, None, -1), slice(2, 4)),
+        ],
+        ids=["full", "offset", "strided", "negative"],
+    )
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_out_of_band(self, usm_type, slices, order):
+        a = numpy.arange(30, dtype="i4").reshape(5, 6, order=order)
+        ia = dpnp.array(a, usm_type=usm_type, order=order)[slices]
+        a = a[slices]
+
+        buffers = []
+        data = pickle.dumps(ia, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert buffers[0].raw().nbytes == a.nbytes
+
+        result = pickle.loads(data, buffers=buffers)
+        assert result.flags.c_contiguous == (
+            a.flags.c_contiguous or not a.flags.f_contiguous
+        )
+        assert_array_equal(result, a)
+
+    @pytest.mark.parametrize("shape", [(), (0,), (2, 0, 3)])
+    def test_empty_and_scalar(self, shape):
+        a = numpy.ones(shape, dtype="f4")
+        ia = dpnp.array(a)
+
+        result = pickle.loads(pickle.dumps(ia, protocol=5))
+        assert result.shape == shape
+        assert_array_equal(result, a)
+
+
+class TestView:
+    def test_none_dtype(self):
+        a = numpy.arange(6).reshape(2, 3)
+        ia = dpnp.array(a)
+
+        iv = ia.view()
+        assert iv is not ia
+        assert iv.dtype == ia.dtype
+        iv[0, 0] = 10
+        assert ia[0, 0] == 10
+
+    @pytest.mark.parametrize(
+        "src_dt, dst_dt",
+        [
+            ("i4", "u4"),
+            ("u4", "f4"),
+            ("c8", "f4"),
+            ("i2", "i8"),
+            ("i8", "i1"),
+            ("b1", "u1"),
+        ],
+    )
+    def test_dtype(self, src_dt, dst_dt):
+        a = numpy.arange(8).reshape(2, 4).astype(src_dt)
+        ia = dpnp.array(a)
+
+        result = ia.view(dst_dt)
+        expected = a.view(dst_dt)
+        assert result.dtype == expected.dtype
+        assert result.strides == tuple(
+            st // expected.itemsize for st in expected.strides
+        )
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("dt", ["i1", "i2", "i8"])
+    def test_strided(self, dt):
+        a = numpy.arange(2 * 3 * 8, dtype="i1").reshape(2, 3, 8)
+        ia = dpnp.array(a)
+
+        a = a.transpose(1, 0, 2)[1:, ::-1, :]
+        ia = ia.transpose(1, 0, 2)[1:, ::-1, :]
+        assert_array_equal(ia.view(dt), a.view(dt))
+
+    def test_complex_parts(self):
+        a = numpy.array([[1 + 2j, 3 + 4j], [5 + 6j, 7 + 8j]], dtype="c8")
+        ia = dpnp.array(a)
+
+        iv = ia.view("f4")
+        assert_array_equal(iv, a.view("f4"))
+        iv[..., 1::2] = 0
+        assert_array_equal(ia, a.real)
+
+    def test_type(self):
+        ia = dpnp.arange(4)
+        assert type(ia.view(dpnp.ndarray)) is dpnp.ndarray
+        assert type(ia.view(type=dpnp.ndarray)) is dpnp.ndarray
+
+    @pytest.mark.parametrize(
+        "shape, slices, dt",
+        [
+            ((), (), "i8"),
+            ((2, 4), (slice(None), slice(None, None, 2)), "i8"),
+            ((2, 3), (), "i8"),
+            ((9,), (slice(1, None),), "i8"),
+        ],
+        ids=["0d", "non-contiguous", "last-axis", "offset"],
+    )
+    def test_error(self, shape, slices, dt):
+        ia = dpnp.ones(shape, dtype="i4")[slices]
+        with pytest.raises(ValueError):
+            ia.view(dt)
+
+    def test_type_error(self):
+        ia = dpnp.ones(4)
+        with pytest.raises(TypeError):
+            ia.view(type=numpy.ndarray)
+        with pytest.raises(ValueError):
+            ia.view(dpnp.ndarray, type=dpnp.ndarray)
+
+
 class TestUsmNdarrayProtocol:
     def test_basic(self):
         a = dpnp.arange(256, dtype=dpnp.int64)
@@ -457,6 +592,18 @@ def test_repeat():
     assert_array_equal(numpy_array, dpnp_array)
 
 
+@pytest.mark.parametrize("dtype", get_all_dtypes())
+@pytest.mark.parametrize("shape", [(), (0,), (4,), (2, 3), (2, 0, 3)])
+def test_tolist(shape, dtype):
+    a = numpy.ones(shape, dtype=dtype)
+    ia = dpnp.array(a)
+
+    result = ia.tolist()
+    expected = a.tolist()
+    assert result == expected
+    assert type(result) is type(expected)
+
+
 def test_clip():
     numpy_array = numpy.arange(10)
     dpnp_array = dpnp.arange(10)
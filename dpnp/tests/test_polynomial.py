@@ -0,0 +1,320 @@
+import numpy
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal, assert_raises
+
+import dpnp
+
+from .helper import (
+    assert_dtype_allclose,
+    generate_random_numpy_array,
+    get_all_dtypes,
+    get_float_complex_dtypes,
+)
+
+
+class TestPoly:
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_bool=True, no_none=True))
+    def test_roots(self, dt):
+        a = numpy.arange(1, 5).astype(dt)
+        ia = dpnp.array(a)
+
+        result = dpnp.poly(ia)
+        expected = numpy.poly(a)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    def test_square_matrix(self, dt):
+        a = generate_random_numpy_array((4, 4), dt, seed_value=42)
+        ia = dpnp.array(a)
+
+        result = dpnp.poly(ia)
+        expected = numpy.poly(a)
+        assert_dtype_allclose(result, expected, factor=24)
+
+    def test_conjugate_roots(self):
+        a = numpy.array([1 + 2j, 1 - 2j, 3])
+        ia = dpnp.array(a)
+
+        result = dpnp.poly(ia)
+        expected = numpy.poly(a)
+        assert result.dtype == expected.dtype
+        assert_allclose(result, expected)
+
+    def test_empty(self):
+        assert dpnp.poly(dpnp.array([])) == numpy.poly(numpy.array([]))
+
+    @pytest.mark.parametrize("shape", [(2, 3), (2, 2, 2)])
+    def test_error(self, shape):
+        ia = dpnp.ones(shape)
+        assert_raises(ValueError, dpnp.poly, ia)
+
+
+class TestPolyval:
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_none=True))
+    def test_array(self, dt):
+        p = numpy.arange(4).astype(dt)
+        x = numpy.arange(10).astype(dt)
+        ip, ix = dpnp.array(p), dpnp.array(x)
+
+        result = dpnp.polyval(ip, ix)
+        expected = numpy.polyval(p, x)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("x", [2, 1.5, 1 + 2j, numpy.float32(0.5)])
+    def test_scalar(self, x):
+        p = numpy.array([3.0, 0.0, -1.0, 2.0])
+        ip = dpnp.array(p)
+
+        result = dpnp.polyval(ip, x)
+        expected = numpy.polyval(p, x)
+        assert_dtype_allclose(result, expected)
+
+    def test_2d_x(self):
+        p = numpy.array([1.0, -2.0, 3.0])
+        x = generate_random_numpy_array((3, 5), numpy.float32, seed_value=1)
+        ip, ix = dpnp.array(p), dpnp.array(x)
+
+        result = dpnp.polyval(ip, ix)
+        expected = numpy.polyval(p, x)
+        assert_dtype_allclose(result, expected)
+
+    def test_poly1d(self):
+        p = numpy.poly1d([1.0, 2.0, 3.0])
+        q = numpy.poly1d([2.0, -1.0])
+        ip, iq = dpnp.poly1d(p), dpnp.poly1d(q)
+
+        result = dpnp.polyval(ip, iq)
+        expected = numpy.polyval(p, q)
+        assert isinstance(result, dpnp.poly1d)
+        assert_allclose(result.coeffs, expected.coeffs)
+
+    def test_empty_coeffs(self):
+        ix = dpnp.arange(5.0)
+        result = dpnp.polyval(dpnp.array([]), ix)
+        expected = numpy.polyval(numpy.array([]), ix.asnumpy())
+        assert_array_equal(result, expected)
+
+    def test_error(self):
+        assert_raises(TypeError, dpnp.polyval, dpnp.array(1.0), 2.0)
+        assert_raises(TypeError, dpnp.polyval, [1.0, 2.0], 2.0)
+        assert_raises(ValueError, dpnp.polyval, dpnp.ones((2, 2)), 2.0)
+
+
+class TestPolyfit:
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("deg", [0, 1, 3])
+    def test_basic(self, dt, deg):
+        x = numpy.linspace(0, 2, 11).astype(dt)
+        y = generate_random_numpy_array(11, dt, seed_value=5)
+        ix, iy = dpnp.array(x), dpnp.array(y)
+
+        result = dpnp.polyfit(ix, iy, deg)
+        expected = numpy.polyfit(x, y, deg)
+        assert_dtype_allclose(result, expected, factor=32)
+
+    def test_2d_y(self):
+        x = numpy.linspace(-1, 1, 20)
+        y = numpy.stack([x**2 - 1, 3 * x + 2, x**3], axis=1)
+        ix, iy = dpnp.array(x), dpnp.array(y)
+
+        result = dpnp.polyfit(ix, iy, 3)
+        expected = numpy.polyfit(x, y, 3)
+        assert_dtype_allclose(result, expected, factor=32)
+
+    def test_weights(self):
+        x = numpy.linspace(0, 1, 15)
+        y = numpy.sin(3 * x)
+        w = numpy.linspace(1, 2, 15)
+        ix, iy, iw = dpnp.array(x), dpnp.array(y), dpnp.array(w)
+
+        result = dpnp.polyfit(ix, iy, 2, w=iw)
+        expected = numpy.polyfit(x, y, 2, w=w)
+        assert_dtype_allclose(result, expected, factor=32)
+
+    def test_full(self):
+        x = numpy.linspace(0, 1, 15)
+        y = numpy.cos(2 * x)
+        ix, iy = dpnp.array(x), dpnp.array(y)
+
+        result = dpnp.polyfit(ix, iy, 2, full=True)
+        expected = numpy.polyfit(x, y, 2, full=True)
+        for res, exp in zip(result[:4], expected[:4]):
+            assert_dtype_allclose(res, exp, factor=32)
+        assert result[4] == expected[4]
+
+    @pytest.mark.parametrize("cov", [True, "unscaled"])
+    def test_cov(self, cov):
+        x = numpy.linspace(0, 1, 15)
+        y = numpy.exp(x)
+        ix, iy = dpnp.array(x), dpnp.array(y)
+
+        result = dpnp.polyfit(ix, iy, 2, cov=cov)
+        expected = numpy.polyfit(x, y, 2, cov=cov)
+        for res, exp in zip(result, expected):
+            assert_dtype_allclose(res, exp, factor=32)
+
+    def test_error(self):
+        ix = dpnp.arange(5.0)
+        assert_raises(ValueError, dpnp.polyfit, ix, ix, -1)
+        assert_raises(TypeError, dpnp.polyfit, ix[:0], ix[:0], 1)
+        assert_raises(TypeError, dpnp.polyfit, ix, ix[:3], 1)
+        assert_raises(TypeError, dpnp.polyfit, ix.reshape(5, 1), ix, 1)
+
+
+class TestPolyderPolyint:
+    @pytest.mark.parametrize("m", [0, 1, 2, 5])
+    def test_polyder(self, m):
+        p = numpy.arange(1, 6).astype(numpy.float32)
+        ip = dpnp.array(p)
+
+        result = dpnp.polyder(ip, m)
+        expected = numpy.polyder(p, m)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("m", [0, 1, 3])
+    @pytest.mark.parametrize("k", [None, 2.0, [1.0, 2.0, 3.0]])
+    def test_polyint(self, m, k):
+        p = numpy.arange(1, 5).astype(numpy.float32)
+        ip = dpnp.array(p)
+
+        result = dpnp.polyint(ip, m, k)
+        expected = numpy.polyint(p, m, k)
+        assert_dtype_allclose(result, expected)
+
+    def test_poly1d_roundtrip(self):
+        p = dpnp.poly1d([3.0, 2.0, 1.0])
+        result = p.integ().deriv()
+        assert result == p
+
+    def test_error(self):
+        ip = dpnp.arange(4.0)
+        assert_raises(ValueError, dpnp.polyder, ip, -1)
+        assert_raises(ValueError, dpnp.polyint, ip, -1)
+        assert_raises(ValueError, dpnp.polyint, ip, 4, [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("func", ["polyadd", "polysub", "polymul"])
+class TestPolyArithmetic:
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_bool=True, no_none=True))
+    def test_array(self, func, dt):
+        a1 = numpy.arange(5).astype(dt)
+        a2 = numpy.arange(1, 4).astype(dt)
+        ia1, ia2 = dpnp.array(a1), dpnp.array(a2)
+
+        result = getattr(dpnp, func)(ia1, ia2)
+        expected = getattr(numpy, func)(a1, a2)
+        assert_dtype_allclose(result, expected)
+
+    def test_poly1d(self, func):
+        a1 = numpy.poly1d([1.0, 2.0, 3.0])
+        a2 = numpy.array([4.0, 5.0])
+        ia1, ia2 = dpnp.poly1d(a1), dpnp.array(a2)
+
+        result = getattr(dpnp, func)(ia1, ia2)
+        expected = getattr(numpy, func)(a1, a2)
+        assert isinstance(result, dpnp.poly1d)
+        assert_allclose(result.coeffs, expected.coeffs)
+
+    def test_error(self, func):
+        ia = dpnp.ones((2, 2))
+        assert_raises(ValueError, getattr(dpnp, func), ia, ia)
+
+
+class TestRoots:
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_bool=True, no_none=True))
+    def test_basic(self, dt):
+        p = numpy.array([1, -6, 11, -6]).astype(dt)
+        ip = dpnp.array(p)
+
+        result = dpnp.sort(dpnp.roots(ip))
+        expected = numpy.sort(numpy.roots(p))
+        assert_dtype_allclose(result, expected, factor=24)
+
+    def test_complex_roots(self):
+        p = numpy.array([1.0, 0.0, 4.0])
+        ip = dpnp.array(p)
+
+        result = dpnp.sort(dpnp.roots(ip))
+        expected = numpy.sort(numpy.roots(p))
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize(
+        "p", [[0, 0, 1, 2, 0, 0], [5, 0], [0, 5], [0, 0], [5], []]
+    )
+    def test_zeros(self, p):
+        p = numpy.array(p, dtype=numpy.float32)
+        ip = dpnp.array(p)
+
+        result = dpnp.sort(dpnp.roots(ip))
+        expected = numpy.sort(numpy.roots(p))
+        assert_dtype_allclose(result, expected)
+
+    def test_error(self):
+        assert_raises(TypeError, dpnp.roots, dpnp.array(1.0))
+        assert_raises(ValueError, dpnp.roots, dpnp.ones((2, 2)))
+
+
+class TestPoly1d:
+    def test_attributes(self):
+        a = numpy.poly1d([0, 1, 2, 3], variable="z")
+        ia = dpnp.poly1d([0, 1, 2, 3], variable="z")
+
+        assert_array_equal(ia.coeffs, a.coeffs)
+        assert ia.order == a.order
+        assert ia.variable == a.variable
+        assert len(ia) == len(a)
+        assert str(ia) == str(a)
+
+    def test_from_roots(self):
+        a = numpy.poly1d([1.0, 2.0, 3.0], r=True)
+        ia = dpnp.poly1d(dpnp.array([1.0, 2.0, 3.0]), r=True)
+        assert_allclose(ia.coeffs, a.coeffs)
+        assert_allclose(dpnp.sort(ia.roots), numpy.sort(a.roots))
+
+    def test_operators(self):
+        a, b = numpy.poly1d([1.0, 2.0]), numpy.poly1d([3.0, 0.0, 1.0])
+        ia, ib = dpnp.poly1d(a), dpnp.poly1d(b)
+
+        for result, expected in [
+            (ia + ib, a + b),
+            (ia - ib, a - b),
+            (ia * ib, a * b),
+            (2 * ia, 2 * a),
+            (ia / 2, a / 2),
+            (ia**3, a**3),
+            (-ia, -a),
+        ]:
+            assert isinstance(result, dpnp.poly1d)
+            assert_allclose(result.coeffs, expected.coeffs)
+
+        assert ia == dpnp.poly1d(a)
+        assert ia != ib
+
+    def test_call(self):
+        a = numpy.poly1d([1.0, -2.0, 3.0])
+        ia = dpnp.poly1d(a)
+        x = numpy.linspace(-1, 1, 7)
+
+        assert_dtype_allclose(ia(dpnp.array(x)), a(x))
+
+    def test_getitem_setitem(self):
+        a = numpy.poly1d([1.0, 2.0, 3.0])
+        ia = dpnp.poly1d(a)
+
+        assert ia[0] == a[0]
+        assert ia[10] == a[10]
+
+        a[5] = 7.0
+        ia[5] = 7.0
+        assert_array_equal(ia.coeffs, a.coeffs)
+
+    def test_asnumpy(self):
+        ia = dpnp.poly1d([1.0, 2.0, 3.0], variable="t")
+        a = ia.asnumpy()
+        assert isinstance(a, numpy.poly1d)
+        assert a.variable == "t"
+        assert_array_equal(a.coeffs, ia.coeffs.asnumpy())
+
+    def test_error(self):
+        assert_raises(ValueError, dpnp.poly1d, dpnp.ones((2, 2)))
+        assert_raises(ValueError, pow, dpnp.poly1d([1.0, 2.0]), -1)
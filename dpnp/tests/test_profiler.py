@@ -0,0 +1,159 @@
+import json
+
+import dpctl
+import numpy
+import pytest
+from numpy.testing import assert_array_equal
+
+import dpnp
+from dpnp.dpnp_algo.dpnp_elementwise_common import (
+    DPNPBinaryFunc,
+    DPNPUnaryFunc,
+)
+
+
+class TestProfiler:
+    def test_calls(self):
+        with dpnp.profiler() as prof:
+            a = dpnp.arange(10.0)
+            b = dpnp.sum(a * a)
+            c = dpnp.linalg.norm(a)
+
+        stats = {r["name"]: r for r in prof.stats()}
+        assert stats["multiply"]["calls"] == 1
+        assert stats["multiply"]["host_time"] > 0
+        assert stats["multiply"]["bytes_allocated"] == a.nbytes
+
+        for name in ["arange", "sum", "linalg.norm"]:
+            assert stats[name]["calls"] == 1
+            assert stats[name]["host_time"] > 0
+            assert stats[name]["kernels"] > 0
+        assert stats["arange"]["bytes_allocated"] == a.nbytes
+        assert_array_equal(b, numpy.sum(numpy.arange(10.0) ** 2))
+        assert c.ndim == 0
+
+    def test_not_recorded_calls(self):
+        a = dpnp.zeros(10)
+        with dpnp.profiler() as prof:
+            a[2:5] = 1
+
+        # events of calls which are not recorded are attributed to the
+        # outermost dpnp function, but not to the test
+        stats = {r["name"]: r for r in prof.stats()}
+        assert stats["ndarray.__setitem__"]["calls"] == 0
+        assert stats["ndarray.__setitem__"]["kernels"] > 0
+        assert not any(name.startswith("tests.") for name in stats)
+
+    def test_identity(self):
+        sum_func = dpnp.sum
+        item_method = dpnp.ndarray.item
+        with dpnp.profiler():
+            assert dpnp.ndarray.item is item_method
+            assert isinstance(dpnp.add, DPNPBinaryFunc)
+            assert isinstance(dpnp.sin, DPNPUnaryFunc)
+
+            # public functions are replaced only while profiling
+            assert dpnp.sum is not sum_func
+            assert dpnp.sum is dpnp.dpnp_iface_mathematical.sum
+            assert dpnp.linalg.norm is dpnp.linalg.dpnp_iface_linalg.norm
+            assert dpnp.sum.__name__ == "sum"
+            assert dpnp.sum.__doc__ == sum_func.__doc__
+        assert dpnp.sum is sum_func
+        assert dpnp.dpnp_iface_mathematical.sum is sum_func
+
+    def test_temporaries(self):
+        a = dpnp.ones(10)
+        with dpnp.profiler() as prof:
+            with prof.record_function("step"):
+                b = (a + 1) * 2
+                _ = b[1:]
+
+        stats = {r["name"]: r for r in prof.stats()}
+        assert stats["step"]["calls"] == 1
+        assert stats["step"]["bytes_allocated"] == 2 * a.nbytes
+        assert stats["add"]["bytes_allocated"] == a.nbytes
+        assert stats["multiply"]["bytes_allocated"] == a.nbytes
+
+    def test_restore_on_error(self):
+        with pytest.raises(ValueError):
+            with dpnp.profiler():
+                raise ValueError
+
+        with dpnp.profiler() as prof:
+            dpnp.add(dpnp.ones(3), 1)
+        assert prof.stats()
+
+    def test_ufunc_attributes(self):
+        with dpnp.profiler():
+            assert dpnp.add.nin == 2
+            assert dpnp.add.__name__ == "add"
+
+    def test_host_syncs(self):
+        a = dpnp.arange(5)
+        with dpnp.profiler() as prof:
+            b = a + 1
+            x = b[2].item()
+            y = float(b[3])
+            z = dpnp.asnumpy(b)
+
+        assert (x, y) == (3, 4.0)
+        assert_array_equal(z, numpy.arange(1, 6))
+
+        stats = {r["name"]: r for r in prof.stats()}
+        assert stats["ndarray.item"]["host_syncs"] == 1
+        assert stats["ndarray.__float__"]["host_syncs"] == 1
+        assert stats["asnumpy"]["host_syncs"] == 1
+        assert stats["add"]["host_syncs"] == 0
+
+    def test_nested(self):
+        with dpnp.profiler():
+            with pytest.raises(RuntimeError):
+                with dpnp.profiler():
+                    pass
+
+    def test_device_time(self):
+        q = dpctl.SyclQueue(property="enable_profiling")
+        a = dpnp.ones(1000, sycl_queue=q)
+        with dpnp.profiler() as prof:
+            dpnp.multiply(a, a)
+            dpnp.sum(a)
+
+        stats = {r["name"]: r for r in prof.stats(sort_by="device_time")}
+        for name in ["multiply", "sum"]:
+            assert stats[name]["device_time"] is not None
+            assert stats[name]["device_time"] >= 0
+
+    @pytest.mark.parametrize(
+        "sort_by", ["host_time", "device_time", "calls", "name"]
+    )
+    def test_table(self, sort_by):
+        with dpnp.profiler() as prof:
+            dpnp.cumsum(dpnp.sin(dpnp.ones(10)))
+
+        table = prof.table(sort_by=sort_by, limit=1)
+        lines = table.splitlines()
+        assert lines[0].startswith("Name")
+        assert len(lines) == 3
+
+    def test_table_error(self):
+        with dpnp.profiler() as prof:
+            dpnp.ones(10)
+        with pytest.raises(ValueError):
+            prof.table(sort_by="unknown")
+
+    def test_chrome_trace(self, tmp_path):
+        with dpnp.profiler() as prof:
+            with prof.record_function("step"):
+                dpnp.sum(dpnp.ones(10) + 1)
+
+        path = tmp_path / "trace.json"
+        prof.export_chrome_trace(str(path))
+        with open(path) as f:
+            trace = json.load(f)
+
+        events = trace["traceEvents"]
+        names = [e["name"] for e in events if e["cat"] in ("call", "region")]
+        assert "step" in names
+        assert "add" in names
+        assert "sum" in names
+        assert all(e["dur"] >= 0 for e in trace["traceEvents"] if "dur" in e)
@@ -0,0 +1,174 @@
+import dpctl
+import numpy
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import dpnp
+
+from .helper import generate_random_numpy_array, get_float_dtypes
+
+
+@pytest.fixture
+def queues():
+    return [dpctl.SyclQueue(), dpctl.SyclQueue(), dpctl.SyclQueue()]
+
+
+def _asnumpy(x):
+    if isinstance(x, dpnp.ShardedArray):
+        return x.asnumpy()
+    return dpnp.asnumpy(x)
+
+
+class TestShard:
+    @pytest.mark.parametrize("shape", [(7,), (5, 4), (3, 4, 5)])
+    def test_shard(self, queues, shape):
+        a = numpy.arange(numpy.prod(shape), dtype="f4").reshape(shape)
+        for axis in range(-1, len(shape)):
+            x = dpnp.shard(a, queues, axis=axis)
+            assert x.axis == axis % len(shape)
+            assert x.shape == a.shape
+            assert x.size == a.size
+            assert x.dtype == a.dtype
+            assert x.sycl_queues == tuple(queues)
+
+            sizes = [s.shape[x.axis] for s in x.shards]
+            assert sum(sizes) == a.shape[x.axis]
+            assert max(sizes) - min(sizes) <= 1
+
+            assert_array_equal(x.asnumpy(), a)
+            result = x.gather()
+            assert result.sycl_queue == queues[0]
+            assert_array_equal(result, a)
+
+    def test_shard_dpnp_array(self, queues):
+        ia = dpnp.arange(10)
+        x = dpnp.shard(ia, queues)
+        assert_array_equal(x.gather(sycl_queue=ia.sycl_queue), ia)
+        assert len(x) == 10
+
+    def test_default_queues(self):
+        x = dpnp.shard(dpnp.arange(8))
+        assert len(x.shards) >= 1
+        assert_array_equal(x.asnumpy(), numpy.arange(8))
+
+    def test_errors(self, queues):
+        with pytest.raises(ValueError):
+            dpnp.shard(dpnp.array(1), queues)
+        with pytest.raises(ValueError):
+            dpnp.shard(dpnp.ones(3), [])
+        with pytest.raises(ValueError):
+            dpnp.ShardedArray([dpnp.ones((2, 3)), dpnp.ones((2, 4))])
+        with pytest.raises(TypeError):
+            dpnp.ShardedArray(
+                [dpnp.ones(2, dtype="i4"), dpnp.ones(2, dtype="f4")]
+            )
+
+
+class TestElementwise:
+    @pytest.mark.parametrize("axis", [0, 1])
+    def test_operators(self, queues, axis):
+        a = generate_random_numpy_array((5, 4), dtype="f4", low=1)
+        b = generate_random_numpy_array((5, 4), dtype="f4", low=1)
+        x = dpnp.shard(a, queues, axis=axis)
+        y = dpnp.shard(b, queues, axis=axis)
+
+        assert_allclose((x + y).asnumpy(), a + b)
+        assert_allclose((x * 2 - 1).asnumpy(), a * 2 - 1)
+        assert_allclose((3 / x).asnumpy(), 3 / a, rtol=1e-6)
+        assert_allclose((-x).asnumpy(), -a)
+        assert_allclose(abs(-x).asnumpy(), a)
+        assert_array_equal((x < y).asnumpy(), a < b)
+        assert_allclose(x.map(dpnp.sqrt).asnumpy(), numpy.sqrt(a))
+        assert x.astype("i4").dtype == numpy.int32
+
+    @pytest.mark.parametrize("b_shape", [(4,), (1, 4), (5, 1), (5, 4)])
+    def test_broadcast(self, queues, b_shape):
+        a = numpy.arange(20, dtype="f4").reshape(5, 4)
+        b = numpy.arange(numpy.prod(b_shape), dtype="f4").reshape(b_shape)
+        x = dpnp.shard(a, queues, axis=0)
+
+        assert_array_equal((x + b).asnumpy(), a + b)
+        assert_array_equal((x + dpnp.array(b)).asnumpy(), a + b)
+        assert_array_equal((b - x).asnumpy(), b - a)
+
+    def test_not_aligned(self, queues):
+        x = dpnp.shard(numpy.ones((4, 4)), queues, axis=0)
+        y = dpnp.shard(numpy.ones((4, 4)), queues, axis=1)
+        with pytest.raises(ValueError):
+            x + y
+
+
+class TestReduction:
+    @pytest.mark.parametrize("func", ["sum", "prod", "max", "min", "mean"])
+    @pytest.mark.parametrize("shard_axis", [0, 1, 2])
+    @pytest.mark.parametrize("axis", [None, 0, 1, -1, (0, 2)])
+    @pytest.mark.parametrize("keepdims", [False, True])
+    def test_reduce(self, queues, func, shard_axis, axis, keepdims):
+        a = generate_random_numpy_array(
+            (4, 5, 3), dtype="f4", low=0.5, high=1.5
+        )
+        x = dpnp.shard(a, queues, axis=shard_axis)
+
+        result = getattr(x, func)(axis=axis, keepdims=keepdims)
+        expected = getattr(a, func)(axis=axis, keepdims=keepdims)
+        assert_allclose(_asnumpy(result), expected, rtol=1e-5)
+
+    @pytest.mark.parametrize("func", ["all", "any"])
+    def test_logical(self, queues, func):
+        a = numpy.array([[True, False], [True, True], [True, True]])
+        x = dpnp.shard(a, queues)
+        for axis in [None, 0, 1]:
+            result = getattr(x, func)(axis=axis)
+            assert_array_equal(_asnumpy(result), getattr(a, func)(axis=axis))
+
+    def test_empty_shard(self, queues):
+        x = dpnp.shard(numpy.array([3.0, -1.0]), queues)
+        assert x.shards[2].size == 0
+        assert x.max() == 3.0
+        assert x.min() == -1.0
+
+
+class TestMatmul:
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    @pytest.mark.parametrize(
+        "a_shape, b_shape",
+        [((5, 4), (4, 3)), ((5, 4), (4,)), ((2, 5, 4), (4, 3))],
+    )
+    def test_rows(self, queues, dtype, a_shape, b_shape):
+        a = generate_random_numpy_array(a_shape, dtype=dtype)
+        b = generate_random_numpy_array(b_shape, dtype=dtype)
+        for axis in range(len(a_shape) - 1):
+            result = dpnp.shard(a, queues, axis=axis) @ b
+            assert isinstance(result, dpnp.ShardedArray)
+            assert_allclose(result.asnumpy(), a @ b, rtol=1e-4)
+
+    @pytest.mark.parametrize(
+        "a_shape, b_shape", [((5, 4), (4, 3)), ((4,), (4, 3))]
+    )
+    def test_columns(self, queues, a_shape, b_shape):
+        a = generate_random_numpy_array(a_shape, dtype="f4")
+        b = generate_random_numpy_array(b_shape, dtype="f4")
+
+        result = a @ dpnp.shard(b, queues, axis=-1)
+        assert_allclose(result.asnumpy(), a @ b, rtol=1e-4)
+
+    @pytest.mark.parametrize(
+        "a_shape, b_shape", [((5, 4), (4, 3)), ((4,), (4,))]
+    )
+    def test_contracted(self, queues, a_shape, b_shape):
+        a = generate_random_numpy_array(a_shape, dtype="f4")
+        b = generate_random_numpy_array(b_shape, dtype="f4")
+        x = dpnp.shard(a, queues, axis=-1)
+        y = dpnp.shard(b, queues, axis=0)
+
+        result = x @ y
+        assert isinstance(result, dpnp.ndarray)
+        assert_allclose(result, a @ b, rtol=1e-4)
+
+    def test_errors(self, queues):
+        x = dpnp.shard(numpy.ones((4, 4)), queues, axis=1)
+        with pytest.raises(ValueError):
+            x @ numpy.ones((4, 2))
+        y = dpnp.shard(numpy.ones((4, 4)), queues, axis=0)
+        with pytest.raises(NotImplementedError):
+            y @ numpy.ones((2, 4, 2))
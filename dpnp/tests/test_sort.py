@@ -10,6 +10,7 @@ from .helper import (
     generate_random_numpy_array,
     get_all_dtypes,
     get_complex_dtypes,
+    get_float_complex_dtypes,
     get_float_dtypes,
 )
 from .third_party.cupy import testing
@@ -106,6 +107,61 @@ class TestArgsort:
         assert_array_equal(result, expected)
 
 
+class TestLexsort:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_basic(self, dtype):
+        a = generate_random_numpy_array((3, 20), "i4", low=0, high=3)
+        a = a.astype(dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.lexsort(ia)
+        expected = numpy.lexsort(a)
+        assert_array_equal(result, expected)
+
+    def test_sequence(self):
+        a = numpy.array([1, 5, 1, 4, 3, 4, 4])
+        b = numpy.array([9.0, 4, 0, 4, 0, 2, 1])
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = dpnp.lexsort((ib, ia))
+        expected = numpy.lexsort((b, a))
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("axis", [-2, -1, 0, 1, 2])
+    def test_axis(self, axis):
+        a = generate_random_numpy_array((2, 4, 5, 3), dtype="i4", low=0, high=2)
+        ia = dpnp.array(a)
+
+        result = dpnp.lexsort(ia, axis=axis)
+        expected = numpy.lexsort(a, axis=axis)
+        assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_nan(self, dtype):
+        a = generate_random_numpy_array((2, 10), "i4", low=0, high=2)
+        a = a.astype(dtype)
+        a[0, 2] = a[1, 3] = a[1, 6] = a[0, 6] = numpy.nan
+        ia = dpnp.array(a)
+
+        result = dpnp.lexsort(ia)
+        expected = numpy.lexsort(a)
+        assert_array_equal(result, expected)
+
+    def test_scalar_keys(self):
+        ia = dpnp.array([3.0, 1.0])
+        result = dpnp.lexsort(ia)
+        assert result.ndim == 0
+        assert result == numpy.lexsort(numpy.array([3.0, 1.0]))
+
+    def test_error(self):
+        ia = dpnp.arange(5)
+        assert_raises(TypeError, dpnp.lexsort, dpnp.array(1))
+        assert_raises(TypeError, dpnp.lexsort, [])
+        assert_raises(TypeError, dpnp.lexsort, [numpy.arange(5)])
+        assert_raises(ValueError, dpnp.lexsort, [ia, ia[:3]])
+        assert_raises(AxisError, dpnp.lexsort, [ia], axis=1)
+
+
 class TestSearchSorted:
     @pytest.mark.parametrize("side", ["left", "right"])
     @pytest.mark.parametrize("dtype", get_float_dtypes(no_float16=False))
@@ -0,0 +1,468 @@
+import operator
+
+import numpy
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal, assert_raises
+
+import dpnp
+from dpnp import sparse
+
+from .helper import (
+    assert_dtype_allclose,
+    generate_random_numpy_array,
+    get_all_dtypes,
+    get_float_complex_dtypes,
+)
+
+_formats = ["coo", "csc", "csr"]
+
+
+def _get_dense(dtype, shape=(7, 5), seed=42):
+    a = generate_random_numpy_array(shape, dtype, seed_value=seed)
+    mask = numpy.random.default_rng(seed).random(shape) < 0.4
+    return numpy.where(mask, a, 0).astype(dtype)
+
+
+def _get_matrix(fmt, a):
+    return getattr(sparse, fmt + "_matrix")(dpnp.array(a))
+
+
+class TestConstruct:
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_none=True))
+    def test_dense(self, fmt, dt):
+        a = _get_dense(dt)
+        ia = _get_matrix(fmt, a)
+
+        assert ia.format == fmt
+        assert ia.shape == a.shape
+        assert ia.dtype == a.dtype
+        assert ia.nnz == numpy.count_nonzero(a)
+        assert_array_equal(ia.toarray(), a)
+
+    @pytest.mark.parametrize("fmt", ["csc", "csr"])
+    def test_compressed_indices(self, fmt):
+        a = _get_dense(numpy.float32)
+        ia = _get_matrix(fmt, a)
+
+        b = a if fmt == "csr" else a.T
+        major, minor = numpy.nonzero(b)
+        indptr = numpy.searchsorted(major, numpy.arange(b.shape[0] + 1))
+        assert_array_equal(ia.indices, minor)
+        assert_array_equal(ia.indptr, indptr)
+        assert_array_equal(ia.data, b[major, minor])
+
+    @pytest.mark.parametrize("fmt", _formats)
+    def test_triplets_with_duplicates(self, fmt):
+        row = numpy.array([2, 0, 2, 1, 0])
+        col = numpy.array([1, 3, 1, 0, 3])
+        data = numpy.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        expected = numpy.zeros((3, 4))
+        numpy.add.at(expected, (row, col), data)
+
+        cls = getattr(sparse, fmt + "_matrix")
+        ia = cls((dpnp.array(data), (dpnp.array(row), dpnp.array(col))))
+        assert ia.shape == (3, 4)
+        assert ia.nnz == 5
+        assert_array_equal(ia.toarray(), expected)
+
+    def test_csr_arrays(self):
+        data = dpnp.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        indices = dpnp.array([0, 2, 2, 0, 1, 2])
+        indptr = dpnp.array([0, 2, 3, 6])
+        ia = sparse.csr_matrix((data, indices, indptr), shape=(3, 4))
+
+        expected = numpy.array(
+            [[1.0, 0, 2, 0], [0, 0, 3, 0], [4, 5, 6, 0]], dtype=ia.dtype
+        )
+        assert_array_equal(ia.toarray(), expected)
+        assert_array_equal(ia.T.toarray(), expected.T)
+        assert isinstance(ia.T, sparse.csc_matrix)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    def test_empty(self, fmt):
+        ia = getattr(sparse, fmt + "_matrix")((3, 4))
+        assert ia.nnz == 0
+        assert ia.dtype == dpnp.default_float_type()
+        assert_array_equal(ia.toarray(), numpy.zeros((3, 4)))
+
+    @pytest.mark.parametrize("fmt_in", _formats)
+    @pytest.mark.parametrize("fmt_out", _formats)
+    def test_conversion(self, fmt_in, fmt_out):
+        a = _get_dense(numpy.float32)
+        ia = _get_matrix(fmt_in, a)
+
+        result = ia.asformat(fmt_out)
+        assert result.format == fmt_out
+        assert_array_equal(result.toarray(), a)
+
+        result = getattr(ia, "to" + fmt_out)(copy=True)
+        assert result.data is not ia.data
+        assert_array_equal(result.toarray(), a)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    def test_dtype_copy(self, fmt):
+        a = _get_dense(numpy.float32)
+        ia = dpnp.array(a)
+        cls = getattr(sparse, fmt + "_matrix")
+
+        result = cls(cls(ia), dtype=dpnp.int32, copy=True)
+        assert result.dtype == dpnp.int32
+        assert_array_equal(result.toarray(), a.astype(numpy.int32))
+
+    def test_issparse(self):
+        ia = sparse.csr_matrix((2, 3))
+        assert sparse.issparse(ia)
+        assert not sparse.issparse(ia.toarray())
+        assert sparse.isspmatrix_csr(ia)
+        assert sparse.isspmatrix_csc(ia.T)
+        assert sparse.isspmatrix_coo(ia.tocoo())
+
+    def test_error(self):
+        ia = dpnp.ones(3)
+        assert_raises(TypeError, sparse.csr_matrix, ia)
+        assert_raises(TypeError, sparse.coo_matrix, numpy.ones((2, 2)))
+        assert_raises(ValueError, sparse.coo_matrix, (ia, (ia[:2], ia)))
+        assert_raises(ValueError, sparse.coo_matrix, (ia[:0], (ia[:0], ia[:0])))
+        assert_raises(
+            ValueError,
+            sparse.csr_matrix,
+            (ia, dpnp.arange(3), dpnp.array([0, 3])),
+            shape=(2, 3),
+        )
+        assert_raises(ValueError, sparse.csr_matrix((2, 2)).asformat, "bsr")
+        assert_raises(TypeError, len, sparse.csr_matrix((2, 2)))
+
+
+class TestProduct:
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_none=True))
+    def test_matvec(self, fmt, dt):
+        a = _get_dense(dt)
+        x = generate_random_numpy_array(a.shape[1], dt, seed_value=1)
+        ia, ix = _get_matrix(fmt, a), dpnp.array(x)
+
+        result = ia @ ix
+        expected = numpy.dot(a, x)
+        assert_dtype_allclose(result, expected)
+        assert_dtype_allclose(ia.dot(ix), expected)
+        assert_dtype_allclose(ia * ix, expected)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("k", [1, 4])
+    def test_matmat(self, fmt, dt, k):
+        a = _get_dense(dt)
+        x = generate_random_numpy_array((a.shape[1], k), dt, seed_value=1)
+        ia, ix = _get_matrix(fmt, a), dpnp.array(x)
+
+        result = ia @ ix
+        expected = numpy.dot(a, x)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    def test_transpose(self, fmt):
+        a = _get_dense(numpy.float32)
+        x = generate_random_numpy_array(a.shape[0], numpy.float32)
+        ia, ix = _get_matrix(fmt, a), dpnp.array(x)
+
+        assert_dtype_allclose(ia.T @ ix, a.T @ x)
+        assert_dtype_allclose(ia.__rmatmul__(ix), x @ a)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    def test_empty_rows(self, fmt):
+        a = numpy.zeros((6, 4), dtype=numpy.float32)
+        a[1, 2], a[4, 0] = 3.0, -1.0
+        ia = _get_matrix(fmt, a)
+        ix = dpnp.arange(4, dtype=dpnp.float32)
+
+        assert_array_equal(ia @ ix, a @ numpy.arange(4, dtype=numpy.float32))
+
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("k", [None, 3])
+    def test_coo_chunked(self, monkeypatch, dt, k):
+        monkeypatch.setattr(
+            "dpnp.sparse.dpnp_utils_sparse._CHUNK_SIZE", 4, raising=True
+        )
+        a = _get_dense(dt, shape=(9, 6))
+        shape = (a.shape[1],) if k is None else (a.shape[1], k)
+        x = generate_random_numpy_array(shape, dt, seed_value=1)
+        ia, ix = _get_matrix("coo", a), dpnp.array(x)
+
+        assert_dtype_allclose(ia @ ix, numpy.dot(a, x))
+
+    def test_error(self):
+        ia = sparse.csr_matrix(dpnp.eye(3))
+        assert_raises(ValueError, ia.dot, dpnp.ones(4))
+        assert_raises(ValueError, ia.dot, dpnp.ones((3, 3, 3)))
+        assert_raises(ValueError, ia.__matmul__, 2)
+        assert_raises(TypeError, operator.matmul, ia, ia)
+
+
+class TestElementwise:
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    def test_scaling(self, fmt, dt):
+        a = _get_dense(dt)
+        ia = _get_matrix(fmt, a)
+
+        for result, expected in [
+            (ia * 2, a * 2),
+            (3 * ia, 3 * a),
+            (ia / 4, a / 4),
+            (-ia, -a),
+            (abs(ia), abs(a)),
+            (ia.conj(), a.conj()),
+        ]:
+            assert result.format == fmt
+            assert_dtype_allclose(result.toarray(), expected)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("shape", [(7, 5), (5,), (7, 1)])
+    def test_multiply(self, fmt, shape):
+        a = _get_dense(numpy.float32)
+        b = generate_random_numpy_array(shape, numpy.float32, seed_value=3)
+        ia, ib = _get_matrix(fmt, a), dpnp.array(b)
+
+        result = ia.multiply(ib)
+        assert result.format == fmt
+        assert result.nnz == ia.nnz
+        assert_dtype_allclose(result.toarray(), a * b)
+
+    @pytest.mark.parametrize("fmt", _formats)
+    @pytest.mark.parametrize("axis", [None, 0, 1, -1])
+    def test_sum(self, fmt, axis):
+        a = _get_dense(numpy.float32)
+        ia = _get_matrix(fmt, a)
+
+        assert_allclose(ia.sum(axis=axis), a.sum(axis=axis), rtol=1e-5)
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_toarray_order(self, order):
+        a = _get_dense(numpy.float32)
+        result = _get_matrix("csr", a).toarray(order=order)
+        assert result.flags[order + "_CONTIGUOUS"]
+        assert_array_equal(result, a)
+
+
+class TestIterativeSolvers:
+    @staticmethod
+    def _get_system(dtype, spd, n=40):
+        a = generate_random_numpy_array(
+            (n, n), dtype, seed_value=7, low=-1, high=1
+        )
+        if spd:
+            a = a @ a.T.conj()
+        a += n * numpy.eye(n, dtype=dtype)
+        b = generate_random_numpy_array(n, dtype, seed_value=11)
+        return a, b
+
+    @staticmethod
+    def _check_solution(a, b, x, info, rtol):
+        # the true residual may differ from the updated one in single precision
+        assert info == 0
+        res = numpy.linalg.norm(a @ dpnp.asnumpy(x) - b)
+        assert res <= rtol * numpy.linalg.norm(b)
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("op", ["dense", "sparse", "callable"])
+    def test_solve(self, func, dt, op):
+        a, b = self._get_system(dt, spd=(func == "cg"))
+        ia, ib = dpnp.array(a), dpnp.array(b)
+        if op == "sparse":
+            ia = sparse.csr_matrix(ia)
+        elif op == "callable":
+            ia = ia.__matmul__
+
+        x, info = getattr(sparse.linalg, func)(ia, ib, rtol=1e-5)
+        assert isinstance(x, dpnp.ndarray)
+        assert x.dtype == ib.dtype
+        self._check_solution(a, b, x, info, rtol=1e-4)
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    def test_preconditioner(self, func):
+        a, b = self._get_system(numpy.float32, spd=True)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+        im = dpnp.diag(1 / dpnp.diagonal(ia))
+
+        x0 = dpnp.ones_like(ib)
+        x, info = getattr(sparse.linalg, func)(ia, ib, x0=x0, M=im, rtol=1e-5)
+        self._check_solution(a, b, x, info, rtol=1e-4)
+        assert_array_equal(x0, numpy.ones_like(b))
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    def test_callback(self, func):
+        a, b = self._get_system(numpy.float32, spd=True)
+        iterates = []
+
+        x, info = getattr(sparse.linalg, func)(
+            dpnp.array(a), dpnp.array(b), callback=iterates.append
+        )
+        self._check_solution(a, b, x, info, rtol=1e-4)
+        assert len(iterates) > 0
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    def test_not_converged(self, func):
+        a, b = self._get_system(numpy.float32, spd=True)
+
+        kwargs = {"restart": 2} if func == "gmres" else {}
+        _, info = getattr(sparse.linalg, func)(
+            dpnp.array(a), dpnp.array(b), rtol=1e-12, maxiter=1, **kwargs
+        )
+        assert info == 1
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    def test_zero_rhs(self, func):
+        x, info = getattr(sparse.linalg, func)(dpnp.eye(4), dpnp.zeros(4))
+        assert info == 0
+        assert_array_equal(x, numpy.zeros(4))
+
+    def test_gmres_exact(self):
+        a = numpy.array([[3.0, 2.0, 0.0], [1.0, -1.0, 0.0], [0.0, 5.0, 1.0]])
+        b = numpy.array([2.0, 4.0, -1.0])
+
+        x, info = sparse.linalg.gmres(dpnp.array(a), dpnp.array(b), rtol=1e-8)
+        assert info == 0
+        assert_dtype_allclose(x, numpy.linalg.solve(a, b))
+
+    @pytest.mark.parametrize("func", ["bicgstab", "cg", "gmres"])
+    def test_error(self, func):
+        solver = getattr(sparse.linalg, func)
+        ia, ib = dpnp.eye(4), dpnp.ones(4)
+        assert_raises(ValueError, solver, dpnp.eye(3), ib)
+        assert_raises(ValueError, solver, ia, dpnp.ones((2, 2)))
+        assert_raises(ValueError, solver, ia, ib, x0=dpnp.ones(3))
+        assert_raises(ValueError, solver, ia, ib, M=dpnp.eye(3))
+        assert_raises(TypeError, solver, "A", ib)
+
+
+class TestEigsh:
+    @staticmethod
+    def _get_matrix(dtype, n=40):
+        # Hermitian matrix with well-separated extreme eigenvalues
+        q = numpy.linalg.qr(
+            generate_random_numpy_array((n, n), dtype, seed_value=3)
+        )[0]
+        w = numpy.concatenate(
+            ([-20.0, -8.0], numpy.linspace(-1, 1, n - 5), [5.0, 10.0, 20.0])
+        )
+        a = (q * w) @ q.T.conj()
+        return ((a + a.T.conj()) / 2).astype(dtype)
+
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize(
+        "which, idx",
+        [("LM", [0, -2, -1]), ("LA", [-3, -2, -1]), ("SA", [0, 1, 2])],
+    )
+    @pytest.mark.parametrize("op", ["dense", "sparse"])
+    def test_eigsh(self, dt, which, idx, op):
+        a = self._get_matrix(dt)
+        ia = dpnp.array(a)
+        if op == "sparse":
+            ia = sparse.csr_matrix(ia)
+
+        w, v = sparse.linalg.eigsh(ia, k=3, which=which)
+        expected = numpy.linalg.eigvalsh(a)[idx]
+        assert_dtype_allclose(w, numpy.sort(expected), factor=24)
+        assert v.dtype == dt
+        assert v.shape == (a.shape[0], 3)
+
+        v = dpnp.asnumpy(v)
+        assert_allclose(a @ v, v * dpnp.asnumpy(w), atol=1e-3)
+
+    def test_callable(self):
+        a = self._get_matrix(numpy.float32)
+        ia = dpnp.array(a)
+        v0 = dpnp.ones(a.shape[0], dtype=ia.dtype)
+
+        w = sparse.linalg.eigsh(
+            ia.__matmul__, k=2, v0=v0, return_eigenvectors=False
+        )
+        expected = numpy.array([-20.0, 20.0], dtype=numpy.float32)
+        assert_dtype_allclose(w, expected, factor=24)
+
+    def test_error(self):
+        ia = dpnp.eye(4)
+        assert_raises(ValueError, sparse.linalg.eigsh, dpnp.ones((4, 3)))
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=0)
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=4)
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=2, ncv=2)
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=2, ncv=5)
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=2, which="SM")
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, k=2, maxiter=0)
+        assert_raises(ValueError, sparse.linalg.eigsh, ia, 2, v0=dpnp.ones(3))
+        assert_raises(TypeError, sparse.linalg.eigsh, ia.__matmul__, k=2)
+
+
+class TestSvds:
+    @staticmethod
+    def _get_matrix(dtype, m=60, n=30):
+        # matrix with quickly decaying singular values
+        u = numpy.linalg.qr(
+            generate_random_numpy_array((m, n), dtype, seed_value=5)
+        )[0]
+        v = numpy.linalg.qr(
+            generate_random_numpy_array((n, n), dtype, seed_value=6)
+        )[0]
+        s = numpy.logspace(2, -2, n)
+        return ((u * s) @ v.T.conj()).astype(dtype), s
+
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("op", ["dense", "sparse", "transposed"])
+    def test_svds(self, dt, op):
+        a, s = self._get_matrix(dt)
+        if op == "transposed":
+            a = a.T.copy()
+        ia = dpnp.array(a)
+        if op == "sparse":
+            ia = sparse.csr_matrix(ia)
+
+        u, result, vh = sparse.linalg.svds(ia, k=4, random_state=0)
+        assert_dtype_allclose(result, s[3::-1].astype(result.dtype), factor=24)
+        assert u.dtype == vh.dtype == dt
+        assert u.shape == (a.shape[0], 4)
+        assert vh.shape == (4, a.shape[1])
+
+        expected = numpy.linalg.svd(a, full_matrices=False)
+        expected = (expected[0][:, :4] * expected[1][:4]) @ expected[2][:4]
+        approx = dpnp.asnumpy(u) * dpnp.asnumpy(result) @ dpnp.asnumpy(vh)
+        assert_allclose(approx, expected, atol=1e-3)
+
+    @pytest.mark.parametrize("vectors", [False, "u", "vh"])
+    def test_return_singular_vectors(self, vectors):
+        a, s = self._get_matrix(numpy.float32)
+        ia = dpnp.array(a)
+
+        result = sparse.linalg.svds(ia, k=2, return_singular_vectors=vectors)
+        if vectors is False:
+            assert_dtype_allclose(result, s[1::-1].astype(numpy.float32))
+        elif vectors == "u":
+            assert result[0].shape == (a.shape[0], 2)
+            assert result[2] is None
+        else:
+            assert result[0] is None
+            assert result[2].shape == (2, a.shape[1])
+
+    def test_random_state(self):
+        ia = dpnp.array(self._get_matrix(numpy.float32)[0])
+
+        rs = dpnp.random.RandomState(1)
+        u, s, vh = sparse.linalg.svds(ia, k=3, random_state=rs)
+        expected = sparse.linalg.svds(ia, k=3, random_state=1)
+        assert_array_equal(u, expected[0])
+        assert_array_equal(s, expected[1])
+        assert_array_equal(vh, expected[2])
+
+    def test_error(self):
+        ia = dpnp.ones((5, 4))
+        assert_raises(ValueError, sparse.linalg.svds, dpnp.ones(4))
+        assert_raises(ValueError, sparse.linalg.svds, ia, k=0)
+        assert_raises(ValueError, sparse.linalg.svds, ia, k=5)
+        assert_raises(ValueError, sparse.linalg.svds, ia, k=3, ncv=2)
+        assert_raises(ValueError, sparse.linalg.svds, ia, k=2, maxiter=-1)
+        assert_raises(ValueError, sparse.linalg.svds, ia, k=2, which="LA")
+        assert_raises(NotImplementedError, sparse.linalg.svds, ia, which="SM")
+        assert_raises(
+            ValueError, sparse.linalg.svds, ia, k=2, return_singular_vectors="x"
+        )
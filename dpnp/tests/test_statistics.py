@@ -2,6 +2,7 @@ import dpctl
 import dpctl.tensor as dpt
 import numpy
 import pytest
+from dpctl.tensor._numpy_helper import AxisError
 from numpy.testing import (
     assert_allclose,
     assert_array_equal,
@@ -308,6 +309,47 @@ class TestConvolve:
         with pytest.raises(ValueError):
             dpnp.convolve(a, v, method="unknown")
 
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    @pytest.mark.parametrize("mode", ["full", "valid", "same"])
+    @pytest.mark.parametrize("method", ["auto", "direct", "fft"])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_convolve_axis(self, axis, mode, method, dtype):
+        an = generate_random_numpy_array((8, 12), dtype, seed_value=0)
+        vn = generate_random_numpy_array(5, dtype, seed_value=1)
+        ad, vd = dpnp.array(an), dpnp.array(vn)
+
+        expected = numpy.apply_along_axis(
+            numpy.convolve, axis, an, vn, mode=mode
+        )
+        result = dpnp.convolve(ad, vd, mode=mode, method=method, axis=axis)
+        assert_dtype_allclose(result, expected, factor=50)
+
+    @pytest.mark.parametrize("method", ["direct", "fft"])
+    def test_convolve_axis_many_filters(self, method):
+        an = generate_random_numpy_array((4, 10), numpy.float32, seed_value=0)
+        vn = generate_random_numpy_array((4, 3), numpy.float32, seed_value=1)
+        ad, vd = dpnp.array(an), dpnp.array(vn)
+
+        expected = numpy.stack([numpy.convolve(x, y) for x, y in zip(an, vn)])
+        result = dpnp.convolve(ad, vd, method=method, axis=1)
+        assert_dtype_allclose(result, expected, factor=50)
+
+        # filters are broadcast against signals
+        expected = numpy.stack([numpy.convolve(an[0], y) for y in vn])
+        result = dpnp.convolve(ad[:1], vd, method=method, axis=1)
+        assert_dtype_allclose(result, expected, factor=50)
+
+    def test_convolve_axis_error(self):
+        a = dpnp.ones((2, 3, 4))
+        v = dpnp.ones((2, 3))
+
+        with pytest.raises(ValueError):
+            dpnp.convolve(a, v, axis=-1)
+        with pytest.raises(ValueError):
+            dpnp.convolve(a, dpnp.ones((3, 3, 3)), axis=-1)
+        with pytest.raises(AxisError):
+            dpnp.convolve(a, dpnp.ones(3), axis=3)
+
 
 class TestCorrcoef:
     @pytest.mark.usefixtures(
@@ -532,6 +574,30 @@ class TestCorrelate:
         with pytest.raises(ValueError):
             dpnp.correlate(a, v, method="unknown")
 
+    @pytest.mark.parametrize("axis", [0, 1])
+    @pytest.mark.parametrize("mode", ["full", "valid", "same"])
+    @pytest.mark.parametrize("method", ["auto", "direct", "fft"])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_correlate_axis(self, axis, mode, method, dtype):
+        an = generate_random_numpy_array((6, 9), dtype, seed_value=0)
+        vn = generate_random_numpy_array(4, dtype, seed_value=1)
+        ad, vd = dpnp.array(an), dpnp.array(vn)
+
+        expected = numpy.apply_along_axis(
+            numpy.correlate, axis, an, vn, mode=mode
+        )
+        result = dpnp.correlate(ad, vd, mode=mode, method=method, axis=axis)
+        assert_dtype_allclose(result, expected, factor=50)
+
+        # the stack is shorter than the sequence along the axis
+        expected = numpy.apply_along_axis(
+            lambda x: numpy.correlate(vn, x, mode=mode), axis, an[:2, :2]
+        )
+        result = dpnp.correlate(
+            vd, ad[:2, :2], mode=mode, method=method, axis=axis
+        )
+        assert_dtype_allclose(result, expected, factor=50)
+
 
 class TestCov:
     @pytest.mark.parametrize(
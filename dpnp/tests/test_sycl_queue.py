@@ -270,6 +270,7 @@ def test_meshgrid(device):
         ),
         pytest.param("iscomplex", [1 + 1j, 1 + 0j, 4.5, 3, 2, 2j]),
         pytest.param("isreal", [1 + 1j, 1 + 0j, 4.5, 3, 2, 2j]),
+        pytest.param("lexsort", [[2.0, 1.0, 7.0, 4.0], [1.0, 1.0, 0.0, 0.0]]),
         pytest.param("log", [1.0, 2.0, 4.0, 7.0]),
         pytest.param("log10", [1.0, 2.0, 4.0, 7.0]),
         pytest.param("log1p", [1.0e-10, 1.0, 2.0, 4.0, 7.0]),
@@ -1209,6 +1210,66 @@ def test_clip(device):
     assert_sycl_queue_equal(x.sycl_queue, y.sycl_queue)
 
 
+@pytest.mark.parametrize("func", ["packbits", "unpackbits"])
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_packbits(func, device):
+    x = dpnp.arange(10, dtype=dpnp.uint8, device=device)
+    result = getattr(dpnp, func)(x)
+    assert_sycl_queue_equal(result.sycl_queue, x.sycl_queue)
+
+
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_interp(device):
+    x = dpnp.linspace(0, 4, num=9, device=device)
+    xp = dpnp.arange(5, device=device)
+    fp = dpnp.arange(5, 10, device=device)
+    result = dpnp.interp(x, xp, fp)
+    assert_sycl_queue_equal(result.sycl_queue, x.sycl_queue)
+
+
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_polyval(device):
+    p = dpnp.arange(4.0, device=device)
+    x = dpnp.linspace(-1, 1, num=9, device=device)
+    result = dpnp.polyval(p, x)
+    assert_sycl_queue_equal(result.sycl_queue, x.sycl_queue)
+
+
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_polyfit(device):
+    x = dpnp.linspace(0, 1, num=9, device=device)
+    y = dpnp.exp(x)
+    result = dpnp.polyfit(x, y, 2)
+    assert_sycl_queue_equal(result.sycl_queue, x.sycl_queue)
+
+
+@pytest.mark.parametrize("fmt", ["coo", "csc", "csr"])
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_sparse_matmul(fmt, device):
+    a = dpnp.eye(4, k=1, device=device)
+    x = dpnp.arange(4.0, device=device)
+    m = getattr(dpnp.sparse, fmt + "_matrix")(a)
+    assert_sycl_queue_equal(m.sycl_queue, a.sycl_queue)
+
+    result = m @ x
+    assert_sycl_queue_equal(result.sycl_queue, x.sycl_queue)
+
+    result = m.toarray()
+    assert_sycl_queue_equal(result.sycl_queue, a.sycl_queue)
+
+
+@pytest.mark.parametrize("func", ["eigsh", "svds"])
+@pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
+def test_sparse_eigsh_svds(func, device):
+    a = dpnp.diag(dpnp.arange(1.0, 11.0, device=device))
+    m = dpnp.sparse.csr_matrix(a)
+
+    for op in [a, m]:
+        result = getattr(dpnp.sparse.linalg, func)(op, k=2)
+        for res in result:
+            assert_sycl_queue_equal(res.sycl_queue, a.sycl_queue)
+
+
 @pytest.mark.parametrize("device", valid_dev, ids=dev_ids)
 def test_take(device):
     x = dpnp.arange(5, device=device)
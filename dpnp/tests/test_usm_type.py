@@ -568,6 +568,7 @@ def test_meshgrid(usm_type_x, usm_type_y):
         ),
         pytest.param("iscomplex", [1 + 1j, 1 + 0j, 4.5, 3, 2, 2j]),
         pytest.param("isreal", [1 + 1j, 1 + 0j, 4.5, 3, 2, 2j]),
+        pytest.param("lexsort", [[2.0, 1.0, 7.0, 4.0], [1.0, 1.0, 0.0, 0.0]]),
         pytest.param("log", [1.0, 2.0, 4.0, 7.0]),
         pytest.param("log10", [1.0, 2.0, 4.0, 7.0]),
         pytest.param("log1p", [1.0e-10, 1.0, 2.0, 4.0, 7.0]),
@@ -969,6 +970,66 @@ def test_clip(usm_type):
     assert x.usm_type == y.usm_type
 
 
+@pytest.mark.parametrize("func", ["packbits", "unpackbits"])
+@pytest.mark.parametrize("usm_type", list_of_usm_types)
+def test_packbits(func, usm_type):
+    x = dpnp.arange(10, dtype=dpnp.uint8, usm_type=usm_type)
+    result = getattr(dpnp, func)(x)
+    assert result.usm_type == usm_type
+
+
+@pytest.mark.parametrize("usm_type_x", list_of_usm_types)
+@pytest.mark.parametrize("usm_type_xp", list_of_usm_types)
+def test_interp(usm_type_x, usm_type_xp):
+    x = dpnp.linspace(0, 4, num=9, usm_type=usm_type_x)
+    xp = dpnp.arange(5, usm_type=usm_type_xp)
+    fp = dpnp.arange(5, 10, usm_type=usm_type_xp)
+    result = dpnp.interp(x, xp, fp)
+    assert result.usm_type == du.get_coerced_usm_type([usm_type_x, usm_type_xp])
+
+
+@pytest.mark.parametrize("usm_type_p", list_of_usm_types)
+@pytest.mark.parametrize("usm_type_x", list_of_usm_types)
+def test_polyval(usm_type_p, usm_type_x):
+    p = dpnp.arange(4.0, usm_type=usm_type_p)
+    x = dpnp.linspace(-1, 1, num=9, usm_type=usm_type_x)
+    result = dpnp.polyval(p, x)
+    assert result.usm_type == du.get_coerced_usm_type([usm_type_p, usm_type_x])
+
+
+@pytest.mark.parametrize("usm_type", list_of_usm_types)
+def test_roots(usm_type):
+    p = dpnp.array([1.0, -3.0, 2.0], usm_type=usm_type)
+    result = dpnp.roots(p)
+    assert result.usm_type == usm_type
+
+
+@pytest.mark.parametrize("fmt", ["coo", "csc", "csr"])
+@pytest.mark.parametrize("usm_type_a", list_of_usm_types)
+@pytest.mark.parametrize("usm_type_x", list_of_usm_types)
+def test_sparse_matmul(fmt, usm_type_a, usm_type_x):
+    a = dpnp.eye(4, k=1, usm_type=usm_type_a)
+    x = dpnp.arange(4.0, usm_type=usm_type_x)
+    m = getattr(dpnp.sparse, fmt + "_matrix")(a)
+    assert m.usm_type == usm_type_a
+    assert m.toarray().usm_type == usm_type_a
+
+    result = m @ x
+    assert result.usm_type == du.get_coerced_usm_type([usm_type_a, usm_type_x])
+
+
+@pytest.mark.parametrize("func", ["eigsh", "svds"])
+@pytest.mark.parametrize("usm_type", list_of_usm_types)
+def test_sparse_eigsh_svds(func, usm_type):
+    a = dpnp.diag(dpnp.arange(1.0, 11.0, usm_type=usm_type))
+    m = dpnp.sparse.csr_matrix(a)
+
+    for op in [a, m]:
+        result = getattr(dpnp.sparse.linalg, func)(op, k=2)
+        for res in result:
+            assert res.usm_type == usm_type
+
+
 @pytest.mark.parametrize("usm_type", list_of_usm_types)
 def test_where(usm_type):
     a = dpnp.array([[0, 1, 2], [0, 2, 4], [0, 3, 6]], usm_type=usm_type)
@@ -6,10 +6,6 @@ import pytest
 import dpnp as cupy
 from dpnp.tests.third_party.cupy import testing
 
-pytest.skip(
-    "packbits() and unpackbits() are not supported yet", allow_module_level=True
-)
-
 
 class TestPacking(unittest.TestCase):
 
@@ -10,7 +10,7 @@ from dpnp.tests.third_party.cupy import testing
 
 # from cupy.exceptions import RankWarning
 
-pytest.skip("poly functions are not supported yet", allow_module_level=True)
+RankWarning = getattr(numpy, "exceptions", numpy).RankWarning
 
 
 @testing.parameterize(
@@ -23,8 +23,7 @@ class TestPoly1dInit:
     @testing.numpy_cupy_array_equal()
     def test_poly1d_numpy_array(self, xp, dtype):
         a = numpy.arange(5, dtype=dtype)
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
@@ -32,15 +31,13 @@ class TestPoly1dInit:
     @testing.numpy_cupy_array_equal()
     def test_poly1d_cupy_array(self, xp, dtype):
         a = testing.shaped_arange((5,), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
     @testing.numpy_cupy_array_equal()
     def test_poly1d_list(self, xp):
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d([1, 2, 3, 4], variable=self.variable)
+        out = xp.poly1d([1, 2, 3, 4], variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
@@ -49,8 +46,7 @@ class TestPoly1dInit:
     def test_poly1d_numpy_poly1d(self, xp, dtype):
         array = testing.shaped_arange((5,), numpy, dtype)
         a = numpy.poly1d(array)
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
@@ -59,8 +55,7 @@ class TestPoly1dInit:
     def test_poly1d_numpy_poly1d_variable(self, xp, dtype):
         array = testing.shaped_arange((5,), numpy, dtype)
         a = numpy.poly1d(array, variable="z")
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "z")
         return out
 
@@ -87,8 +82,7 @@ class TestPoly1dInit:
     @testing.numpy_cupy_array_equal()
     def test_poly1d_zero_dim(self, xp, dtype):
         a = testing.shaped_arange((), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
@@ -97,8 +91,7 @@ class TestPoly1dInit:
     @testing.numpy_cupy_array_equal()
     def test_poly1d_zero_size(self, xp, dtype):
         a = testing.shaped_arange((0,), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            out = xp.poly1d(a, variable=self.variable)
+        out = xp.poly1d(a, variable=self.variable)
         assert out.variable == (self.variable or "x")
         return out
 
@@ -137,10 +130,6 @@ class TestPoly1d:
         a = xp.array([0, 0, 1, 2, 3, 0], dtype)
         return xp.poly1d(a).order
 
-    @pytest.mark.skipif(
-        runtime.is_hip and driver.get_build_version() < 402,
-        reason="syevj not available",
-    )
     @testing.for_signed_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-6)
     def test_poly1d_roots(self, xp, dtype):
@@ -153,37 +142,32 @@ class TestPoly1d:
     @testing.numpy_cupy_equal()
     def test_poly1d_getitem1(self, xp, dtype):
         a = testing.shaped_arange((10,), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            return xp.poly1d(a)[-1]
+        return xp.poly1d(a)[-1]
 
     @testing.for_all_dtypes()
     @testing.numpy_cupy_equal()
     def test_poly1d_getitem2(self, xp, dtype):
         a = testing.shaped_arange((10,), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            return xp.poly1d(a)[5]
+        return xp.poly1d(a)[5]
 
     @testing.for_all_dtypes()
     @testing.numpy_cupy_equal()
     def test_poly1d_getitem3(self, xp, dtype):
         a = testing.shaped_arange((10,), xp, dtype)
-        with cupyx.allow_synchronize(False):
-            return xp.poly1d(a)[100]
+        return xp.poly1d(a)[100]
 
     @testing.for_all_dtypes()
     @testing.numpy_cupy_equal()
     def test_poly1d_getitem4(self, xp, dtype):
         a = xp.array([0, 0, 1, 2, 3, 0], dtype)
-        with cupyx.allow_synchronize(False):
-            return xp.poly1d(a)[2]
+        return xp.poly1d(a)[2]
 
     @testing.for_all_dtypes()
     @testing.numpy_cupy_array_equal()
     def test_poly1d_setitem(self, xp, dtype):
         a = testing.shaped_arange((10,), xp, dtype)
         b = xp.poly1d(a)
-        with cupyx.allow_synchronize(False):
-            b[100] = 20
+        b[100] = 20
         return b
 
     @testing.for_all_dtypes()
@@ -191,8 +175,7 @@ class TestPoly1d:
     def test_poly1d_setitem_leading_zeros(self, xp, dtype):
         a = xp.array([0, 0, 0, 2, 3, 0], dtype)
         b = xp.poly1d(a)
-        with cupyx.allow_synchronize(False):
-            b[1] = 10
+        b[1] = 10
         return b
 
     @testing.for_all_dtypes()
@@ -207,7 +190,7 @@ class TestPoly1d:
     def test_poly1d_get1(self, dtype):
         a1 = testing.shaped_arange((10,), cupy, dtype)
         a2 = testing.shaped_arange((10,), numpy, dtype)
-        b1 = cupy.poly1d(a1, variable="z").get()
+        b1 = cupy.poly1d(a1, variable="z").asnumpy()
         b2 = numpy.poly1d(a2, variable="z")
         assert b1 == b2
 
@@ -215,7 +198,7 @@ class TestPoly1d:
     def test_poly1d_get2(self, dtype):
         a1 = testing.shaped_arange((), cupy, dtype)
         a2 = testing.shaped_arange((), numpy, dtype)
-        b1 = cupy.poly1d(a1).get()
+        b1 = cupy.poly1d(a1).asnumpy()
         b2 = numpy.poly1d(a2)
         assert b1 == b2
 
@@ -269,11 +252,12 @@ class TestPoly:
         a = xp.array([[2, -1j], [1j, 1]], dtype)
         return xp.poly(a)
 
-    @testing.for_all_dtypes(no_bool=True)
-    def test_poly_2d_square(self, dtype):
-        a = testing.shaped_arange((3, 3), cupy, dtype)
-        with pytest.raises(NotImplementedError):
-            cupy.poly(a)
+    # dpnp supports a general square matrix contrary to CuPy
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4)
+    def test_poly_2d_square(self, xp, dtype):
+        a = testing.shaped_arange((3, 3), xp, dtype)
+        return xp.poly(a)
 
     @testing.for_all_dtypes()
     def test_poly_2d_general(self, dtype):
@@ -395,6 +379,8 @@ class TestPoly1dPolynomialArithmetic(Poly1dTestBase):
     def test_poly1d_arithmetic(self, xp, dtype):
         if self.type_l == "numpy_scalar" and self.type_r == "poly1d":
             pytest.skip("Avoid numpy bug.")
+        if self.type_l == "ndarray" and self.type_r == "poly1d":
+            pytest.skip("dpnp.ndarray is not converted from poly1d implicitly")
         a1 = self._get_input(xp, self.type_l, dtype)
         a2 = self._get_input(xp, self.type_r, dtype)
         return self.func(a1, a2)
@@ -409,6 +395,7 @@ class TestPoly1dPolynomialArithmetic(Poly1dTestBase):
         }
     )
 )
+@pytest.mark.skip("dpnp functions do not accept poly1d")
 class TestPoly1dMathArithmetic(Poly1dTestBase):
 
     @testing.for_all_dtypes(no_bool=True)
@@ -435,6 +422,8 @@ class TestPoly1dRoutines(Poly1dTestBase):
     @testing.for_all_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-4, accept_error=TypeError)
     def test_poly1d_routine(self, xp, dtype):
+        if self.type_l.endswith("scalar") and self.type_r.endswith("scalar"):
+            pytest.skip("dpnp expects at least one array or poly1d input")
         func = getattr(xp, self.fname)
         a1 = self._get_input(xp, self.type_l, dtype)
         a2 = self._get_input(xp, self.type_r, dtype)
@@ -521,8 +510,6 @@ class TestPolyArithmeticDiffTypes:
             return func(a, b)
 
         rtol = 1e-5
-        if runtime.is_hip and self.fname == "polymul":
-            rtol = 1e-4
         try:
             testing.assert_allclose(f(cupy), f(numpy), rtol=rtol)
         except TypeError:
@@ -541,8 +528,6 @@ class TestPolyArithmeticDiffTypes:
             return out
 
         rtol = 1e-5
-        if runtime.is_hip and self.fname == "polymul":
-            rtol = 1e-4
         try:
             testing.assert_allclose(f(cupy), f(numpy), rtol=rtol)
         except TypeError:
@@ -573,8 +558,6 @@ class TestPolyfitParametersCombinations:
         atol=1e-9, accept_error=TypeError, contiguous_check=False
     )
     def test_polyfit_default(self, xp, dtype):
-        if runtime.is_hip and self.deg == 0:
-            pytest.xfail("ROCm/HIP may have a bug")
         x = testing.shaped_arange(self.shape1, xp, dtype)
         y = testing.shaped_arange(self.shape2, xp, dtype)
         w = x if self.weighted else None
@@ -582,8 +565,6 @@ class TestPolyfitParametersCombinations:
 
     @testing.for_all_dtypes(no_float16=True)
     def test_polyfit_full(self, dtype):
-        if runtime.is_hip and self.deg == 0:
-            pytest.xfail("ROCm/HIP may have a bug")
 
         cp_c, cp_resids, cp_rank, cp_s, cp_rcond = self._full_fit(cupy, dtype)
         np_c, np_resids, np_rank, np_s, np_rcond = self._full_fit(numpy, dtype)
@@ -617,8 +598,6 @@ class TestPolyfitCovMode:
 
     @testing.for_float_dtypes(no_float16=True)
     def test_polyfit_cov(self, dtype):
-        if runtime.is_hip and self.deg == 0:
-            pytest.xfail("ROCm/HIP may have a bug")
         cp_c, cp_cov = self._cov_fit(cupy, dtype)
         np_c, np_cov = self._cov_fit(numpy, dtype)
         testing.assert_allclose(cp_c, np_c, rtol=1e-5)
@@ -866,10 +845,6 @@ class TestPolyRoutinesNdim:
         }
     )
 )
-@pytest.mark.skipif(
-    runtime.is_hip and driver.get_build_version() < 402,
-    reason="syevj not available",
-)
 class TestRootsReal:
 
     @testing.for_signed_dtypes()
@@ -899,8 +874,6 @@ class TestRootsComplex:
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-6)
     def test_roots_array(self, xp, dtype):
-        if runtime.is_hip and self.input == [3j, 1.5j, -3j]:
-            pytest.xfail("rocBLAS not implemented")
         a = xp.array(self.input, dtype)
         out = xp.roots(a)
         return xp.sort(out)
@@ -908,8 +881,6 @@ class TestRootsComplex:
     @testing.for_complex_dtypes()
     @testing.numpy_cupy_allclose(rtol=1e-6)
     def test_roots_poly1d(self, xp, dtype):
-        if runtime.is_hip and self.input == [3j, 1.5j, -3j]:
-            pytest.xfail("rocBLAS not implemented")
         a = xp.array(self.input, dtype)
         out = xp.roots(xp.poly1d(a))
         return xp.sort(out)
@@ -973,7 +944,8 @@ class TestRoots:
             with pytest.raises(ValueError):
                 xp.roots(a)
 
-    def test_roots_bool_symmetric(self):
-        a = cupy.array([5, -1, -5], bool)
-        with pytest.raises(NotImplementedError):
-            cupy.roots(a)
+    # dpnp supports a non-symmetric companion matrix contrary to CuPy
+    @testing.numpy_cupy_allclose(rtol=1e-6)
+    def test_roots_bool_symmetric(self, xp):
+        a = xp.array([5, -1, -5], bool)
+        return xp.sort(xp.roots(a))
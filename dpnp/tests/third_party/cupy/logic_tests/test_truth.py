@@ -89,7 +89,6 @@ class TestAllAnyWithNaN:
         return out
 
 
-@pytest.mark.skip("isin() is not supported yet")
 @testing.parameterize(
     *testing.product(
         {
@@ -110,7 +109,6 @@ class TestIn1DIsIn:
         return xp.isin(x, y, self.assume_unique, self.invert)
 
 
-@pytest.mark.skip("setdiff1d() is not supported yet")
 class TestSetdiff1d:
 
     @testing.for_all_dtypes()
@@ -169,7 +167,6 @@ class TestSetdiff1d:
         return xp.setdiff1d(x, y)
 
 
-@pytest.mark.skip("setxor1d() is not supported yet")
 class TestSetxor1d:
 
     @testing.for_all_dtypes()
@@ -228,7 +225,6 @@ class TestSetxor1d:
         return xp.setxor1d(x, y)
 
 
-@pytest.mark.skip("intersect1d() is not supported yet")
 class TestIntersect1d:
 
     @testing.for_all_dtypes(no_bool=True)
@@ -267,7 +263,6 @@ class TestIntersect1d:
         return xp.intersect1d(a, b, return_indices=True)
 
 
-@pytest.mark.skip("union1d() is not supported yet")
 class TestUnion1d:
 
     @testing.for_all_dtypes()
@@ -213,7 +213,6 @@ class TestSort(unittest.TestCase):
         return xp.sort(a, axis=-1)
 
 
-@pytest.mark.skip("lexsort() is not implemented yet")
 class TestLexsort(unittest.TestCase):
 
     # Test ranks
@@ -238,6 +237,7 @@ class TestLexsort(unittest.TestCase):
         )  # from numpy.lexsort example
         return xp.lexsort(a)
 
+    @pytest.mark.skip("dpnp supports keys of more than two dimensions")
     def test_lexsort_three_or_more_dim(self):
         a = testing.shaped_random((2, 10, 10), cupy)
         with self.assertRaises(NotImplementedError):
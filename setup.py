@@ -69,6 +69,8 @@ setup(
         "dpnp.fft",
         "dpnp.linalg",
         "dpnp.random",
+        "dpnp.sparse",
+        "dpnp.sparse.linalg",
     ],
     package_data={
         "dpnp": [